@@ -1,9 +1,24 @@
 import numpy as np
+import logging
 import math
+import os
+import pickle
+import time
+import cProfile
 import matrices_generator
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 from angled_square import AngledSquare
-from flat_objects import FlatObject
+from disk_cache import code_version
+from flat_objects import BED_X, BED_Y, FlatObject
+from gcode_io import open_gcode
+from gcode_writer import GcodeWriter, as_writer
+from profiling import NULL_PROFILER, Profiler
+from toolpath_cache import ToolpathCache
+from travel_optimizer import optimize_order, orient, travel_distance
+
+logger = logging.getLogger(__name__)  # incremental and travel reports. enable with logging.DEBUG
 
 
 class AngledGrid(FlatObject):
@@ -16,7 +31,8 @@ class AngledGrid(FlatObject):
     '''
 
     def __init__(self, sq_size, nuzzle_size, layers_num, thickness, speed, file_name, angles_mtx1, angles_mtx2=None,
-                 num_mtx1=1, thickness_mtx=None, layer_thickness=None, x_start=150, y_start=100, material='pla'):
+                 num_mtx1=1, thickness_mtx=None, layer_thickness=None, x_start=150, y_start=100, material='pla',
+                 path_cache=None, travel_order='rows', merge_tolerance=None, disk_cache=None, arc_tolerance=None):
         """
 
         :param sq_size: size of single square in matrix
@@ -33,15 +49,24 @@ class AngledGrid(FlatObject):
                 constant thickness.
         :param x_start: x position of bottom left corner
         :param y_start: y position of bottom left corner
+        :param path_cache: ToolpathCache to take squares' paths from. can be shared between grids. None creates a new
+                one for this grid
+        :param disk_cache: DiskToolpathCache, for a new path_cache to look paths up in before generating them
+        :param travel_order: order squares are printed in, each layer. 'rows' - row by row, each square from its corner.
+                'nearest' / 'two_opt' - order and direction of squares minimizing travel (non extruding) moves
+        :param merge_tolerance: if given, consecutive collinear moves (within this distance, mm) are merged into one
+        :param arc_tolerance: if given, runs of moves along circles are written as arcs (G2/G3) within this distance, mm
         """
         FlatObject.__init__(self, sq_size, layers_num=layers_num, thickness=thickness, speed=speed,
                             nuzzle_size=nuzzle_size, x_start=x_start, y_start=y_start, material=material)
+        start = time.perf_counter()
         self.angles_mtx1 = list(list(x)[::-1] for x in zip(*angles_mtx1))  # rotate for consistency with input
         print(angles_mtx2)
         if angles_mtx2 is not None:
             self.angles_mtx2 = list(list(x)[::-1] for x in zip(*angles_mtx2))
         else:
             self.angles_mtx2 = None
+        self.rotation_time = time.perf_counter() - start  # reported by create_gcode(profile=True)
         self.num_mtx1 = num_mtx1
         self.x_sq_num = len(angles_mtx1[0])  # number of squares in the x axis
         self.y_sq_num = len(angles_mtx1)  # number of squares in the y axis
@@ -55,12 +80,22 @@ class AngledGrid(FlatObject):
         self.check_board_limits(x_start, y_start)
 
         self.layer_thickness = layer_thickness
+        self.path_cache = path_cache if path_cache is not None else ToolpathCache(disk_cache=disk_cache)
+        self.travel_order = travel_order
+        self.travel_report = {}  # angles mtx number -> travel distance before and after ordering
+        self.merge_tolerance = merge_tolerance
+        self.moves_removed = 0  # by merging collinear moves
+        self.arc_tolerance = arc_tolerance
+        self.cells_file = f'{file_name}.cells'  # per square gcode of last incremental run
+        self.incremental_report = {}
+        self.profiler = NULL_PROFILER  # Profiler while create_gcode(profile=True) runs
+        self.profile_report = None
 
     def check_board_limits(self, x_start, y_start):
         assert (
-                self.size * self.x_sq_num + x_start <= 250), f'X exceeding board\'s limits by {self.size * self.x_sq_num + x_start - 250}'
+                self.size * self.x_sq_num + x_start <= BED_X), f'X exceeding board\'s limits by {self.size * self.x_sq_num + x_start - BED_X}'
         assert (
-                self.size * self.y_sq_num + y_start <= 200), f'Y exceeding board\'s limits by {self.size * self.y_sq_num + y_start - 200}'  # make sure not exceeding board's limits
+                self.size * self.y_sq_num + y_start <= BED_Y), f'Y exceeding board\'s limits by {self.size * self.y_sq_num + y_start - BED_Y}'  # make sure not exceeding board's limits
         self.x_pos = np.arange(x_start, self.size * self.x_sq_num + x_start, self.size + self.nuzzle_size / 2)
         self.y_pos = np.arange(y_start, self.size * self.y_sq_num + y_start, self.size + self.nuzzle_size / 2)
 
@@ -68,110 +103,397 @@ class AngledGrid(FlatObject):
         if thickness_mtx is not None:
             self.thickness_mtx = list(list(x)[::-1] for x in zip(*thickness_mtx))  # rotate for consistency with input
             # make sure angles and thickness matrix have the same dimensions
-            assert (len(self.thickness_mtx) == len(self.angles_mtx1) & len(self.thickness_mtx[0]) == len(
+            assert (len(self.thickness_mtx) == len(self.angles_mtx1) and len(self.thickness_mtx[0]) == len(
                 self.angles_mtx1[0])), 'Angles and thickness matrices are of different dimensions'
         else:
             self.thickness_mtx = thickness_mtx
 
-    def create_gcode(self):
+    def create_gcode(self, workers=1, incremental=False, profile=False, pstats_file=None, compression='auto'):
         """
 
-        creating gcode for grid, according to given input
+        creating gcode for grid, according to given input. gcode is streamed to the file block by block, so memory
+        use doesn't grow with grid size.
+        :param workers: number of processes to format squares with. 1 (default) formats in this process. output is
+                identical either way
+        :param incremental: reuse gcode of squares that didn't change (angle, thickness, position...) since last
+                incremental run, kept in self.cells_file. only changed squares are generated. holds every square's
+                gcode in memory while running
+        :param profile: time slicing stages and count squares, moves and bytes written. see get_profile_report
+        :param pstats_file: if given, run under cProfile and dump its stats (pstats format) to this file. only this
+                process is profiled, not workers
+        :param compression: of gcode file, compressed while written: 'gzip', 'zstd', 'meatpack' or None. 'auto' - by
+                extension of self.file_name (.gz, .zst, .mpk), see gcode_io
+        :return: profile report if profile, else None
         """
+        self.profiler = Profiler() if profile else NULL_PROFILER
+        stats = cProfile.Profile() if pstats_file is not None else None
+        start = time.perf_counter()
+        try:
+            if stats is not None:
+                stats.enable()
+            with open_gcode(self.file_name, 'w', compression) as file:
+                self.write_gcode(GcodeWriter(file, profiler=self.profiler), workers, incremental)
+            self.gcode = file
+        finally:
+            if stats is not None:
+                stats.disable()
+                stats.dump_stats(pstats_file)
+            wall = time.perf_counter() - start
+            profiler = self.profiler
+            self.profiler = self.path_cache.profiler = NULL_PROFILER
+
+        self.profile_report = self.get_profile_report(profiler, wall, workers) if profile else None
+        return self.profile_report
+
+    def write_gcode(self, file, workers=1, incremental=False):
+        """
+        write the whole print, block by block (see iter_gcode).
+        :param file: open gcode file or GcodeWriter to write to. a GcodeWriter's formatting settings are used
+        :param workers: see create_gcode
+        :param incremental: see create_gcode
+        """
+        writer = as_writer(file)
+        for block in self.iter_gcode(workers, writer, incremental):
+            writer.write(block)
+        writer.flush()
 
-        with open(self.file_name, 'w') as file:
-            file.seek(0)
-
-            file.write(self.header)  # header
-
-            # first, iterate over all angle mtx, create corresponding square instance for each angle in grid.
-            pos1 = []
-            if self.angles_mtx2 is not None:
-                pos2 = []
-                positions = [pos1, pos2]
-            else:
-                positions = [pos1]
-            angles_mtx = self.angles_mtx1
-
-            print('pos', positions)
-
-            for k in range(len(positions)):
-                if k != 0:
-                    angles_mtx = self.angles_mtx2
-
-                for i, x_pos in enumerate(self.x_pos):
-                    row_pos = []
-                    for j, y_pos in enumerate(self.y_pos):
-                        print(i, j)
-                        angle = angles_mtx[i][j]
-                        sq = AngledSquare(self.size, angle=angle, nuzzle_size=self.nuzzle_size,
-                                          thickness=self.thickness, x_start=x_pos, y_start=y_pos)  # create instance
+    def get_profile_report(self, profiler, wall, workers):
+        """
+        :param profiler: Profiler of the run
+        :param wall: run's wall time, seconds
+        :param workers: number of processes of the run. stages of worker processes are summed over processes, so
+                with workers > 1 they can add up to more than wall time
+        :return: dictionary of stages' cumulative time (seconds), counters, wall time and path cache stats
+        """
+        report = profiler.report()
+        report['timers']['matrix rotation'] = self.rotation_time
+        report.update(wall_s=wall, workers=workers, path_cache=self.path_cache.stats())
+        return report
 
-                        array = sq.generate_arrays()
-                        row_pos.append(array)  # add sq position to row array
-                    positions[k].append(row_pos)  # add row positions array to mtx
+    def iter_gcode(self, workers=1, writer=None, incremental=False):
+        """
+        generator of gcode text blocks by file order: header, than for each layer its beginning and its chunks of
+        squares (by travel order), than end print.
+        :param workers: number of processes to format chunks with
+        :param writer: GcodeWriter whose formatting settings to use. None for default settings
+        :param incremental: see create_gcode
+        """
+        writer = writer if writer is not None else GcodeWriter(None)
+        profiler = self.path_cache.profiler = self.profiler
+        yield self.header  # header
+
+        with profiler.stage('square construction'):
+            sq = self.get_extrusion_square()
+
+        thicknesses = []
+        for layer in range(self.layers_num):
+            if self.layer_thickness is not None:
+                self.thickness = self.layer_thickness[layer]
+            thicknesses.append(self.thickness)
+
+        # print order of squares, split to chunks of a row's length. in 'rows' order, chunk == row
+        self.travel_report = {}
+        self.moves_removed = 0
+        plans = [self.plan_travel(layer) for layer in range(self.layers_num)]
+        chunk_size = max(1, len(self.y_pos))
+        layer_chunks = [[plan[c:c + chunk_size] for c in range(0, len(plan), chunk_size)] for plan in plans]
+
+        # in incremental mode, only squares whose fingerprint is not found in last run's gcode are generated
+        settings = self.get_settings_fingerprint(writer, sq)
+        previous = self.load_cell_chunks(settings) if incremental else {}
+        cell_chunks = {}
+        jobs = []  # (layer, cells, fingerprints, cells to generate) of each chunk, by order
+        for layer in range(self.layers_num):
+            for cells in layer_chunks[layer]:
+                if incremental:
+                    fingerprints = [self.get_cell_fingerprint(layer, cell, thicknesses[layer]) for cell in cells]
+                    missing = [cell for cell, fingerprint in zip(cells, fingerprints) if fingerprint not in previous]
+                else:
+                    fingerprints, missing = None, cells
+                jobs.append((layer, cells, fingerprints, missing))
+
+        tasks = ((layer, missing, thicknesses[layer]) for layer, _, _, missing in jobs if missing)
+        if workers > 1:
+            pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                       initargs=(self, sq, writer.precision, writer.strip_zeros))
+            chunks = self._count_removed(_bounded_map(pool, _format_cells, tasks, window=4 * workers))
+        else:
+            pool = None
+            chunks = (self.format_cells(layer, cells, thickness, sq, writer) for layer, cells, thickness in tasks)
 
-            # now, iterate to print - meaning, loop over layers, over all grid, by rows than columns, than loop over
-            # each square's position - to print, than print them by order w corresponding extrusion (based on distance).
-            pos = positions[0]  # default, only one angle mtx
+        jobs = iter(jobs)
+        generated = reused = 0
+        try:
             for layer in range(self.layers_num):
-                if (self.angles_mtx2 is not None) and (layer >= self.num_mtx1):
-                    pos = positions[1]
+                self.thickness = thicknesses[layer]
+                yield self.get_layer_begining(layer + 1)
+
+                # printing instructions, chunk by chunk of squares
+                for _ in layer_chunks[layer]:
+                    _, cells, fingerprints, missing = next(jobs)
+                    texts = iter(next(chunks) if missing else ())
+                    if not incremental:
+                        yield ''.join(texts)
+                        continue
+
+                    # splice last run's squares with generated ones
+                    block = []
+                    for fingerprint in fingerprints:
+                        text = previous.get(fingerprint)
+                        if text is None:
+                            text = next(texts)
+                            generated += 1
+                        else:
+                            reused += 1
+                        cell_chunks[fingerprint] = text
+                        block.append(text)
+                    yield ''.join(block)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        yield self.finish
+
+        if incremental:
+            self.save_cell_chunks(settings, cell_chunks)
+            self.incremental_report = {'generated': generated, 'reused': reused}
+            logger.debug('incremental: %d squares generated, %d reused', generated, reused)
+
+    def get_settings_fingerprint(self, writer, sq):
+        """
+        :param writer: GcodeWriter gcode is formatted with
+        :param sq: AngledSquare extrusion is computed with
+        :return: everything shared by all squares that their gcode depends on. if it changes, all squares change
+        """
+        return (code_version('angled_square.py', 'angeled_grid_tensor.py', 'gcode_writer.py', 'toolpath.py',
+                             'path_simplify.py', 'arc_fit.py'),
+                float(self.size), float(self.nuzzle_size), float(sq.thickness), float(sq.speed), self.merge_tolerance,
+                self.arc_tolerance,
+                sorted(writer.precision.items()), writer.strip_zeros)
 
-                if self.layer_thickness is not None:
-                    self.thickness = self.layer_thickness[i]
-                self.write_layer_begining(file, layer + 1)
+    def get_cell_fingerprint(self, layer, cell, thickness):
+        """
+        :param layer: of print, starting at 0
+        :param cell: (i, j, reverse) square, see iter_cells_toolpaths
+        :param thickness: of layer
+        :return: everything the square's gcode in this layer depends on. thickness_mtx isn't used in gcode yet; once it
+                is, the code version in the settings fingerprint changes
+        """
+        i, j, reverse = cell
+        angle = self.path_cache.key(self.get_angles_mtx(layer)[i][j], self.size, self.nuzzle_size)[0]
+        return layer, i, j, reverse, angle, float(thickness), float(self.x_pos[i]), float(self.y_pos[j])
 
-                # iterate to write printing instructions to the file
-                for i, row in enumerate(pos):  # iterate row by row over matrix
-                    for j, array in enumerate(row):  # iterate of all sqrs in row
+    def load_cell_chunks(self, settings):
+        """
+        :param settings: current settings fingerprint
+        :return: fingerprint -> gcode of each square of last incremental run. empty if none, or if settings changed
+        """
+        try:
+            with open(self.cells_file, 'rb') as file:
+                saved = pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return {}
+        return saved['cells'] if saved.get('settings') == settings else {}
+
+    def save_cell_chunks(self, settings, cell_chunks):
+        tmp_file = f'{self.cells_file}.tmp'
+        with open(tmp_file, 'wb') as file:
+            pickle.dump({'settings': settings, 'cells': cell_chunks}, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, self.cells_file)
+
+    def iter_toolpaths(self, sq=None):
+        """
+        generator of squares' toolpaths by print order: loop over layers, than over squares by travel order.
+        :param sq: AngledSquare to compute extrusion with. None for one with the grid's parameters
+        :return: yields (layer, i, j, toolpath). see iter_cells_toolpaths
+        """
+        if sq is None:
+            sq = self.get_extrusion_square()
+        for layer in range(self.layers_num):
+            for i, j, toolpath in self.iter_cells_toolpaths(layer, self.plan_travel(layer), sq):
+                yield layer, i, j, toolpath
 
-                        file.write(
-                            f'G1 Z{((layer + 1) + 3) * self.thickness} F{6000.000}; move z up\n')  # move to new position safely: move z up
-                        file.write(f'G0 X{self.x_pos[i]} Y{self.y_pos[j]}\n')
-                        file.write(f'G1 Z{(layer + 1) * self.thickness}; move z down \n')  # move z back down
+    def iter_cells_toolpaths(self, layer, cells, sq):
+        """
+        generator of toolpaths of squares in one layer.
+        :param layer: of print, starting at 0
+        :param cells: list of (i, j, reverse) squares to print. reverse - print square's path from its end
+        :param sq: AngledSquare to compute extrusion with
+        :return: yields (i, j, toolpath) for each square. toolpath starts with the travel move to the square
+        """
+        angles_mtx = self.get_angles_mtx(layer)
+        for i, j, reverse in cells:
+            corner = (self.x_pos[i], self.y_pos[j])
+            # same angle -> same path, only shifted. taken from cache and moved to (x_pos, y_pos)
+            # lengths of moves are shared by all squares of same angle, in all layers. only extrusion factor changes
+            array, lengths = self.path_cache.get_with_lengths(angles_mtx[i][j], self.size, self.nuzzle_size, *corner)
+            start = corner  # first move starts from the square's corner
+            if reverse:  # ... or ends there
+                path = np.vstack((corner, array))[::-1]
+                start, array, lengths = path[0], path[1:], lengths[::-1]
+            removed = sq.moves_removed
+            with self.profiler.stage('extrusion'):
+                toolpath = sq.generate_toolpath(layer + 1, start, travel=True, positions=array, lengths=lengths)
+            self.profiler.count('squares')
+            self.profiler.count('moves', len(toolpath))
+            yield i, j, toolpath
+            self.moves_removed += sq.moves_removed - removed
+
+    def plan_travel(self, layer):
+        """
+        order squares of layer by self.travel_order. computed once per angles mtx, reported in self.travel_report.
+        :param layer: of print, starting at 0
+        :return: list of (i, j, reverse) by print order
+        """
+        number = 2 if self.get_angles_mtx(layer) is self.angles_mtx2 else 1
+        if number in self.travel_report:
+            return self.travel_report[number]['plan']
+
+        angles_mtx = self.get_angles_mtx(layer)
+        cells = [(i, j) for i in range(len(self.x_pos)) for j in range(len(self.y_pos))]
+        starts = np.array([(self.x_pos[i], self.y_pos[j]) for i, j in cells], dtype=float).reshape(-1, 2)
+        ends = starts.copy()
+        for k, (i, j) in enumerate(cells):
+            array = self.path_cache.get(angles_mtx[i][j], self.size, self.nuzzle_size, *starts[k])
+            if len(array):
+                ends[k] = array[-1]
+
+        origin = (self.x_start, self.y_start)  # where layer beginning leaves the nuzzle
+        with self.profiler.stage('travel planning'):
+            order, reverse = optimize_order(starts, ends, origin, method=self.travel_order)
+        plan = [(*cells[k], bool(r)) for k, r in zip(order, reverse)]
+        before = travel_distance(starts, ends, origin)
+        after = travel_distance(*orient(starts, ends, order, reverse), origin)
+        self.travel_report[number] = {'before': before, 'after': after, 'plan': plan}
+        if self.travel_order != 'rows':
+            logger.debug('angles mtx %s: travel %.1f mm -> %.1f mm per layer', number, before, after)
+        return plan
+
+    def _count_removed(self, results):
+        """
+        :param results: (text, moves removed, profile report) of chunks formatted by worker processes
+        :return: yields texts, counting removed moves and adding workers' profiles on the way
+        """
+        for text, removed, report in results:
+            self.moves_removed += removed
+            if report is not None:
+                self.profiler.add(report)
+            yield text
+
+    def get_extrusion_square(self):
+        """
+        :return: AngledSquare to compute squares' extrusion with. extrusion depends only on parameters shared by all
+                squares
+        """
+        return AngledSquare(self.size, nuzzle_size=self.nuzzle_size, thickness=self.thickness,
+                            merge_tolerance=self.merge_tolerance)
 
-                        # new square! iterate of all sqr pos
-                        for k in range(len(array)):
-                            file.write(f'G1 X{array[k][0]} Y{array[k][1]} '
-                                       f'E{sq.get_extrusion(array[k][0] - array[k - 1][0], array[k][1] - array[k - 1][1], (layer + 1))}\n')
+    def get_angles_mtx(self, layer):
+        """
+        :param layer: of print, starting at 0
+        :return: (rotated) angles matrix printed in that layer
+        """
+        if (self.angles_mtx2 is not None) and (layer >= self.num_mtx1):
+            return self.angles_mtx2
+        return self.angles_mtx1
 
-            file.write(self.finish)
-        self.gcode = file
+    def format_cells(self, layer, cells, thickness, sq, writer):
+        """
+        gcode of squares in one layer
+        :param layer: of print, starting at 0
+        :param cells: list of (i, j, reverse) squares to print. see iter_cells_toolpaths
+        :param thickness: of layer
+        :param sq: AngledSquare to compute extrusion with
+        :param writer: GcodeWriter to format with
+        :return: list of gcode texts, one per square
+        """
+        texts = []
+        for i, j, toolpath in self.iter_cells_toolpaths(layer, cells, sq):
+            with self.profiler.stage('formatting'):
+                # move to new position safely: move z up
+                texts.append(writer.format_move(Z=((layer + 1) + 3) * thickness, F=6000, comment='move z up') +
+                             writer.format_toolpath(toolpath[:1]) +  # travel to square
+                             writer.format_move(Z=(layer + 1) * thickness, comment='move z down') +  # move z back down
+                             writer.format_toolpath(toolpath[1:], toolpath.xy[0], self.arc_tolerance))  # new square!
+        self.profiler.count('chunks')
+        return texts
 
     def write_layer_begining(self, file, layer):
         """
         assuming layer start at 1 (not 0).
         write down header for new layer (determine z)
-        :param file: to write gcode commands to
+        :param file: to write gcode commands to (file or GcodeWriter)
         :param layer: of print
         """
-        file.write('G92 E0.0\n'
-                   f';{self.thickness * layer}\n'
-                   'G1 E-0.80000 F2100.00000\n'
-                   'G1 Z0.600 F10800.000\n'
-                   f';AFTER_LAYER_CHANGE\n;{self.thickness * layer}\n'
-                   f'G1 X{self.x_start} Y{self.y_start}\n'
-                   f'G1 Z{self.thickness * layer}\n'  # change each layer
-                   'G1 E0.80000 F2100.00000\n'
-                   f'M204 S{self.speed}\n'
-                   f'G1 F{self.speed}\n\n')  ## speed
+        file.write(self.get_layer_begining(layer))
+
+    def get_layer_begining(self, layer):
+        """
+        assuming layer start at 1 (not 0).
+        :param layer: of print
+        :return: header for new layer (determine z)
+        """
+        return ('G92 E0.0\n'
+                f';{self.thickness * layer}\n'
+                'G1 E-0.80000 F2100.00000\n'
+                'G1 Z0.600 F10800.000\n'
+                f';AFTER_LAYER_CHANGE\n;{self.thickness * layer}\n'
+                f'G1 X{self.x_start} Y{self.y_start}\n'
+                f'G1 Z{self.thickness * layer}\n'  # change each layer
+                'G1 E0.80000 F2100.00000\n'
+                f'M204 S{self.speed}\n'
+                f'G1 F{self.speed}\n\n')  ## speed
 
     def get_gcode(self):
         self.create_gcode()
         return self.gcode
 
 
-mtx2 = [[45, 45, 45], [45, 45, 0], [90, 90, 0], [90, 90, 0]]
-mtx1 = [[0,90,90], [0,90,90], [135, 135, 45], [135, 135, 45]]
-print('mtx1', mtx1)
-print('mtx2', mtx2)
+# state of worker processes of AngledGrid.create_gcode(workers=N). sent once per process, not once per chunk.
+_worker_state = {}
+
+
+def _init_worker(grid, sq, precision, strip_zeros):
+    grid.profiler.pop_report()  # drop what the parent process counted before the pool started
+    _worker_state['grid'] = grid
+    _worker_state['sq'] = sq
+    _worker_state['writer'] = GcodeWriter(None, precision=precision, strip_zeros=strip_zeros)
+
+
+def _bounded_map(pool, fn, iterable, window):
+    """
+    like pool.map, but keeps at most window tasks in flight, so results are not piled up in memory faster than they
+    are consumed.
+    :return: yields results by order of iterable
+    """
+    pending = deque()
+    for item in iterable:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _format_cells(task):
+    layer, cells, thickness = task
+    grid = _worker_state['grid']
+    removed = grid.moves_removed
+    text = grid.format_cells(layer, cells, thickness, _worker_state['sq'], _worker_state['writer'])
+    return text, grid.moves_removed - removed, grid.profiler.pop_report()
+
+
+if __name__ == '__main__':
+    mtx2 = [[45, 45, 45], [45, 45, 0], [90, 90, 0], [90, 90, 0]]
+    mtx1 = [[0, 90, 90], [0, 90, 90], [135, 135, 45], [135, 135, 45]]
+    print('mtx1', mtx1)
+    print('mtx2', mtx2)
 
-# create square object, get "write_square" func, write into file
+    # create square object, get "write_square" func, write into file
 
-grid = AngledGrid(10, 0.37, 4, 0.15, 2000, 'ariels1.gcode', mtx1, angles_mtx2=mtx2, num_mtx1=2, y_start=70,
-                  x_start=200)
-grid.create_gcode()
+    grid = AngledGrid(10, 0.37, 4, 0.15, 2000, 'ariels1.gcode', mtx1, angles_mtx2=mtx2, num_mtx1=2, y_start=70,
+                      x_start=200)
+    grid.create_gcode()
 # (self, sq_size, nuzzle_size, layers_num, thickness, speed, file_name, angles_mtx1, angles_mtx2=None,
 #                  thickness_mtx=None, layer_thickness=None, x_start=150, y_start=100, material='pla'):
 
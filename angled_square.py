@@ -1,6 +1,14 @@
+from arc_fit import fit_arcs
 from flat_objects import FlatObject
+from gcode_io import EXTENSIONS, open_gcode
+from gcode_writer import as_writer
+from path_simplify import merge_collinear
+from toolpath import Toolpath
+import logging
 import numpy as np
 
+logger = logging.getLogger(__name__)  # extrusion debug output. enable with logging.DEBUG
+
 
 class AngledSquare(FlatObject):
     '''
@@ -13,7 +21,7 @@ class AngledSquare(FlatObject):
 
     def __init__(self, size, file_name='test', angle=0, nuzzle_size=0.38, layers_num=1, thickness=0.15, x_start=150,
                  y_start=100,
-                 speed=2000, material='pla'):
+                 speed=2000, material='pla', merge_tolerance=None, disk_cache=None, arc_tolerance=None):
 
         """
         :param size: of each squre
@@ -24,12 +32,19 @@ class AngledSquare(FlatObject):
         :param y_start: y position of bottom left corner
         :param speed: of print, mm/min
         :param material: lower case string of print material. effect temperatures.
+        :param merge_tolerance: if given, consecutive collinear moves (within this distance, mm) are merged into one
+        :param disk_cache: DiskToolpathCache to look generated arrays up in (and store them to). None for no caching
+        :param arc_tolerance: if given, runs of moves along circles are written as arcs (G2/G3) within this distance, mm
 
         """
 
-        FlatObject.__init__(self, size, layers_num, thickness, x_start, y_start, speed, material)
+        FlatObject.__init__(self, size, layers_num, thickness, x_start, y_start, speed, nuzzle_size, material)
         self.file_name = file_name
         self.rotated = False
+        self.merge_tolerance = merge_tolerance
+        self.moves_removed = 0  # by merging collinear moves
+        self.disk_cache = disk_cache
+        self.arc_tolerance = arc_tolerance
 
         angle = angle % 360
 
@@ -60,26 +75,54 @@ class AngledSquare(FlatObject):
         self.dx = nuzzle_size / np.abs(np.sin(self.angle)) if self.angle != 0 else self.size
         self.dy = nuzzle_size / np.cos(self.angle) if self.angle != 90 else self.size
 
-    def create_gcode(self):
+    def create_gcode(self, compression=None):
         """
         write to self.gcode the printing instructions by order: write header (print settings), than location and
         extrusion of specific print, than end print.
+        :param compression: of gcode file, compressed while written: 'gzip' (file_name.gcode.gz), 'zstd' (.gcode.zst),
+                'meatpack' (.gcode.mpk) or None (.gcode). see gcode_io
         """
-        with open(f'{self.file_name}.gcode', 'w') as file:
-            file.write(self.header)
-            self.fill_inside(file)
-
-            file.write(self.finish)
+        extension = EXTENSIONS[compression] if compression is not None else ''
+        with open_gcode(f'{self.file_name}.gcode{extension}', 'w', compression) as file:
+            self.write_gcode(file)
 
         self.gcode = file
 
+    def write_gcode(self, file):
+        """
+        write the whole print: header, all layers, end print.
+        :param file: open gcode file or GcodeWriter to write to
+        """
+        writer = as_writer(file)
+        writer.write(self.header)
+        self.fill_inside(writer)
+
+        writer.write(self.finish)
+        writer.flush()
+
     def fill_inside(self, file):
+        """
+        write all layers of the square.
+        :param file: open gcode file or GcodeWriter to write to
+        """
+        writer = as_writer(file)
+
+        # xy path is the same in all layers: generate it once, with its moves' lengths, and format its positions once.
+        # first move starts from (x_start, y_start), where the layer header left the nuzzle
+        pos, lengths, removed = self.generate_path(start=(self.x_start, self.y_start))
+        if self.arc_tolerance is None:
+            template = writer.toolpath_template(Toolpath.from_positions(pos, lengths))
+        else:  # extrusion of fitted moves is proportional to their 'lengths' too
+            arcs = fit_arcs(pos, lengths, (self.x_start, self.y_start), self.arc_tolerance)
+            template, lengths = writer.format_arcs(arcs, e_placeholders=True), arcs['e']
+        self.moves_removed += removed * self.layers_num
+
         for i in range(self.layers_num):
             height = self.thickness * (i + 1)
             # if self.thickness < 0.15 and i == 0:  # not working try to get thinner layers
             #     height = self.thickness * 0.6 * (i + 1)
 
-            file.write(';BEFORE_LAYER_CHANGE '
+            writer.write(';BEFORE_LAYER_CHANGE '
                        'G92 E0.0'
                        ';0.15'
                        f';{height}\n'
@@ -92,35 +135,45 @@ class AngledSquare(FlatObject):
                        f'M204 S{self.speed}\n'
                        f'G1 F{self.speed}\n\n')  ## speed
 
-            pos = self.generate_arrays()
-            for i in range(len(pos)):
-                if i == 0:
-                    # write lines in format: 'G1 Xx Yy Ee', where E == extrusion.
-                    file.write(
-                        f'G1 X{pos[i][0]} Y{pos[i][1]} E{self.get_extrusion(pos[i][0] - self.x_start, pos[i][1] - self.y_start, layer=i)}\n')
-                else:
-                    file.write(
-                        f'G1 X{pos[i][0]} Y{pos[i][1]} E{self.get_extrusion(pos[i][0] - pos[i - 1][0], pos[i][1] - pos[i - 1][1], layer=i)}\n')
+            # write lines in format: 'G1 Xx Yy Ee', where E == extrusion. only extrusion changes between layers
+            writer.write(writer.fill_template(template, lengths * self.get_extrusion_factor(i)))
+
+        if writer is not file:
+            writer.flush()
 
     def generate_arrays(self):
+        """
+        raw position generator of the square: positions only, no extrusion or flags. generate_toolpath wraps them
+        in a Toolpath. kept as bare positions for ToolpathCache and AngledGrid, which translate them.
+        :return: merged (N, 2) array of locations, to iterate and print accordingly. taken from self.disk_cache if
+                it has them (read only), else computed by compute_arrays
+        """
+        if self.disk_cache is None:
+            return self.compute_arrays()
+        # key holds everything the positions depend on
+        return self.disk_cache.get_or_create(self.compute_arrays, size=self.size, angle=self.angle,
+                                             rotated=self.rotated, dx=self.dx, dy=self.dy, x_start=self.x_start,
+                                             y_start=self.y_start)
+
+    def compute_arrays(self):
         """
         create 4 arrays for 4 edges of the square. links them to 2 arrays of 2 adges, accordeing to the travel wanted.
         combines two arrays in a zipper method, 2 locations of each one at a time, to create the weave pattern.
         the locations ans their order are providing the geometry of the shape.
         two edge cases: angle=0 and angle=90
-        :return: merged list of location, to iterate and print accordingly
+        :return: merged (N, 2) array of locations, to iterate and print accordingly
         """
 
         x_array = np.round(np.arange(self.x_start, self.x_end, self.dx), 6)
         y_array = np.round(np.arange(self.y_start, self.y_end, self.dy), 4)
 
         if self.angle == 0:  # iterate only over right and left edges.
-            array2 = [[self.x_start, y] for y in y_array]
-            array1 = [[self.x_end, y] for y in y_array]
+            array2 = self.edge(self.x_start, y_array)
+            array1 = self.edge(self.x_end, y_array)
 
         elif self.angle == np.pi / 2:  # iterate only over bottom and upper edges.
-            array2 = [[x, self.y_start] for x in x_array]
-            array1 = [[x, self.y_end] for x in x_array]
+            array2 = self.edge(x_array, self.y_start)
+            array1 = self.edge(x_array, self.y_end)
 
         else:  # just a nice midvalue angle.
 
@@ -128,63 +181,98 @@ class AngledSquare(FlatObject):
             k = self.y_end - y_array[-1]  # gap between last location on edge to the end of the edge
 
             m = self.dx - k / np.tan(self.angle)  # simple geometry leads to this conclusion
-            x_up = np.round(np.arange(self.x_start + m, self.x_end, self.dx), 4).tolist()
+            x_up = np.round(np.arange(self.x_start + m, self.x_end, self.dx), 4)
 
             # right and left up-shift
             k = self.x_end - x_array[-1]
             m = self.dy - k * np.tan(self.angle)
-            y_right = np.round(np.arange(self.y_start + m, self.y_end, self.dy), 4).tolist()
-
-            # x_up, y_right = self.get_shifted_arrays(x_bottom, y_left) if self.angle != 0 else [],np.round(np.arange(self.y_start, self.y_end, self.dy), 4)
+            y_right = np.round(np.arange(self.y_start + m, self.y_end, self.dy), 4)
 
             if self.rotated:  # angle > 90, hence starting from bottom right corner.
                 # mirrored x positions around x axis
-                bottom = [[self.x_end + self.x_start - x, self.y_start] for x in x_array]  # bottom array
-                up = [[self.x_end + self.x_start - x, self.y_end] for x in x_up]  # upper array
+                bottom = self.edge(self.x_end + self.x_start - x_array, self.y_start)  # bottom array
+                up = self.edge(self.x_end + self.x_start - x_up, self.y_end)  # upper array
 
                 # mirror y array around x axis: y positions stay same, but left and right edges switch sides
-                left = [[self.x_start, y] for y in y_right]  # left edge initiated with right y positions
-                right = [[self.x_end, y] for y in y_array]  # same, vice-versa
+                left = self.edge(self.x_start, y_right)  # left edge initiated with right y positions
+                right = self.edge(self.x_end, y_array)  # same, vice-versa
 
-                array1, array2 = right + up, bottom + left  # first array goes from bottom right corner, up and left. second array goes left and up.
+                # first array goes from bottom right corner, up and left. second array goes left and up.
+                array1, array2 = np.concatenate((right, up)), np.concatenate((bottom, left))
 
             else:  # angle <= 90, hence starting from bottom left corner.
-                bottom = [[x, self.y_start] for x in x_array]
-                up = [[x, self.y_end] for x in x_up]
+                bottom = self.edge(x_array, self.y_start)
+                up = self.edge(x_up, self.y_end)
 
-                left = [[self.x_start, y] for y in y_array]
-                right = [[self.x_end, y] for y in y_right]
+                left = self.edge(self.x_start, y_array)
+                right = self.edge(self.x_end, y_right)
 
-                array1, array2 = bottom + right, left + up
+                array1, array2 = np.concatenate((bottom, right)), np.concatenate((left, up))
 
         # now, merge two arrays into one, alternating 2 position from array1 and then 2 from array2
         arr = self.merge_two_arrays(array1, array2)
 
         return arr
 
+    def generate_path(self, start, positions=None, lengths=None):
+        """
+        xy path of the square and length of each of its moves. same for all layers.
+        :param start: [x_pos, y_pos] the nuzzle moves from to first position
+        :param positions: (N, 2) array of positions, if already generated. None to call generate_arrays
+        :param lengths: array of N moves' lengths, if already computed
+        :return: (positions, lengths, removed). collinear moves merged if self.merge_tolerance, removed - their number
+        """
+        pos = self.generate_arrays() if positions is None else positions
+        if lengths is None:
+            lengths = self.get_move_lengths(pos, start)
+        if self.merge_tolerance is None:
+            return pos, lengths, 0
+        return merge_collinear(pos, lengths, start, self.merge_tolerance)
+
+    def generate_toolpath(self, layer, start, travel=False, positions=None, lengths=None):
+        """
+        printing moves of a layer of the square, with their extrusion. the Toolpath entry point of the square,
+        positions come from generate_arrays.
+        :param layer: of print, starting at 0
+        :param start: [x_pos, y_pos] the nuzzle moves from to first position
+        :param travel: add travel move to start at beginning of toolpath
+        :param positions: (N, 2) array of positions, if already generated. None to call generate_arrays
+        :param lengths: array of N moves' lengths, if already computed
+        :return: Toolpath
+        """
+        pos, lengths, removed = self.generate_path(start, positions, lengths)
+        self.moves_removed += removed
+        return Toolpath.from_positions(pos, lengths * self.get_extrusion_factor(layer), layer=layer,
+                                       travel_to=start if travel else None)
+
+    @staticmethod
+    def edge(x, y):
+        """
+        :param x: x position(s) on edge. scalar or 1d array
+        :param y: y position(s) on edge. scalar or 1d array
+        :return: (N, 2) float array of [x_pos, y_pos] positions along the edge
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        return np.column_stack((x.ravel(), y.ravel()))
+
     def merge_two_arrays(self, array1, array2):
         """
-        merging 2 lists of positions, zipper way, for 3d printer to alternate between both. small step (nuzzle size) on
+        merging 2 arrays of positions, zipper way, for 3d printer to alternate between both. small step (nuzzle size) on
         each line, and long steps between them.
-        :param array1: python list of [x_pos,y_pos]. positions on two edges, for printer to stop on.
-        :param array2: python list of [x_pos,y_pos]. positions on two edges, for printer to stop on.
-        :return: merged array of positions, for printer to stop on. will fill up the surface between the travel lines
-        with perallal lines in certain angle.
-        """
-        arr = []
-        i, j = 0, 1
-        while i < len(array1) - 1 and j < len(array2) - 1:
-            # add 2 from first array
-            arr.append(array1[i])
-            arr.append(array1[i + 1])
-
-            # add 2 from second array
-            arr.append(array2[j])
-            arr.append(array2[j + 1])
-
-            i, j = i + 2, j + 2  # move counters
-        arr = arr + array1[i::] + array2[j::]  # add leftovers
-        return arr
+        :param array1: (N, 2) array (or list) of [x_pos,y_pos]. positions on two edges, for printer to stop on.
+        :param array2: (M, 2) array (or list) of [x_pos,y_pos]. positions on two edges, for printer to stop on.
+        :return: merged (K, 2) array of positions, for printer to stop on. will fill up the surface between the travel
+        lines with perallal lines in certain angle.
+        """
+        array1 = np.asarray(array1, dtype=float).reshape(-1, 2)
+        array2 = np.asarray(array2, dtype=float).reshape(-1, 2)
+
+        # number of zipper steps: 2 from first array (starting at 0), then 2 from second array (starting at 1)
+        steps = max(0, min((len(array1) - 2) // 2 + 1, (len(array2) - 3) // 2 + 1))
+        i, j = 2 * steps, 1 + 2 * steps
+
+        zipper = np.stack((array1[:i].reshape(steps, 2, 2), array2[1:j].reshape(steps, 2, 2)), axis=1)
+        return np.concatenate((zipper.reshape(-1, 2), array1[i:], array2[j:]))  # add leftovers
 
     def get_shifted_arrays(self, x_arr, y_arr):
         """
@@ -205,12 +293,11 @@ class AngledSquare(FlatObject):
         y_right_arr = np.round(np.arange(self.y_start + m, self.y_end, self.dy), 4).tolist()
         return x_up_arr, y_right_arr
 
-    def get_extrusion(self, dx, dy, layer):
+    def get_extrusion_factor(self, layer):
         """
-        still un-sealed formula. not linear with all the parameters.
-        :param dx: distance traveled by machine in x direction
-        :param dy: distance traveled by machine in y direction
-        :return: amount of material to extrude by printer in this move.
+        layer dependent part of the extrusion formula.
+        :param layer: of print, starting at 0
+        :return: amount of material to extrude per mm of travel
         """
         if layer == 0:
             if self.thickness < 0.1:
@@ -221,10 +308,42 @@ class AngledSquare(FlatObject):
         else:
             const = 0.45
 
-        print(self.thickness, ' ', layer)
+        logger.debug('thickness %s layer %s', self.thickness, layer)
+
+        return self.extrusion_const * self.thickness * self.speed * const
+
+    def get_extrusion(self, dx, dy, layer):
+        """
+        still un-sealed formula. not linear with all the parameters.
+        :param dx: distance traveled by machine in x direction
+        :param dy: distance traveled by machine in y direction
+        :return: amount of material to extrude by printer in this move.
+        """
+        return ((dx ** 2 + dy ** 2) ** (1 / 2)) * self.get_extrusion_factor(layer)
+
+    def get_extrusions(self, pos, layer, start=None):
+        """
+        extrusion of a whole path at once.
+        :param pos: (N, 2) array of positions, for printer to stop on
+        :param layer: of print, starting at 0
+        :param start: [x_pos, y_pos] the nuzzle moves from to pos[0]. None - first move extrudes nothing
+        :return: array of N amounts of material to extrude, one per move
+        """
+        return self.get_move_lengths(pos, start) * self.get_extrusion_factor(layer)
 
-        return ((dx ** 2 + dy ** 2) ** (1 / 2)) * self.extrusion_const * self.thickness * self.speed * const
+    @staticmethod
+    def get_move_lengths(pos, start=None):
+        """
+        :param pos: (N, 2) array of positions, for printer to stop on
+        :param start: [x_pos, y_pos] the nuzzle moves from to pos[0]. None - first move has no length
+        :return: array of N distances traveled, one per move
+        """
+        pos = np.asarray(pos, dtype=float).reshape(-1, 2)
+        prepend = pos[:1] if start is None else np.asarray(start, dtype=float).reshape(1, 2)
+        steps = np.diff(pos, axis=0, prepend=prepend)
+        return np.hypot(steps[:, 0], steps[:, 1])
 
 
-sq = AngledSquare(20, file_name='test0.05', thickness=0.05, layers_num=1, angle=0, nuzzle_size=0.3, material='pla')
-sq.create_gcode()
+if __name__ == '__main__':
+    sq = AngledSquare(20, file_name='test0.05', thickness=0.05, layers_num=1, angle=0, nuzzle_size=0.3, material='pla')
+    sq.create_gcode()
@@ -0,0 +1,139 @@
+import numpy as np
+
+# gcode numbers of fitted moves
+LINE = 1  # G1
+CW = 2  # G2, clockwise arc
+CCW = 3  # G3, counter clockwise arc
+
+# one record per fitted move: where it ends, its arc center relative to where it starts (0 for lines), extrusion
+ARC_DTYPE = np.dtype([('x', np.float64), ('y', np.float64), ('i', np.float64), ('j', np.float64), ('e', np.float64),
+                      ('command', np.uint8)])
+
+
+def _circle(a, b, c):
+    """
+    :return: (center, radius) of circle through points a, b, c. radius is inf if they are collinear
+    """
+    ab, ac = b - a, c - a
+    d = 2 * (ab[0] * ac[1] - ab[1] * ac[0])
+    if d == 0:
+        return a, np.inf
+    ab2, ac2 = ab @ ab, ac @ ac
+    offset = np.array([ac[1] * ab2 - ab[1] * ac2, ab[0] * ac2 - ac[0] * ab2]) / d
+    return a + offset, np.hypot(*offset)
+
+
+def _fit(points, a, b, turn, tolerance, max_radius):
+    """
+    :param points: (N, 2) array of positions
+    :param a, b: fit arc from points[a] to points[b], through all points between
+    :param turn: 1 counter clockwise, -1 clockwise
+    :return: (center, radius, sweep) of arc, or None if some point or chord is further than tolerance from it
+    """
+    run = points[a:b + 1]
+    center, radius = _circle(run[0], run[(b - a) // 2], run[-1])
+    if radius > max_radius:
+        return None
+    offset = run - center
+    if np.abs(np.hypot(offset[:, 0], offset[:, 1]) - radius).max() > tolerance:
+        return None
+    # chords cut inside the arc by up to their sagitta
+    half = np.hypot(*np.diff(run, axis=0).T) / 2
+    if (half > radius).any() or (radius - np.sqrt(radius ** 2 - half ** 2)).max() > tolerance:
+        return None
+    step = np.diff(np.unwrap(np.arctan2(offset[:, 1], offset[:, 0])))
+    if (step * turn <= 0).any() or abs(step.sum()) >= 2 * np.pi - 1e-6:
+        return None
+    return center, radius, abs(step.sum())
+
+
+def fit_arcs(positions, extrusion, start, tolerance=0.01, min_moves=3, max_radius=1000):
+    """
+    replace runs of short moves along a circle with single arc moves (G2/G3). an arc's extrusion is the extrusion per
+    mm of the moves it replaces, over its length.
+    :param positions: (N, 2) array of positions, for printer to stop on
+    :param extrusion: array of N amounts of material to extrude, one per move (or anything proportional to it, like
+            the moves' lengths)
+    :param start: [x_pos, y_pos] the nuzzle moves from to positions[0]
+    :param tolerance: max distance (mm) of a replaced position, or move, from its arc
+    :param min_moves: min number of moves to replace by an arc
+    :param max_radius: of arcs (mm). flatter runs are left as lines
+    :return: structured array of ARC_DTYPE, fitted moves by order
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    extrusion = np.asarray(extrusion, dtype=float)
+    n = len(positions)
+    points = np.vstack((np.asarray(start, dtype=float).reshape(1, 2), positions))  # points[m] -> points[m + 1] is move m
+
+    # turn at each inner point. an arc can only run over inner points all turning the same way
+    turn = np.zeros(n + 1, dtype=np.int8)
+    if n >= 2:
+        before, after = points[1:-1] - points[:-2], points[2:] - points[1:-1]
+        cross = before[:, 0] * after[:, 1] - before[:, 1] * after[:, 0]
+        scale = np.hypot(before[:, 0], before[:, 1]) * np.hypot(after[:, 0], after[:, 1])
+        turn[1:-1] = np.where(np.abs(cross) > 1e-9 * np.maximum(scale, 1e-12), np.sign(cross), 0)
+    # last point of each run of same turn: arcs from point a can reach at most run_end[a + 1] + 1
+    index = np.arange(n + 1)
+    new_run = np.concatenate(([True], turn[1:] != turn[:-1]))
+    run_id = np.cumsum(new_run) - 1
+    run_end = np.append(np.flatnonzero(new_run)[1:] - 1, n)[run_id]
+    # points an arc of min_moves can start at
+    starts = np.flatnonzero((turn[np.minimum(index + 1, n)] != 0) & (run_end[np.minimum(index + 1, n)] + 1 >= index +
+                                                                      min_moves) & (index + min_moves <= n))
+
+    lines = np.zeros(n, dtype=bool)  # moves left as lines
+    arcs = []  # (a, b, center, radius, sweep, turn) - arc replacing moves a to b - 1
+    a = 0
+    while a < n:
+        k = np.searchsorted(starts, a)
+        if k == len(starts):
+            lines[a:] = True
+            break
+        if starts[k] > a:
+            lines[a:starts[k]] = True
+            a = starts[k]
+        direction = turn[a + 1]
+        limit = run_end[a + 1] + 1
+        fitted = _fit(points, a, a + min_moves, direction, tolerance, max_radius)
+        if fitted is None:
+            lines[a] = True
+            a += 1
+            continue
+
+        # longest arc from a: double its length while it fits, than bisect
+        good, step = a + min_moves, min_moves
+        while good < limit:
+            trial = min(good + step, limit)
+            attempt = _fit(points, a, trial, direction, tolerance, max_radius)
+            if attempt is None:
+                bad = trial
+                while bad - good > 1:
+                    middle = (good + bad) // 2
+                    attempt = _fit(points, a, middle, direction, tolerance, max_radius)
+                    if attempt is None:
+                        bad = middle
+                    else:
+                        good, fitted = middle, attempt
+                break
+            good, fitted = trial, attempt
+            step *= 2
+        arcs.append((a, good, *fitted, direction))
+        a = good
+
+    # assemble by order of first replaced move
+    firsts = np.concatenate((np.flatnonzero(lines), [arc[0] for arc in arcs])).astype(int)
+    order = np.argsort(firsts, kind='stable')
+    out = np.zeros(len(firsts), dtype=ARC_DTYPE)
+    line_moves = np.flatnonzero(lines)
+    count = len(line_moves)
+    out['x'][:count], out['y'][:count] = positions[line_moves, 0], positions[line_moves, 1]
+    out['e'][:count] = extrusion[line_moves]
+    out['command'][:count] = LINE
+    lengths = np.hypot(*np.diff(points, axis=0).T)
+    for k, (first, last, center, radius, sweep, direction) in enumerate(arcs, start=count):
+        out['x'][k], out['y'][k] = points[last]
+        out['i'][k], out['j'][k] = center - points[first]
+        chord_length = lengths[first:last].sum()
+        out['e'][k] = extrusion[first:last].sum() * (radius * sweep / chord_length if chord_length > 0 else 1)
+        out['command'][k] = CCW if direction > 0 else CW
+    return out[order]
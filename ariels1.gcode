@@ -0,0 +1,3364 @@
+
+; external perimeters extrusion width = 0.45mm
+; perimeters extrusion width = 0.45mm
+; infill extrusion width = 0.45mm
+; solid infill extrusion width = 0.45mm
+; top infill extrusion width = 0.40mm
+; first layer extrusion width = 0.42mm
+M73 P0 R1
+M73 Q0 S1
+M201 X1000 Y1000 Z1000 E5000 ; sets maximum accelerations, mm/sec^2
+M203 X200 Y200 Z12 E120 ; sets maximum feedrates, mm/sec
+M204 P1250 R1250 T1250 ; sets acceleration (P, T) and retract acceleration (R), mm/sec^2
+M205 X8.00 Y8.00 Z0.40 E4.50 ; sets the jerk limits, mm/sec
+M205 S0 T0 ; sets the minimum extruding and travel feed rate, mm/sec
+M862.3 P "MK3" ; printer model check
+M862.1 P0.4 ; nozzle diameter check
+M115 U3.8.1 ; tell printer latest fw version
+G90 ; use absolute coordinates
+M83 ; extruder relative mode
+M104 S200 ; set extruder temp
+M140 S60 ; set bed temp
+M190 S60 ; wait for bed temp
+M109 S200 ; wait for extruder temp
+G28 W ; home all without mesh bed level
+G80 ; mesh bed leveling
+G1 Y-3.0 F1000.0 ; go outside print area
+G92 E0.0
+G1 X60.0 E9.0 F1000.0 ; intro line
+M73 Q5 S1
+M73 P5 R1
+G1 X100.0 E12.5 F1000.0 ; intro line
+G92 E0.0
+M221 S95
+G21 ; set units to millimeters
+G90 ; use absolute coordinates
+M83 ; use relative distances for extrusion
+M900 K30 ; Filament gcode
+M106 S255G92 E0.0
+;0.15
+G1 E-0.80000 F2100.00000
+G1 Z0.600 F10800.000
+;AFTER_LAYER_CHANGE
+;0.15
+G1 X200 Y70
+G1 Z0.15
+G1 E0.80000 F2100.00000
+M204 S2000
+G1 F2000
+
+G1 Z0.6 F6000.0; move z up
+G0 X200.0 Y70.0
+G1 Z0.15; move z down 
+G1 X210.0 Y70.0 E0.3468892805904711
+G1 X210.0 Y70.5233 E0.012910700609764666
+G1 X209.476741 Y70.0 E0.01825777264949695
+G1 X208.953482 Y70.0 E0.012909689070064434
+G1 X210.0 Y71.0465 E0.036513800719685276
+G1 X210.0 Y71.5698 E0.012910700609764666
+G1 X208.430223 Y70.0 E0.05477157335529104
+G1 X207.906964 Y70.0 E0.012909689070065136
+G1 X210.0 Y72.093 E0.0730276014393713
+G1 X210.0 Y72.6163 E0.012910700609764314
+G1 X207.383705 Y70.0 E0.09128537407219847
+G1 X206.860446 Y70.0 E0.012909689070064434
+G1 X210.0 Y73.1396 E0.10954314671058257
+G1 X210.0 Y73.6628 E0.012908233439764629
+G1 X206.337187 Y70.0 E0.12779917479069325
+G1 X205.813928 Y70.0 E0.012909689070064434
+G1 X210.0 Y74.1861 E0.14605694742679493
+G1 X210.0 Y74.7093 E0.012908233439764629
+G1 X205.290669 Y70.0 E0.16431297550971705
+G1 X204.76741 Y70.0 E0.012909689070064434
+G1 X210.0 Y75.2326 E0.1825707481443967
+G1 X210.0 Y75.7558 E0.012908233439764279
+G1 X204.244151 Y70.0 E0.20082677622898185
+G1 X203.720892 Y70.0 E0.012909689070064434
+G1 X210.0 Y76.2791 E0.2190845488626933
+G1 X210.0 Y76.8024 E0.012910700609764666
+G1 X203.197633 Y70.0 E0.2373423214988334
+G1 X202.674374 Y70.0 E0.012909689070064434
+G1 X210.0 Y77.3256 E0.2555983495813864
+G1 X210.0 Y77.8489 E0.012910700609764666
+G1 X202.151115 Y70.0 E0.2738561222165951
+G1 X201.627856 Y70.0 E0.012909689070064434
+G1 X210.0 Y78.3721 E0.29211215030032756
+G1 X210.0 Y78.8954 E0.012910700609764314
+G1 X201.104597 Y70.0 E0.31036992293480953
+G1 X200.581338 Y70.0 E0.012909689070065136
+G1 X210.0 Y79.4187 E0.32862769557096055
+G1 X210.0 Y79.9419 E0.012908233439764629
+G1 X200.058079 Y70.0 E0.3468837236533343
+G1 X200.0 Y70.4652 E0.011566376360918902
+G1 X209.5348 Y80.0 E0.3326792097241233
+G1 X209.0116 Y80.0 E0.012908233439764629
+G1 X200.0 Y70.9884 E0.31442421092733036
+G1 X200.0 Y71.5117 E0.012910700609764666
+G1 X208.4883 Y80.0 E0.2961657230252631
+G1 X207.9651 Y80.0 E0.012908233439764629
+G1 X200.0 Y72.035 E0.27790897968130857
+G1 X200.0 Y72.5582 E0.012908233439764629
+G1 X207.4418 Y80.0 E0.2596522363264025
+G1 X206.9185 Y80.0 E0.012910700609764666
+G1 X200.0 Y73.0815 E0.2413937484243347
+G1 X200.0 Y73.6047 E0.012908233439764279
+G1 X206.3953 Y80.0 E0.2231387496275419
+G1 X205.872 Y80.0 E0.012910700609763966
+G1 X200.0 Y74.128 E0.20488026172547466
+G1 X200.0 Y74.6513 E0.012910700609764666
+G1 X205.3488 Y80.0 E0.18662351838419824
+G1 X204.8255 Y80.0 E0.012910700609764666
+G1 X200.0 Y75.1745 E0.16836677502661407
+G1 X200.0 Y75.6978 E0.012910700609764666
+G1 X204.3023 Y80.0 E0.15011003168732112
+G1 X203.779 Y80.0 E0.012910700609764666
+G1 X200.0 Y76.221 E0.13185328832775323
+G1 X200.0 Y76.7443 E0.012910700609764314
+G1 X203.2557 Y80.0 E0.11359480042568568
+G1 X202.7325 Y80.0 E0.012908233439764629
+G1 X200.0 Y77.2675 E0.09533980162889265
+G1 X200.0 Y77.7908 E0.012910700609764666
+G1 X202.2092 Y80.0 E0.07708131372682538
+G1 X201.686 Y80.0 E0.012908233439764629
+G1 X200.0 Y78.3141 E0.0588245704032642
+G1 X200.0 Y78.8373 E0.012908233439764629
+G1 X201.1627 Y80.0 E0.04056782702796479
+G1 X200.6394 Y80.0 E0.012910700609764666
+G1 X200.0 Y79.3606 E0.022309339125897016
+G1 X200.0 Y79.8838 E0.012908233439764279
+G1 X200.1162 Y80.0 E0.004054340329104216
+G1 Z0.6 F6000.0; move z up
+G0 X200.0 Y80.185
+G1 Z0.15; move z down 
+G1 X210.0 Y80.185 E0.3468892805904711
+G1 X210.0 Y80.7083 E0.012910700609764314
+G1 X209.476741 Y80.185 E0.018257772649496705
+G1 X208.953482 Y80.185 E0.012909689070064434
+G1 X210.0 Y81.2315 E0.036513800719685276
+G1 X210.0 Y81.7548 E0.012910700609764666
+G1 X208.430223 Y80.185 E0.05477157335529104
+G1 X207.906964 Y80.185 E0.012909689070065136
+G1 X210.0 Y82.278 E0.0730276014393713
+G1 X210.0 Y82.8013 E0.012910700609764314
+G1 X207.383705 Y80.185 E0.09128537407219847
+G1 X206.860446 Y80.185 E0.012909689070064434
+G1 X210.0 Y83.3246 E0.10954314671058257
+G1 X210.0 Y83.8478 E0.012908233439764629
+G1 X206.337187 Y80.185 E0.12779917479069325
+G1 X205.813928 Y80.185 E0.012909689070064434
+G1 X210.0 Y84.3711 E0.14605694742679493
+G1 X210.0 Y84.8943 E0.012908233439764629
+G1 X205.290669 Y80.185 E0.16431297550971705
+G1 X204.76741 Y80.185 E0.012909689070064434
+G1 X210.0 Y85.4176 E0.18257074814439642
+G1 X210.0 Y85.9408 E0.012908233439764629
+G1 X204.244151 Y80.185 E0.20082677622898185
+G1 X203.720892 Y80.185 E0.012909689070064434
+G1 X210.0 Y86.4641 E0.2190845488626933
+G1 X210.0 Y86.9874 E0.012910700609764314
+G1 X203.197633 Y80.185 E0.23734232149883308
+G1 X202.674374 Y80.185 E0.012909689070064434
+G1 X210.0 Y87.5106 E0.2555983495813864
+G1 X210.0 Y88.0339 E0.012910700609764666
+G1 X202.151115 Y80.185 E0.2738561222165951
+G1 X201.627856 Y80.185 E0.012909689070064434
+G1 X210.0 Y88.5571 E0.29211215030032756
+G1 X210.0 Y89.0804 E0.012910700609764314
+G1 X201.104597 Y80.185 E0.31036992293480953
+G1 X200.581338 Y80.185 E0.012909689070065136
+G1 X210.0 Y89.6037 E0.32862769557096055
+G1 X210.0 Y90.1269 E0.012908233439764629
+G1 X200.058079 Y80.185 E0.3468837236533343
+G1 X200.0 Y80.6502 E0.011566376360918902
+G1 X209.5348 Y90.185 E0.3326792097241233
+G1 X209.0116 Y90.185 E0.012908233439764629
+G1 X200.0 Y81.1734 E0.31442421092733036
+G1 X200.0 Y81.6967 E0.012910700609764666
+G1 X208.4883 Y90.185 E0.2961657230252631
+G1 X207.9651 Y90.185 E0.012908233439764629
+G1 X200.0 Y82.22 E0.27790897968130857
+G1 X200.0 Y82.7432 E0.012908233439764629
+G1 X207.4418 Y90.185 E0.2596522363264025
+G1 X206.9185 Y90.185 E0.012910700609764666
+G1 X200.0 Y83.2665 E0.24139374842433495
+G1 X200.0 Y83.7897 E0.012908233439764629
+G1 X206.3953 Y90.185 E0.2231387496275419
+G1 X205.872 Y90.185 E0.012910700609763966
+G1 X200.0 Y84.313 E0.20488026172547466
+G1 X200.0 Y84.8363 E0.012910700609764314
+G1 X205.3488 Y90.185 E0.1866235183841985
+G1 X204.8255 Y90.185 E0.012910700609764666
+G1 X200.0 Y85.3595 E0.16836677502661407
+G1 X200.0 Y85.8828 E0.012910700609764666
+G1 X204.3023 Y90.185 E0.15011003168732112
+G1 X203.779 Y90.185 E0.012910700609764666
+G1 X200.0 Y86.406 E0.13185328832775323
+G1 X200.0 Y86.9293 E0.012910700609764314
+G1 X203.2557 Y90.185 E0.11359480042568568
+G1 X202.7325 Y90.185 E0.012908233439764629
+G1 X200.0 Y87.4525 E0.09533980162889265
+G1 X200.0 Y87.9758 E0.012910700609764666
+G1 X202.2092 Y90.185 E0.07708131372682538
+G1 X201.686 Y90.185 E0.012908233439764629
+G1 X200.0 Y88.4991 E0.0588245704032642
+G1 X200.0 Y89.0223 E0.012908233439764629
+G1 X201.1627 Y90.185 E0.04056782702796479
+G1 X200.6394 Y90.185 E0.012910700609764666
+G1 X200.0 Y89.5456 E0.022309339125897262
+G1 X200.0 Y90.0688 E0.012908233439764629
+G1 X200.1162 Y90.185 E0.004054340329104216
+G1 Z0.6 F6000.0; move z up
+G0 X200.0 Y90.37
+G1 Z0.15; move z down 
+G1 X210.0 Y90.37 E0.3487361158335391
+G1 X210.0 Y90.74 E0.009128528999833263
+G1 X200.0 Y90.74 E0.24671699999550004
+G1 X200.0 Y91.11 E0.009128528999833612
+G1 X210.0 Y91.11 E0.24671699999550004
+G1 X210.0 Y91.48 E0.009128528999833612
+G1 X200.0 Y91.48 E0.24671699999550004
+G1 X200.0 Y91.85 E0.009128528999833263
+G1 X210.0 Y91.85 E0.24671699999550004
+G1 X210.0 Y92.22 E0.009128528999833612
+G1 X200.0 Y92.22 E0.24671699999550004
+G1 X200.0 Y92.59 E0.009128528999833612
+G1 X210.0 Y92.59 E0.24671699999550004
+G1 X210.0 Y92.96 E0.009128528999833263
+G1 X200.0 Y92.96 E0.24671699999550004
+G1 X200.0 Y93.33 E0.009128528999833612
+G1 X210.0 Y93.33 E0.24671699999550004
+G1 X210.0 Y93.7 E0.009128528999833612
+G1 X200.0 Y93.7 E0.24671699999550004
+G1 X200.0 Y94.07 E0.009128528999833263
+G1 X210.0 Y94.07 E0.24671699999550004
+G1 X210.0 Y94.44 E0.009128528999833612
+G1 X200.0 Y94.44 E0.24671699999550004
+G1 X200.0 Y94.81 E0.009128528999833612
+G1 X210.0 Y94.81 E0.24671699999550004
+G1 X210.0 Y95.18 E0.009128528999833612
+G1 X200.0 Y95.18 E0.24671699999550004
+G1 X200.0 Y95.55 E0.009128528999833263
+G1 X210.0 Y95.55 E0.24671699999550004
+G1 X210.0 Y95.92 E0.009128528999833612
+G1 X200.0 Y95.92 E0.24671699999550004
+G1 X200.0 Y96.29 E0.009128528999833612
+G1 X210.0 Y96.29 E0.24671699999550004
+G1 X210.0 Y96.66 E0.009128528999833263
+G1 X200.0 Y96.66 E0.24671699999550004
+G1 X200.0 Y97.03 E0.009128528999833612
+G1 X210.0 Y97.03 E0.24671699999550004
+G1 X210.0 Y97.4 E0.009128528999833612
+G1 X200.0 Y97.4 E0.24671699999550004
+G1 X200.0 Y97.77 E0.009128528999833263
+G1 X210.0 Y97.77 E0.24671699999550004
+G1 X210.0 Y98.14 E0.009128528999833612
+G1 X200.0 Y98.14 E0.24671699999550004
+G1 X200.0 Y98.51 E0.009128528999833612
+G1 X210.0 Y98.51 E0.24671699999550004
+G1 X210.0 Y98.88 E0.009128528999833263
+G1 X200.0 Y98.88 E0.24671699999550004
+G1 X200.0 Y99.25 E0.009128528999833612
+G1 X210.0 Y99.25 E0.24671699999550004
+G1 X210.0 Y99.62 E0.009128528999833612
+G1 X200.0 Y99.62 E0.24671699999550004
+G1 X200.0 Y99.99 E0.009128528999833263
+G1 X210.0 Y99.99 E0.24671699999550004
+G1 X210.0 Y100.36 E0.009128528999833612
+G1 X200.0 Y100.36 E0.24671699999550004
+G1 Z0.6 F6000.0; move z up
+G0 X200.0 Y100.555
+G1 Z0.15; move z down 
+G1 X210.0 Y100.555 E0.3487361158335391
+G1 X210.0 Y100.925 E0.009128528999833263
+G1 X200.0 Y100.925 E0.24671699999550004
+G1 X200.0 Y101.295 E0.009128528999833612
+G1 X210.0 Y101.295 E0.24671699999550004
+G1 X210.0 Y101.665 E0.009128528999833612
+G1 X200.0 Y101.665 E0.24671699999550004
+G1 X200.0 Y102.035 E0.009128528999833263
+G1 X210.0 Y102.035 E0.24671699999550004
+G1 X210.0 Y102.405 E0.009128528999833612
+G1 X200.0 Y102.405 E0.24671699999550004
+G1 X200.0 Y102.775 E0.009128528999833612
+G1 X210.0 Y102.775 E0.24671699999550004
+G1 X210.0 Y103.145 E0.009128528999833263
+G1 X200.0 Y103.145 E0.24671699999550004
+G1 X200.0 Y103.515 E0.009128528999833612
+G1 X210.0 Y103.515 E0.24671699999550004
+G1 X210.0 Y103.885 E0.009128528999833612
+G1 X200.0 Y103.885 E0.24671699999550004
+G1 X200.0 Y104.255 E0.009128528999833263
+G1 X210.0 Y104.255 E0.24671699999550004
+G1 X210.0 Y104.625 E0.009128528999833612
+G1 X200.0 Y104.625 E0.24671699999550004
+G1 X200.0 Y104.995 E0.009128528999833612
+G1 X210.0 Y104.995 E0.24671699999550004
+G1 X210.0 Y105.365 E0.009128528999833263
+G1 X200.0 Y105.365 E0.24671699999550004
+G1 X200.0 Y105.735 E0.009128528999833612
+G1 X210.0 Y105.735 E0.24671699999550004
+G1 X210.0 Y106.105 E0.009128528999833612
+G1 X200.0 Y106.105 E0.24671699999550004
+G1 X200.0 Y106.475 E0.009128528999833263
+G1 X210.0 Y106.475 E0.24671699999550004
+G1 X210.0 Y106.845 E0.009128528999833612
+G1 X200.0 Y106.845 E0.24671699999550004
+G1 X200.0 Y107.215 E0.009128528999833612
+G1 X210.0 Y107.215 E0.24671699999550004
+G1 X210.0 Y107.585 E0.009128528999833263
+G1 X200.0 Y107.585 E0.24671699999550004
+G1 X200.0 Y107.955 E0.009128528999833612
+G1 X210.0 Y107.955 E0.24671699999550004
+G1 X210.0 Y108.325 E0.009128528999833612
+G1 X200.0 Y108.325 E0.24671699999550004
+G1 X200.0 Y108.695 E0.009128528999833263
+G1 X210.0 Y108.695 E0.24671699999550004
+G1 X210.0 Y109.065 E0.009128528999833612
+G1 X200.0 Y109.065 E0.24671699999550004
+G1 X200.0 Y109.435 E0.009128528999833612
+G1 X210.0 Y109.435 E0.24671699999550004
+G1 X210.0 Y109.805 E0.009128528999833612
+G1 X200.0 Y109.805 E0.24671699999550004
+G1 X200.0 Y110.175 E0.009128528999833263
+G1 X210.0 Y110.175 E0.24671699999550004
+G1 X210.0 Y110.545 E0.009128528999833612
+G1 X200.0 Y110.545 E0.24671699999550004
+G1 Z0.6 F6000.0; move z up
+G0 X210.185 Y70.0
+G1 Z0.15; move z down 
+G1 X220.185 Y70.0 E0.3468892805904711
+G1 X220.185 Y70.5233 E0.012910700609764666
+G1 X219.661741 Y70.0 E0.01825777264949695
+G1 X219.138482 Y70.0 E0.012909689070064434
+G1 X220.185 Y71.0465 E0.036513800719685276
+G1 X220.185 Y71.5698 E0.012910700609764666
+G1 X218.61522300000001 Y70.0 E0.05477157335529104
+G1 X218.09196400000002 Y70.0 E0.012909689070064434
+G1 X220.185 Y72.093 E0.07302760143937082
+G1 X220.185 Y72.6163 E0.012910700609764314
+G1 X217.568705 Y70.0 E0.09128537407219847
+G1 X217.045446 Y70.0 E0.012909689070064434
+G1 X220.185 Y73.1396 E0.10954314671058257
+G1 X220.185 Y73.6628 E0.012908233439764629
+G1 X216.522187 Y70.0 E0.12779917479069325
+G1 X215.998928 Y70.0 E0.012909689070064434
+G1 X220.185 Y74.1861 E0.14605694742679493
+G1 X220.185 Y74.7093 E0.012908233439764629
+G1 X215.475669 Y70.0 E0.16431297550971705
+G1 X214.95241000000001 Y70.0 E0.012909689070064434
+G1 X220.185 Y75.2326 E0.1825707481443967
+G1 X220.185 Y75.7558 E0.012908233439764279
+G1 X214.42915100000002 Y70.0 E0.20082677622898135
+G1 X213.905892 Y70.0 E0.012909689070065136
+G1 X220.185 Y76.2791 E0.2190845488626933
+G1 X220.185 Y76.8024 E0.012910700609764666
+G1 X213.382633 Y70.0 E0.2373423214988334
+G1 X212.859374 Y70.0 E0.012909689070064434
+G1 X220.185 Y77.3256 E0.2555983495813864
+G1 X220.185 Y77.8489 E0.012910700609764666
+G1 X212.336115 Y70.0 E0.2738561222165951
+G1 X211.812856 Y70.0 E0.012909689070064434
+G1 X220.185 Y78.3721 E0.29211215030032756
+G1 X220.185 Y78.8954 E0.012910700609764314
+G1 X211.28959700000001 Y70.0 E0.31036992293480953
+G1 X210.766338 Y70.0 E0.012909689070065136
+G1 X220.185 Y79.4187 E0.32862769557096055
+G1 X220.185 Y79.9419 E0.012908233439764629
+G1 X210.243079 Y70.0 E0.3468837236533343
+G1 X210.185 Y70.4652 E0.011566376360918902
+G1 X219.7198 Y80.0 E0.3326792097241233
+G1 X219.19660000000002 Y80.0 E0.012908233439763927
+G1 X210.185 Y70.9884 E0.31442421092733086
+G1 X210.185 Y71.5117 E0.012910700609764666
+G1 X218.6733 Y80.0 E0.2961657230252631
+G1 X218.1501 Y80.0 E0.012908233439764629
+G1 X210.185 Y72.035 E0.27790897968130857
+G1 X210.185 Y72.5582 E0.012908233439764629
+G1 X217.6268 Y80.0 E0.2596522363264025
+G1 X217.1035 Y80.0 E0.012910700609764666
+G1 X210.185 Y73.0815 E0.2413937484243347
+G1 X210.185 Y73.6047 E0.012908233439764279
+G1 X216.5803 Y80.0 E0.2231387496275419
+G1 X216.05700000000002 Y80.0 E0.012910700609763966
+G1 X210.185 Y74.128 E0.20488026172547466
+G1 X210.185 Y74.6513 E0.012910700609764666
+G1 X215.5338 Y80.0 E0.18662351838419824
+G1 X215.0105 Y80.0 E0.012910700609764666
+G1 X210.185 Y75.1745 E0.16836677502661407
+G1 X210.185 Y75.6978 E0.012910700609764666
+G1 X214.4873 Y80.0 E0.15011003168732112
+G1 X213.964 Y80.0 E0.012910700609764666
+G1 X210.185 Y76.221 E0.13185328832775323
+G1 X210.185 Y76.7443 E0.012910700609764314
+G1 X213.4407 Y80.0 E0.11359480042568568
+G1 X212.91750000000002 Y80.0 E0.012908233439763927
+G1 X210.185 Y77.2675 E0.09533980162889315
+G1 X210.185 Y77.7908 E0.012910700609764666
+G1 X212.3942 Y80.0 E0.07708131372682538
+G1 X211.871 Y80.0 E0.012908233439764629
+G1 X210.185 Y78.3141 E0.0588245704032642
+G1 X210.185 Y78.8373 E0.012908233439764629
+G1 X211.3477 Y80.0 E0.04056782702796479
+G1 X210.8244 Y80.0 E0.012910700609764666
+G1 X210.185 Y79.3606 E0.022309339125897016
+G1 X210.185 Y79.8838 E0.012908233439764279
+G1 X210.3012 Y80.0 E0.004054340329104216
+G1 Z0.6 F6000.0; move z up
+G0 X210.185 Y80.185
+G1 Z0.15; move z down 
+G1 X220.185 Y80.185 E0.3468892805904711
+G1 X220.185 Y80.7083 E0.012910700609764314
+G1 X219.661741 Y80.185 E0.018257772649496705
+G1 X219.138482 Y80.185 E0.012909689070064434
+G1 X220.185 Y81.2315 E0.036513800719685276
+G1 X220.185 Y81.7548 E0.012910700609764666
+G1 X218.61522300000001 Y80.185 E0.05477157335529104
+G1 X218.09196400000002 Y80.185 E0.012909689070064434
+G1 X220.185 Y82.278 E0.07302760143937082
+G1 X220.185 Y82.8013 E0.012910700609764314
+G1 X217.568705 Y80.185 E0.09128537407219847
+G1 X217.045446 Y80.185 E0.012909689070064434
+G1 X220.185 Y83.3246 E0.10954314671058257
+G1 X220.185 Y83.8478 E0.012908233439764629
+G1 X216.522187 Y80.185 E0.12779917479069325
+G1 X215.998928 Y80.185 E0.012909689070064434
+G1 X220.185 Y84.3711 E0.14605694742679493
+G1 X220.185 Y84.8943 E0.012908233439764629
+G1 X215.475669 Y80.185 E0.16431297550971705
+G1 X214.95241000000001 Y80.185 E0.012909689070064434
+G1 X220.185 Y85.4176 E0.18257074814439642
+G1 X220.185 Y85.9408 E0.012908233439764629
+G1 X214.42915100000002 Y80.185 E0.20082677622898135
+G1 X213.905892 Y80.185 E0.012909689070065136
+G1 X220.185 Y86.4641 E0.2190845488626933
+G1 X220.185 Y86.9874 E0.012910700609764314
+G1 X213.382633 Y80.185 E0.23734232149883308
+G1 X212.859374 Y80.185 E0.012909689070064434
+G1 X220.185 Y87.5106 E0.2555983495813864
+G1 X220.185 Y88.0339 E0.012910700609764666
+G1 X212.336115 Y80.185 E0.2738561222165951
+G1 X211.812856 Y80.185 E0.012909689070064434
+G1 X220.185 Y88.5571 E0.29211215030032756
+G1 X220.185 Y89.0804 E0.012910700609764314
+G1 X211.28959700000001 Y80.185 E0.31036992293480953
+G1 X210.766338 Y80.185 E0.012909689070065136
+G1 X220.185 Y89.6037 E0.32862769557096055
+G1 X220.185 Y90.1269 E0.012908233439764629
+G1 X210.243079 Y80.185 E0.3468837236533343
+G1 X210.185 Y80.6502 E0.011566376360918902
+G1 X219.7198 Y90.185 E0.3326792097241233
+G1 X219.19660000000002 Y90.185 E0.012908233439763927
+G1 X210.185 Y81.1734 E0.31442421092733086
+G1 X210.185 Y81.6967 E0.012910700609764666
+G1 X218.6733 Y90.185 E0.2961657230252631
+G1 X218.1501 Y90.185 E0.012908233439764629
+G1 X210.185 Y82.22 E0.27790897968130857
+G1 X210.185 Y82.7432 E0.012908233439764629
+G1 X217.6268 Y90.185 E0.2596522363264025
+G1 X217.1035 Y90.185 E0.012910700609764666
+G1 X210.185 Y83.2665 E0.24139374842433495
+G1 X210.185 Y83.7897 E0.012908233439764629
+G1 X216.5803 Y90.185 E0.2231387496275419
+G1 X216.05700000000002 Y90.185 E0.012910700609763966
+G1 X210.185 Y84.313 E0.20488026172547466
+G1 X210.185 Y84.8363 E0.012910700609764314
+G1 X215.5338 Y90.185 E0.1866235183841985
+G1 X215.0105 Y90.185 E0.012910700609764666
+G1 X210.185 Y85.3595 E0.16836677502661407
+G1 X210.185 Y85.8828 E0.012910700609764666
+G1 X214.4873 Y90.185 E0.15011003168732112
+G1 X213.964 Y90.185 E0.012910700609764666
+G1 X210.185 Y86.406 E0.13185328832775323
+G1 X210.185 Y86.9293 E0.012910700609764314
+G1 X213.4407 Y90.185 E0.11359480042568568
+G1 X212.91750000000002 Y90.185 E0.012908233439763927
+G1 X210.185 Y87.4525 E0.09533980162889315
+G1 X210.185 Y87.9758 E0.012910700609764666
+G1 X212.3942 Y90.185 E0.07708131372682538
+G1 X211.871 Y90.185 E0.012908233439764629
+G1 X210.185 Y88.4991 E0.0588245704032642
+G1 X210.185 Y89.0223 E0.012908233439764629
+G1 X211.3477 Y90.185 E0.04056782702796479
+G1 X210.8244 Y90.185 E0.012910700609764666
+G1 X210.185 Y89.5456 E0.022309339125897262
+G1 X210.185 Y90.0688 E0.012908233439764629
+G1 X210.3012 Y90.185 E0.004054340329104216
+G1 Z0.6 F6000.0; move z up
+G0 X210.185 Y90.37
+G1 Z0.15; move z down 
+G1 X210.185 Y100.37 E0.34873611583353936
+G1 X210.555 Y100.37 E0.009128528999833612
+G1 X210.555 Y90.37 E0.24671699999550004
+G1 X210.925 Y90.37 E0.009128528999833612
+G1 X210.925 Y100.37 E0.24671699999550004
+G1 X211.295 Y100.37 E0.009128528999832911
+G1 X211.295 Y90.37 E0.24671699999550004
+G1 X211.665 Y90.37 E0.009128528999833612
+G1 X211.665 Y100.37 E0.24671699999550004
+G1 X212.035 Y100.37 E0.009128528999833612
+G1 X212.035 Y90.37 E0.24671699999550004
+G1 X212.405 Y90.37 E0.009128528999833612
+G1 X212.405 Y100.37 E0.24671699999550004
+G1 X212.775 Y100.37 E0.009128528999833612
+G1 X212.775 Y90.37 E0.24671699999550004
+G1 X213.145 Y90.37 E0.009128528999833612
+G1 X213.145 Y100.37 E0.24671699999550004
+G1 X213.515 Y100.37 E0.009128528999832911
+G1 X213.515 Y90.37 E0.24671699999550004
+G1 X213.885 Y90.37 E0.009128528999833612
+G1 X213.885 Y100.37 E0.24671699999550004
+G1 X214.255 Y100.37 E0.009128528999833612
+G1 X214.255 Y90.37 E0.24671699999550004
+G1 X214.625 Y90.37 E0.009128528999833612
+G1 X214.625 Y100.37 E0.24671699999550004
+G1 X214.995 Y100.37 E0.009128528999833612
+G1 X214.995 Y90.37 E0.24671699999550004
+G1 X215.365 Y90.37 E0.009128528999833612
+G1 X215.365 Y100.37 E0.24671699999550004
+G1 X215.735 Y100.37 E0.009128528999833612
+G1 X215.735 Y90.37 E0.24671699999550004
+G1 X216.105 Y90.37 E0.009128528999832911
+G1 X216.105 Y100.37 E0.24671699999550004
+G1 X216.475 Y100.37 E0.009128528999833612
+G1 X216.475 Y90.37 E0.24671699999550004
+G1 X216.845 Y90.37 E0.009128528999833612
+G1 X216.845 Y100.37 E0.24671699999550004
+G1 X217.215 Y100.37 E0.009128528999833612
+G1 X217.215 Y90.37 E0.24671699999550004
+G1 X217.585 Y90.37 E0.009128528999833612
+G1 X217.585 Y100.37 E0.24671699999550004
+G1 X217.955 Y100.37 E0.009128528999833612
+G1 X217.955 Y90.37 E0.24671699999550004
+G1 X218.325 Y90.37 E0.009128528999832911
+G1 X218.325 Y100.37 E0.24671699999550004
+G1 X218.695 Y100.37 E0.009128528999833612
+G1 X218.695 Y90.37 E0.24671699999550004
+G1 X219.065 Y90.37 E0.009128528999833612
+G1 X219.065 Y100.37 E0.24671699999550004
+G1 X219.435 Y100.37 E0.009128528999833612
+G1 X219.435 Y90.37 E0.24671699999550004
+G1 X219.805 Y90.37 E0.009128528999833612
+G1 X219.805 Y100.37 E0.24671699999550004
+G1 X220.175 Y100.37 E0.009128528999833612
+G1 X220.175 Y90.37 E0.24671699999550004
+G1 Z0.6 F6000.0; move z up
+G0 X210.185 Y100.555
+G1 Z0.15; move z down 
+G1 X210.185 Y110.555 E0.34873611583353936
+G1 X210.555 Y110.555 E0.009128528999833612
+G1 X210.555 Y100.555 E0.24671699999550004
+G1 X210.925 Y100.555 E0.009128528999833612
+G1 X210.925 Y110.555 E0.24671699999550004
+G1 X211.295 Y110.555 E0.009128528999832911
+G1 X211.295 Y100.555 E0.24671699999550004
+G1 X211.665 Y100.555 E0.009128528999833612
+G1 X211.665 Y110.555 E0.24671699999550004
+G1 X212.035 Y110.555 E0.009128528999833612
+G1 X212.035 Y100.555 E0.24671699999550004
+G1 X212.405 Y100.555 E0.009128528999833612
+G1 X212.405 Y110.555 E0.24671699999550004
+G1 X212.775 Y110.555 E0.009128528999833612
+G1 X212.775 Y100.555 E0.24671699999550004
+G1 X213.145 Y100.555 E0.009128528999833612
+G1 X213.145 Y110.555 E0.24671699999550004
+G1 X213.515 Y110.555 E0.009128528999832911
+G1 X213.515 Y100.555 E0.24671699999550004
+G1 X213.885 Y100.555 E0.009128528999833612
+G1 X213.885 Y110.555 E0.24671699999550004
+G1 X214.255 Y110.555 E0.009128528999833612
+G1 X214.255 Y100.555 E0.24671699999550004
+G1 X214.625 Y100.555 E0.009128528999833612
+G1 X214.625 Y110.555 E0.24671699999550004
+G1 X214.995 Y110.555 E0.009128528999833612
+G1 X214.995 Y100.555 E0.24671699999550004
+G1 X215.365 Y100.555 E0.009128528999833612
+G1 X215.365 Y110.555 E0.24671699999550004
+G1 X215.735 Y110.555 E0.009128528999833612
+G1 X215.735 Y100.555 E0.24671699999550004
+G1 X216.105 Y100.555 E0.009128528999832911
+G1 X216.105 Y110.555 E0.24671699999550004
+G1 X216.475 Y110.555 E0.009128528999833612
+G1 X216.475 Y100.555 E0.24671699999550004
+G1 X216.845 Y100.555 E0.009128528999833612
+G1 X216.845 Y110.555 E0.24671699999550004
+G1 X217.215 Y110.555 E0.009128528999833612
+G1 X217.215 Y100.555 E0.24671699999550004
+G1 X217.585 Y100.555 E0.009128528999833612
+G1 X217.585 Y110.555 E0.24671699999550004
+G1 X217.955 Y110.555 E0.009128528999833612
+G1 X217.955 Y100.555 E0.24671699999550004
+G1 X218.325 Y100.555 E0.009128528999832911
+G1 X218.325 Y110.555 E0.24671699999550004
+G1 X218.695 Y110.555 E0.009128528999833612
+G1 X218.695 Y100.555 E0.24671699999550004
+G1 X219.065 Y100.555 E0.009128528999833612
+G1 X219.065 Y110.555 E0.24671699999550004
+G1 X219.435 Y110.555 E0.009128528999833612
+G1 X219.435 Y100.555 E0.24671699999550004
+G1 X219.805 Y100.555 E0.009128528999833612
+G1 X219.805 Y110.555 E0.24671699999550004
+G1 X220.175 Y110.555 E0.009128528999833612
+G1 X220.175 Y100.555 E0.24671699999550004
+G1 Z0.6 F6000.0; move z up
+G0 X220.37 Y70.0
+G1 Z0.15; move z down 
+G1 X220.37 Y70.0 E0.3468892805904708
+G1 X220.893259 Y70.0 E0.012909689070064434
+G1 X220.37 Y70.5233 E0.01825777264949695
+G1 X220.37 Y71.0465 E0.012908233439764279
+G1 X221.416518 Y70.0 E0.036513800719685276
+G1 X221.939777 Y70.0 E0.012909689070064434
+G1 X220.37 Y71.5698 E0.05477157335529104
+G1 X220.37 Y72.093 E0.012908233439764629
+G1 X222.463036 Y70.0 E0.07302760143937082
+G1 X222.986295 Y70.0 E0.012909689070065136
+G1 X220.37 Y72.6163 E0.09128537407219847
+G1 X220.37 Y73.1396 E0.012910700609764666
+G1 X223.509554 Y70.0 E0.10954314671058257
+G1 X224.032813 Y70.0 E0.012909689070064434
+G1 X220.37 Y73.6628 E0.12779917479069325
+G1 X220.37 Y74.1861 E0.012910700609764314
+G1 X224.556072 Y70.0 E0.14605694742679493
+G1 X225.079331 Y70.0 E0.012909689070064434
+G1 X220.37 Y74.7093 E0.16431297550971705
+G1 X220.37 Y75.2326 E0.012910700609764666
+G1 X225.60259 Y70.0 E0.1825707481443967
+G1 X226.125849 Y70.0 E0.012909689070064434
+G1 X220.37 Y75.7558 E0.20082677622898135
+G1 X220.37 Y76.2791 E0.012910700609764666
+G1 X226.649108 Y70.0 E0.2190845488626933
+G1 X227.172367 Y70.0 E0.012909689070064434
+G1 X220.37 Y76.8024 E0.2373423214988334
+G1 X220.37 Y77.3256 E0.012908233439764279
+G1 X227.695626 Y70.0 E0.2555983495813864
+G1 X228.218885 Y70.0 E0.012909689070064434
+G1 X220.37 Y77.8489 E0.2738561222165951
+G1 X220.37 Y78.3721 E0.012908233439764629
+G1 X228.742144 Y70.0 E0.29211215030032756
+G1 X229.265403 Y70.0 E0.012909689070064434
+G1 X220.37 Y78.8954 E0.31036992293480953
+G1 X220.37 Y79.4187 E0.012910700609764666
+G1 X229.788662 Y70.0 E0.32862769557096005
+G1 X230.311921 Y70.0 E0.012909689070065136
+G1 X220.37 Y79.9419 E0.3468837236533343
+G1 X220.8352 Y80.0 E0.011566440558188427
+G1 X230.37 Y70.4652 E0.33267920972412385
+G1 X230.37 Y70.9884 E0.012908233439764629
+G1 X221.3584 Y80.0 E0.31442421092733086
+G1 X221.8817 Y80.0 E0.012910700609764666
+G1 X230.37 Y71.5117 E0.2961657230252631
+G1 X230.37 Y72.035 E0.012910700609764314
+G1 X222.4049 Y80.0 E0.27790897968130857
+G1 X222.9282 Y80.0 E0.012910700609764666
+G1 X230.37 Y72.5582 E0.2596522363264025
+G1 X230.37 Y73.0815 E0.012910700609764666
+G1 X223.4515 Y80.0 E0.2413937484243347
+G1 X223.9747 Y80.0 E0.012908233439764629
+G1 X230.37 Y73.6047 E0.2231387496275419
+G1 X230.37 Y74.128 E0.012910700609764666
+G1 X224.498 Y80.0 E0.20488026172547466
+G1 X225.0212 Y80.0 E0.012908233439764629
+G1 X230.37 Y74.6513 E0.18662351838419824
+G1 X230.37 Y75.1745 E0.012908233439764279
+G1 X225.5445 Y80.0 E0.16836677502661407
+G1 X226.0677 Y80.0 E0.012908233439764629
+G1 X230.37 Y75.6978 E0.15011003168732112
+G1 X230.37 Y76.221 E0.012908233439764629
+G1 X226.591 Y80.0 E0.13185328832775323
+G1 X227.1143 Y80.0 E0.012910700609763966
+G1 X230.37 Y76.7443 E0.1135948004256862
+G1 X230.37 Y77.2675 E0.012908233439764629
+G1 X227.6375 Y80.0 E0.09533980162889315
+G1 X228.1608 Y80.0 E0.012910700609764666
+G1 X230.37 Y77.7908 E0.07708131372682538
+G1 X230.37 Y78.3141 E0.012910700609764314
+G1 X228.684 Y80.0 E0.0588245704032642
+G1 X229.2073 Y80.0 E0.012910700609764666
+G1 X230.37 Y78.8373 E0.04056782702796479
+G1 X230.37 Y79.3606 E0.012910700609764666
+G1 X229.7306 Y80.0 E0.022309339125897016
+G1 X230.2538 Y80.0 E0.012908233439764629
+G1 X230.37 Y79.8838 E0.004054340329104216
+G1 Z0.6 F6000.0; move z up
+G0 X220.37 Y80.185
+G1 Z0.15; move z down 
+G1 X220.37 Y80.185 E0.3468892805904708
+G1 X220.893259 Y80.185 E0.012909689070064434
+G1 X220.37 Y80.7083 E0.018257772649496705
+G1 X220.37 Y81.2315 E0.012908233439764629
+G1 X221.416518 Y80.185 E0.036513800719685276
+G1 X221.939777 Y80.185 E0.012909689070064434
+G1 X220.37 Y81.7548 E0.05477157335529104
+G1 X220.37 Y82.278 E0.012908233439764629
+G1 X222.463036 Y80.185 E0.07302760143937082
+G1 X222.986295 Y80.185 E0.012909689070065136
+G1 X220.37 Y82.8013 E0.09128537407219847
+G1 X220.37 Y83.3246 E0.012910700609764666
+G1 X223.509554 Y80.185 E0.10954314671058257
+G1 X224.032813 Y80.185 E0.012909689070064434
+G1 X220.37 Y83.8478 E0.12779917479069325
+G1 X220.37 Y84.3711 E0.012910700609764314
+G1 X224.556072 Y80.185 E0.14605694742679493
+G1 X225.079331 Y80.185 E0.012909689070064434
+G1 X220.37 Y84.8943 E0.16431297550971705
+G1 X220.37 Y85.4176 E0.012910700609764314
+G1 X225.60259 Y80.185 E0.18257074814439642
+G1 X226.125849 Y80.185 E0.012909689070064434
+G1 X220.37 Y85.9408 E0.20082677622898135
+G1 X220.37 Y86.4641 E0.012910700609764666
+G1 X226.649108 Y80.185 E0.2190845488626933
+G1 X227.172367 Y80.185 E0.012909689070064434
+G1 X220.37 Y86.9874 E0.23734232149883308
+G1 X220.37 Y87.5106 E0.012908233439764629
+G1 X227.695626 Y80.185 E0.2555983495813864
+G1 X228.218885 Y80.185 E0.012909689070064434
+G1 X220.37 Y88.0339 E0.2738561222165951
+G1 X220.37 Y88.5571 E0.012908233439764629
+G1 X228.742144 Y80.185 E0.29211215030032756
+G1 X229.265403 Y80.185 E0.012909689070064434
+G1 X220.37 Y89.0804 E0.31036992293480953
+G1 X220.37 Y89.6037 E0.012910700609764666
+G1 X229.788662 Y80.185 E0.32862769557096005
+G1 X230.311921 Y80.185 E0.012909689070065136
+G1 X220.37 Y90.1269 E0.3468837236533343
+G1 X220.8352 Y90.185 E0.011566440558188427
+G1 X230.37 Y80.6502 E0.33267920972412385
+G1 X230.37 Y81.1734 E0.012908233439764629
+G1 X221.3584 Y90.185 E0.31442421092733086
+G1 X221.8817 Y90.185 E0.012910700609764666
+G1 X230.37 Y81.6967 E0.2961657230252631
+G1 X230.37 Y82.22 E0.012910700609764314
+G1 X222.4049 Y90.185 E0.27790897968130857
+G1 X222.9282 Y90.185 E0.012910700609764666
+G1 X230.37 Y82.7432 E0.2596522363264025
+G1 X230.37 Y83.2665 E0.012910700609764314
+G1 X223.4515 Y90.185 E0.24139374842433495
+G1 X223.9747 Y90.185 E0.012908233439764629
+G1 X230.37 Y83.7897 E0.2231387496275419
+G1 X230.37 Y84.313 E0.012910700609764666
+G1 X224.498 Y90.185 E0.20488026172547466
+G1 X225.0212 Y90.185 E0.012908233439764629
+G1 X230.37 Y84.8363 E0.1866235183841985
+G1 X230.37 Y85.3595 E0.012908233439764629
+G1 X225.5445 Y90.185 E0.16836677502661407
+G1 X226.0677 Y90.185 E0.012908233439764629
+G1 X230.37 Y85.8828 E0.15011003168732112
+G1 X230.37 Y86.406 E0.012908233439764629
+G1 X226.591 Y90.185 E0.13185328832775323
+G1 X227.1143 Y90.185 E0.012910700609763966
+G1 X230.37 Y86.9293 E0.1135948004256862
+G1 X230.37 Y87.4525 E0.012908233439764629
+G1 X227.6375 Y90.185 E0.09533980162889315
+G1 X228.1608 Y90.185 E0.012910700609764666
+G1 X230.37 Y87.9758 E0.07708131372682538
+G1 X230.37 Y88.4991 E0.012910700609764314
+G1 X228.684 Y90.185 E0.0588245704032642
+G1 X229.2073 Y90.185 E0.012910700609764666
+G1 X230.37 Y89.0223 E0.04056782702796479
+G1 X230.37 Y89.5456 E0.012910700609764314
+G1 X229.7306 Y90.185 E0.022309339125897262
+G1 X230.2538 Y90.185 E0.012908233439764629
+G1 X230.37 Y90.0688 E0.004054340329104216
+G1 Z0.6 F6000.0; move z up
+G0 X220.37 Y90.37
+G1 Z0.15; move z down 
+G1 X220.37 Y100.37 E0.34873611583353936
+G1 X220.74 Y100.37 E0.009128528999833612
+G1 X220.74 Y90.37 E0.24671699999550004
+G1 X221.11 Y90.37 E0.009128528999833612
+G1 X221.11 Y100.37 E0.24671699999550004
+G1 X221.48 Y100.37 E0.009128528999832911
+G1 X221.48 Y90.37 E0.24671699999550004
+G1 X221.85 Y90.37 E0.009128528999833612
+G1 X221.85 Y100.37 E0.24671699999550004
+G1 X222.22 Y100.37 E0.009128528999833612
+G1 X222.22 Y90.37 E0.24671699999550004
+G1 X222.59 Y90.37 E0.009128528999833612
+G1 X222.59 Y100.37 E0.24671699999550004
+G1 X222.96 Y100.37 E0.009128528999833612
+G1 X222.96 Y90.37 E0.24671699999550004
+G1 X223.33 Y90.37 E0.009128528999833612
+G1 X223.33 Y100.37 E0.24671699999550004
+G1 X223.7 Y100.37 E0.009128528999832911
+G1 X223.7 Y90.37 E0.24671699999550004
+G1 X224.07 Y90.37 E0.009128528999833612
+G1 X224.07 Y100.37 E0.24671699999550004
+G1 X224.44 Y100.37 E0.009128528999833612
+G1 X224.44 Y90.37 E0.24671699999550004
+G1 X224.81 Y90.37 E0.009128528999833612
+G1 X224.81 Y100.37 E0.24671699999550004
+G1 X225.18 Y100.37 E0.009128528999833612
+G1 X225.18 Y90.37 E0.24671699999550004
+G1 X225.55 Y90.37 E0.009128528999833612
+G1 X225.55 Y100.37 E0.24671699999550004
+G1 X225.92 Y100.37 E0.009128528999832911
+G1 X225.92 Y90.37 E0.24671699999550004
+G1 X226.29 Y90.37 E0.009128528999833612
+G1 X226.29 Y100.37 E0.24671699999550004
+G1 X226.66 Y100.37 E0.009128528999833612
+G1 X226.66 Y90.37 E0.24671699999550004
+G1 X227.03 Y90.37 E0.009128528999833612
+G1 X227.03 Y100.37 E0.24671699999550004
+G1 X227.4 Y100.37 E0.009128528999833612
+G1 X227.4 Y90.37 E0.24671699999550004
+G1 X227.77 Y90.37 E0.009128528999833612
+G1 X227.77 Y100.37 E0.24671699999550004
+G1 X228.14 Y100.37 E0.009128528999832911
+G1 X228.14 Y90.37 E0.24671699999550004
+G1 X228.51 Y90.37 E0.009128528999833612
+G1 X228.51 Y100.37 E0.24671699999550004
+G1 X228.88 Y100.37 E0.009128528999833612
+G1 X228.88 Y90.37 E0.24671699999550004
+G1 X229.25 Y90.37 E0.009128528999833612
+G1 X229.25 Y100.37 E0.24671699999550004
+G1 X229.62 Y100.37 E0.009128528999833612
+G1 X229.62 Y90.37 E0.24671699999550004
+G1 X229.99 Y90.37 E0.009128528999833612
+G1 X229.99 Y100.37 E0.24671699999550004
+G1 X230.36 Y100.37 E0.009128528999833612
+G1 X230.36 Y90.37 E0.24671699999550004
+G1 Z0.6 F6000.0; move z up
+G0 X220.37 Y100.555
+G1 Z0.15; move z down 
+G1 X220.37 Y110.555 E0.34873611583353936
+G1 X220.74 Y110.555 E0.009128528999833612
+G1 X220.74 Y100.555 E0.24671699999550004
+G1 X221.11 Y100.555 E0.009128528999833612
+G1 X221.11 Y110.555 E0.24671699999550004
+G1 X221.48 Y110.555 E0.009128528999832911
+G1 X221.48 Y100.555 E0.24671699999550004
+G1 X221.85 Y100.555 E0.009128528999833612
+G1 X221.85 Y110.555 E0.24671699999550004
+G1 X222.22 Y110.555 E0.009128528999833612
+G1 X222.22 Y100.555 E0.24671699999550004
+G1 X222.59 Y100.555 E0.009128528999833612
+G1 X222.59 Y110.555 E0.24671699999550004
+G1 X222.96 Y110.555 E0.009128528999833612
+G1 X222.96 Y100.555 E0.24671699999550004
+G1 X223.33 Y100.555 E0.009128528999833612
+G1 X223.33 Y110.555 E0.24671699999550004
+G1 X223.7 Y110.555 E0.009128528999832911
+G1 X223.7 Y100.555 E0.24671699999550004
+G1 X224.07 Y100.555 E0.009128528999833612
+G1 X224.07 Y110.555 E0.24671699999550004
+G1 X224.44 Y110.555 E0.009128528999833612
+G1 X224.44 Y100.555 E0.24671699999550004
+G1 X224.81 Y100.555 E0.009128528999833612
+G1 X224.81 Y110.555 E0.24671699999550004
+G1 X225.18 Y110.555 E0.009128528999833612
+G1 X225.18 Y100.555 E0.24671699999550004
+G1 X225.55 Y100.555 E0.009128528999833612
+G1 X225.55 Y110.555 E0.24671699999550004
+G1 X225.92 Y110.555 E0.009128528999832911
+G1 X225.92 Y100.555 E0.24671699999550004
+G1 X226.29 Y100.555 E0.009128528999833612
+G1 X226.29 Y110.555 E0.24671699999550004
+G1 X226.66 Y110.555 E0.009128528999833612
+G1 X226.66 Y100.555 E0.24671699999550004
+G1 X227.03 Y100.555 E0.009128528999833612
+G1 X227.03 Y110.555 E0.24671699999550004
+G1 X227.4 Y110.555 E0.009128528999833612
+G1 X227.4 Y100.555 E0.24671699999550004
+G1 X227.77 Y100.555 E0.009128528999833612
+G1 X227.77 Y110.555 E0.24671699999550004
+G1 X228.14 Y110.555 E0.009128528999832911
+G1 X228.14 Y100.555 E0.24671699999550004
+G1 X228.51 Y100.555 E0.009128528999833612
+G1 X228.51 Y110.555 E0.24671699999550004
+G1 X228.88 Y110.555 E0.009128528999833612
+G1 X228.88 Y100.555 E0.24671699999550004
+G1 X229.25 Y100.555 E0.009128528999833612
+G1 X229.25 Y110.555 E0.24671699999550004
+G1 X229.62 Y110.555 E0.009128528999833612
+G1 X229.62 Y100.555 E0.24671699999550004
+G1 X229.99 Y100.555 E0.009128528999833612
+G1 X229.99 Y110.555 E0.24671699999550004
+G1 X230.36 Y110.555 E0.009128528999833612
+G1 X230.36 Y100.555 E0.24671699999550004
+G92 E0.0
+;0.3
+G1 E-0.80000 F2100.00000
+G1 Z0.600 F10800.000
+;AFTER_LAYER_CHANGE
+;0.3
+G1 X200 Y70
+G1 Z0.3
+G1 E0.80000 F2100.00000
+M204 S2000
+G1 F2000
+
+G1 Z0.75 F6000.0; move z up
+G0 X200.0 Y70.0
+G1 Z0.3; move z down 
+G1 X210.0 Y70.0 E0.3468892805904711
+G1 X210.0 Y70.5233 E0.012910700609764666
+G1 X209.476741 Y70.0 E0.01825777264949695
+G1 X208.953482 Y70.0 E0.012909689070064434
+G1 X210.0 Y71.0465 E0.036513800719685276
+G1 X210.0 Y71.5698 E0.012910700609764666
+G1 X208.430223 Y70.0 E0.05477157335529104
+G1 X207.906964 Y70.0 E0.012909689070065136
+G1 X210.0 Y72.093 E0.0730276014393713
+G1 X210.0 Y72.6163 E0.012910700609764314
+G1 X207.383705 Y70.0 E0.09128537407219847
+G1 X206.860446 Y70.0 E0.012909689070064434
+G1 X210.0 Y73.1396 E0.10954314671058257
+G1 X210.0 Y73.6628 E0.012908233439764629
+G1 X206.337187 Y70.0 E0.12779917479069325
+G1 X205.813928 Y70.0 E0.012909689070064434
+G1 X210.0 Y74.1861 E0.14605694742679493
+G1 X210.0 Y74.7093 E0.012908233439764629
+G1 X205.290669 Y70.0 E0.16431297550971705
+G1 X204.76741 Y70.0 E0.012909689070064434
+G1 X210.0 Y75.2326 E0.1825707481443967
+G1 X210.0 Y75.7558 E0.012908233439764279
+G1 X204.244151 Y70.0 E0.20082677622898185
+G1 X203.720892 Y70.0 E0.012909689070064434
+G1 X210.0 Y76.2791 E0.2190845488626933
+G1 X210.0 Y76.8024 E0.012910700609764666
+G1 X203.197633 Y70.0 E0.2373423214988334
+G1 X202.674374 Y70.0 E0.012909689070064434
+G1 X210.0 Y77.3256 E0.2555983495813864
+G1 X210.0 Y77.8489 E0.012910700609764666
+G1 X202.151115 Y70.0 E0.2738561222165951
+G1 X201.627856 Y70.0 E0.012909689070064434
+G1 X210.0 Y78.3721 E0.29211215030032756
+G1 X210.0 Y78.8954 E0.012910700609764314
+G1 X201.104597 Y70.0 E0.31036992293480953
+G1 X200.581338 Y70.0 E0.012909689070065136
+G1 X210.0 Y79.4187 E0.32862769557096055
+G1 X210.0 Y79.9419 E0.012908233439764629
+G1 X200.058079 Y70.0 E0.3468837236533343
+G1 X200.0 Y70.4652 E0.011566376360918902
+G1 X209.5348 Y80.0 E0.3326792097241233
+G1 X209.0116 Y80.0 E0.012908233439764629
+G1 X200.0 Y70.9884 E0.31442421092733036
+G1 X200.0 Y71.5117 E0.012910700609764666
+G1 X208.4883 Y80.0 E0.2961657230252631
+G1 X207.9651 Y80.0 E0.012908233439764629
+G1 X200.0 Y72.035 E0.27790897968130857
+G1 X200.0 Y72.5582 E0.012908233439764629
+G1 X207.4418 Y80.0 E0.2596522363264025
+G1 X206.9185 Y80.0 E0.012910700609764666
+G1 X200.0 Y73.0815 E0.2413937484243347
+G1 X200.0 Y73.6047 E0.012908233439764279
+G1 X206.3953 Y80.0 E0.2231387496275419
+G1 X205.872 Y80.0 E0.012910700609763966
+G1 X200.0 Y74.128 E0.20488026172547466
+G1 X200.0 Y74.6513 E0.012910700609764666
+G1 X205.3488 Y80.0 E0.18662351838419824
+G1 X204.8255 Y80.0 E0.012910700609764666
+G1 X200.0 Y75.1745 E0.16836677502661407
+G1 X200.0 Y75.6978 E0.012910700609764666
+G1 X204.3023 Y80.0 E0.15011003168732112
+G1 X203.779 Y80.0 E0.012910700609764666
+G1 X200.0 Y76.221 E0.13185328832775323
+G1 X200.0 Y76.7443 E0.012910700609764314
+G1 X203.2557 Y80.0 E0.11359480042568568
+G1 X202.7325 Y80.0 E0.012908233439764629
+G1 X200.0 Y77.2675 E0.09533980162889265
+G1 X200.0 Y77.7908 E0.012910700609764666
+G1 X202.2092 Y80.0 E0.07708131372682538
+G1 X201.686 Y80.0 E0.012908233439764629
+G1 X200.0 Y78.3141 E0.0588245704032642
+G1 X200.0 Y78.8373 E0.012908233439764629
+G1 X201.1627 Y80.0 E0.04056782702796479
+G1 X200.6394 Y80.0 E0.012910700609764666
+G1 X200.0 Y79.3606 E0.022309339125897016
+G1 X200.0 Y79.8838 E0.012908233439764279
+G1 X200.1162 Y80.0 E0.004054340329104216
+G1 Z0.75 F6000.0; move z up
+G0 X200.0 Y80.185
+G1 Z0.3; move z down 
+G1 X210.0 Y80.185 E0.3468892805904711
+G1 X210.0 Y80.7083 E0.012910700609764314
+G1 X209.476741 Y80.185 E0.018257772649496705
+G1 X208.953482 Y80.185 E0.012909689070064434
+G1 X210.0 Y81.2315 E0.036513800719685276
+G1 X210.0 Y81.7548 E0.012910700609764666
+G1 X208.430223 Y80.185 E0.05477157335529104
+G1 X207.906964 Y80.185 E0.012909689070065136
+G1 X210.0 Y82.278 E0.0730276014393713
+G1 X210.0 Y82.8013 E0.012910700609764314
+G1 X207.383705 Y80.185 E0.09128537407219847
+G1 X206.860446 Y80.185 E0.012909689070064434
+G1 X210.0 Y83.3246 E0.10954314671058257
+G1 X210.0 Y83.8478 E0.012908233439764629
+G1 X206.337187 Y80.185 E0.12779917479069325
+G1 X205.813928 Y80.185 E0.012909689070064434
+G1 X210.0 Y84.3711 E0.14605694742679493
+G1 X210.0 Y84.8943 E0.012908233439764629
+G1 X205.290669 Y80.185 E0.16431297550971705
+G1 X204.76741 Y80.185 E0.012909689070064434
+G1 X210.0 Y85.4176 E0.18257074814439642
+G1 X210.0 Y85.9408 E0.012908233439764629
+G1 X204.244151 Y80.185 E0.20082677622898185
+G1 X203.720892 Y80.185 E0.012909689070064434
+G1 X210.0 Y86.4641 E0.2190845488626933
+G1 X210.0 Y86.9874 E0.012910700609764314
+G1 X203.197633 Y80.185 E0.23734232149883308
+G1 X202.674374 Y80.185 E0.012909689070064434
+G1 X210.0 Y87.5106 E0.2555983495813864
+G1 X210.0 Y88.0339 E0.012910700609764666
+G1 X202.151115 Y80.185 E0.2738561222165951
+G1 X201.627856 Y80.185 E0.012909689070064434
+G1 X210.0 Y88.5571 E0.29211215030032756
+G1 X210.0 Y89.0804 E0.012910700609764314
+G1 X201.104597 Y80.185 E0.31036992293480953
+G1 X200.581338 Y80.185 E0.012909689070065136
+G1 X210.0 Y89.6037 E0.32862769557096055
+G1 X210.0 Y90.1269 E0.012908233439764629
+G1 X200.058079 Y80.185 E0.3468837236533343
+G1 X200.0 Y80.6502 E0.011566376360918902
+G1 X209.5348 Y90.185 E0.3326792097241233
+G1 X209.0116 Y90.185 E0.012908233439764629
+G1 X200.0 Y81.1734 E0.31442421092733036
+G1 X200.0 Y81.6967 E0.012910700609764666
+G1 X208.4883 Y90.185 E0.2961657230252631
+G1 X207.9651 Y90.185 E0.012908233439764629
+G1 X200.0 Y82.22 E0.27790897968130857
+G1 X200.0 Y82.7432 E0.012908233439764629
+G1 X207.4418 Y90.185 E0.2596522363264025
+G1 X206.9185 Y90.185 E0.012910700609764666
+G1 X200.0 Y83.2665 E0.24139374842433495
+G1 X200.0 Y83.7897 E0.012908233439764629
+G1 X206.3953 Y90.185 E0.2231387496275419
+G1 X205.872 Y90.185 E0.012910700609763966
+G1 X200.0 Y84.313 E0.20488026172547466
+G1 X200.0 Y84.8363 E0.012910700609764314
+G1 X205.3488 Y90.185 E0.1866235183841985
+G1 X204.8255 Y90.185 E0.012910700609764666
+G1 X200.0 Y85.3595 E0.16836677502661407
+G1 X200.0 Y85.8828 E0.012910700609764666
+G1 X204.3023 Y90.185 E0.15011003168732112
+G1 X203.779 Y90.185 E0.012910700609764666
+G1 X200.0 Y86.406 E0.13185328832775323
+G1 X200.0 Y86.9293 E0.012910700609764314
+G1 X203.2557 Y90.185 E0.11359480042568568
+G1 X202.7325 Y90.185 E0.012908233439764629
+G1 X200.0 Y87.4525 E0.09533980162889265
+G1 X200.0 Y87.9758 E0.012910700609764666
+G1 X202.2092 Y90.185 E0.07708131372682538
+G1 X201.686 Y90.185 E0.012908233439764629
+G1 X200.0 Y88.4991 E0.0588245704032642
+G1 X200.0 Y89.0223 E0.012908233439764629
+G1 X201.1627 Y90.185 E0.04056782702796479
+G1 X200.6394 Y90.185 E0.012910700609764666
+G1 X200.0 Y89.5456 E0.022309339125897262
+G1 X200.0 Y90.0688 E0.012908233439764629
+G1 X200.1162 Y90.185 E0.004054340329104216
+G1 Z0.75 F6000.0; move z up
+G0 X200.0 Y90.37
+G1 Z0.3; move z down 
+G1 X210.0 Y90.37 E0.3487361158335391
+G1 X210.0 Y90.74 E0.009128528999833263
+G1 X200.0 Y90.74 E0.24671699999550004
+G1 X200.0 Y91.11 E0.009128528999833612
+G1 X210.0 Y91.11 E0.24671699999550004
+G1 X210.0 Y91.48 E0.009128528999833612
+G1 X200.0 Y91.48 E0.24671699999550004
+G1 X200.0 Y91.85 E0.009128528999833263
+G1 X210.0 Y91.85 E0.24671699999550004
+G1 X210.0 Y92.22 E0.009128528999833612
+G1 X200.0 Y92.22 E0.24671699999550004
+G1 X200.0 Y92.59 E0.009128528999833612
+G1 X210.0 Y92.59 E0.24671699999550004
+G1 X210.0 Y92.96 E0.009128528999833263
+G1 X200.0 Y92.96 E0.24671699999550004
+G1 X200.0 Y93.33 E0.009128528999833612
+G1 X210.0 Y93.33 E0.24671699999550004
+G1 X210.0 Y93.7 E0.009128528999833612
+G1 X200.0 Y93.7 E0.24671699999550004
+G1 X200.0 Y94.07 E0.009128528999833263
+G1 X210.0 Y94.07 E0.24671699999550004
+G1 X210.0 Y94.44 E0.009128528999833612
+G1 X200.0 Y94.44 E0.24671699999550004
+G1 X200.0 Y94.81 E0.009128528999833612
+G1 X210.0 Y94.81 E0.24671699999550004
+G1 X210.0 Y95.18 E0.009128528999833612
+G1 X200.0 Y95.18 E0.24671699999550004
+G1 X200.0 Y95.55 E0.009128528999833263
+G1 X210.0 Y95.55 E0.24671699999550004
+G1 X210.0 Y95.92 E0.009128528999833612
+G1 X200.0 Y95.92 E0.24671699999550004
+G1 X200.0 Y96.29 E0.009128528999833612
+G1 X210.0 Y96.29 E0.24671699999550004
+G1 X210.0 Y96.66 E0.009128528999833263
+G1 X200.0 Y96.66 E0.24671699999550004
+G1 X200.0 Y97.03 E0.009128528999833612
+G1 X210.0 Y97.03 E0.24671699999550004
+G1 X210.0 Y97.4 E0.009128528999833612
+G1 X200.0 Y97.4 E0.24671699999550004
+G1 X200.0 Y97.77 E0.009128528999833263
+G1 X210.0 Y97.77 E0.24671699999550004
+G1 X210.0 Y98.14 E0.009128528999833612
+G1 X200.0 Y98.14 E0.24671699999550004
+G1 X200.0 Y98.51 E0.009128528999833612
+G1 X210.0 Y98.51 E0.24671699999550004
+G1 X210.0 Y98.88 E0.009128528999833263
+G1 X200.0 Y98.88 E0.24671699999550004
+G1 X200.0 Y99.25 E0.009128528999833612
+G1 X210.0 Y99.25 E0.24671699999550004
+G1 X210.0 Y99.62 E0.009128528999833612
+G1 X200.0 Y99.62 E0.24671699999550004
+G1 X200.0 Y99.99 E0.009128528999833263
+G1 X210.0 Y99.99 E0.24671699999550004
+G1 X210.0 Y100.36 E0.009128528999833612
+G1 X200.0 Y100.36 E0.24671699999550004
+G1 Z0.75 F6000.0; move z up
+G0 X200.0 Y100.555
+G1 Z0.3; move z down 
+G1 X210.0 Y100.555 E0.3487361158335391
+G1 X210.0 Y100.925 E0.009128528999833263
+G1 X200.0 Y100.925 E0.24671699999550004
+G1 X200.0 Y101.295 E0.009128528999833612
+G1 X210.0 Y101.295 E0.24671699999550004
+G1 X210.0 Y101.665 E0.009128528999833612
+G1 X200.0 Y101.665 E0.24671699999550004
+G1 X200.0 Y102.035 E0.009128528999833263
+G1 X210.0 Y102.035 E0.24671699999550004
+G1 X210.0 Y102.405 E0.009128528999833612
+G1 X200.0 Y102.405 E0.24671699999550004
+G1 X200.0 Y102.775 E0.009128528999833612
+G1 X210.0 Y102.775 E0.24671699999550004
+G1 X210.0 Y103.145 E0.009128528999833263
+G1 X200.0 Y103.145 E0.24671699999550004
+G1 X200.0 Y103.515 E0.009128528999833612
+G1 X210.0 Y103.515 E0.24671699999550004
+G1 X210.0 Y103.885 E0.009128528999833612
+G1 X200.0 Y103.885 E0.24671699999550004
+G1 X200.0 Y104.255 E0.009128528999833263
+G1 X210.0 Y104.255 E0.24671699999550004
+G1 X210.0 Y104.625 E0.009128528999833612
+G1 X200.0 Y104.625 E0.24671699999550004
+G1 X200.0 Y104.995 E0.009128528999833612
+G1 X210.0 Y104.995 E0.24671699999550004
+G1 X210.0 Y105.365 E0.009128528999833263
+G1 X200.0 Y105.365 E0.24671699999550004
+G1 X200.0 Y105.735 E0.009128528999833612
+G1 X210.0 Y105.735 E0.24671699999550004
+G1 X210.0 Y106.105 E0.009128528999833612
+G1 X200.0 Y106.105 E0.24671699999550004
+G1 X200.0 Y106.475 E0.009128528999833263
+G1 X210.0 Y106.475 E0.24671699999550004
+G1 X210.0 Y106.845 E0.009128528999833612
+G1 X200.0 Y106.845 E0.24671699999550004
+G1 X200.0 Y107.215 E0.009128528999833612
+G1 X210.0 Y107.215 E0.24671699999550004
+G1 X210.0 Y107.585 E0.009128528999833263
+G1 X200.0 Y107.585 E0.24671699999550004
+G1 X200.0 Y107.955 E0.009128528999833612
+G1 X210.0 Y107.955 E0.24671699999550004
+G1 X210.0 Y108.325 E0.009128528999833612
+G1 X200.0 Y108.325 E0.24671699999550004
+G1 X200.0 Y108.695 E0.009128528999833263
+G1 X210.0 Y108.695 E0.24671699999550004
+G1 X210.0 Y109.065 E0.009128528999833612
+G1 X200.0 Y109.065 E0.24671699999550004
+G1 X200.0 Y109.435 E0.009128528999833612
+G1 X210.0 Y109.435 E0.24671699999550004
+G1 X210.0 Y109.805 E0.009128528999833612
+G1 X200.0 Y109.805 E0.24671699999550004
+G1 X200.0 Y110.175 E0.009128528999833263
+G1 X210.0 Y110.175 E0.24671699999550004
+G1 X210.0 Y110.545 E0.009128528999833612
+G1 X200.0 Y110.545 E0.24671699999550004
+G1 Z0.75 F6000.0; move z up
+G0 X210.185 Y70.0
+G1 Z0.3; move z down 
+G1 X220.185 Y70.0 E0.3468892805904711
+G1 X220.185 Y70.5233 E0.012910700609764666
+G1 X219.661741 Y70.0 E0.01825777264949695
+G1 X219.138482 Y70.0 E0.012909689070064434
+G1 X220.185 Y71.0465 E0.036513800719685276
+G1 X220.185 Y71.5698 E0.012910700609764666
+G1 X218.61522300000001 Y70.0 E0.05477157335529104
+G1 X218.09196400000002 Y70.0 E0.012909689070064434
+G1 X220.185 Y72.093 E0.07302760143937082
+G1 X220.185 Y72.6163 E0.012910700609764314
+G1 X217.568705 Y70.0 E0.09128537407219847
+G1 X217.045446 Y70.0 E0.012909689070064434
+G1 X220.185 Y73.1396 E0.10954314671058257
+G1 X220.185 Y73.6628 E0.012908233439764629
+G1 X216.522187 Y70.0 E0.12779917479069325
+G1 X215.998928 Y70.0 E0.012909689070064434
+G1 X220.185 Y74.1861 E0.14605694742679493
+G1 X220.185 Y74.7093 E0.012908233439764629
+G1 X215.475669 Y70.0 E0.16431297550971705
+G1 X214.95241000000001 Y70.0 E0.012909689070064434
+G1 X220.185 Y75.2326 E0.1825707481443967
+G1 X220.185 Y75.7558 E0.012908233439764279
+G1 X214.42915100000002 Y70.0 E0.20082677622898135
+G1 X213.905892 Y70.0 E0.012909689070065136
+G1 X220.185 Y76.2791 E0.2190845488626933
+G1 X220.185 Y76.8024 E0.012910700609764666
+G1 X213.382633 Y70.0 E0.2373423214988334
+G1 X212.859374 Y70.0 E0.012909689070064434
+G1 X220.185 Y77.3256 E0.2555983495813864
+G1 X220.185 Y77.8489 E0.012910700609764666
+G1 X212.336115 Y70.0 E0.2738561222165951
+G1 X211.812856 Y70.0 E0.012909689070064434
+G1 X220.185 Y78.3721 E0.29211215030032756
+G1 X220.185 Y78.8954 E0.012910700609764314
+G1 X211.28959700000001 Y70.0 E0.31036992293480953
+G1 X210.766338 Y70.0 E0.012909689070065136
+G1 X220.185 Y79.4187 E0.32862769557096055
+G1 X220.185 Y79.9419 E0.012908233439764629
+G1 X210.243079 Y70.0 E0.3468837236533343
+G1 X210.185 Y70.4652 E0.011566376360918902
+G1 X219.7198 Y80.0 E0.3326792097241233
+G1 X219.19660000000002 Y80.0 E0.012908233439763927
+G1 X210.185 Y70.9884 E0.31442421092733086
+G1 X210.185 Y71.5117 E0.012910700609764666
+G1 X218.6733 Y80.0 E0.2961657230252631
+G1 X218.1501 Y80.0 E0.012908233439764629
+G1 X210.185 Y72.035 E0.27790897968130857
+G1 X210.185 Y72.5582 E0.012908233439764629
+G1 X217.6268 Y80.0 E0.2596522363264025
+G1 X217.1035 Y80.0 E0.012910700609764666
+G1 X210.185 Y73.0815 E0.2413937484243347
+G1 X210.185 Y73.6047 E0.012908233439764279
+G1 X216.5803 Y80.0 E0.2231387496275419
+G1 X216.05700000000002 Y80.0 E0.012910700609763966
+G1 X210.185 Y74.128 E0.20488026172547466
+G1 X210.185 Y74.6513 E0.012910700609764666
+G1 X215.5338 Y80.0 E0.18662351838419824
+G1 X215.0105 Y80.0 E0.012910700609764666
+G1 X210.185 Y75.1745 E0.16836677502661407
+G1 X210.185 Y75.6978 E0.012910700609764666
+G1 X214.4873 Y80.0 E0.15011003168732112
+G1 X213.964 Y80.0 E0.012910700609764666
+G1 X210.185 Y76.221 E0.13185328832775323
+G1 X210.185 Y76.7443 E0.012910700609764314
+G1 X213.4407 Y80.0 E0.11359480042568568
+G1 X212.91750000000002 Y80.0 E0.012908233439763927
+G1 X210.185 Y77.2675 E0.09533980162889315
+G1 X210.185 Y77.7908 E0.012910700609764666
+G1 X212.3942 Y80.0 E0.07708131372682538
+G1 X211.871 Y80.0 E0.012908233439764629
+G1 X210.185 Y78.3141 E0.0588245704032642
+G1 X210.185 Y78.8373 E0.012908233439764629
+G1 X211.3477 Y80.0 E0.04056782702796479
+G1 X210.8244 Y80.0 E0.012910700609764666
+G1 X210.185 Y79.3606 E0.022309339125897016
+G1 X210.185 Y79.8838 E0.012908233439764279
+G1 X210.3012 Y80.0 E0.004054340329104216
+G1 Z0.75 F6000.0; move z up
+G0 X210.185 Y80.185
+G1 Z0.3; move z down 
+G1 X220.185 Y80.185 E0.3468892805904711
+G1 X220.185 Y80.7083 E0.012910700609764314
+G1 X219.661741 Y80.185 E0.018257772649496705
+G1 X219.138482 Y80.185 E0.012909689070064434
+G1 X220.185 Y81.2315 E0.036513800719685276
+G1 X220.185 Y81.7548 E0.012910700609764666
+G1 X218.61522300000001 Y80.185 E0.05477157335529104
+G1 X218.09196400000002 Y80.185 E0.012909689070064434
+G1 X220.185 Y82.278 E0.07302760143937082
+G1 X220.185 Y82.8013 E0.012910700609764314
+G1 X217.568705 Y80.185 E0.09128537407219847
+G1 X217.045446 Y80.185 E0.012909689070064434
+G1 X220.185 Y83.3246 E0.10954314671058257
+G1 X220.185 Y83.8478 E0.012908233439764629
+G1 X216.522187 Y80.185 E0.12779917479069325
+G1 X215.998928 Y80.185 E0.012909689070064434
+G1 X220.185 Y84.3711 E0.14605694742679493
+G1 X220.185 Y84.8943 E0.012908233439764629
+G1 X215.475669 Y80.185 E0.16431297550971705
+G1 X214.95241000000001 Y80.185 E0.012909689070064434
+G1 X220.185 Y85.4176 E0.18257074814439642
+G1 X220.185 Y85.9408 E0.012908233439764629
+G1 X214.42915100000002 Y80.185 E0.20082677622898135
+G1 X213.905892 Y80.185 E0.012909689070065136
+G1 X220.185 Y86.4641 E0.2190845488626933
+G1 X220.185 Y86.9874 E0.012910700609764314
+G1 X213.382633 Y80.185 E0.23734232149883308
+G1 X212.859374 Y80.185 E0.012909689070064434
+G1 X220.185 Y87.5106 E0.2555983495813864
+G1 X220.185 Y88.0339 E0.012910700609764666
+G1 X212.336115 Y80.185 E0.2738561222165951
+G1 X211.812856 Y80.185 E0.012909689070064434
+G1 X220.185 Y88.5571 E0.29211215030032756
+G1 X220.185 Y89.0804 E0.012910700609764314
+G1 X211.28959700000001 Y80.185 E0.31036992293480953
+G1 X210.766338 Y80.185 E0.012909689070065136
+G1 X220.185 Y89.6037 E0.32862769557096055
+G1 X220.185 Y90.1269 E0.012908233439764629
+G1 X210.243079 Y80.185 E0.3468837236533343
+G1 X210.185 Y80.6502 E0.011566376360918902
+G1 X219.7198 Y90.185 E0.3326792097241233
+G1 X219.19660000000002 Y90.185 E0.012908233439763927
+G1 X210.185 Y81.1734 E0.31442421092733086
+G1 X210.185 Y81.6967 E0.012910700609764666
+G1 X218.6733 Y90.185 E0.2961657230252631
+G1 X218.1501 Y90.185 E0.012908233439764629
+G1 X210.185 Y82.22 E0.27790897968130857
+G1 X210.185 Y82.7432 E0.012908233439764629
+G1 X217.6268 Y90.185 E0.2596522363264025
+G1 X217.1035 Y90.185 E0.012910700609764666
+G1 X210.185 Y83.2665 E0.24139374842433495
+G1 X210.185 Y83.7897 E0.012908233439764629
+G1 X216.5803 Y90.185 E0.2231387496275419
+G1 X216.05700000000002 Y90.185 E0.012910700609763966
+G1 X210.185 Y84.313 E0.20488026172547466
+G1 X210.185 Y84.8363 E0.012910700609764314
+G1 X215.5338 Y90.185 E0.1866235183841985
+G1 X215.0105 Y90.185 E0.012910700609764666
+G1 X210.185 Y85.3595 E0.16836677502661407
+G1 X210.185 Y85.8828 E0.012910700609764666
+G1 X214.4873 Y90.185 E0.15011003168732112
+G1 X213.964 Y90.185 E0.012910700609764666
+G1 X210.185 Y86.406 E0.13185328832775323
+G1 X210.185 Y86.9293 E0.012910700609764314
+G1 X213.4407 Y90.185 E0.11359480042568568
+G1 X212.91750000000002 Y90.185 E0.012908233439763927
+G1 X210.185 Y87.4525 E0.09533980162889315
+G1 X210.185 Y87.9758 E0.012910700609764666
+G1 X212.3942 Y90.185 E0.07708131372682538
+G1 X211.871 Y90.185 E0.012908233439764629
+G1 X210.185 Y88.4991 E0.0588245704032642
+G1 X210.185 Y89.0223 E0.012908233439764629
+G1 X211.3477 Y90.185 E0.04056782702796479
+G1 X210.8244 Y90.185 E0.012910700609764666
+G1 X210.185 Y89.5456 E0.022309339125897262
+G1 X210.185 Y90.0688 E0.012908233439764629
+G1 X210.3012 Y90.185 E0.004054340329104216
+G1 Z0.75 F6000.0; move z up
+G0 X210.185 Y90.37
+G1 Z0.3; move z down 
+G1 X210.185 Y100.37 E0.34873611583353936
+G1 X210.555 Y100.37 E0.009128528999833612
+G1 X210.555 Y90.37 E0.24671699999550004
+G1 X210.925 Y90.37 E0.009128528999833612
+G1 X210.925 Y100.37 E0.24671699999550004
+G1 X211.295 Y100.37 E0.009128528999832911
+G1 X211.295 Y90.37 E0.24671699999550004
+G1 X211.665 Y90.37 E0.009128528999833612
+G1 X211.665 Y100.37 E0.24671699999550004
+G1 X212.035 Y100.37 E0.009128528999833612
+G1 X212.035 Y90.37 E0.24671699999550004
+G1 X212.405 Y90.37 E0.009128528999833612
+G1 X212.405 Y100.37 E0.24671699999550004
+G1 X212.775 Y100.37 E0.009128528999833612
+G1 X212.775 Y90.37 E0.24671699999550004
+G1 X213.145 Y90.37 E0.009128528999833612
+G1 X213.145 Y100.37 E0.24671699999550004
+G1 X213.515 Y100.37 E0.009128528999832911
+G1 X213.515 Y90.37 E0.24671699999550004
+G1 X213.885 Y90.37 E0.009128528999833612
+G1 X213.885 Y100.37 E0.24671699999550004
+G1 X214.255 Y100.37 E0.009128528999833612
+G1 X214.255 Y90.37 E0.24671699999550004
+G1 X214.625 Y90.37 E0.009128528999833612
+G1 X214.625 Y100.37 E0.24671699999550004
+G1 X214.995 Y100.37 E0.009128528999833612
+G1 X214.995 Y90.37 E0.24671699999550004
+G1 X215.365 Y90.37 E0.009128528999833612
+G1 X215.365 Y100.37 E0.24671699999550004
+G1 X215.735 Y100.37 E0.009128528999833612
+G1 X215.735 Y90.37 E0.24671699999550004
+G1 X216.105 Y90.37 E0.009128528999832911
+G1 X216.105 Y100.37 E0.24671699999550004
+G1 X216.475 Y100.37 E0.009128528999833612
+G1 X216.475 Y90.37 E0.24671699999550004
+G1 X216.845 Y90.37 E0.009128528999833612
+G1 X216.845 Y100.37 E0.24671699999550004
+G1 X217.215 Y100.37 E0.009128528999833612
+G1 X217.215 Y90.37 E0.24671699999550004
+G1 X217.585 Y90.37 E0.009128528999833612
+G1 X217.585 Y100.37 E0.24671699999550004
+G1 X217.955 Y100.37 E0.009128528999833612
+G1 X217.955 Y90.37 E0.24671699999550004
+G1 X218.325 Y90.37 E0.009128528999832911
+G1 X218.325 Y100.37 E0.24671699999550004
+G1 X218.695 Y100.37 E0.009128528999833612
+G1 X218.695 Y90.37 E0.24671699999550004
+G1 X219.065 Y90.37 E0.009128528999833612
+G1 X219.065 Y100.37 E0.24671699999550004
+G1 X219.435 Y100.37 E0.009128528999833612
+G1 X219.435 Y90.37 E0.24671699999550004
+G1 X219.805 Y90.37 E0.009128528999833612
+G1 X219.805 Y100.37 E0.24671699999550004
+G1 X220.175 Y100.37 E0.009128528999833612
+G1 X220.175 Y90.37 E0.24671699999550004
+G1 Z0.75 F6000.0; move z up
+G0 X210.185 Y100.555
+G1 Z0.3; move z down 
+G1 X210.185 Y110.555 E0.34873611583353936
+G1 X210.555 Y110.555 E0.009128528999833612
+G1 X210.555 Y100.555 E0.24671699999550004
+G1 X210.925 Y100.555 E0.009128528999833612
+G1 X210.925 Y110.555 E0.24671699999550004
+G1 X211.295 Y110.555 E0.009128528999832911
+G1 X211.295 Y100.555 E0.24671699999550004
+G1 X211.665 Y100.555 E0.009128528999833612
+G1 X211.665 Y110.555 E0.24671699999550004
+G1 X212.035 Y110.555 E0.009128528999833612
+G1 X212.035 Y100.555 E0.24671699999550004
+G1 X212.405 Y100.555 E0.009128528999833612
+G1 X212.405 Y110.555 E0.24671699999550004
+G1 X212.775 Y110.555 E0.009128528999833612
+G1 X212.775 Y100.555 E0.24671699999550004
+G1 X213.145 Y100.555 E0.009128528999833612
+G1 X213.145 Y110.555 E0.24671699999550004
+G1 X213.515 Y110.555 E0.009128528999832911
+G1 X213.515 Y100.555 E0.24671699999550004
+G1 X213.885 Y100.555 E0.009128528999833612
+G1 X213.885 Y110.555 E0.24671699999550004
+G1 X214.255 Y110.555 E0.009128528999833612
+G1 X214.255 Y100.555 E0.24671699999550004
+G1 X214.625 Y100.555 E0.009128528999833612
+G1 X214.625 Y110.555 E0.24671699999550004
+G1 X214.995 Y110.555 E0.009128528999833612
+G1 X214.995 Y100.555 E0.24671699999550004
+G1 X215.365 Y100.555 E0.009128528999833612
+G1 X215.365 Y110.555 E0.24671699999550004
+G1 X215.735 Y110.555 E0.009128528999833612
+G1 X215.735 Y100.555 E0.24671699999550004
+G1 X216.105 Y100.555 E0.009128528999832911
+G1 X216.105 Y110.555 E0.24671699999550004
+G1 X216.475 Y110.555 E0.009128528999833612
+G1 X216.475 Y100.555 E0.24671699999550004
+G1 X216.845 Y100.555 E0.009128528999833612
+G1 X216.845 Y110.555 E0.24671699999550004
+G1 X217.215 Y110.555 E0.009128528999833612
+G1 X217.215 Y100.555 E0.24671699999550004
+G1 X217.585 Y100.555 E0.009128528999833612
+G1 X217.585 Y110.555 E0.24671699999550004
+G1 X217.955 Y110.555 E0.009128528999833612
+G1 X217.955 Y100.555 E0.24671699999550004
+G1 X218.325 Y100.555 E0.009128528999832911
+G1 X218.325 Y110.555 E0.24671699999550004
+G1 X218.695 Y110.555 E0.009128528999833612
+G1 X218.695 Y100.555 E0.24671699999550004
+G1 X219.065 Y100.555 E0.009128528999833612
+G1 X219.065 Y110.555 E0.24671699999550004
+G1 X219.435 Y110.555 E0.009128528999833612
+G1 X219.435 Y100.555 E0.24671699999550004
+G1 X219.805 Y100.555 E0.009128528999833612
+G1 X219.805 Y110.555 E0.24671699999550004
+G1 X220.175 Y110.555 E0.009128528999833612
+G1 X220.175 Y100.555 E0.24671699999550004
+G1 Z0.75 F6000.0; move z up
+G0 X220.37 Y70.0
+G1 Z0.3; move z down 
+G1 X220.37 Y70.0 E0.3468892805904708
+G1 X220.893259 Y70.0 E0.012909689070064434
+G1 X220.37 Y70.5233 E0.01825777264949695
+G1 X220.37 Y71.0465 E0.012908233439764279
+G1 X221.416518 Y70.0 E0.036513800719685276
+G1 X221.939777 Y70.0 E0.012909689070064434
+G1 X220.37 Y71.5698 E0.05477157335529104
+G1 X220.37 Y72.093 E0.012908233439764629
+G1 X222.463036 Y70.0 E0.07302760143937082
+G1 X222.986295 Y70.0 E0.012909689070065136
+G1 X220.37 Y72.6163 E0.09128537407219847
+G1 X220.37 Y73.1396 E0.012910700609764666
+G1 X223.509554 Y70.0 E0.10954314671058257
+G1 X224.032813 Y70.0 E0.012909689070064434
+G1 X220.37 Y73.6628 E0.12779917479069325
+G1 X220.37 Y74.1861 E0.012910700609764314
+G1 X224.556072 Y70.0 E0.14605694742679493
+G1 X225.079331 Y70.0 E0.012909689070064434
+G1 X220.37 Y74.7093 E0.16431297550971705
+G1 X220.37 Y75.2326 E0.012910700609764666
+G1 X225.60259 Y70.0 E0.1825707481443967
+G1 X226.125849 Y70.0 E0.012909689070064434
+G1 X220.37 Y75.7558 E0.20082677622898135
+G1 X220.37 Y76.2791 E0.012910700609764666
+G1 X226.649108 Y70.0 E0.2190845488626933
+G1 X227.172367 Y70.0 E0.012909689070064434
+G1 X220.37 Y76.8024 E0.2373423214988334
+G1 X220.37 Y77.3256 E0.012908233439764279
+G1 X227.695626 Y70.0 E0.2555983495813864
+G1 X228.218885 Y70.0 E0.012909689070064434
+G1 X220.37 Y77.8489 E0.2738561222165951
+G1 X220.37 Y78.3721 E0.012908233439764629
+G1 X228.742144 Y70.0 E0.29211215030032756
+G1 X229.265403 Y70.0 E0.012909689070064434
+G1 X220.37 Y78.8954 E0.31036992293480953
+G1 X220.37 Y79.4187 E0.012910700609764666
+G1 X229.788662 Y70.0 E0.32862769557096005
+G1 X230.311921 Y70.0 E0.012909689070065136
+G1 X220.37 Y79.9419 E0.3468837236533343
+G1 X220.8352 Y80.0 E0.011566440558188427
+G1 X230.37 Y70.4652 E0.33267920972412385
+G1 X230.37 Y70.9884 E0.012908233439764629
+G1 X221.3584 Y80.0 E0.31442421092733086
+G1 X221.8817 Y80.0 E0.012910700609764666
+G1 X230.37 Y71.5117 E0.2961657230252631
+G1 X230.37 Y72.035 E0.012910700609764314
+G1 X222.4049 Y80.0 E0.27790897968130857
+G1 X222.9282 Y80.0 E0.012910700609764666
+G1 X230.37 Y72.5582 E0.2596522363264025
+G1 X230.37 Y73.0815 E0.012910700609764666
+G1 X223.4515 Y80.0 E0.2413937484243347
+G1 X223.9747 Y80.0 E0.012908233439764629
+G1 X230.37 Y73.6047 E0.2231387496275419
+G1 X230.37 Y74.128 E0.012910700609764666
+G1 X224.498 Y80.0 E0.20488026172547466
+G1 X225.0212 Y80.0 E0.012908233439764629
+G1 X230.37 Y74.6513 E0.18662351838419824
+G1 X230.37 Y75.1745 E0.012908233439764279
+G1 X225.5445 Y80.0 E0.16836677502661407
+G1 X226.0677 Y80.0 E0.012908233439764629
+G1 X230.37 Y75.6978 E0.15011003168732112
+G1 X230.37 Y76.221 E0.012908233439764629
+G1 X226.591 Y80.0 E0.13185328832775323
+G1 X227.1143 Y80.0 E0.012910700609763966
+G1 X230.37 Y76.7443 E0.1135948004256862
+G1 X230.37 Y77.2675 E0.012908233439764629
+G1 X227.6375 Y80.0 E0.09533980162889315
+G1 X228.1608 Y80.0 E0.012910700609764666
+G1 X230.37 Y77.7908 E0.07708131372682538
+G1 X230.37 Y78.3141 E0.012910700609764314
+G1 X228.684 Y80.0 E0.0588245704032642
+G1 X229.2073 Y80.0 E0.012910700609764666
+G1 X230.37 Y78.8373 E0.04056782702796479
+G1 X230.37 Y79.3606 E0.012910700609764666
+G1 X229.7306 Y80.0 E0.022309339125897016
+G1 X230.2538 Y80.0 E0.012908233439764629
+G1 X230.37 Y79.8838 E0.004054340329104216
+G1 Z0.75 F6000.0; move z up
+G0 X220.37 Y80.185
+G1 Z0.3; move z down 
+G1 X220.37 Y80.185 E0.3468892805904708
+G1 X220.893259 Y80.185 E0.012909689070064434
+G1 X220.37 Y80.7083 E0.018257772649496705
+G1 X220.37 Y81.2315 E0.012908233439764629
+G1 X221.416518 Y80.185 E0.036513800719685276
+G1 X221.939777 Y80.185 E0.012909689070064434
+G1 X220.37 Y81.7548 E0.05477157335529104
+G1 X220.37 Y82.278 E0.012908233439764629
+G1 X222.463036 Y80.185 E0.07302760143937082
+G1 X222.986295 Y80.185 E0.012909689070065136
+G1 X220.37 Y82.8013 E0.09128537407219847
+G1 X220.37 Y83.3246 E0.012910700609764666
+G1 X223.509554 Y80.185 E0.10954314671058257
+G1 X224.032813 Y80.185 E0.012909689070064434
+G1 X220.37 Y83.8478 E0.12779917479069325
+G1 X220.37 Y84.3711 E0.012910700609764314
+G1 X224.556072 Y80.185 E0.14605694742679493
+G1 X225.079331 Y80.185 E0.012909689070064434
+G1 X220.37 Y84.8943 E0.16431297550971705
+G1 X220.37 Y85.4176 E0.012910700609764314
+G1 X225.60259 Y80.185 E0.18257074814439642
+G1 X226.125849 Y80.185 E0.012909689070064434
+G1 X220.37 Y85.9408 E0.20082677622898135
+G1 X220.37 Y86.4641 E0.012910700609764666
+G1 X226.649108 Y80.185 E0.2190845488626933
+G1 X227.172367 Y80.185 E0.012909689070064434
+G1 X220.37 Y86.9874 E0.23734232149883308
+G1 X220.37 Y87.5106 E0.012908233439764629
+G1 X227.695626 Y80.185 E0.2555983495813864
+G1 X228.218885 Y80.185 E0.012909689070064434
+G1 X220.37 Y88.0339 E0.2738561222165951
+G1 X220.37 Y88.5571 E0.012908233439764629
+G1 X228.742144 Y80.185 E0.29211215030032756
+G1 X229.265403 Y80.185 E0.012909689070064434
+G1 X220.37 Y89.0804 E0.31036992293480953
+G1 X220.37 Y89.6037 E0.012910700609764666
+G1 X229.788662 Y80.185 E0.32862769557096005
+G1 X230.311921 Y80.185 E0.012909689070065136
+G1 X220.37 Y90.1269 E0.3468837236533343
+G1 X220.8352 Y90.185 E0.011566440558188427
+G1 X230.37 Y80.6502 E0.33267920972412385
+G1 X230.37 Y81.1734 E0.012908233439764629
+G1 X221.3584 Y90.185 E0.31442421092733086
+G1 X221.8817 Y90.185 E0.012910700609764666
+G1 X230.37 Y81.6967 E0.2961657230252631
+G1 X230.37 Y82.22 E0.012910700609764314
+G1 X222.4049 Y90.185 E0.27790897968130857
+G1 X222.9282 Y90.185 E0.012910700609764666
+G1 X230.37 Y82.7432 E0.2596522363264025
+G1 X230.37 Y83.2665 E0.012910700609764314
+G1 X223.4515 Y90.185 E0.24139374842433495
+G1 X223.9747 Y90.185 E0.012908233439764629
+G1 X230.37 Y83.7897 E0.2231387496275419
+G1 X230.37 Y84.313 E0.012910700609764666
+G1 X224.498 Y90.185 E0.20488026172547466
+G1 X225.0212 Y90.185 E0.012908233439764629
+G1 X230.37 Y84.8363 E0.1866235183841985
+G1 X230.37 Y85.3595 E0.012908233439764629
+G1 X225.5445 Y90.185 E0.16836677502661407
+G1 X226.0677 Y90.185 E0.012908233439764629
+G1 X230.37 Y85.8828 E0.15011003168732112
+G1 X230.37 Y86.406 E0.012908233439764629
+G1 X226.591 Y90.185 E0.13185328832775323
+G1 X227.1143 Y90.185 E0.012910700609763966
+G1 X230.37 Y86.9293 E0.1135948004256862
+G1 X230.37 Y87.4525 E0.012908233439764629
+G1 X227.6375 Y90.185 E0.09533980162889315
+G1 X228.1608 Y90.185 E0.012910700609764666
+G1 X230.37 Y87.9758 E0.07708131372682538
+G1 X230.37 Y88.4991 E0.012910700609764314
+G1 X228.684 Y90.185 E0.0588245704032642
+G1 X229.2073 Y90.185 E0.012910700609764666
+G1 X230.37 Y89.0223 E0.04056782702796479
+G1 X230.37 Y89.5456 E0.012910700609764314
+G1 X229.7306 Y90.185 E0.022309339125897262
+G1 X230.2538 Y90.185 E0.012908233439764629
+G1 X230.37 Y90.0688 E0.004054340329104216
+G1 Z0.75 F6000.0; move z up
+G0 X220.37 Y90.37
+G1 Z0.3; move z down 
+G1 X220.37 Y100.37 E0.34873611583353936
+G1 X220.74 Y100.37 E0.009128528999833612
+G1 X220.74 Y90.37 E0.24671699999550004
+G1 X221.11 Y90.37 E0.009128528999833612
+G1 X221.11 Y100.37 E0.24671699999550004
+G1 X221.48 Y100.37 E0.009128528999832911
+G1 X221.48 Y90.37 E0.24671699999550004
+G1 X221.85 Y90.37 E0.009128528999833612
+G1 X221.85 Y100.37 E0.24671699999550004
+G1 X222.22 Y100.37 E0.009128528999833612
+G1 X222.22 Y90.37 E0.24671699999550004
+G1 X222.59 Y90.37 E0.009128528999833612
+G1 X222.59 Y100.37 E0.24671699999550004
+G1 X222.96 Y100.37 E0.009128528999833612
+G1 X222.96 Y90.37 E0.24671699999550004
+G1 X223.33 Y90.37 E0.009128528999833612
+G1 X223.33 Y100.37 E0.24671699999550004
+G1 X223.7 Y100.37 E0.009128528999832911
+G1 X223.7 Y90.37 E0.24671699999550004
+G1 X224.07 Y90.37 E0.009128528999833612
+G1 X224.07 Y100.37 E0.24671699999550004
+G1 X224.44 Y100.37 E0.009128528999833612
+G1 X224.44 Y90.37 E0.24671699999550004
+G1 X224.81 Y90.37 E0.009128528999833612
+G1 X224.81 Y100.37 E0.24671699999550004
+G1 X225.18 Y100.37 E0.009128528999833612
+G1 X225.18 Y90.37 E0.24671699999550004
+G1 X225.55 Y90.37 E0.009128528999833612
+G1 X225.55 Y100.37 E0.24671699999550004
+G1 X225.92 Y100.37 E0.009128528999832911
+G1 X225.92 Y90.37 E0.24671699999550004
+G1 X226.29 Y90.37 E0.009128528999833612
+G1 X226.29 Y100.37 E0.24671699999550004
+G1 X226.66 Y100.37 E0.009128528999833612
+G1 X226.66 Y90.37 E0.24671699999550004
+G1 X227.03 Y90.37 E0.009128528999833612
+G1 X227.03 Y100.37 E0.24671699999550004
+G1 X227.4 Y100.37 E0.009128528999833612
+G1 X227.4 Y90.37 E0.24671699999550004
+G1 X227.77 Y90.37 E0.009128528999833612
+G1 X227.77 Y100.37 E0.24671699999550004
+G1 X228.14 Y100.37 E0.009128528999832911
+G1 X228.14 Y90.37 E0.24671699999550004
+G1 X228.51 Y90.37 E0.009128528999833612
+G1 X228.51 Y100.37 E0.24671699999550004
+G1 X228.88 Y100.37 E0.009128528999833612
+G1 X228.88 Y90.37 E0.24671699999550004
+G1 X229.25 Y90.37 E0.009128528999833612
+G1 X229.25 Y100.37 E0.24671699999550004
+G1 X229.62 Y100.37 E0.009128528999833612
+G1 X229.62 Y90.37 E0.24671699999550004
+G1 X229.99 Y90.37 E0.009128528999833612
+G1 X229.99 Y100.37 E0.24671699999550004
+G1 X230.36 Y100.37 E0.009128528999833612
+G1 X230.36 Y90.37 E0.24671699999550004
+G1 Z0.75 F6000.0; move z up
+G0 X220.37 Y100.555
+G1 Z0.3; move z down 
+G1 X220.37 Y110.555 E0.34873611583353936
+G1 X220.74 Y110.555 E0.009128528999833612
+G1 X220.74 Y100.555 E0.24671699999550004
+G1 X221.11 Y100.555 E0.009128528999833612
+G1 X221.11 Y110.555 E0.24671699999550004
+G1 X221.48 Y110.555 E0.009128528999832911
+G1 X221.48 Y100.555 E0.24671699999550004
+G1 X221.85 Y100.555 E0.009128528999833612
+G1 X221.85 Y110.555 E0.24671699999550004
+G1 X222.22 Y110.555 E0.009128528999833612
+G1 X222.22 Y100.555 E0.24671699999550004
+G1 X222.59 Y100.555 E0.009128528999833612
+G1 X222.59 Y110.555 E0.24671699999550004
+G1 X222.96 Y110.555 E0.009128528999833612
+G1 X222.96 Y100.555 E0.24671699999550004
+G1 X223.33 Y100.555 E0.009128528999833612
+G1 X223.33 Y110.555 E0.24671699999550004
+G1 X223.7 Y110.555 E0.009128528999832911
+G1 X223.7 Y100.555 E0.24671699999550004
+G1 X224.07 Y100.555 E0.009128528999833612
+G1 X224.07 Y110.555 E0.24671699999550004
+G1 X224.44 Y110.555 E0.009128528999833612
+G1 X224.44 Y100.555 E0.24671699999550004
+G1 X224.81 Y100.555 E0.009128528999833612
+G1 X224.81 Y110.555 E0.24671699999550004
+G1 X225.18 Y110.555 E0.009128528999833612
+G1 X225.18 Y100.555 E0.24671699999550004
+G1 X225.55 Y100.555 E0.009128528999833612
+G1 X225.55 Y110.555 E0.24671699999550004
+G1 X225.92 Y110.555 E0.009128528999832911
+G1 X225.92 Y100.555 E0.24671699999550004
+G1 X226.29 Y100.555 E0.009128528999833612
+G1 X226.29 Y110.555 E0.24671699999550004
+G1 X226.66 Y110.555 E0.009128528999833612
+G1 X226.66 Y100.555 E0.24671699999550004
+G1 X227.03 Y100.555 E0.009128528999833612
+G1 X227.03 Y110.555 E0.24671699999550004
+G1 X227.4 Y110.555 E0.009128528999833612
+G1 X227.4 Y100.555 E0.24671699999550004
+G1 X227.77 Y100.555 E0.009128528999833612
+G1 X227.77 Y110.555 E0.24671699999550004
+G1 X228.14 Y110.555 E0.009128528999832911
+G1 X228.14 Y100.555 E0.24671699999550004
+G1 X228.51 Y100.555 E0.009128528999833612
+G1 X228.51 Y110.555 E0.24671699999550004
+G1 X228.88 Y110.555 E0.009128528999833612
+G1 X228.88 Y100.555 E0.24671699999550004
+G1 X229.25 Y100.555 E0.009128528999833612
+G1 X229.25 Y110.555 E0.24671699999550004
+G1 X229.62 Y110.555 E0.009128528999833612
+G1 X229.62 Y100.555 E0.24671699999550004
+G1 X229.99 Y100.555 E0.009128528999833612
+G1 X229.99 Y110.555 E0.24671699999550004
+G1 X230.36 Y110.555 E0.009128528999833612
+G1 X230.36 Y100.555 E0.24671699999550004
+G92 E0.0
+;0.44999999999999996
+G1 E-0.80000 F2100.00000
+G1 Z0.600 F10800.000
+;AFTER_LAYER_CHANGE
+;0.44999999999999996
+G1 X200 Y70
+G1 Z0.44999999999999996
+G1 E0.80000 F2100.00000
+M204 S2000
+G1 F2000
+
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X200.0 Y70.0
+G1 Z0.44999999999999996; move z down 
+G1 X200.0 Y80.0 E0.34873611583353936
+G1 X200.37 Y80.0 E0.009128528999833612
+G1 X200.37 Y70.0 E0.24671699999550004
+G1 X200.74 Y70.0 E0.009128528999833612
+G1 X200.74 Y80.0 E0.24671699999550004
+G1 X201.11 Y80.0 E0.009128528999833612
+G1 X201.11 Y70.0 E0.24671699999550004
+G1 X201.48 Y70.0 E0.009128528999832911
+G1 X201.48 Y80.0 E0.24671699999550004
+G1 X201.85 Y80.0 E0.009128528999833612
+G1 X201.85 Y70.0 E0.24671699999550004
+G1 X202.22 Y70.0 E0.009128528999833612
+G1 X202.22 Y80.0 E0.24671699999550004
+G1 X202.59 Y80.0 E0.009128528999833612
+G1 X202.59 Y70.0 E0.24671699999550004
+G1 X202.96 Y70.0 E0.009128528999833612
+G1 X202.96 Y80.0 E0.24671699999550004
+G1 X203.33 Y80.0 E0.009128528999833612
+G1 X203.33 Y70.0 E0.24671699999550004
+G1 X203.7 Y70.0 E0.009128528999832911
+G1 X203.7 Y80.0 E0.24671699999550004
+G1 X204.07 Y80.0 E0.009128528999833612
+G1 X204.07 Y70.0 E0.24671699999550004
+G1 X204.44 Y70.0 E0.009128528999833612
+G1 X204.44 Y80.0 E0.24671699999550004
+G1 X204.81 Y80.0 E0.009128528999833612
+G1 X204.81 Y70.0 E0.24671699999550004
+G1 X205.18 Y70.0 E0.009128528999833612
+G1 X205.18 Y80.0 E0.24671699999550004
+G1 X205.55 Y80.0 E0.009128528999833612
+G1 X205.55 Y70.0 E0.24671699999550004
+G1 X205.92 Y70.0 E0.009128528999832911
+G1 X205.92 Y80.0 E0.24671699999550004
+G1 X206.29 Y80.0 E0.009128528999833612
+G1 X206.29 Y70.0 E0.24671699999550004
+G1 X206.66 Y70.0 E0.009128528999833612
+G1 X206.66 Y80.0 E0.24671699999550004
+G1 X207.03 Y80.0 E0.009128528999833612
+G1 X207.03 Y70.0 E0.24671699999550004
+G1 X207.4 Y70.0 E0.009128528999833612
+G1 X207.4 Y80.0 E0.24671699999550004
+G1 X207.77 Y80.0 E0.009128528999833612
+G1 X207.77 Y70.0 E0.24671699999550004
+G1 X208.14 Y70.0 E0.009128528999832911
+G1 X208.14 Y80.0 E0.24671699999550004
+G1 X208.51 Y80.0 E0.009128528999833612
+G1 X208.51 Y70.0 E0.24671699999550004
+G1 X208.88 Y70.0 E0.009128528999833612
+G1 X208.88 Y80.0 E0.24671699999550004
+G1 X209.25 Y80.0 E0.009128528999833612
+G1 X209.25 Y70.0 E0.24671699999550004
+G1 X209.62 Y70.0 E0.009128528999833612
+G1 X209.62 Y80.0 E0.24671699999550004
+G1 X209.99 Y80.0 E0.009128528999833612
+G1 X209.99 Y70.0 E0.24671699999550004
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X200.0 Y80.185
+G1 Z0.44999999999999996; move z down 
+G1 X200.0 Y90.185 E0.34873611583353936
+G1 X200.37 Y90.185 E0.009128528999833612
+G1 X200.37 Y80.185 E0.24671699999550004
+G1 X200.74 Y80.185 E0.009128528999833612
+G1 X200.74 Y90.185 E0.24671699999550004
+G1 X201.11 Y90.185 E0.009128528999833612
+G1 X201.11 Y80.185 E0.24671699999550004
+G1 X201.48 Y80.185 E0.009128528999832911
+G1 X201.48 Y90.185 E0.24671699999550004
+G1 X201.85 Y90.185 E0.009128528999833612
+G1 X201.85 Y80.185 E0.24671699999550004
+G1 X202.22 Y80.185 E0.009128528999833612
+G1 X202.22 Y90.185 E0.24671699999550004
+G1 X202.59 Y90.185 E0.009128528999833612
+G1 X202.59 Y80.185 E0.24671699999550004
+G1 X202.96 Y80.185 E0.009128528999833612
+G1 X202.96 Y90.185 E0.24671699999550004
+G1 X203.33 Y90.185 E0.009128528999833612
+G1 X203.33 Y80.185 E0.24671699999550004
+G1 X203.7 Y80.185 E0.009128528999832911
+G1 X203.7 Y90.185 E0.24671699999550004
+G1 X204.07 Y90.185 E0.009128528999833612
+G1 X204.07 Y80.185 E0.24671699999550004
+G1 X204.44 Y80.185 E0.009128528999833612
+G1 X204.44 Y90.185 E0.24671699999550004
+G1 X204.81 Y90.185 E0.009128528999833612
+G1 X204.81 Y80.185 E0.24671699999550004
+G1 X205.18 Y80.185 E0.009128528999833612
+G1 X205.18 Y90.185 E0.24671699999550004
+G1 X205.55 Y90.185 E0.009128528999833612
+G1 X205.55 Y80.185 E0.24671699999550004
+G1 X205.92 Y80.185 E0.009128528999832911
+G1 X205.92 Y90.185 E0.24671699999550004
+G1 X206.29 Y90.185 E0.009128528999833612
+G1 X206.29 Y80.185 E0.24671699999550004
+G1 X206.66 Y80.185 E0.009128528999833612
+G1 X206.66 Y90.185 E0.24671699999550004
+G1 X207.03 Y90.185 E0.009128528999833612
+G1 X207.03 Y80.185 E0.24671699999550004
+G1 X207.4 Y80.185 E0.009128528999833612
+G1 X207.4 Y90.185 E0.24671699999550004
+G1 X207.77 Y90.185 E0.009128528999833612
+G1 X207.77 Y80.185 E0.24671699999550004
+G1 X208.14 Y80.185 E0.009128528999832911
+G1 X208.14 Y90.185 E0.24671699999550004
+G1 X208.51 Y90.185 E0.009128528999833612
+G1 X208.51 Y80.185 E0.24671699999550004
+G1 X208.88 Y80.185 E0.009128528999833612
+G1 X208.88 Y90.185 E0.24671699999550004
+G1 X209.25 Y90.185 E0.009128528999833612
+G1 X209.25 Y80.185 E0.24671699999550004
+G1 X209.62 Y80.185 E0.009128528999833612
+G1 X209.62 Y90.185 E0.24671699999550004
+G1 X209.99 Y90.185 E0.009128528999833612
+G1 X209.99 Y80.185 E0.24671699999550004
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X200.0 Y90.37
+G1 Z0.44999999999999996; move z down 
+G1 X200.0 Y90.37 E0.3468892805904708
+G1 X200.523259 Y90.37 E0.012909689070064434
+G1 X200.0 Y90.8933 E0.018257772649496705
+G1 X200.0 Y91.4165 E0.012908233439764629
+G1 X201.046518 Y90.37 E0.036513800719685276
+G1 X201.569777 Y90.37 E0.012909689070064434
+G1 X200.0 Y91.9398 E0.05477157335529104
+G1 X200.0 Y92.463 E0.012908233439764279
+G1 X202.093036 Y90.37 E0.07302760143937106
+G1 X202.616295 Y90.37 E0.012909689070064434
+G1 X200.0 Y92.9863 E0.09128537407219847
+G1 X200.0 Y93.5096 E0.012910700609764666
+G1 X203.139554 Y90.37 E0.10954314671058257
+G1 X203.662813 Y90.37 E0.012909689070064434
+G1 X200.0 Y94.0328 E0.12779917479069303
+G1 X200.0 Y94.5561 E0.012910700609764666
+G1 X204.186072 Y90.37 E0.14605694742679493
+G1 X204.709331 Y90.37 E0.012909689070064434
+G1 X200.0 Y95.0793 E0.16431297550971705
+G1 X200.0 Y95.6026 E0.012910700609764314
+G1 X205.23259 Y90.37 E0.18257074814439642
+G1 X205.755849 Y90.37 E0.012909689070065136
+G1 X200.0 Y96.1258 E0.20082677622898185
+G1 X200.0 Y96.6491 E0.012910700609764666
+G1 X206.279108 Y90.37 E0.2190845488626933
+G1 X206.802367 Y90.37 E0.012909689070064434
+G1 X200.0 Y97.1724 E0.23734232149883308
+G1 X200.0 Y97.6956 E0.012908233439764629
+G1 X207.325626 Y90.37 E0.2555983495813864
+G1 X207.848885 Y90.37 E0.012909689070064434
+G1 X200.0 Y98.2189 E0.2738561222165951
+G1 X200.0 Y98.7421 E0.012908233439764279
+G1 X208.372144 Y90.37 E0.29211215030032733
+G1 X208.895403 Y90.37 E0.012909689070064434
+G1 X200.0 Y99.2654 E0.31036992293480953
+G1 X200.0 Y99.7887 E0.012910700609764666
+G1 X209.418662 Y90.37 E0.32862769557096055
+G1 X209.941921 Y90.37 E0.012909689070064434
+G1 X200.0 Y100.3119 E0.3468837236533341
+G1 X200.4652 Y100.37 E0.011566440558189166
+G1 X210.0 Y90.8352 E0.3326792097241233
+G1 X210.0 Y91.3584 E0.012908233439764629
+G1 X200.9884 Y100.37 E0.31442421092733036
+G1 X201.5117 Y100.37 E0.012910700609763966
+G1 X210.0 Y91.8817 E0.2961657230252633
+G1 X210.0 Y92.405 E0.012910700609764666
+G1 X202.0349 Y100.37 E0.27790897968130857
+G1 X202.5582 Y100.37 E0.012910700609764666
+G1 X210.0 Y92.9282 E0.2596522363264025
+G1 X210.0 Y93.4515 E0.012910700609764314
+G1 X203.0815 Y100.37 E0.24139374842433495
+G1 X203.6047 Y100.37 E0.012908233439764629
+G1 X210.0 Y93.9747 E0.2231387496275419
+G1 X210.0 Y94.498 E0.012910700609764666
+G1 X204.128 Y100.37 E0.20488026172547466
+G1 X204.6512 Y100.37 E0.012908233439764629
+G1 X210.0 Y95.0213 E0.1866235183841985
+G1 X210.0 Y95.5445 E0.012908233439764629
+G1 X205.1745 Y100.37 E0.16836677502661407
+G1 X205.6977 Y100.37 E0.012908233439764629
+G1 X210.0 Y96.0678 E0.15011003168732112
+G1 X210.0 Y96.591 E0.012908233439764279
+G1 X206.221 Y100.37 E0.13185328832775348
+G1 X206.7443 Y100.37 E0.012910700609764666
+G1 X210.0 Y97.1143 E0.11359480042568568
+G1 X210.0 Y97.6375 E0.012908233439764629
+G1 X207.2675 Y100.37 E0.09533980162889265
+G1 X207.7908 Y100.37 E0.012910700609763966
+G1 X210.0 Y98.1608 E0.07708131372682563
+G1 X210.0 Y98.6841 E0.012910700609764666
+G1 X208.314 Y100.37 E0.0588245704032642
+G1 X208.8373 Y100.37 E0.012910700609764666
+G1 X210.0 Y99.2073 E0.04056782702796479
+G1 X210.0 Y99.7306 E0.012910700609764314
+G1 X209.3606 Y100.37 E0.022309339125897262
+G1 X209.8838 Y100.37 E0.012908233439764629
+G1 X210.0 Y100.2538 E0.004054340329104216
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X200.0 Y100.555
+G1 Z0.44999999999999996; move z down 
+G1 X200.0 Y100.555 E0.3468892805904708
+G1 X200.523259 Y100.555 E0.012909689070064434
+G1 X200.0 Y101.0783 E0.018257772649496705
+G1 X200.0 Y101.6015 E0.012908233439764629
+G1 X201.046518 Y100.555 E0.036513800719685276
+G1 X201.569777 Y100.555 E0.012909689070064434
+G1 X200.0 Y102.1248 E0.054771573355290794
+G1 X200.0 Y102.648 E0.012908233439764629
+G1 X202.093036 Y100.555 E0.07302760143937106
+G1 X202.616295 Y100.555 E0.012909689070064434
+G1 X200.0 Y103.1713 E0.09128537407219847
+G1 X200.0 Y103.6946 E0.012910700609764314
+G1 X203.139554 Y100.555 E0.10954314671058231
+G1 X203.662813 Y100.555 E0.012909689070064434
+G1 X200.0 Y104.2178 E0.12779917479069303
+G1 X200.0 Y104.7411 E0.012910700609764666
+G1 X204.186072 Y100.555 E0.14605694742679493
+G1 X204.709331 Y100.555 E0.012909689070064434
+G1 X200.0 Y105.2643 E0.16431297550971705
+G1 X200.0 Y105.7876 E0.012910700609764314
+G1 X205.23259 Y100.555 E0.18257074814439642
+G1 X205.755849 Y100.555 E0.012909689070065136
+G1 X200.0 Y106.3108 E0.20082677622898185
+G1 X200.0 Y106.8341 E0.012910700609764666
+G1 X206.279108 Y100.555 E0.2190845488626933
+G1 X206.802367 Y100.555 E0.012909689070064434
+G1 X200.0 Y107.3574 E0.23734232149883308
+G1 X200.0 Y107.8806 E0.012908233439764629
+G1 X207.325626 Y100.555 E0.2555983495813864
+G1 X207.848885 Y100.555 E0.012909689070064434
+G1 X200.0 Y108.4039 E0.273856122216595
+G1 X200.0 Y108.9271 E0.012908233439764629
+G1 X208.372144 Y100.555 E0.29211215030032733
+G1 X208.895403 Y100.555 E0.012909689070064434
+G1 X200.0 Y109.4504 E0.31036992293480953
+G1 X200.0 Y109.9737 E0.012910700609764314
+G1 X209.418662 Y100.555 E0.3286276955709604
+G1 X209.941921 Y100.555 E0.012909689070064434
+G1 X200.0 Y110.4969 E0.3468837236533341
+G1 X200.4652 Y110.555 E0.011566440558189166
+G1 X210.0 Y101.0202 E0.3326792097241233
+G1 X210.0 Y101.5434 E0.012908233439764629
+G1 X200.9884 Y110.555 E0.31442421092733036
+G1 X201.5117 Y110.555 E0.012910700609763966
+G1 X210.0 Y102.0667 E0.2961657230252633
+G1 X210.0 Y102.59 E0.012910700609764666
+G1 X202.0349 Y110.555 E0.27790897968130857
+G1 X202.5582 Y110.555 E0.012910700609764666
+G1 X210.0 Y103.1132 E0.2596522363264025
+G1 X210.0 Y103.6365 E0.012910700609764314
+G1 X203.0815 Y110.555 E0.24139374842433495
+G1 X203.6047 Y110.555 E0.012908233439764629
+G1 X210.0 Y104.1597 E0.2231387496275419
+G1 X210.0 Y104.683 E0.012910700609764666
+G1 X204.128 Y110.555 E0.20488026172547466
+G1 X204.6512 Y110.555 E0.012908233439764629
+G1 X210.0 Y105.2063 E0.1866235183841985
+G1 X210.0 Y105.7295 E0.012908233439764629
+G1 X205.1745 Y110.555 E0.16836677502661407
+G1 X205.6977 Y110.555 E0.012908233439764629
+G1 X210.0 Y106.2528 E0.15011003168732134
+G1 X210.0 Y106.776 E0.012908233439764629
+G1 X206.221 Y110.555 E0.13185328832775348
+G1 X206.7443 Y110.555 E0.012910700609764666
+G1 X210.0 Y107.2993 E0.11359480042568568
+G1 X210.0 Y107.8225 E0.012908233439764629
+G1 X207.2675 Y110.555 E0.09533980162889265
+G1 X207.7908 Y110.555 E0.012910700609763966
+G1 X210.0 Y108.3458 E0.07708131372682563
+G1 X210.0 Y108.8691 E0.012910700609764666
+G1 X208.314 Y110.555 E0.0588245704032642
+G1 X208.8373 Y110.555 E0.012910700609764666
+G1 X210.0 Y109.3923 E0.04056782702796479
+G1 X210.0 Y109.9156 E0.012910700609764314
+G1 X209.3606 Y110.555 E0.022309339125897262
+G1 X209.8838 Y110.555 E0.012908233439764629
+G1 X210.0 Y110.4388 E0.004054340329104216
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X210.185 Y70.0
+G1 Z0.44999999999999996; move z down 
+G1 X210.185 Y80.0 E0.34873611583353936
+G1 X210.555 Y80.0 E0.009128528999833612
+G1 X210.555 Y70.0 E0.24671699999550004
+G1 X210.925 Y70.0 E0.009128528999833612
+G1 X210.925 Y80.0 E0.24671699999550004
+G1 X211.295 Y80.0 E0.009128528999832911
+G1 X211.295 Y70.0 E0.24671699999550004
+G1 X211.665 Y70.0 E0.009128528999833612
+G1 X211.665 Y80.0 E0.24671699999550004
+G1 X212.035 Y80.0 E0.009128528999833612
+G1 X212.035 Y70.0 E0.24671699999550004
+G1 X212.405 Y70.0 E0.009128528999833612
+G1 X212.405 Y80.0 E0.24671699999550004
+G1 X212.775 Y80.0 E0.009128528999833612
+G1 X212.775 Y70.0 E0.24671699999550004
+G1 X213.145 Y70.0 E0.009128528999833612
+G1 X213.145 Y80.0 E0.24671699999550004
+G1 X213.515 Y80.0 E0.009128528999832911
+G1 X213.515 Y70.0 E0.24671699999550004
+G1 X213.885 Y70.0 E0.009128528999833612
+G1 X213.885 Y80.0 E0.24671699999550004
+G1 X214.255 Y80.0 E0.009128528999833612
+G1 X214.255 Y70.0 E0.24671699999550004
+G1 X214.625 Y70.0 E0.009128528999833612
+G1 X214.625 Y80.0 E0.24671699999550004
+G1 X214.995 Y80.0 E0.009128528999833612
+G1 X214.995 Y70.0 E0.24671699999550004
+G1 X215.365 Y70.0 E0.009128528999833612
+G1 X215.365 Y80.0 E0.24671699999550004
+G1 X215.735 Y80.0 E0.009128528999833612
+G1 X215.735 Y70.0 E0.24671699999550004
+G1 X216.105 Y70.0 E0.009128528999832911
+G1 X216.105 Y80.0 E0.24671699999550004
+G1 X216.475 Y80.0 E0.009128528999833612
+G1 X216.475 Y70.0 E0.24671699999550004
+G1 X216.845 Y70.0 E0.009128528999833612
+G1 X216.845 Y80.0 E0.24671699999550004
+G1 X217.215 Y80.0 E0.009128528999833612
+G1 X217.215 Y70.0 E0.24671699999550004
+G1 X217.585 Y70.0 E0.009128528999833612
+G1 X217.585 Y80.0 E0.24671699999550004
+G1 X217.955 Y80.0 E0.009128528999833612
+G1 X217.955 Y70.0 E0.24671699999550004
+G1 X218.325 Y70.0 E0.009128528999832911
+G1 X218.325 Y80.0 E0.24671699999550004
+G1 X218.695 Y80.0 E0.009128528999833612
+G1 X218.695 Y70.0 E0.24671699999550004
+G1 X219.065 Y70.0 E0.009128528999833612
+G1 X219.065 Y80.0 E0.24671699999550004
+G1 X219.435 Y80.0 E0.009128528999833612
+G1 X219.435 Y70.0 E0.24671699999550004
+G1 X219.805 Y70.0 E0.009128528999833612
+G1 X219.805 Y80.0 E0.24671699999550004
+G1 X220.175 Y80.0 E0.009128528999833612
+G1 X220.175 Y70.0 E0.24671699999550004
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X210.185 Y80.185
+G1 Z0.44999999999999996; move z down 
+G1 X210.185 Y90.185 E0.34873611583353936
+G1 X210.555 Y90.185 E0.009128528999833612
+G1 X210.555 Y80.185 E0.24671699999550004
+G1 X210.925 Y80.185 E0.009128528999833612
+G1 X210.925 Y90.185 E0.24671699999550004
+G1 X211.295 Y90.185 E0.009128528999832911
+G1 X211.295 Y80.185 E0.24671699999550004
+G1 X211.665 Y80.185 E0.009128528999833612
+G1 X211.665 Y90.185 E0.24671699999550004
+G1 X212.035 Y90.185 E0.009128528999833612
+G1 X212.035 Y80.185 E0.24671699999550004
+G1 X212.405 Y80.185 E0.009128528999833612
+G1 X212.405 Y90.185 E0.24671699999550004
+G1 X212.775 Y90.185 E0.009128528999833612
+G1 X212.775 Y80.185 E0.24671699999550004
+G1 X213.145 Y80.185 E0.009128528999833612
+G1 X213.145 Y90.185 E0.24671699999550004
+G1 X213.515 Y90.185 E0.009128528999832911
+G1 X213.515 Y80.185 E0.24671699999550004
+G1 X213.885 Y80.185 E0.009128528999833612
+G1 X213.885 Y90.185 E0.24671699999550004
+G1 X214.255 Y90.185 E0.009128528999833612
+G1 X214.255 Y80.185 E0.24671699999550004
+G1 X214.625 Y80.185 E0.009128528999833612
+G1 X214.625 Y90.185 E0.24671699999550004
+G1 X214.995 Y90.185 E0.009128528999833612
+G1 X214.995 Y80.185 E0.24671699999550004
+G1 X215.365 Y80.185 E0.009128528999833612
+G1 X215.365 Y90.185 E0.24671699999550004
+G1 X215.735 Y90.185 E0.009128528999833612
+G1 X215.735 Y80.185 E0.24671699999550004
+G1 X216.105 Y80.185 E0.009128528999832911
+G1 X216.105 Y90.185 E0.24671699999550004
+G1 X216.475 Y90.185 E0.009128528999833612
+G1 X216.475 Y80.185 E0.24671699999550004
+G1 X216.845 Y80.185 E0.009128528999833612
+G1 X216.845 Y90.185 E0.24671699999550004
+G1 X217.215 Y90.185 E0.009128528999833612
+G1 X217.215 Y80.185 E0.24671699999550004
+G1 X217.585 Y80.185 E0.009128528999833612
+G1 X217.585 Y90.185 E0.24671699999550004
+G1 X217.955 Y90.185 E0.009128528999833612
+G1 X217.955 Y80.185 E0.24671699999550004
+G1 X218.325 Y80.185 E0.009128528999832911
+G1 X218.325 Y90.185 E0.24671699999550004
+G1 X218.695 Y90.185 E0.009128528999833612
+G1 X218.695 Y80.185 E0.24671699999550004
+G1 X219.065 Y80.185 E0.009128528999833612
+G1 X219.065 Y90.185 E0.24671699999550004
+G1 X219.435 Y90.185 E0.009128528999833612
+G1 X219.435 Y80.185 E0.24671699999550004
+G1 X219.805 Y80.185 E0.009128528999833612
+G1 X219.805 Y90.185 E0.24671699999550004
+G1 X220.175 Y90.185 E0.009128528999833612
+G1 X220.175 Y80.185 E0.24671699999550004
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X210.185 Y90.37
+G1 Z0.44999999999999996; move z down 
+G1 X210.185 Y90.37 E0.3468892805904708
+G1 X210.708259 Y90.37 E0.012909689070064434
+G1 X210.185 Y90.8933 E0.018257772649496705
+G1 X210.185 Y91.4165 E0.012908233439764629
+G1 X211.231518 Y90.37 E0.036513800719685276
+G1 X211.754777 Y90.37 E0.012909689070064434
+G1 X210.185 Y91.9398 E0.05477157335529104
+G1 X210.185 Y92.463 E0.012908233439764279
+G1 X212.278036 Y90.37 E0.07302760143937055
+G1 X212.801295 Y90.37 E0.012909689070065136
+G1 X210.185 Y92.9863 E0.09128537407219847
+G1 X210.185 Y93.5096 E0.012910700609764666
+G1 X213.324554 Y90.37 E0.10954314671058257
+G1 X213.847813 Y90.37 E0.012909689070064434
+G1 X210.185 Y94.0328 E0.12779917479069303
+G1 X210.185 Y94.5561 E0.012910700609764666
+G1 X214.371072 Y90.37 E0.14605694742679493
+G1 X214.894331 Y90.37 E0.012909689070064434
+G1 X210.185 Y95.0793 E0.16431297550971705
+G1 X210.185 Y95.6026 E0.012910700609764314
+G1 X215.41759 Y90.37 E0.18257074814439642
+G1 X215.940849 Y90.37 E0.012909689070064434
+G1 X210.185 Y96.1258 E0.20082677622898135
+G1 X210.185 Y96.6491 E0.012910700609764666
+G1 X216.464108 Y90.37 E0.2190845488626933
+G1 X216.987367 Y90.37 E0.012909689070064434
+G1 X210.185 Y97.1724 E0.23734232149883308
+G1 X210.185 Y97.6956 E0.012908233439764629
+G1 X217.510626 Y90.37 E0.2555983495813864
+G1 X218.033885 Y90.37 E0.012909689070064434
+G1 X210.185 Y98.2189 E0.2738561222165951
+G1 X210.185 Y98.7421 E0.012908233439764279
+G1 X218.557144 Y90.37 E0.29211215030032733
+G1 X219.080403 Y90.37 E0.012909689070064434
+G1 X210.185 Y99.2654 E0.31036992293480953
+G1 X210.185 Y99.7887 E0.012910700609764666
+G1 X219.603662 Y90.37 E0.32862769557096055
+G1 X220.126921 Y90.37 E0.012909689070064434
+G1 X210.185 Y100.3119 E0.3468837236533341
+G1 X210.6502 Y100.37 E0.011566440558189166
+G1 X220.185 Y90.8352 E0.3326792097241233
+G1 X220.185 Y91.3584 E0.012908233439764629
+G1 X211.1734 Y100.37 E0.31442421092733086
+G1 X211.6967 Y100.37 E0.012910700609764666
+G1 X220.185 Y91.8817 E0.2961657230252633
+G1 X220.185 Y92.405 E0.012910700609764666
+G1 X212.2199 Y100.37 E0.27790897968130857
+G1 X212.7432 Y100.37 E0.012910700609764666
+G1 X220.185 Y92.9282 E0.2596522363264025
+G1 X220.185 Y93.4515 E0.012910700609764314
+G1 X213.2665 Y100.37 E0.24139374842433495
+G1 X213.7897 Y100.37 E0.012908233439764629
+G1 X220.185 Y93.9747 E0.2231387496275419
+G1 X220.185 Y94.498 E0.012910700609764666
+G1 X214.313 Y100.37 E0.20488026172547466
+G1 X214.8362 Y100.37 E0.012908233439764629
+G1 X220.185 Y95.0213 E0.1866235183841985
+G1 X220.185 Y95.5445 E0.012908233439764629
+G1 X215.3595 Y100.37 E0.16836677502661407
+G1 X215.8827 Y100.37 E0.012908233439764629
+G1 X220.185 Y96.0678 E0.15011003168732112
+G1 X220.185 Y96.591 E0.012908233439764279
+G1 X216.406 Y100.37 E0.13185328832775348
+G1 X216.9293 Y100.37 E0.012910700609764666
+G1 X220.185 Y97.1143 E0.11359480042568568
+G1 X220.185 Y97.6375 E0.012908233439764629
+G1 X217.4525 Y100.37 E0.09533980162889315
+G1 X217.9758 Y100.37 E0.012910700609764666
+G1 X220.185 Y98.1608 E0.07708131372682563
+G1 X220.185 Y98.6841 E0.012910700609764666
+G1 X218.499 Y100.37 E0.0588245704032642
+G1 X219.0223 Y100.37 E0.012910700609764666
+G1 X220.185 Y99.2073 E0.04056782702796479
+G1 X220.185 Y99.7306 E0.012910700609764314
+G1 X219.5456 Y100.37 E0.022309339125897262
+G1 X220.0688 Y100.37 E0.012908233439764629
+G1 X220.185 Y100.2538 E0.004054340329104216
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X210.185 Y100.555
+G1 Z0.44999999999999996; move z down 
+G1 X210.185 Y100.555 E0.3468892805904708
+G1 X210.708259 Y100.555 E0.012909689070064434
+G1 X210.185 Y101.0783 E0.018257772649496705
+G1 X210.185 Y101.6015 E0.012908233439764629
+G1 X211.231518 Y100.555 E0.036513800719685276
+G1 X211.754777 Y100.555 E0.012909689070064434
+G1 X210.185 Y102.1248 E0.054771573355290794
+G1 X210.185 Y102.648 E0.012908233439764629
+G1 X212.278036 Y100.555 E0.07302760143937055
+G1 X212.801295 Y100.555 E0.012909689070065136
+G1 X210.185 Y103.1713 E0.09128537407219847
+G1 X210.185 Y103.6946 E0.012910700609764314
+G1 X213.324554 Y100.555 E0.10954314671058231
+G1 X213.847813 Y100.555 E0.012909689070064434
+G1 X210.185 Y104.2178 E0.12779917479069303
+G1 X210.185 Y104.7411 E0.012910700609764666
+G1 X214.371072 Y100.555 E0.14605694742679493
+G1 X214.894331 Y100.555 E0.012909689070064434
+G1 X210.185 Y105.2643 E0.16431297550971705
+G1 X210.185 Y105.7876 E0.012910700609764314
+G1 X215.41759 Y100.555 E0.18257074814439642
+G1 X215.940849 Y100.555 E0.012909689070064434
+G1 X210.185 Y106.3108 E0.20082677622898135
+G1 X210.185 Y106.8341 E0.012910700609764666
+G1 X216.464108 Y100.555 E0.2190845488626933
+G1 X216.987367 Y100.555 E0.012909689070064434
+G1 X210.185 Y107.3574 E0.23734232149883308
+G1 X210.185 Y107.8806 E0.012908233439764629
+G1 X217.510626 Y100.555 E0.2555983495813864
+G1 X218.033885 Y100.555 E0.012909689070064434
+G1 X210.185 Y108.4039 E0.273856122216595
+G1 X210.185 Y108.9271 E0.012908233439764629
+G1 X218.557144 Y100.555 E0.29211215030032733
+G1 X219.080403 Y100.555 E0.012909689070064434
+G1 X210.185 Y109.4504 E0.31036992293480953
+G1 X210.185 Y109.9737 E0.012910700609764314
+G1 X219.603662 Y100.555 E0.3286276955709604
+G1 X220.126921 Y100.555 E0.012909689070064434
+G1 X210.185 Y110.4969 E0.3468837236533341
+G1 X210.6502 Y110.555 E0.011566440558189166
+G1 X220.185 Y101.0202 E0.3326792097241233
+G1 X220.185 Y101.5434 E0.012908233439764629
+G1 X211.1734 Y110.555 E0.31442421092733086
+G1 X211.6967 Y110.555 E0.012910700609764666
+G1 X220.185 Y102.0667 E0.2961657230252633
+G1 X220.185 Y102.59 E0.012910700609764666
+G1 X212.2199 Y110.555 E0.27790897968130857
+G1 X212.7432 Y110.555 E0.012910700609764666
+G1 X220.185 Y103.1132 E0.2596522363264025
+G1 X220.185 Y103.6365 E0.012910700609764314
+G1 X213.2665 Y110.555 E0.24139374842433495
+G1 X213.7897 Y110.555 E0.012908233439764629
+G1 X220.185 Y104.1597 E0.2231387496275419
+G1 X220.185 Y104.683 E0.012910700609764666
+G1 X214.313 Y110.555 E0.20488026172547466
+G1 X214.8362 Y110.555 E0.012908233439764629
+G1 X220.185 Y105.2063 E0.1866235183841985
+G1 X220.185 Y105.7295 E0.012908233439764629
+G1 X215.3595 Y110.555 E0.16836677502661407
+G1 X215.8827 Y110.555 E0.012908233439764629
+G1 X220.185 Y106.2528 E0.15011003168732134
+G1 X220.185 Y106.776 E0.012908233439764629
+G1 X216.406 Y110.555 E0.13185328832775348
+G1 X216.9293 Y110.555 E0.012910700609764666
+G1 X220.185 Y107.2993 E0.11359480042568568
+G1 X220.185 Y107.8225 E0.012908233439764629
+G1 X217.4525 Y110.555 E0.09533980162889315
+G1 X217.9758 Y110.555 E0.012910700609764666
+G1 X220.185 Y108.3458 E0.07708131372682563
+G1 X220.185 Y108.8691 E0.012910700609764666
+G1 X218.499 Y110.555 E0.0588245704032642
+G1 X219.0223 Y110.555 E0.012910700609764666
+G1 X220.185 Y109.3923 E0.04056782702796479
+G1 X220.185 Y109.9156 E0.012910700609764314
+G1 X219.5456 Y110.555 E0.022309339125897262
+G1 X220.0688 Y110.555 E0.012908233439764629
+G1 X220.185 Y110.4388 E0.004054340329104216
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X220.37 Y70.0
+G1 Z0.44999999999999996; move z down 
+G1 X230.37 Y70.0 E0.3487361158335391
+G1 X230.37 Y70.37 E0.009128528999833612
+G1 X220.37 Y70.37 E0.24671699999550004
+G1 X220.37 Y70.74 E0.009128528999833263
+G1 X230.37 Y70.74 E0.24671699999550004
+G1 X230.37 Y71.11 E0.009128528999833612
+G1 X220.37 Y71.11 E0.24671699999550004
+G1 X220.37 Y71.48 E0.009128528999833612
+G1 X230.37 Y71.48 E0.24671699999550004
+G1 X230.37 Y71.85 E0.009128528999833263
+G1 X220.37 Y71.85 E0.24671699999550004
+G1 X220.37 Y72.22 E0.009128528999833612
+G1 X230.37 Y72.22 E0.24671699999550004
+G1 X230.37 Y72.59 E0.009128528999833612
+G1 X220.37 Y72.59 E0.24671699999550004
+G1 X220.37 Y72.96 E0.009128528999833263
+G1 X230.37 Y72.96 E0.24671699999550004
+G1 X230.37 Y73.33 E0.009128528999833612
+G1 X220.37 Y73.33 E0.24671699999550004
+G1 X220.37 Y73.7 E0.009128528999833612
+G1 X230.37 Y73.7 E0.24671699999550004
+G1 X230.37 Y74.07 E0.009128528999833263
+G1 X220.37 Y74.07 E0.24671699999550004
+G1 X220.37 Y74.44 E0.009128528999833612
+G1 X230.37 Y74.44 E0.24671699999550004
+G1 X230.37 Y74.81 E0.009128528999833612
+G1 X220.37 Y74.81 E0.24671699999550004
+G1 X220.37 Y75.18 E0.009128528999833612
+G1 X230.37 Y75.18 E0.24671699999550004
+G1 X230.37 Y75.55 E0.009128528999833263
+G1 X220.37 Y75.55 E0.24671699999550004
+G1 X220.37 Y75.92 E0.009128528999833612
+G1 X230.37 Y75.92 E0.24671699999550004
+G1 X230.37 Y76.29 E0.009128528999833612
+G1 X220.37 Y76.29 E0.24671699999550004
+G1 X220.37 Y76.66 E0.009128528999833263
+G1 X230.37 Y76.66 E0.24671699999550004
+G1 X230.37 Y77.03 E0.009128528999833612
+G1 X220.37 Y77.03 E0.24671699999550004
+G1 X220.37 Y77.4 E0.009128528999833612
+G1 X230.37 Y77.4 E0.24671699999550004
+G1 X230.37 Y77.77 E0.009128528999833263
+G1 X220.37 Y77.77 E0.24671699999550004
+G1 X220.37 Y78.14 E0.009128528999833612
+G1 X230.37 Y78.14 E0.24671699999550004
+G1 X230.37 Y78.51 E0.009128528999833612
+G1 X220.37 Y78.51 E0.24671699999550004
+G1 X220.37 Y78.88 E0.009128528999833263
+G1 X230.37 Y78.88 E0.24671699999550004
+G1 X230.37 Y79.25 E0.009128528999833612
+G1 X220.37 Y79.25 E0.24671699999550004
+G1 X220.37 Y79.62 E0.009128528999833612
+G1 X230.37 Y79.62 E0.24671699999550004
+G1 X230.37 Y79.99 E0.009128528999833263
+G1 X220.37 Y79.99 E0.24671699999550004
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X220.37 Y80.185
+G1 Z0.44999999999999996; move z down 
+G1 X230.37 Y80.185 E0.3487361158335391
+G1 X230.37 Y80.555 E0.009128528999833612
+G1 X220.37 Y80.555 E0.24671699999550004
+G1 X220.37 Y80.925 E0.009128528999833263
+G1 X230.37 Y80.925 E0.24671699999550004
+G1 X230.37 Y81.295 E0.009128528999833612
+G1 X220.37 Y81.295 E0.24671699999550004
+G1 X220.37 Y81.665 E0.009128528999833612
+G1 X230.37 Y81.665 E0.24671699999550004
+G1 X230.37 Y82.035 E0.009128528999833263
+G1 X220.37 Y82.035 E0.24671699999550004
+G1 X220.37 Y82.405 E0.009128528999833612
+G1 X230.37 Y82.405 E0.24671699999550004
+G1 X230.37 Y82.775 E0.009128528999833612
+G1 X220.37 Y82.775 E0.24671699999550004
+G1 X220.37 Y83.145 E0.009128528999833263
+G1 X230.37 Y83.145 E0.24671699999550004
+G1 X230.37 Y83.515 E0.009128528999833612
+G1 X220.37 Y83.515 E0.24671699999550004
+G1 X220.37 Y83.885 E0.009128528999833612
+G1 X230.37 Y83.885 E0.24671699999550004
+G1 X230.37 Y84.255 E0.009128528999833263
+G1 X220.37 Y84.255 E0.24671699999550004
+G1 X220.37 Y84.625 E0.009128528999833612
+G1 X230.37 Y84.625 E0.24671699999550004
+G1 X230.37 Y84.995 E0.009128528999833612
+G1 X220.37 Y84.995 E0.24671699999550004
+G1 X220.37 Y85.365 E0.009128528999833263
+G1 X230.37 Y85.365 E0.24671699999550004
+G1 X230.37 Y85.735 E0.009128528999833612
+G1 X220.37 Y85.735 E0.24671699999550004
+G1 X220.37 Y86.105 E0.009128528999833612
+G1 X230.37 Y86.105 E0.24671699999550004
+G1 X230.37 Y86.475 E0.009128528999833263
+G1 X220.37 Y86.475 E0.24671699999550004
+G1 X220.37 Y86.845 E0.009128528999833612
+G1 X230.37 Y86.845 E0.24671699999550004
+G1 X230.37 Y87.215 E0.009128528999833612
+G1 X220.37 Y87.215 E0.24671699999550004
+G1 X220.37 Y87.585 E0.009128528999833263
+G1 X230.37 Y87.585 E0.24671699999550004
+G1 X230.37 Y87.955 E0.009128528999833612
+G1 X220.37 Y87.955 E0.24671699999550004
+G1 X220.37 Y88.325 E0.009128528999833612
+G1 X230.37 Y88.325 E0.24671699999550004
+G1 X230.37 Y88.695 E0.009128528999833263
+G1 X220.37 Y88.695 E0.24671699999550004
+G1 X220.37 Y89.065 E0.009128528999833612
+G1 X230.37 Y89.065 E0.24671699999550004
+G1 X230.37 Y89.435 E0.009128528999833612
+G1 X220.37 Y89.435 E0.24671699999550004
+G1 X220.37 Y89.805 E0.009128528999833612
+G1 X230.37 Y89.805 E0.24671699999550004
+G1 X230.37 Y90.175 E0.009128528999833263
+G1 X220.37 Y90.175 E0.24671699999550004
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X220.37 Y90.37
+G1 Z0.44999999999999996; move z down 
+G1 X230.37 Y90.37 E0.3487361158335391
+G1 X230.37 Y90.74 E0.009128528999833263
+G1 X220.37 Y90.74 E0.24671699999550004
+G1 X220.37 Y91.11 E0.009128528999833612
+G1 X230.37 Y91.11 E0.24671699999550004
+G1 X230.37 Y91.48 E0.009128528999833612
+G1 X220.37 Y91.48 E0.24671699999550004
+G1 X220.37 Y91.85 E0.009128528999833263
+G1 X230.37 Y91.85 E0.24671699999550004
+G1 X230.37 Y92.22 E0.009128528999833612
+G1 X220.37 Y92.22 E0.24671699999550004
+G1 X220.37 Y92.59 E0.009128528999833612
+G1 X230.37 Y92.59 E0.24671699999550004
+G1 X230.37 Y92.96 E0.009128528999833263
+G1 X220.37 Y92.96 E0.24671699999550004
+G1 X220.37 Y93.33 E0.009128528999833612
+G1 X230.37 Y93.33 E0.24671699999550004
+G1 X230.37 Y93.7 E0.009128528999833612
+G1 X220.37 Y93.7 E0.24671699999550004
+G1 X220.37 Y94.07 E0.009128528999833263
+G1 X230.37 Y94.07 E0.24671699999550004
+G1 X230.37 Y94.44 E0.009128528999833612
+G1 X220.37 Y94.44 E0.24671699999550004
+G1 X220.37 Y94.81 E0.009128528999833612
+G1 X230.37 Y94.81 E0.24671699999550004
+G1 X230.37 Y95.18 E0.009128528999833612
+G1 X220.37 Y95.18 E0.24671699999550004
+G1 X220.37 Y95.55 E0.009128528999833263
+G1 X230.37 Y95.55 E0.24671699999550004
+G1 X230.37 Y95.92 E0.009128528999833612
+G1 X220.37 Y95.92 E0.24671699999550004
+G1 X220.37 Y96.29 E0.009128528999833612
+G1 X230.37 Y96.29 E0.24671699999550004
+G1 X230.37 Y96.66 E0.009128528999833263
+G1 X220.37 Y96.66 E0.24671699999550004
+G1 X220.37 Y97.03 E0.009128528999833612
+G1 X230.37 Y97.03 E0.24671699999550004
+G1 X230.37 Y97.4 E0.009128528999833612
+G1 X220.37 Y97.4 E0.24671699999550004
+G1 X220.37 Y97.77 E0.009128528999833263
+G1 X230.37 Y97.77 E0.24671699999550004
+G1 X230.37 Y98.14 E0.009128528999833612
+G1 X220.37 Y98.14 E0.24671699999550004
+G1 X220.37 Y98.51 E0.009128528999833612
+G1 X230.37 Y98.51 E0.24671699999550004
+G1 X230.37 Y98.88 E0.009128528999833263
+G1 X220.37 Y98.88 E0.24671699999550004
+G1 X220.37 Y99.25 E0.009128528999833612
+G1 X230.37 Y99.25 E0.24671699999550004
+G1 X230.37 Y99.62 E0.009128528999833612
+G1 X220.37 Y99.62 E0.24671699999550004
+G1 X220.37 Y99.99 E0.009128528999833263
+G1 X230.37 Y99.99 E0.24671699999550004
+G1 X230.37 Y100.36 E0.009128528999833612
+G1 X220.37 Y100.36 E0.24671699999550004
+G1 Z0.8999999999999999 F6000.0; move z up
+G0 X220.37 Y100.555
+G1 Z0.44999999999999996; move z down 
+G1 X220.37 Y100.555 E0.3468892805904708
+G1 X220.893259 Y100.555 E0.012909689070064434
+G1 X220.37 Y101.0783 E0.018257772649496705
+G1 X220.37 Y101.6015 E0.012908233439764629
+G1 X221.416518 Y100.555 E0.036513800719685276
+G1 X221.939777 Y100.555 E0.012909689070064434
+G1 X220.37 Y102.1248 E0.054771573355290794
+G1 X220.37 Y102.648 E0.012908233439764629
+G1 X222.463036 Y100.555 E0.07302760143937055
+G1 X222.986295 Y100.555 E0.012909689070065136
+G1 X220.37 Y103.1713 E0.09128537407219847
+G1 X220.37 Y103.6946 E0.012910700609764314
+G1 X223.509554 Y100.555 E0.10954314671058231
+G1 X224.032813 Y100.555 E0.012909689070064434
+G1 X220.37 Y104.2178 E0.12779917479069303
+G1 X220.37 Y104.7411 E0.012910700609764666
+G1 X224.556072 Y100.555 E0.14605694742679493
+G1 X225.079331 Y100.555 E0.012909689070064434
+G1 X220.37 Y105.2643 E0.16431297550971705
+G1 X220.37 Y105.7876 E0.012910700609764314
+G1 X225.60259 Y100.555 E0.18257074814439642
+G1 X226.125849 Y100.555 E0.012909689070064434
+G1 X220.37 Y106.3108 E0.20082677622898135
+G1 X220.37 Y106.8341 E0.012910700609764666
+G1 X226.649108 Y100.555 E0.2190845488626933
+G1 X227.172367 Y100.555 E0.012909689070064434
+G1 X220.37 Y107.3574 E0.23734232149883308
+G1 X220.37 Y107.8806 E0.012908233439764629
+G1 X227.695626 Y100.555 E0.2555983495813864
+G1 X228.218885 Y100.555 E0.012909689070064434
+G1 X220.37 Y108.4039 E0.273856122216595
+G1 X220.37 Y108.9271 E0.012908233439764629
+G1 X228.742144 Y100.555 E0.29211215030032733
+G1 X229.265403 Y100.555 E0.012909689070064434
+G1 X220.37 Y109.4504 E0.31036992293480953
+G1 X220.37 Y109.9737 E0.012910700609764314
+G1 X229.788662 Y100.555 E0.32862769557095983
+G1 X230.311921 Y100.555 E0.012909689070065136
+G1 X220.37 Y110.4969 E0.3468837236533341
+G1 X220.8352 Y110.555 E0.011566440558188472
+G1 X230.37 Y101.0202 E0.33267920972412385
+G1 X230.37 Y101.5434 E0.012908233439764629
+G1 X221.3584 Y110.555 E0.31442421092733086
+G1 X221.8817 Y110.555 E0.012910700609764666
+G1 X230.37 Y102.0667 E0.2961657230252633
+G1 X230.37 Y102.59 E0.012910700609764666
+G1 X222.4049 Y110.555 E0.27790897968130857
+G1 X222.9282 Y110.555 E0.012910700609764666
+G1 X230.37 Y103.1132 E0.2596522363264025
+G1 X230.37 Y103.6365 E0.012910700609764314
+G1 X223.4515 Y110.555 E0.24139374842433495
+G1 X223.9747 Y110.555 E0.012908233439764629
+G1 X230.37 Y104.1597 E0.2231387496275419
+G1 X230.37 Y104.683 E0.012910700609764666
+G1 X224.498 Y110.555 E0.20488026172547466
+G1 X225.0212 Y110.555 E0.012908233439764629
+G1 X230.37 Y105.2063 E0.1866235183841985
+G1 X230.37 Y105.7295 E0.012908233439764629
+G1 X225.5445 Y110.555 E0.16836677502661407
+G1 X226.0677 Y110.555 E0.012908233439764629
+G1 X230.37 Y106.2528 E0.15011003168732134
+G1 X230.37 Y106.776 E0.012908233439764629
+G1 X226.591 Y110.555 E0.13185328832775348
+G1 X227.1143 Y110.555 E0.012910700609763966
+G1 X230.37 Y107.2993 E0.1135948004256862
+G1 X230.37 Y107.8225 E0.012908233439764629
+G1 X227.6375 Y110.555 E0.09533980162889315
+G1 X228.1608 Y110.555 E0.012910700609764666
+G1 X230.37 Y108.3458 E0.07708131372682563
+G1 X230.37 Y108.8691 E0.012910700609764666
+G1 X228.684 Y110.555 E0.0588245704032642
+G1 X229.2073 Y110.555 E0.012910700609764666
+G1 X230.37 Y109.3923 E0.04056782702796479
+G1 X230.37 Y109.9156 E0.012910700609764314
+G1 X229.7306 Y110.555 E0.022309339125897262
+G1 X230.2538 Y110.555 E0.012908233439764629
+G1 X230.37 Y110.4388 E0.004054340329104216
+G92 E0.0
+;0.6
+G1 E-0.80000 F2100.00000
+G1 Z0.600 F10800.000
+;AFTER_LAYER_CHANGE
+;0.6
+G1 X200 Y70
+G1 Z0.6
+G1 E0.80000 F2100.00000
+M204 S2000
+G1 F2000
+
+G1 Z1.05 F6000.0; move z up
+G0 X200.0 Y70.0
+G1 Z0.6; move z down 
+G1 X200.0 Y80.0 E0.34873611583353936
+G1 X200.37 Y80.0 E0.009128528999833612
+G1 X200.37 Y70.0 E0.24671699999550004
+G1 X200.74 Y70.0 E0.009128528999833612
+G1 X200.74 Y80.0 E0.24671699999550004
+G1 X201.11 Y80.0 E0.009128528999833612
+G1 X201.11 Y70.0 E0.24671699999550004
+G1 X201.48 Y70.0 E0.009128528999832911
+G1 X201.48 Y80.0 E0.24671699999550004
+G1 X201.85 Y80.0 E0.009128528999833612
+G1 X201.85 Y70.0 E0.24671699999550004
+G1 X202.22 Y70.0 E0.009128528999833612
+G1 X202.22 Y80.0 E0.24671699999550004
+G1 X202.59 Y80.0 E0.009128528999833612
+G1 X202.59 Y70.0 E0.24671699999550004
+G1 X202.96 Y70.0 E0.009128528999833612
+G1 X202.96 Y80.0 E0.24671699999550004
+G1 X203.33 Y80.0 E0.009128528999833612
+G1 X203.33 Y70.0 E0.24671699999550004
+G1 X203.7 Y70.0 E0.009128528999832911
+G1 X203.7 Y80.0 E0.24671699999550004
+G1 X204.07 Y80.0 E0.009128528999833612
+G1 X204.07 Y70.0 E0.24671699999550004
+G1 X204.44 Y70.0 E0.009128528999833612
+G1 X204.44 Y80.0 E0.24671699999550004
+G1 X204.81 Y80.0 E0.009128528999833612
+G1 X204.81 Y70.0 E0.24671699999550004
+G1 X205.18 Y70.0 E0.009128528999833612
+G1 X205.18 Y80.0 E0.24671699999550004
+G1 X205.55 Y80.0 E0.009128528999833612
+G1 X205.55 Y70.0 E0.24671699999550004
+G1 X205.92 Y70.0 E0.009128528999832911
+G1 X205.92 Y80.0 E0.24671699999550004
+G1 X206.29 Y80.0 E0.009128528999833612
+G1 X206.29 Y70.0 E0.24671699999550004
+G1 X206.66 Y70.0 E0.009128528999833612
+G1 X206.66 Y80.0 E0.24671699999550004
+G1 X207.03 Y80.0 E0.009128528999833612
+G1 X207.03 Y70.0 E0.24671699999550004
+G1 X207.4 Y70.0 E0.009128528999833612
+G1 X207.4 Y80.0 E0.24671699999550004
+G1 X207.77 Y80.0 E0.009128528999833612
+G1 X207.77 Y70.0 E0.24671699999550004
+G1 X208.14 Y70.0 E0.009128528999832911
+G1 X208.14 Y80.0 E0.24671699999550004
+G1 X208.51 Y80.0 E0.009128528999833612
+G1 X208.51 Y70.0 E0.24671699999550004
+G1 X208.88 Y70.0 E0.009128528999833612
+G1 X208.88 Y80.0 E0.24671699999550004
+G1 X209.25 Y80.0 E0.009128528999833612
+G1 X209.25 Y70.0 E0.24671699999550004
+G1 X209.62 Y70.0 E0.009128528999833612
+G1 X209.62 Y80.0 E0.24671699999550004
+G1 X209.99 Y80.0 E0.009128528999833612
+G1 X209.99 Y70.0 E0.24671699999550004
+G1 Z1.05 F6000.0; move z up
+G0 X200.0 Y80.185
+G1 Z0.6; move z down 
+G1 X200.0 Y90.185 E0.34873611583353936
+G1 X200.37 Y90.185 E0.009128528999833612
+G1 X200.37 Y80.185 E0.24671699999550004
+G1 X200.74 Y80.185 E0.009128528999833612
+G1 X200.74 Y90.185 E0.24671699999550004
+G1 X201.11 Y90.185 E0.009128528999833612
+G1 X201.11 Y80.185 E0.24671699999550004
+G1 X201.48 Y80.185 E0.009128528999832911
+G1 X201.48 Y90.185 E0.24671699999550004
+G1 X201.85 Y90.185 E0.009128528999833612
+G1 X201.85 Y80.185 E0.24671699999550004
+G1 X202.22 Y80.185 E0.009128528999833612
+G1 X202.22 Y90.185 E0.24671699999550004
+G1 X202.59 Y90.185 E0.009128528999833612
+G1 X202.59 Y80.185 E0.24671699999550004
+G1 X202.96 Y80.185 E0.009128528999833612
+G1 X202.96 Y90.185 E0.24671699999550004
+G1 X203.33 Y90.185 E0.009128528999833612
+G1 X203.33 Y80.185 E0.24671699999550004
+G1 X203.7 Y80.185 E0.009128528999832911
+G1 X203.7 Y90.185 E0.24671699999550004
+G1 X204.07 Y90.185 E0.009128528999833612
+G1 X204.07 Y80.185 E0.24671699999550004
+G1 X204.44 Y80.185 E0.009128528999833612
+G1 X204.44 Y90.185 E0.24671699999550004
+G1 X204.81 Y90.185 E0.009128528999833612
+G1 X204.81 Y80.185 E0.24671699999550004
+G1 X205.18 Y80.185 E0.009128528999833612
+G1 X205.18 Y90.185 E0.24671699999550004
+G1 X205.55 Y90.185 E0.009128528999833612
+G1 X205.55 Y80.185 E0.24671699999550004
+G1 X205.92 Y80.185 E0.009128528999832911
+G1 X205.92 Y90.185 E0.24671699999550004
+G1 X206.29 Y90.185 E0.009128528999833612
+G1 X206.29 Y80.185 E0.24671699999550004
+G1 X206.66 Y80.185 E0.009128528999833612
+G1 X206.66 Y90.185 E0.24671699999550004
+G1 X207.03 Y90.185 E0.009128528999833612
+G1 X207.03 Y80.185 E0.24671699999550004
+G1 X207.4 Y80.185 E0.009128528999833612
+G1 X207.4 Y90.185 E0.24671699999550004
+G1 X207.77 Y90.185 E0.009128528999833612
+G1 X207.77 Y80.185 E0.24671699999550004
+G1 X208.14 Y80.185 E0.009128528999832911
+G1 X208.14 Y90.185 E0.24671699999550004
+G1 X208.51 Y90.185 E0.009128528999833612
+G1 X208.51 Y80.185 E0.24671699999550004
+G1 X208.88 Y80.185 E0.009128528999833612
+G1 X208.88 Y90.185 E0.24671699999550004
+G1 X209.25 Y90.185 E0.009128528999833612
+G1 X209.25 Y80.185 E0.24671699999550004
+G1 X209.62 Y80.185 E0.009128528999833612
+G1 X209.62 Y90.185 E0.24671699999550004
+G1 X209.99 Y90.185 E0.009128528999833612
+G1 X209.99 Y80.185 E0.24671699999550004
+G1 Z1.05 F6000.0; move z up
+G0 X200.0 Y90.37
+G1 Z0.6; move z down 
+G1 X200.0 Y90.37 E0.3468892805904708
+G1 X200.523259 Y90.37 E0.012909689070064434
+G1 X200.0 Y90.8933 E0.018257772649496705
+G1 X200.0 Y91.4165 E0.012908233439764629
+G1 X201.046518 Y90.37 E0.036513800719685276
+G1 X201.569777 Y90.37 E0.012909689070064434
+G1 X200.0 Y91.9398 E0.05477157335529104
+G1 X200.0 Y92.463 E0.012908233439764279
+G1 X202.093036 Y90.37 E0.07302760143937106
+G1 X202.616295 Y90.37 E0.012909689070064434
+G1 X200.0 Y92.9863 E0.09128537407219847
+G1 X200.0 Y93.5096 E0.012910700609764666
+G1 X203.139554 Y90.37 E0.10954314671058257
+G1 X203.662813 Y90.37 E0.012909689070064434
+G1 X200.0 Y94.0328 E0.12779917479069303
+G1 X200.0 Y94.5561 E0.012910700609764666
+G1 X204.186072 Y90.37 E0.14605694742679493
+G1 X204.709331 Y90.37 E0.012909689070064434
+G1 X200.0 Y95.0793 E0.16431297550971705
+G1 X200.0 Y95.6026 E0.012910700609764314
+G1 X205.23259 Y90.37 E0.18257074814439642
+G1 X205.755849 Y90.37 E0.012909689070065136
+G1 X200.0 Y96.1258 E0.20082677622898185
+G1 X200.0 Y96.6491 E0.012910700609764666
+G1 X206.279108 Y90.37 E0.2190845488626933
+G1 X206.802367 Y90.37 E0.012909689070064434
+G1 X200.0 Y97.1724 E0.23734232149883308
+G1 X200.0 Y97.6956 E0.012908233439764629
+G1 X207.325626 Y90.37 E0.2555983495813864
+G1 X207.848885 Y90.37 E0.012909689070064434
+G1 X200.0 Y98.2189 E0.2738561222165951
+G1 X200.0 Y98.7421 E0.012908233439764279
+G1 X208.372144 Y90.37 E0.29211215030032733
+G1 X208.895403 Y90.37 E0.012909689070064434
+G1 X200.0 Y99.2654 E0.31036992293480953
+G1 X200.0 Y99.7887 E0.012910700609764666
+G1 X209.418662 Y90.37 E0.32862769557096055
+G1 X209.941921 Y90.37 E0.012909689070064434
+G1 X200.0 Y100.3119 E0.3468837236533341
+G1 X200.4652 Y100.37 E0.011566440558189166
+G1 X210.0 Y90.8352 E0.3326792097241233
+G1 X210.0 Y91.3584 E0.012908233439764629
+G1 X200.9884 Y100.37 E0.31442421092733036
+G1 X201.5117 Y100.37 E0.012910700609763966
+G1 X210.0 Y91.8817 E0.2961657230252633
+G1 X210.0 Y92.405 E0.012910700609764666
+G1 X202.0349 Y100.37 E0.27790897968130857
+G1 X202.5582 Y100.37 E0.012910700609764666
+G1 X210.0 Y92.9282 E0.2596522363264025
+G1 X210.0 Y93.4515 E0.012910700609764314
+G1 X203.0815 Y100.37 E0.24139374842433495
+G1 X203.6047 Y100.37 E0.012908233439764629
+G1 X210.0 Y93.9747 E0.2231387496275419
+G1 X210.0 Y94.498 E0.012910700609764666
+G1 X204.128 Y100.37 E0.20488026172547466
+G1 X204.6512 Y100.37 E0.012908233439764629
+G1 X210.0 Y95.0213 E0.1866235183841985
+G1 X210.0 Y95.5445 E0.012908233439764629
+G1 X205.1745 Y100.37 E0.16836677502661407
+G1 X205.6977 Y100.37 E0.012908233439764629
+G1 X210.0 Y96.0678 E0.15011003168732112
+G1 X210.0 Y96.591 E0.012908233439764279
+G1 X206.221 Y100.37 E0.13185328832775348
+G1 X206.7443 Y100.37 E0.012910700609764666
+G1 X210.0 Y97.1143 E0.11359480042568568
+G1 X210.0 Y97.6375 E0.012908233439764629
+G1 X207.2675 Y100.37 E0.09533980162889265
+G1 X207.7908 Y100.37 E0.012910700609763966
+G1 X210.0 Y98.1608 E0.07708131372682563
+G1 X210.0 Y98.6841 E0.012910700609764666
+G1 X208.314 Y100.37 E0.0588245704032642
+G1 X208.8373 Y100.37 E0.012910700609764666
+G1 X210.0 Y99.2073 E0.04056782702796479
+G1 X210.0 Y99.7306 E0.012910700609764314
+G1 X209.3606 Y100.37 E0.022309339125897262
+G1 X209.8838 Y100.37 E0.012908233439764629
+G1 X210.0 Y100.2538 E0.004054340329104216
+G1 Z1.05 F6000.0; move z up
+G0 X200.0 Y100.555
+G1 Z0.6; move z down 
+G1 X200.0 Y100.555 E0.3468892805904708
+G1 X200.523259 Y100.555 E0.012909689070064434
+G1 X200.0 Y101.0783 E0.018257772649496705
+G1 X200.0 Y101.6015 E0.012908233439764629
+G1 X201.046518 Y100.555 E0.036513800719685276
+G1 X201.569777 Y100.555 E0.012909689070064434
+G1 X200.0 Y102.1248 E0.054771573355290794
+G1 X200.0 Y102.648 E0.012908233439764629
+G1 X202.093036 Y100.555 E0.07302760143937106
+G1 X202.616295 Y100.555 E0.012909689070064434
+G1 X200.0 Y103.1713 E0.09128537407219847
+G1 X200.0 Y103.6946 E0.012910700609764314
+G1 X203.139554 Y100.555 E0.10954314671058231
+G1 X203.662813 Y100.555 E0.012909689070064434
+G1 X200.0 Y104.2178 E0.12779917479069303
+G1 X200.0 Y104.7411 E0.012910700609764666
+G1 X204.186072 Y100.555 E0.14605694742679493
+G1 X204.709331 Y100.555 E0.012909689070064434
+G1 X200.0 Y105.2643 E0.16431297550971705
+G1 X200.0 Y105.7876 E0.012910700609764314
+G1 X205.23259 Y100.555 E0.18257074814439642
+G1 X205.755849 Y100.555 E0.012909689070065136
+G1 X200.0 Y106.3108 E0.20082677622898185
+G1 X200.0 Y106.8341 E0.012910700609764666
+G1 X206.279108 Y100.555 E0.2190845488626933
+G1 X206.802367 Y100.555 E0.012909689070064434
+G1 X200.0 Y107.3574 E0.23734232149883308
+G1 X200.0 Y107.8806 E0.012908233439764629
+G1 X207.325626 Y100.555 E0.2555983495813864
+G1 X207.848885 Y100.555 E0.012909689070064434
+G1 X200.0 Y108.4039 E0.273856122216595
+G1 X200.0 Y108.9271 E0.012908233439764629
+G1 X208.372144 Y100.555 E0.29211215030032733
+G1 X208.895403 Y100.555 E0.012909689070064434
+G1 X200.0 Y109.4504 E0.31036992293480953
+G1 X200.0 Y109.9737 E0.012910700609764314
+G1 X209.418662 Y100.555 E0.3286276955709604
+G1 X209.941921 Y100.555 E0.012909689070064434
+G1 X200.0 Y110.4969 E0.3468837236533341
+G1 X200.4652 Y110.555 E0.011566440558189166
+G1 X210.0 Y101.0202 E0.3326792097241233
+G1 X210.0 Y101.5434 E0.012908233439764629
+G1 X200.9884 Y110.555 E0.31442421092733036
+G1 X201.5117 Y110.555 E0.012910700609763966
+G1 X210.0 Y102.0667 E0.2961657230252633
+G1 X210.0 Y102.59 E0.012910700609764666
+G1 X202.0349 Y110.555 E0.27790897968130857
+G1 X202.5582 Y110.555 E0.012910700609764666
+G1 X210.0 Y103.1132 E0.2596522363264025
+G1 X210.0 Y103.6365 E0.012910700609764314
+G1 X203.0815 Y110.555 E0.24139374842433495
+G1 X203.6047 Y110.555 E0.012908233439764629
+G1 X210.0 Y104.1597 E0.2231387496275419
+G1 X210.0 Y104.683 E0.012910700609764666
+G1 X204.128 Y110.555 E0.20488026172547466
+G1 X204.6512 Y110.555 E0.012908233439764629
+G1 X210.0 Y105.2063 E0.1866235183841985
+G1 X210.0 Y105.7295 E0.012908233439764629
+G1 X205.1745 Y110.555 E0.16836677502661407
+G1 X205.6977 Y110.555 E0.012908233439764629
+G1 X210.0 Y106.2528 E0.15011003168732134
+G1 X210.0 Y106.776 E0.012908233439764629
+G1 X206.221 Y110.555 E0.13185328832775348
+G1 X206.7443 Y110.555 E0.012910700609764666
+G1 X210.0 Y107.2993 E0.11359480042568568
+G1 X210.0 Y107.8225 E0.012908233439764629
+G1 X207.2675 Y110.555 E0.09533980162889265
+G1 X207.7908 Y110.555 E0.012910700609763966
+G1 X210.0 Y108.3458 E0.07708131372682563
+G1 X210.0 Y108.8691 E0.012910700609764666
+G1 X208.314 Y110.555 E0.0588245704032642
+G1 X208.8373 Y110.555 E0.012910700609764666
+G1 X210.0 Y109.3923 E0.04056782702796479
+G1 X210.0 Y109.9156 E0.012910700609764314
+G1 X209.3606 Y110.555 E0.022309339125897262
+G1 X209.8838 Y110.555 E0.012908233439764629
+G1 X210.0 Y110.4388 E0.004054340329104216
+G1 Z1.05 F6000.0; move z up
+G0 X210.185 Y70.0
+G1 Z0.6; move z down 
+G1 X210.185 Y80.0 E0.34873611583353936
+G1 X210.555 Y80.0 E0.009128528999833612
+G1 X210.555 Y70.0 E0.24671699999550004
+G1 X210.925 Y70.0 E0.009128528999833612
+G1 X210.925 Y80.0 E0.24671699999550004
+G1 X211.295 Y80.0 E0.009128528999832911
+G1 X211.295 Y70.0 E0.24671699999550004
+G1 X211.665 Y70.0 E0.009128528999833612
+G1 X211.665 Y80.0 E0.24671699999550004
+G1 X212.035 Y80.0 E0.009128528999833612
+G1 X212.035 Y70.0 E0.24671699999550004
+G1 X212.405 Y70.0 E0.009128528999833612
+G1 X212.405 Y80.0 E0.24671699999550004
+G1 X212.775 Y80.0 E0.009128528999833612
+G1 X212.775 Y70.0 E0.24671699999550004
+G1 X213.145 Y70.0 E0.009128528999833612
+G1 X213.145 Y80.0 E0.24671699999550004
+G1 X213.515 Y80.0 E0.009128528999832911
+G1 X213.515 Y70.0 E0.24671699999550004
+G1 X213.885 Y70.0 E0.009128528999833612
+G1 X213.885 Y80.0 E0.24671699999550004
+G1 X214.255 Y80.0 E0.009128528999833612
+G1 X214.255 Y70.0 E0.24671699999550004
+G1 X214.625 Y70.0 E0.009128528999833612
+G1 X214.625 Y80.0 E0.24671699999550004
+G1 X214.995 Y80.0 E0.009128528999833612
+G1 X214.995 Y70.0 E0.24671699999550004
+G1 X215.365 Y70.0 E0.009128528999833612
+G1 X215.365 Y80.0 E0.24671699999550004
+G1 X215.735 Y80.0 E0.009128528999833612
+G1 X215.735 Y70.0 E0.24671699999550004
+G1 X216.105 Y70.0 E0.009128528999832911
+G1 X216.105 Y80.0 E0.24671699999550004
+G1 X216.475 Y80.0 E0.009128528999833612
+G1 X216.475 Y70.0 E0.24671699999550004
+G1 X216.845 Y70.0 E0.009128528999833612
+G1 X216.845 Y80.0 E0.24671699999550004
+G1 X217.215 Y80.0 E0.009128528999833612
+G1 X217.215 Y70.0 E0.24671699999550004
+G1 X217.585 Y70.0 E0.009128528999833612
+G1 X217.585 Y80.0 E0.24671699999550004
+G1 X217.955 Y80.0 E0.009128528999833612
+G1 X217.955 Y70.0 E0.24671699999550004
+G1 X218.325 Y70.0 E0.009128528999832911
+G1 X218.325 Y80.0 E0.24671699999550004
+G1 X218.695 Y80.0 E0.009128528999833612
+G1 X218.695 Y70.0 E0.24671699999550004
+G1 X219.065 Y70.0 E0.009128528999833612
+G1 X219.065 Y80.0 E0.24671699999550004
+G1 X219.435 Y80.0 E0.009128528999833612
+G1 X219.435 Y70.0 E0.24671699999550004
+G1 X219.805 Y70.0 E0.009128528999833612
+G1 X219.805 Y80.0 E0.24671699999550004
+G1 X220.175 Y80.0 E0.009128528999833612
+G1 X220.175 Y70.0 E0.24671699999550004
+G1 Z1.05 F6000.0; move z up
+G0 X210.185 Y80.185
+G1 Z0.6; move z down 
+G1 X210.185 Y90.185 E0.34873611583353936
+G1 X210.555 Y90.185 E0.009128528999833612
+G1 X210.555 Y80.185 E0.24671699999550004
+G1 X210.925 Y80.185 E0.009128528999833612
+G1 X210.925 Y90.185 E0.24671699999550004
+G1 X211.295 Y90.185 E0.009128528999832911
+G1 X211.295 Y80.185 E0.24671699999550004
+G1 X211.665 Y80.185 E0.009128528999833612
+G1 X211.665 Y90.185 E0.24671699999550004
+G1 X212.035 Y90.185 E0.009128528999833612
+G1 X212.035 Y80.185 E0.24671699999550004
+G1 X212.405 Y80.185 E0.009128528999833612
+G1 X212.405 Y90.185 E0.24671699999550004
+G1 X212.775 Y90.185 E0.009128528999833612
+G1 X212.775 Y80.185 E0.24671699999550004
+G1 X213.145 Y80.185 E0.009128528999833612
+G1 X213.145 Y90.185 E0.24671699999550004
+G1 X213.515 Y90.185 E0.009128528999832911
+G1 X213.515 Y80.185 E0.24671699999550004
+G1 X213.885 Y80.185 E0.009128528999833612
+G1 X213.885 Y90.185 E0.24671699999550004
+G1 X214.255 Y90.185 E0.009128528999833612
+G1 X214.255 Y80.185 E0.24671699999550004
+G1 X214.625 Y80.185 E0.009128528999833612
+G1 X214.625 Y90.185 E0.24671699999550004
+G1 X214.995 Y90.185 E0.009128528999833612
+G1 X214.995 Y80.185 E0.24671699999550004
+G1 X215.365 Y80.185 E0.009128528999833612
+G1 X215.365 Y90.185 E0.24671699999550004
+G1 X215.735 Y90.185 E0.009128528999833612
+G1 X215.735 Y80.185 E0.24671699999550004
+G1 X216.105 Y80.185 E0.009128528999832911
+G1 X216.105 Y90.185 E0.24671699999550004
+G1 X216.475 Y90.185 E0.009128528999833612
+G1 X216.475 Y80.185 E0.24671699999550004
+G1 X216.845 Y80.185 E0.009128528999833612
+G1 X216.845 Y90.185 E0.24671699999550004
+G1 X217.215 Y90.185 E0.009128528999833612
+G1 X217.215 Y80.185 E0.24671699999550004
+G1 X217.585 Y80.185 E0.009128528999833612
+G1 X217.585 Y90.185 E0.24671699999550004
+G1 X217.955 Y90.185 E0.009128528999833612
+G1 X217.955 Y80.185 E0.24671699999550004
+G1 X218.325 Y80.185 E0.009128528999832911
+G1 X218.325 Y90.185 E0.24671699999550004
+G1 X218.695 Y90.185 E0.009128528999833612
+G1 X218.695 Y80.185 E0.24671699999550004
+G1 X219.065 Y80.185 E0.009128528999833612
+G1 X219.065 Y90.185 E0.24671699999550004
+G1 X219.435 Y90.185 E0.009128528999833612
+G1 X219.435 Y80.185 E0.24671699999550004
+G1 X219.805 Y80.185 E0.009128528999833612
+G1 X219.805 Y90.185 E0.24671699999550004
+G1 X220.175 Y90.185 E0.009128528999833612
+G1 X220.175 Y80.185 E0.24671699999550004
+G1 Z1.05 F6000.0; move z up
+G0 X210.185 Y90.37
+G1 Z0.6; move z down 
+G1 X210.185 Y90.37 E0.3468892805904708
+G1 X210.708259 Y90.37 E0.012909689070064434
+G1 X210.185 Y90.8933 E0.018257772649496705
+G1 X210.185 Y91.4165 E0.012908233439764629
+G1 X211.231518 Y90.37 E0.036513800719685276
+G1 X211.754777 Y90.37 E0.012909689070064434
+G1 X210.185 Y91.9398 E0.05477157335529104
+G1 X210.185 Y92.463 E0.012908233439764279
+G1 X212.278036 Y90.37 E0.07302760143937055
+G1 X212.801295 Y90.37 E0.012909689070065136
+G1 X210.185 Y92.9863 E0.09128537407219847
+G1 X210.185 Y93.5096 E0.012910700609764666
+G1 X213.324554 Y90.37 E0.10954314671058257
+G1 X213.847813 Y90.37 E0.012909689070064434
+G1 X210.185 Y94.0328 E0.12779917479069303
+G1 X210.185 Y94.5561 E0.012910700609764666
+G1 X214.371072 Y90.37 E0.14605694742679493
+G1 X214.894331 Y90.37 E0.012909689070064434
+G1 X210.185 Y95.0793 E0.16431297550971705
+G1 X210.185 Y95.6026 E0.012910700609764314
+G1 X215.41759 Y90.37 E0.18257074814439642
+G1 X215.940849 Y90.37 E0.012909689070064434
+G1 X210.185 Y96.1258 E0.20082677622898135
+G1 X210.185 Y96.6491 E0.012910700609764666
+G1 X216.464108 Y90.37 E0.2190845488626933
+G1 X216.987367 Y90.37 E0.012909689070064434
+G1 X210.185 Y97.1724 E0.23734232149883308
+G1 X210.185 Y97.6956 E0.012908233439764629
+G1 X217.510626 Y90.37 E0.2555983495813864
+G1 X218.033885 Y90.37 E0.012909689070064434
+G1 X210.185 Y98.2189 E0.2738561222165951
+G1 X210.185 Y98.7421 E0.012908233439764279
+G1 X218.557144 Y90.37 E0.29211215030032733
+G1 X219.080403 Y90.37 E0.012909689070064434
+G1 X210.185 Y99.2654 E0.31036992293480953
+G1 X210.185 Y99.7887 E0.012910700609764666
+G1 X219.603662 Y90.37 E0.32862769557096055
+G1 X220.126921 Y90.37 E0.012909689070064434
+G1 X210.185 Y100.3119 E0.3468837236533341
+G1 X210.6502 Y100.37 E0.011566440558189166
+G1 X220.185 Y90.8352 E0.3326792097241233
+G1 X220.185 Y91.3584 E0.012908233439764629
+G1 X211.1734 Y100.37 E0.31442421092733086
+G1 X211.6967 Y100.37 E0.012910700609764666
+G1 X220.185 Y91.8817 E0.2961657230252633
+G1 X220.185 Y92.405 E0.012910700609764666
+G1 X212.2199 Y100.37 E0.27790897968130857
+G1 X212.7432 Y100.37 E0.012910700609764666
+G1 X220.185 Y92.9282 E0.2596522363264025
+G1 X220.185 Y93.4515 E0.012910700609764314
+G1 X213.2665 Y100.37 E0.24139374842433495
+G1 X213.7897 Y100.37 E0.012908233439764629
+G1 X220.185 Y93.9747 E0.2231387496275419
+G1 X220.185 Y94.498 E0.012910700609764666
+G1 X214.313 Y100.37 E0.20488026172547466
+G1 X214.8362 Y100.37 E0.012908233439764629
+G1 X220.185 Y95.0213 E0.1866235183841985
+G1 X220.185 Y95.5445 E0.012908233439764629
+G1 X215.3595 Y100.37 E0.16836677502661407
+G1 X215.8827 Y100.37 E0.012908233439764629
+G1 X220.185 Y96.0678 E0.15011003168732112
+G1 X220.185 Y96.591 E0.012908233439764279
+G1 X216.406 Y100.37 E0.13185328832775348
+G1 X216.9293 Y100.37 E0.012910700609764666
+G1 X220.185 Y97.1143 E0.11359480042568568
+G1 X220.185 Y97.6375 E0.012908233439764629
+G1 X217.4525 Y100.37 E0.09533980162889315
+G1 X217.9758 Y100.37 E0.012910700609764666
+G1 X220.185 Y98.1608 E0.07708131372682563
+G1 X220.185 Y98.6841 E0.012910700609764666
+G1 X218.499 Y100.37 E0.0588245704032642
+G1 X219.0223 Y100.37 E0.012910700609764666
+G1 X220.185 Y99.2073 E0.04056782702796479
+G1 X220.185 Y99.7306 E0.012910700609764314
+G1 X219.5456 Y100.37 E0.022309339125897262
+G1 X220.0688 Y100.37 E0.012908233439764629
+G1 X220.185 Y100.2538 E0.004054340329104216
+G1 Z1.05 F6000.0; move z up
+G0 X210.185 Y100.555
+G1 Z0.6; move z down 
+G1 X210.185 Y100.555 E0.3468892805904708
+G1 X210.708259 Y100.555 E0.012909689070064434
+G1 X210.185 Y101.0783 E0.018257772649496705
+G1 X210.185 Y101.6015 E0.012908233439764629
+G1 X211.231518 Y100.555 E0.036513800719685276
+G1 X211.754777 Y100.555 E0.012909689070064434
+G1 X210.185 Y102.1248 E0.054771573355290794
+G1 X210.185 Y102.648 E0.012908233439764629
+G1 X212.278036 Y100.555 E0.07302760143937055
+G1 X212.801295 Y100.555 E0.012909689070065136
+G1 X210.185 Y103.1713 E0.09128537407219847
+G1 X210.185 Y103.6946 E0.012910700609764314
+G1 X213.324554 Y100.555 E0.10954314671058231
+G1 X213.847813 Y100.555 E0.012909689070064434
+G1 X210.185 Y104.2178 E0.12779917479069303
+G1 X210.185 Y104.7411 E0.012910700609764666
+G1 X214.371072 Y100.555 E0.14605694742679493
+G1 X214.894331 Y100.555 E0.012909689070064434
+G1 X210.185 Y105.2643 E0.16431297550971705
+G1 X210.185 Y105.7876 E0.012910700609764314
+G1 X215.41759 Y100.555 E0.18257074814439642
+G1 X215.940849 Y100.555 E0.012909689070064434
+G1 X210.185 Y106.3108 E0.20082677622898135
+G1 X210.185 Y106.8341 E0.012910700609764666
+G1 X216.464108 Y100.555 E0.2190845488626933
+G1 X216.987367 Y100.555 E0.012909689070064434
+G1 X210.185 Y107.3574 E0.23734232149883308
+G1 X210.185 Y107.8806 E0.012908233439764629
+G1 X217.510626 Y100.555 E0.2555983495813864
+G1 X218.033885 Y100.555 E0.012909689070064434
+G1 X210.185 Y108.4039 E0.273856122216595
+G1 X210.185 Y108.9271 E0.012908233439764629
+G1 X218.557144 Y100.555 E0.29211215030032733
+G1 X219.080403 Y100.555 E0.012909689070064434
+G1 X210.185 Y109.4504 E0.31036992293480953
+G1 X210.185 Y109.9737 E0.012910700609764314
+G1 X219.603662 Y100.555 E0.3286276955709604
+G1 X220.126921 Y100.555 E0.012909689070064434
+G1 X210.185 Y110.4969 E0.3468837236533341
+G1 X210.6502 Y110.555 E0.011566440558189166
+G1 X220.185 Y101.0202 E0.3326792097241233
+G1 X220.185 Y101.5434 E0.012908233439764629
+G1 X211.1734 Y110.555 E0.31442421092733086
+G1 X211.6967 Y110.555 E0.012910700609764666
+G1 X220.185 Y102.0667 E0.2961657230252633
+G1 X220.185 Y102.59 E0.012910700609764666
+G1 X212.2199 Y110.555 E0.27790897968130857
+G1 X212.7432 Y110.555 E0.012910700609764666
+G1 X220.185 Y103.1132 E0.2596522363264025
+G1 X220.185 Y103.6365 E0.012910700609764314
+G1 X213.2665 Y110.555 E0.24139374842433495
+G1 X213.7897 Y110.555 E0.012908233439764629
+G1 X220.185 Y104.1597 E0.2231387496275419
+G1 X220.185 Y104.683 E0.012910700609764666
+G1 X214.313 Y110.555 E0.20488026172547466
+G1 X214.8362 Y110.555 E0.012908233439764629
+G1 X220.185 Y105.2063 E0.1866235183841985
+G1 X220.185 Y105.7295 E0.012908233439764629
+G1 X215.3595 Y110.555 E0.16836677502661407
+G1 X215.8827 Y110.555 E0.012908233439764629
+G1 X220.185 Y106.2528 E0.15011003168732134
+G1 X220.185 Y106.776 E0.012908233439764629
+G1 X216.406 Y110.555 E0.13185328832775348
+G1 X216.9293 Y110.555 E0.012910700609764666
+G1 X220.185 Y107.2993 E0.11359480042568568
+G1 X220.185 Y107.8225 E0.012908233439764629
+G1 X217.4525 Y110.555 E0.09533980162889315
+G1 X217.9758 Y110.555 E0.012910700609764666
+G1 X220.185 Y108.3458 E0.07708131372682563
+G1 X220.185 Y108.8691 E0.012910700609764666
+G1 X218.499 Y110.555 E0.0588245704032642
+G1 X219.0223 Y110.555 E0.012910700609764666
+G1 X220.185 Y109.3923 E0.04056782702796479
+G1 X220.185 Y109.9156 E0.012910700609764314
+G1 X219.5456 Y110.555 E0.022309339125897262
+G1 X220.0688 Y110.555 E0.012908233439764629
+G1 X220.185 Y110.4388 E0.004054340329104216
+G1 Z1.05 F6000.0; move z up
+G0 X220.37 Y70.0
+G1 Z0.6; move z down 
+G1 X230.37 Y70.0 E0.3487361158335391
+G1 X230.37 Y70.37 E0.009128528999833612
+G1 X220.37 Y70.37 E0.24671699999550004
+G1 X220.37 Y70.74 E0.009128528999833263
+G1 X230.37 Y70.74 E0.24671699999550004
+G1 X230.37 Y71.11 E0.009128528999833612
+G1 X220.37 Y71.11 E0.24671699999550004
+G1 X220.37 Y71.48 E0.009128528999833612
+G1 X230.37 Y71.48 E0.24671699999550004
+G1 X230.37 Y71.85 E0.009128528999833263
+G1 X220.37 Y71.85 E0.24671699999550004
+G1 X220.37 Y72.22 E0.009128528999833612
+G1 X230.37 Y72.22 E0.24671699999550004
+G1 X230.37 Y72.59 E0.009128528999833612
+G1 X220.37 Y72.59 E0.24671699999550004
+G1 X220.37 Y72.96 E0.009128528999833263
+G1 X230.37 Y72.96 E0.24671699999550004
+G1 X230.37 Y73.33 E0.009128528999833612
+G1 X220.37 Y73.33 E0.24671699999550004
+G1 X220.37 Y73.7 E0.009128528999833612
+G1 X230.37 Y73.7 E0.24671699999550004
+G1 X230.37 Y74.07 E0.009128528999833263
+G1 X220.37 Y74.07 E0.24671699999550004
+G1 X220.37 Y74.44 E0.009128528999833612
+G1 X230.37 Y74.44 E0.24671699999550004
+G1 X230.37 Y74.81 E0.009128528999833612
+G1 X220.37 Y74.81 E0.24671699999550004
+G1 X220.37 Y75.18 E0.009128528999833612
+G1 X230.37 Y75.18 E0.24671699999550004
+G1 X230.37 Y75.55 E0.009128528999833263
+G1 X220.37 Y75.55 E0.24671699999550004
+G1 X220.37 Y75.92 E0.009128528999833612
+G1 X230.37 Y75.92 E0.24671699999550004
+G1 X230.37 Y76.29 E0.009128528999833612
+G1 X220.37 Y76.29 E0.24671699999550004
+G1 X220.37 Y76.66 E0.009128528999833263
+G1 X230.37 Y76.66 E0.24671699999550004
+G1 X230.37 Y77.03 E0.009128528999833612
+G1 X220.37 Y77.03 E0.24671699999550004
+G1 X220.37 Y77.4 E0.009128528999833612
+G1 X230.37 Y77.4 E0.24671699999550004
+G1 X230.37 Y77.77 E0.009128528999833263
+G1 X220.37 Y77.77 E0.24671699999550004
+G1 X220.37 Y78.14 E0.009128528999833612
+G1 X230.37 Y78.14 E0.24671699999550004
+G1 X230.37 Y78.51 E0.009128528999833612
+G1 X220.37 Y78.51 E0.24671699999550004
+G1 X220.37 Y78.88 E0.009128528999833263
+G1 X230.37 Y78.88 E0.24671699999550004
+G1 X230.37 Y79.25 E0.009128528999833612
+G1 X220.37 Y79.25 E0.24671699999550004
+G1 X220.37 Y79.62 E0.009128528999833612
+G1 X230.37 Y79.62 E0.24671699999550004
+G1 X230.37 Y79.99 E0.009128528999833263
+G1 X220.37 Y79.99 E0.24671699999550004
+G1 Z1.05 F6000.0; move z up
+G0 X220.37 Y80.185
+G1 Z0.6; move z down 
+G1 X230.37 Y80.185 E0.3487361158335391
+G1 X230.37 Y80.555 E0.009128528999833612
+G1 X220.37 Y80.555 E0.24671699999550004
+G1 X220.37 Y80.925 E0.009128528999833263
+G1 X230.37 Y80.925 E0.24671699999550004
+G1 X230.37 Y81.295 E0.009128528999833612
+G1 X220.37 Y81.295 E0.24671699999550004
+G1 X220.37 Y81.665 E0.009128528999833612
+G1 X230.37 Y81.665 E0.24671699999550004
+G1 X230.37 Y82.035 E0.009128528999833263
+G1 X220.37 Y82.035 E0.24671699999550004
+G1 X220.37 Y82.405 E0.009128528999833612
+G1 X230.37 Y82.405 E0.24671699999550004
+G1 X230.37 Y82.775 E0.009128528999833612
+G1 X220.37 Y82.775 E0.24671699999550004
+G1 X220.37 Y83.145 E0.009128528999833263
+G1 X230.37 Y83.145 E0.24671699999550004
+G1 X230.37 Y83.515 E0.009128528999833612
+G1 X220.37 Y83.515 E0.24671699999550004
+G1 X220.37 Y83.885 E0.009128528999833612
+G1 X230.37 Y83.885 E0.24671699999550004
+G1 X230.37 Y84.255 E0.009128528999833263
+G1 X220.37 Y84.255 E0.24671699999550004
+G1 X220.37 Y84.625 E0.009128528999833612
+G1 X230.37 Y84.625 E0.24671699999550004
+G1 X230.37 Y84.995 E0.009128528999833612
+G1 X220.37 Y84.995 E0.24671699999550004
+G1 X220.37 Y85.365 E0.009128528999833263
+G1 X230.37 Y85.365 E0.24671699999550004
+G1 X230.37 Y85.735 E0.009128528999833612
+G1 X220.37 Y85.735 E0.24671699999550004
+G1 X220.37 Y86.105 E0.009128528999833612
+G1 X230.37 Y86.105 E0.24671699999550004
+G1 X230.37 Y86.475 E0.009128528999833263
+G1 X220.37 Y86.475 E0.24671699999550004
+G1 X220.37 Y86.845 E0.009128528999833612
+G1 X230.37 Y86.845 E0.24671699999550004
+G1 X230.37 Y87.215 E0.009128528999833612
+G1 X220.37 Y87.215 E0.24671699999550004
+G1 X220.37 Y87.585 E0.009128528999833263
+G1 X230.37 Y87.585 E0.24671699999550004
+G1 X230.37 Y87.955 E0.009128528999833612
+G1 X220.37 Y87.955 E0.24671699999550004
+G1 X220.37 Y88.325 E0.009128528999833612
+G1 X230.37 Y88.325 E0.24671699999550004
+G1 X230.37 Y88.695 E0.009128528999833263
+G1 X220.37 Y88.695 E0.24671699999550004
+G1 X220.37 Y89.065 E0.009128528999833612
+G1 X230.37 Y89.065 E0.24671699999550004
+G1 X230.37 Y89.435 E0.009128528999833612
+G1 X220.37 Y89.435 E0.24671699999550004
+G1 X220.37 Y89.805 E0.009128528999833612
+G1 X230.37 Y89.805 E0.24671699999550004
+G1 X230.37 Y90.175 E0.009128528999833263
+G1 X220.37 Y90.175 E0.24671699999550004
+G1 Z1.05 F6000.0; move z up
+G0 X220.37 Y90.37
+G1 Z0.6; move z down 
+G1 X230.37 Y90.37 E0.3487361158335391
+G1 X230.37 Y90.74 E0.009128528999833263
+G1 X220.37 Y90.74 E0.24671699999550004
+G1 X220.37 Y91.11 E0.009128528999833612
+G1 X230.37 Y91.11 E0.24671699999550004
+G1 X230.37 Y91.48 E0.009128528999833612
+G1 X220.37 Y91.48 E0.24671699999550004
+G1 X220.37 Y91.85 E0.009128528999833263
+G1 X230.37 Y91.85 E0.24671699999550004
+G1 X230.37 Y92.22 E0.009128528999833612
+G1 X220.37 Y92.22 E0.24671699999550004
+G1 X220.37 Y92.59 E0.009128528999833612
+G1 X230.37 Y92.59 E0.24671699999550004
+G1 X230.37 Y92.96 E0.009128528999833263
+G1 X220.37 Y92.96 E0.24671699999550004
+G1 X220.37 Y93.33 E0.009128528999833612
+G1 X230.37 Y93.33 E0.24671699999550004
+G1 X230.37 Y93.7 E0.009128528999833612
+G1 X220.37 Y93.7 E0.24671699999550004
+G1 X220.37 Y94.07 E0.009128528999833263
+G1 X230.37 Y94.07 E0.24671699999550004
+G1 X230.37 Y94.44 E0.009128528999833612
+G1 X220.37 Y94.44 E0.24671699999550004
+G1 X220.37 Y94.81 E0.009128528999833612
+G1 X230.37 Y94.81 E0.24671699999550004
+G1 X230.37 Y95.18 E0.009128528999833612
+G1 X220.37 Y95.18 E0.24671699999550004
+G1 X220.37 Y95.55 E0.009128528999833263
+G1 X230.37 Y95.55 E0.24671699999550004
+G1 X230.37 Y95.92 E0.009128528999833612
+G1 X220.37 Y95.92 E0.24671699999550004
+G1 X220.37 Y96.29 E0.009128528999833612
+G1 X230.37 Y96.29 E0.24671699999550004
+G1 X230.37 Y96.66 E0.009128528999833263
+G1 X220.37 Y96.66 E0.24671699999550004
+G1 X220.37 Y97.03 E0.009128528999833612
+G1 X230.37 Y97.03 E0.24671699999550004
+G1 X230.37 Y97.4 E0.009128528999833612
+G1 X220.37 Y97.4 E0.24671699999550004
+G1 X220.37 Y97.77 E0.009128528999833263
+G1 X230.37 Y97.77 E0.24671699999550004
+G1 X230.37 Y98.14 E0.009128528999833612
+G1 X220.37 Y98.14 E0.24671699999550004
+G1 X220.37 Y98.51 E0.009128528999833612
+G1 X230.37 Y98.51 E0.24671699999550004
+G1 X230.37 Y98.88 E0.009128528999833263
+G1 X220.37 Y98.88 E0.24671699999550004
+G1 X220.37 Y99.25 E0.009128528999833612
+G1 X230.37 Y99.25 E0.24671699999550004
+G1 X230.37 Y99.62 E0.009128528999833612
+G1 X220.37 Y99.62 E0.24671699999550004
+G1 X220.37 Y99.99 E0.009128528999833263
+G1 X230.37 Y99.99 E0.24671699999550004
+G1 X230.37 Y100.36 E0.009128528999833612
+G1 X220.37 Y100.36 E0.24671699999550004
+G1 Z1.05 F6000.0; move z up
+G0 X220.37 Y100.555
+G1 Z0.6; move z down 
+G1 X220.37 Y100.555 E0.3468892805904708
+G1 X220.893259 Y100.555 E0.012909689070064434
+G1 X220.37 Y101.0783 E0.018257772649496705
+G1 X220.37 Y101.6015 E0.012908233439764629
+G1 X221.416518 Y100.555 E0.036513800719685276
+G1 X221.939777 Y100.555 E0.012909689070064434
+G1 X220.37 Y102.1248 E0.054771573355290794
+G1 X220.37 Y102.648 E0.012908233439764629
+G1 X222.463036 Y100.555 E0.07302760143937055
+G1 X222.986295 Y100.555 E0.012909689070065136
+G1 X220.37 Y103.1713 E0.09128537407219847
+G1 X220.37 Y103.6946 E0.012910700609764314
+G1 X223.509554 Y100.555 E0.10954314671058231
+G1 X224.032813 Y100.555 E0.012909689070064434
+G1 X220.37 Y104.2178 E0.12779917479069303
+G1 X220.37 Y104.7411 E0.012910700609764666
+G1 X224.556072 Y100.555 E0.14605694742679493
+G1 X225.079331 Y100.555 E0.012909689070064434
+G1 X220.37 Y105.2643 E0.16431297550971705
+G1 X220.37 Y105.7876 E0.012910700609764314
+G1 X225.60259 Y100.555 E0.18257074814439642
+G1 X226.125849 Y100.555 E0.012909689070064434
+G1 X220.37 Y106.3108 E0.20082677622898135
+G1 X220.37 Y106.8341 E0.012910700609764666
+G1 X226.649108 Y100.555 E0.2190845488626933
+G1 X227.172367 Y100.555 E0.012909689070064434
+G1 X220.37 Y107.3574 E0.23734232149883308
+G1 X220.37 Y107.8806 E0.012908233439764629
+G1 X227.695626 Y100.555 E0.2555983495813864
+G1 X228.218885 Y100.555 E0.012909689070064434
+G1 X220.37 Y108.4039 E0.273856122216595
+G1 X220.37 Y108.9271 E0.012908233439764629
+G1 X228.742144 Y100.555 E0.29211215030032733
+G1 X229.265403 Y100.555 E0.012909689070064434
+G1 X220.37 Y109.4504 E0.31036992293480953
+G1 X220.37 Y109.9737 E0.012910700609764314
+G1 X229.788662 Y100.555 E0.32862769557095983
+G1 X230.311921 Y100.555 E0.012909689070065136
+G1 X220.37 Y110.4969 E0.3468837236533341
+G1 X220.8352 Y110.555 E0.011566440558188472
+G1 X230.37 Y101.0202 E0.33267920972412385
+G1 X230.37 Y101.5434 E0.012908233439764629
+G1 X221.3584 Y110.555 E0.31442421092733086
+G1 X221.8817 Y110.555 E0.012910700609764666
+G1 X230.37 Y102.0667 E0.2961657230252633
+G1 X230.37 Y102.59 E0.012910700609764666
+G1 X222.4049 Y110.555 E0.27790897968130857
+G1 X222.9282 Y110.555 E0.012910700609764666
+G1 X230.37 Y103.1132 E0.2596522363264025
+G1 X230.37 Y103.6365 E0.012910700609764314
+G1 X223.4515 Y110.555 E0.24139374842433495
+G1 X223.9747 Y110.555 E0.012908233439764629
+G1 X230.37 Y104.1597 E0.2231387496275419
+G1 X230.37 Y104.683 E0.012910700609764666
+G1 X224.498 Y110.555 E0.20488026172547466
+G1 X225.0212 Y110.555 E0.012908233439764629
+G1 X230.37 Y105.2063 E0.1866235183841985
+G1 X230.37 Y105.7295 E0.012908233439764629
+G1 X225.5445 Y110.555 E0.16836677502661407
+G1 X226.0677 Y110.555 E0.012908233439764629
+G1 X230.37 Y106.2528 E0.15011003168732134
+G1 X230.37 Y106.776 E0.012908233439764629
+G1 X226.591 Y110.555 E0.13185328832775348
+G1 X227.1143 Y110.555 E0.012910700609763966
+G1 X230.37 Y107.2993 E0.1135948004256862
+G1 X230.37 Y107.8225 E0.012908233439764629
+G1 X227.6375 Y110.555 E0.09533980162889315
+G1 X228.1608 Y110.555 E0.012910700609764666
+G1 X230.37 Y108.3458 E0.07708131372682563
+G1 X230.37 Y108.8691 E0.012910700609764666
+G1 X228.684 Y110.555 E0.0588245704032642
+G1 X229.2073 Y110.555 E0.012910700609764666
+G1 X230.37 Y109.3923 E0.04056782702796479
+G1 X230.37 Y109.9156 E0.012910700609764314
+G1 X229.7306 Y110.555 E0.022309339125897262
+G1 X230.2538 Y110.555 E0.012908233439764629
+G1 X230.37 Y110.4388 E0.004054340329104216
+; Filament-specific end gcode
+G4 ; wait
+M221 S100
+M104 S0 ; turn off temperature
+M140 S0 ; turn off heatbed
+M107 ; turn off fan
+G1 Z30.9 ; Move print head up
+G1 X0 Y200 F3000 ; home X axis
+M84 ; disable motors
+M73 P100 R0
+M73 Q100 S0
\ No newline at end of file
@@ -0,0 +1,194 @@
+"""
+Benchmarks of slicing hot paths at realistic scales.
+Run: python benchmarks.py [--quick] [--out results.json] [--baseline old_results.json]
+Each scenario reports wall time (best of repeats), peak memory (python allocations), moves per second and output
+bytes. Results are saved as JSON, and compared against a baseline JSON of an earlier run if given.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+import matrices_generator
+from angeled_grid_tensor import AngledGrid
+from angled_square import AngledSquare
+from multi_square import MultiSquare
+
+ANGLES = (0, 30, 45, 90, 135)
+NUZZLE_SIZES = (0.3, 0.38)
+
+
+def count_moves(file_name):
+    """
+    :return: number of G0/G1 moves with a position in gcode file
+    """
+    with open(file_name) as file:
+        return sum(1 for line in file if line.startswith(('G1 X', 'G0 X')))
+
+
+def measure(run, repeats):
+    """
+    :param run: function running scenario once, returning (moves, output bytes)
+    :param repeats: number of timed runs. best time is reported
+    :return: dictionary of metrics
+    """
+    times = []
+    for _ in range(repeats):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            moves, output_bytes = run()
+            times.append(time.perf_counter() - start)
+
+    # separate run for memory, tracing slows python down
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    wall = min(times)
+    return {'wall_s': wall, 'peak_mb': peak / 2 ** 20, 'moves': moves,
+            'moves_per_s': moves / wall if wall > 0 else None, 'output_bytes': output_bytes}
+
+
+def square_scenarios(directory):
+    """
+    single square: path generation, zipper merge, extrusion and writing, across angles and nuzzle sizes
+    """
+    for angle in ANGLES:
+        for nuzzle_size in NUZZLE_SIZES:
+            sq = AngledSquare(20, angle=angle, nuzzle_size=nuzzle_size, layers_num=4)
+            file_name = os.path.join(directory, f'sq_{angle}_{nuzzle_size}')
+            pos = sq.generate_arrays()
+            half = len(pos) // 2
+
+            def generate(sq=sq):
+                return len(sq.generate_arrays()), 0
+
+            def merge(sq=sq, pos=pos, half=half):
+                return len(sq.merge_two_arrays(pos[:half], pos[half:])), 0
+
+            def extrusion(sq=sq, pos=pos):
+                return len(sq.get_extrusions(pos, layer=1, start=(sq.x_start, sq.y_start))), 0
+
+            def scalar_extrusion(sq=sq, pos=pos):
+                for k in range(1, len(pos)):
+                    sq.get_extrusion(pos[k][0] - pos[k - 1][0], pos[k][1] - pos[k - 1][1], layer=1)
+                return len(pos) - 1, 0
+
+            def fill(sq=sq, file_name=file_name):
+                sq.file_name = file_name
+                sq.create_gcode()
+                return count_moves(f'{file_name}.gcode'), os.path.getsize(f'{file_name}.gcode')
+
+            params = {'angle': angle, 'nuzzle_size': nuzzle_size}
+            yield 'square.generate_arrays', params, generate
+            yield 'square.merge_two_arrays', params, merge
+            yield 'square.get_extrusions', params, extrusion
+            yield 'square.get_extrusion', params, scalar_extrusion
+            yield 'square.fill_inside', params, fill
+
+
+def grid_run(file_name, **kwargs):
+    def run():
+        grid = AngledGrid(file_name=file_name, **kwargs)
+        grid.create_gcode()
+        return count_moves(file_name), os.path.getsize(file_name)
+    return run
+
+
+def grid_scenarios(directory, sizes):
+    """
+    egg carton grids, and two-matrix grids switching matrices after num_mtx1 layers
+    """
+    for n in sizes:
+        sq_size = min(10, 190 // n)  # fit the bed
+        egg = matrices_generator.egg_carton(n)
+        yield 'grid.egg_carton', {'n': n, 'sq_size': sq_size}, grid_run(
+            os.path.join(directory, f'egg_{n}.gcode'), sq_size=sq_size, nuzzle_size=0.37, layers_num=2,
+            thickness=0.15, speed=2000, angles_mtx1=egg, x_start=10, y_start=10)
+
+        dome = matrices_generator.dome(n)
+        yield 'grid.two_matrices', {'n': n, 'sq_size': sq_size, 'num_mtx1': 2}, grid_run(
+            os.path.join(directory, f'two_{n}.gcode'), sq_size=sq_size, nuzzle_size=0.37, layers_num=4,
+            thickness=0.15, speed=2000, angles_mtx1=dome, angles_mtx2=matrices_generator.get_perpendicular(dome),
+            num_mtx1=2, x_start=10, y_start=10)
+
+
+def multi_square_scenarios(directory):
+    """
+    calibration plates of squares with increasing number of layers
+    """
+    for count in (12, 24):
+        array = [[20, 0.37, 1 + k // 4, 0.15, 2000] for k in range(count)]
+        file_name = os.path.join(directory, f'multi_{count}.gcode')
+
+        def run(array=array, file_name=file_name):
+            MultiSquare(file_name, array, start_x=20, start_y=20).create_gcode()
+            return count_moves(file_name), os.path.getsize(file_name)
+
+        yield 'multi_square', {'squares': count}, run
+
+
+def run_benchmarks(quick=False, repeats=3):
+    """
+    :param quick: smaller grids, single repeat
+    :return: list of results, one per scenario
+    """
+    sizes = (4, 8) if quick else (4, 8, 16, 32, 64)
+    repeats = 1 if quick else repeats
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        scenarios = [*square_scenarios(directory), *grid_scenarios(directory, sizes),
+                     *multi_square_scenarios(directory)]
+        for name, params, run in scenarios:
+            result = {'name': name, 'params': params, **measure(run, repeats)}
+            results.append(result)
+            print(f'{name:26} {json.dumps(params):40} {result["wall_s"] * 1000:10.2f} ms '
+                  f'{result["peak_mb"]:8.2f} MB {result["moves"]:9d} moves')
+    return results
+
+
+def compare(results, baseline):
+    """
+    print wall time and peak memory of results relative to baseline, scenario by scenario
+    """
+    old = {(item['name'], json.dumps(item['params'], sort_keys=True)): item for item in baseline['results']}
+    print('\nrelative to baseline (new / old):')
+    for item in results:
+        before = old.get((item['name'], json.dumps(item['params'], sort_keys=True)))
+        if before is None or not before['wall_s']:
+            continue
+        print(f'{item["name"]:26} {json.dumps(item["params"]):40} time x{item["wall_s"] / before["wall_s"]:6.2f} '
+              f'memory x{item["peak_mb"] / max(before["peak_mb"], 1e-9):6.2f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--quick', action='store_true', help='small scenarios, single repeat')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--out', default='bench_results.json', help='JSON file to save results to')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.quick, args.repeats)
+    report = {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine(),
+              'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'results': results}
+    with open(args.out, 'w') as file:
+        json.dump(report, file, indent=1)
+    print(f'\nresults saved to {args.out}')
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            compare(results, json.load(file))
+
+
+if __name__ == '__main__':
+    main()
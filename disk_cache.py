@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def code_version(*modules):
+    """
+    :param modules: file names of the modules generating the cached data. toolpaths are generated by angled_square,
+            so any change to it invalidates cached toolpaths
+    :return: hash of the code generating cached data
+    """
+    digest = hashlib.sha256()
+    for module in modules or ('angled_square.py',):
+        with open(os.path.join(_DIRECTORY, module), 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+
+class DiskToolpathCache:
+    '''
+    Content addressed on-disk cache of toolpath arrays, shared between runs (and processes).
+    Each array is kept as <hash of parameters and code version>.npy, and loaded memory-mapped.
+    Size capped: least recently used files are deleted once the cache grows over max_bytes.
+    '''
+
+    def __init__(self, directory, max_bytes=256 * 2 ** 20, version=None):
+        """
+        :param directory: to keep cached files in. created if missing
+        :param max_bytes: max total size of cached files
+        :param version: of toolpaths' code, part of every key. None for code_version()
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.version = version if version is not None else code_version()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, **params):
+        """
+        :param params: parameters the toolpath is generated from
+        :return: hex key of params and code version
+        """
+        text = json.dumps({name: float(value) if isinstance(value, (int, float, np.number)) else value
+                           for name, value in params.items()}, sort_keys=True)
+        return hashlib.sha256(f'{self.version}:{text}'.encode()).hexdigest()[:32]
+
+    def path(self, key):
+        return os.path.join(self.directory, f'{key}.npy')
+
+    def get(self, key):
+        """
+        :return: read only, memory-mapped array stored under key. None if not cached
+        """
+        path = self.path(key)
+        try:
+            array = np.load(path, mmap_mode='r')
+        except (FileNotFoundError, ValueError):  # ValueError - file partially written by a killed process
+            self.misses += 1
+            return None
+        os.utime(path)  # mark as recently used
+        self.hits += 1
+        return np.asarray(array)
+
+    def put(self, key, array):
+        """
+        store array under key, than evict least recently used files if over max_bytes.
+        """
+        path = self.path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as file:
+            np.save(file, np.ascontiguousarray(array))
+        os.replace(tmp_path, path)  # atomic, readers never see a partial file
+        self.evict()
+
+    def get_or_create(self, create, **params):
+        """
+        :param create: function returning the array, called only if not cached
+        :param params: parameters the array is generated from
+        :return: cached (memory-mapped) or newly created array
+        """
+        key = self.key(**params)
+        array = self.get(key)
+        if array is None:
+            array = create()
+            self.put(key, array)
+        return array
+
+    def size(self):
+        """
+        :return: total size of cached files, bytes
+        """
+        return sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.name.endswith('.npy'))
+
+    def evict(self):
+        """
+        delete least recently used files until total size is within max_bytes
+        :return: number of files deleted
+        """
+        entries = [(entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in os.scandir(self.directory)
+                   if entry.name.endswith('.npy')]
+        total = sum(size for _, size, _ in entries)
+        deleted = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:  # evicted by another process
+                pass
+            total -= size
+            deleted += 1
+        return deleted
+
+    def clear(self):
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.npy'):
+                os.remove(entry.path)
+        self.hits = self.misses = 0
@@ -0,0 +1,189 @@
+"""
+Angle and thickness matrices of AngledGrid, imported from high resolution maps: .npy arrays, TIFF files (needs
+tifffile) or images (needs Pillow).
+The map is split to a cell per square of the grid, each cell's pixels are reduced to one value: angles by circular mean
+over the 0-180 degrees range (mean direction of the doubled angles, halved), thickness by mean. The map is read tile by
+tile of whole cells - .npy and uncompressed TIFF files are memory mapped, other TIFF files decoded to a temporary
+memory mapped file - so maps larger than memory can be imported.
+Row 0 of the map is the top of the sheet, as in the angle matrices.
+Run: python field_import.py orientation.npy 20 30   (prints 20 x 30 angle matrix as JSON)
+"""
+import json
+import sys
+
+import numpy as np
+
+try:
+    import tifffile
+except ImportError:  # only needed for TIFF maps
+    tifffile = None
+
+try:
+    from PIL import Image
+except ImportError:  # only needed for image maps
+    Image = None
+
+TILE_PIXELS = 1 << 22  # pixels of map read at a time
+
+
+def open_field(source):
+    """
+    :param source: 2d array, or file name of map: .npy, .tif / .tiff, or image (png, jpg... as gray levels 0-255)
+    :return: 2d array of map. memory mapped where possible, read only
+    """
+    if not isinstance(source, str):
+        field = source
+    elif source.endswith('.npy'):
+        field = np.load(source, mmap_mode='r')
+    elif source.endswith(('.tif', '.tiff')):
+        if tifffile is None:
+            raise ImportError('TIFF maps require the tifffile package (pip install tifffile)')
+        try:
+            field = tifffile.memmap(source, mode='r')
+        except ValueError:  # compressed or tiled: decoded to a temporary memory mapped file
+            field = tifffile.imread(source, out='memmap')
+    else:
+        if Image is None:
+            raise ImportError('image maps require the Pillow package (pip install pillow)')
+        with Image.open(source) as image:
+            field = np.asarray(image.convert('L'))
+    assert field.ndim == 2, f'map must be 2d, got shape {field.shape}'
+    return field
+
+
+def cell_edges(size, cells):
+    """
+    :param size: number of pixels
+    :param cells: number of cells to split them to
+    :return: array of cells + 1 pixel indices, cell k is pixels edges[k] to edges[k + 1]. cells differ by a pixel at most
+    """
+    assert 0 < cells <= size, f'cannot split {size} pixels to {cells} cells'
+    return np.round(np.linspace(0, size, cells + 1)).astype(np.int64)
+
+
+def get_shape(field_shape, shape=None, cell_pixels=None):
+    """
+    :param shape: (rows, columns) of matrix
+    :param cell_pixels: pixels of map per cell: n or (rows, columns). used if shape isn't given. pixels left over are
+            spread over the cells
+    :return: (rows, columns) of matrix
+    """
+    if shape is not None:
+        return tuple(int(n) for n in shape)
+    assert cell_pixels is not None, 'either shape or cell_pixels is needed'
+    cell_pixels = np.broadcast_to(cell_pixels, 2)
+    return int(field_shape[0] // cell_pixels[0]), int(field_shape[1] // cell_pixels[1])
+
+
+def iter_cell_sums(field, shape, to_values, tile_pixels=TILE_PIXELS):
+    """
+    sums over cells of per pixel values, tile by tile of whole cells.
+    :param field: 2d array of map (can be memory mapped)
+    :param shape: (rows, columns) of cells, see get_shape
+    :param to_values: function of a tile of map (2d float array: float32 for maps of up to 32 bits, else float64) ->
+            list of 2d arrays of values to sum. nan values aren't summed. sums are float64
+    :param tile_pixels: max pixels of map to read at a time
+    :return: yields (rows, columns, sums, counts) of each tile: slices of cells, list of (rows, columns) arrays of sums
+            of each value, and array of numbers of pixels summed
+    """
+    rows, columns = shape
+    if rows == 0 or columns == 0:
+        return
+    row_edges, column_edges = cell_edges(field.shape[0], rows), cell_edges(field.shape[1], columns)
+    cell_size = int(np.diff(row_edges).max() * np.diff(column_edges).max())
+    dtype = np.float32 if field.dtype.itemsize <= 4 else np.float64
+    tile_columns = min(columns, max(1, tile_pixels // cell_size))
+    tile_rows = min(rows, max(1, tile_pixels // (cell_size * tile_columns)))
+
+    for top in range(0, rows, tile_rows):
+        bottom = min(rows, top + tile_rows)
+        for left in range(0, columns, tile_columns):
+            right = min(columns, left + tile_columns)
+            y0, y1, x0, x1 = row_edges[top], row_edges[bottom], column_edges[left], column_edges[right]
+            tile = np.asarray(field[y0:y1, x0:x1], dtype=dtype)
+            row_starts, column_starts = row_edges[top:bottom] - y0, column_edges[left:right] - x0
+            values = to_values(tile)
+            valid = np.isfinite(values[0])
+            for value in values[1:]:
+                valid &= np.isfinite(value)
+            if not valid.all():
+                values = [np.where(valid, value, 0) for value in values]
+            sums = [_block_sums(value, row_starts, column_starts) for value in values]
+            counts = _block_sums(valid, row_starts, column_starts)
+            yield slice(top, bottom), slice(left, right), sums, counts
+
+
+def _block_sums(values, row_starts, column_starts):
+    return np.add.reduceat(np.add.reduceat(values, row_starts, axis=0, dtype=np.float64), column_starts, axis=1)
+
+
+def import_angles(source, shape=None, cell_pixels=None, scale=1.0, offset=0.0, fill=0.0, tile_pixels=TILE_PIXELS):
+    """
+    :param source: map of angles, see open_field
+    :param shape: (rows, columns) of matrix, see get_shape
+    :param cell_pixels: pixels of map per cell, if no shape given
+    :param scale, offset: angle (degrees) of map value v is v * scale + offset. e.g. scale=180/np.pi for radians,
+            180/256 for gray levels of an image, -1 to mirror
+    :param fill: angle of cells without any valid (finite) value
+    :return: matrix (list of rows) of angles in 0-180 degrees: circular mean of each cell over the 0-180 range
+    """
+    field = open_field(source)
+    shape = get_shape(field.shape, shape, cell_pixels)
+    angles = np.full(shape, float(fill))
+
+    def to_values(tile):
+        # doubled angle, radians: directions 180 apart are the same line
+        doubled = tile * tile.dtype.type(np.pi / 90 * scale)
+        doubled += tile.dtype.type(np.pi / 90 * offset)
+        return [np.cos(doubled), np.sin(doubled)]
+
+    for rows, columns, (cos, sin), counts in iter_cell_sums(field, shape, to_values, tile_pixels):
+        mean = np.degrees(np.arctan2(sin, cos)) / 2 % 180
+        mean[mean >= 180] = 0  # tiny negative angles wrap to 180.0
+        angles[rows, columns] = np.where(counts > 0, mean, angles[rows, columns])
+    return angles.tolist()
+
+
+def import_thickness(source, shape=None, cell_pixels=None, scale=1.0, offset=0.0, fill=None,
+                     tile_pixels=TILE_PIXELS):
+    """
+    :param source: map of thickness, see open_field
+    :param shape: (rows, columns) of matrix, see get_shape
+    :param cell_pixels: pixels of map per cell, if no shape given
+    :param scale, offset: thickness (mm) of map value v is v * scale + offset
+    :param fill: thickness of cells without any valid (finite) value. None - raise an error if there are any
+    :return: thickness_mtx (list of rows): mean of each cell
+    """
+    field = open_field(source)
+    shape = get_shape(field.shape, shape, cell_pixels)
+    thickness = np.full(shape, np.nan)
+
+    for rows, columns, (total,), counts in iter_cell_sums(field, shape, lambda tile: [tile * scale + offset],
+                                                          tile_pixels):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            thickness[rows, columns] = total / counts
+    if np.isnan(thickness).any():
+        if fill is None:
+            raise ValueError(f'{int(np.isnan(thickness).sum())} cells of thickness map have no valid value')
+        thickness[np.isnan(thickness)] = fill
+    return thickness.tolist()
+
+
+def import_field(angles_source, shape=None, cell_pixels=None, thickness_source=None, scale=1.0, offset=0.0,
+                 thickness_scale=1.0, tile_pixels=TILE_PIXELS):
+    """
+    angles_mtx1 and thickness_mtx of AngledGrid, of same shape.
+    :param angles_source: map of angles, see import_angles
+    :param shape, cell_pixels: of angles matrix, see get_shape. thickness map is split to the same shape
+    :param thickness_source: map of thickness, see import_thickness. None for no thickness_mtx
+    :return: (angles matrix, thickness matrix or None)
+    """
+    angles = import_angles(angles_source, shape, cell_pixels, scale, offset, tile_pixels=tile_pixels)
+    if thickness_source is None:
+        return angles, None
+    shape = (len(angles), len(angles[0]) if angles else 0)
+    return angles, import_thickness(thickness_source, shape, scale=thickness_scale, tile_pixels=tile_pixels)
+
+
+if __name__ == '__main__':
+    print(json.dumps(import_angles(sys.argv[1], (int(sys.argv[2]), int(sys.argv[3])))))
@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 EXTRUDER_TEMP = 200
 BED_TEMP = 60
+BED_X = 250  # mm, printable bed of MK3S (250 x 210). limits of AngledGrid, MultiSquare, plate_layout and gcode_check
+BED_Y = 210
 
 
 class FlatObject(ABC):
@@ -0,0 +1,466 @@
+"""
+Checks generated gcode files before they are printed. moves (G0 - G3) of a file are parsed to arrays and validated all
+at once - no Python loop per line, so files of hundreds of MB can gate every job.
+Plain files are memory mapped (compressed ones decompressed to memory) and parsed chunk by chunk of whole lines: lines
+are found from the newlines, their commands from their first characters, words from the spaces before their letters,
+and numbers decoded 8 characters at a time, from uint64 words of their characters (SWAR; longer numbers from a window
+of characters, digit by digit). Modal positions and feedrate are carried forward with cumulative maximums of the indices of the lines that set them, and E is followed through
+M82 / M83 and G92.
+Checks, each violation reported with its line number (1 based):
+    number - X, Y, Z, E or F word that isn't a finite number (nan, inf, garbage)
+    bed - move to outside of the bed, or above max z
+    extrusion - printing move (moving in xy with E) of non positive, or implausibly high, E per mm
+    layer - printing move at a z other than its layer's, as given by ';AFTER_LAYER_CHANGE' and ';<z>' comments
+    relative - G91. relative positioning isn't followed, moves after it aren't checked correctly
+Run: python gcode_check.py file.gcode [--max-e-per-mm 0.5] [--limit 20]   (exit status 1 if there are violations)
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from flat_objects import BED_X, BED_Y
+from gcode_io import compression_of, open_gcode
+
+AXES = 'XYZEF'  # words parsed, bit 1 << k of 'words' and 'invalid' masks is AXES[k]
+CHECKS = ('number', 'bed', 'extrusion', 'layer', 'relative')
+MOVE_DTYPE = np.dtype([('line', np.int64), ('command', np.uint8), ('x', np.float64), ('y', np.float64),
+                       ('z', np.float64), ('e', np.float32), ('f', np.float32), ('words', np.uint8),
+                       ('invalid', np.uint8)])
+LAYER_DTYPE = np.dtype([('line', np.int64), ('z', np.float64)])
+VIOLATION_DTYPE = np.dtype([('line', np.int64), ('check', np.uint8), ('axis', np.uint8), ('value', np.float64),
+                            ('limit', np.float64)])
+BED_BOUNDS = (0, -4, BED_X, BED_Y)  # x_min, y_min, x_max, y_max, mm. header's intro goes outside print area, to Y-3
+Z_MAX = 210  # mm
+MAX_E_PER_MM = 0.5  # mm of filament per mm of move. a 0.8 x 1 mm line is 0.33
+LAYER_TOLERANCE = 1e-3  # mm. z is written with 3 decimals
+LAYER_MARKER = b';AFTER_LAYER_CHANGE'
+
+# command of line -> code in 'command' of moves and of parsed lines. other commands are OTHER
+COMMANDS = {b'G0': 0, b'G1': 1, b'G2': 2, b'G3': 3, b'G90': 90, b'G91': 91, b'G92': 92, b'M82': 182, b'M83': 183}
+OTHER = 255
+_CHUNK = 1 << 20  # bytes parsed at a time
+_LONG_WIDTH = 32  # characters of window of numbers longer than 8
+_NEWLINE, _SPACE, _COMMENT = ord('\n'), ord(' '), ord(';')
+_AXIS_OF = np.full(256, OTHER, dtype=np.uint8)  # character -> index in AXES
+_AXIS_OF[np.frombuffer(AXES.encode(), dtype=np.uint8)] = np.arange(len(AXES))
+_DELIMITER = np.zeros(256, dtype=bool)  # characters that end a command
+_DELIMITER[[_NEWLINE, _SPACE, _COMMENT, ord('\r'), ord('\t')]] = True
+_SIGN = np.zeros(256, dtype=bool)
+_SIGN[[ord('-'), ord('+')]] = True
+_NUMBER_PART = np.zeros(256, dtype=bool)  # characters that continue a number
+_NUMBER_PART[np.frombuffer(b'0123456789.', dtype=np.uint8)] = True
+_POWERS = 10 ** np.arange(19, dtype=np.int64)
+_DECIMALS = np.append(np.ones(9), 10.0 ** np.arange(8))  # 10 ** decimals of number at [length - point + 8]
+_ONE = np.uint64(1)
+
+
+def _bytes(byte):
+    return np.uint64(byte * 0x0101010101010101)
+
+
+_HIGH, _LOW = _bytes(0x80), _bytes(0x7F)
+_BYTE_MASKS = np.array([(1 << 8 * k) - 1 for k in range(9)], dtype=np.uint64)  # low k bytes
+_ALIGN = np.array([8 * (8 - k) % 64 for k in range(9)], dtype=np.uint64)  # shift of k digits to top bytes
+
+
+def parse_numbers(chars):
+    """
+    :param chars: (n, width) uint8 array, a number at the start of each row: optional sign, digits and a decimal point
+    :return: n float64 values: as float() of the numbers up to 15 digits, within a unit of the last place up to 18.
+            nan where a row doesn't start with a number (no digits, or a second decimal point) or it doesn't end within
+            width
+    """
+    width = chars.shape[1]
+    digit = (chars >= ord('0')) & (chars <= ord('9'))
+    point = chars == ord('.')
+    sign = (chars[:, 0] == ord('-')) | (chars[:, 0] == ord('+'))
+    part = digit | point
+    part[:, 0] |= sign
+    length = np.where(part.all(axis=1), width, np.argmin(part, axis=1))
+    column = np.arange(width)
+    inside = column < length[:, None]
+    digit &= inside
+    point &= inside
+    # mantissa of all digits as an integer, divided by 10 to the digits after the point: one rounding, as float()
+    digits = digit.sum(axis=1)
+    after = digits[:, None] - np.cumsum(digit, axis=1)  # digits after each digit
+    valid = (digits > 0) & (digits < len(_POWERS)) & (point.sum(axis=1) <= 1) & (length < width)
+    mantissa = np.where(digit, (chars - ord('0')) * _POWERS[np.minimum(after, len(_POWERS) - 1)], 0).sum(axis=1)
+    point_at = np.where(point.any(axis=1), np.argmax(point, axis=1), width)
+    decimals = (digit & (column > point_at[:, None])).sum(axis=1)
+    values = mantissa / 10.0 ** decimals
+    values[chars[:, 0] == ord('-')] *= -1
+    values[~valid] = np.nan
+    return values
+
+
+def _lowest_byte(mask):
+    """
+    :param mask: uint64 array of high bits of bytes (0x80 << 8 * k)
+    :return: index of lowest byte with its bit set in each, 8 for none
+    """
+    lowest = (mask & (~mask + _ONE)) >> np.uint64(7)  # 1 << 8 * k
+    # byte 7 - k of constant is k, multiplied to the top byte
+    return np.where(mask != 0, (lowest * np.uint64(0x0001020304050607)) >> np.uint64(56), 8).astype(np.int64)
+
+
+def parse_short_numbers(text, positions):
+    """
+    numbers of up to 8 characters (sign aside) parsed 8 at a time, as uint64 of their characters (SWAR).
+    :param text: uint8 array, at least 9 bytes after each position
+    :param positions: of numbers in text: optional sign, digits and a decimal point
+    :return: (float64 values - as float(), nan where there is no number, indices of longer numbers - not parsed)
+    """
+    positions = positions.copy()
+    signed = np.flatnonzero(_SIGN[text[positions]])
+    negative = signed[text[positions[signed]] == ord('-')]
+    positions[signed] += 1
+    words = np.ndarray((len(text) - 7,), '<u8', text, strides=(1,))[positions]  # 8 characters from each position
+    # high bit of each byte that isn't a digit, and of each '.'
+    not_digit = ((words + _bytes(0x46)) | ~((words | _HIGH) - _bytes(0x30)) | words) & _HIGH
+    dots = words ^ _bytes(ord('.'))
+    dots = ~(((dots & _LOW) + _LOW) | dots | _LOW)
+    length = _lowest_byte(not_digit & ~dots)
+    point = _lowest_byte(dots)
+    long = np.flatnonzero(length == 8)
+    long = long[_NUMBER_PART[text[positions[long] + 8]]]
+    invalid = np.flatnonzero(dots & (dots - _ONE))  # a second point, if it is within the number
+    invalid = invalid[_lowest_byte(dots[invalid] & (dots[invalid] - _ONE)) < length[invalid]]
+    # point removed, digits right aligned to 8 bytes after leading zeros. then pairs, quads and 8 digits are added
+    below = _BYTE_MASKS[point]
+    words = (words & below) | ((words >> np.uint64(8)) & ~below)
+    digits = length - (point < length)
+    keep = _BYTE_MASKS[digits]
+    words = ((words & keep) - (_bytes(0x30) & keep)) << _ALIGN[digits]
+    words = ((words & _bytes(0x0F)) * np.uint64(10 * 256 + 1)) >> np.uint64(8)
+    words = ((words & np.uint64(0x00FF00FF00FF00FF)) * np.uint64(100 * 65536 + 1)) >> np.uint64(16)
+    words = ((words & np.uint64(0x0000FFFF0000FFFF)) * np.uint64(10000 * 2 ** 32 + 1)) >> np.uint64(32)
+    values = words.astype(np.float64) / _DECIMALS[length - point + 8]
+    values[negative] *= -1
+    values[digits == 0] = np.nan
+    values[invalid] = np.nan
+    return values, long
+
+
+def _numbers_at(text, positions):
+    # text is padded with newlines, _LONG_WIDTH after its end
+    values, long = parse_short_numbers(text, positions)
+    if len(long):
+        values[long] = parse_numbers(text[positions[long, None] + np.arange(_LONG_WIDTH)])
+    return values
+
+
+def _parse_chunk(text, size, first_line):
+    """
+    :param text: uint8 array of whole lines, size bytes, then padded with newlines
+    :param first_line: number of chunk's first line
+    :return: dictionary of lines of G0 - G3, G90, G91, G92, M82 and M83: line, command, values ((len(AXES), n) array of
+            their words, nan for none), words and invalid masks. and: lines - number of lines in chunk, markers - lines
+            of layer markers, heights - (lines, values) of comments of a number (';0.15')
+    """
+    # newlines, spaces and comments by position. the line of each is the number of newlines before it
+    delimiters = np.flatnonzero((text[:size] == _NEWLINE) | (text[:size] == _SPACE) | (text[:size] == _COMMENT))
+    kinds = text[delimiters]
+    newline = kinds == _NEWLINE
+    line_of = np.cumsum(newline) - newline
+    newlines = delimiters[newline]
+    starts = np.append(0, newlines + 1)
+    starts = starts[starts < size]
+    count = len(starts)
+    # end of each line's code: its first comment, else its newline
+    ends = np.append(newlines, size)[:count]
+    comments = np.flatnonzero(kinds == _COMMENT)
+    comments = comments[np.diff(line_of[comments], prepend=-1) != 0]
+    ends[line_of[comments]] = delimiters[comments]
+
+    heads = np.ndarray((len(text) - 3,), '<u4', text, strides=(1,))[starts]  # first 4 characters of each line
+    ended = {2: _DELIMITER[(heads >> 16) & 0xFF], 3: _DELIMITER[heads >> 24]}
+    commands = np.full(count, OTHER, dtype=np.uint8)
+    for name, code in COMMANDS.items():
+        commands[((heads & ((1 << 8 * len(name)) - 1)) == int.from_bytes(name, 'little')) & ended[len(name)]] = code
+    selected = np.flatnonzero(commands != OTHER)
+    row_of = np.full(count, -1, dtype=np.int64)
+    row_of[selected] = np.arange(len(selected))
+
+    # words: letter of AXES after a space, within code of a selected line
+    spaces = np.flatnonzero(kinds == _SPACE)
+    lines = line_of[spaces]
+    spaces = delimiters[spaces]
+    axes = _AXIS_OF[text[spaces + 1]]
+    row = row_of[lines]
+    keep = np.flatnonzero((axes != OTHER) & (row >= 0) & (spaces < ends[lines]))
+    spaces, axes, row = spaces[keep], axes[keep], row[keep]
+    values = np.full((len(AXES), len(selected)), np.nan)
+    values[axes, row] = _numbers_at(text, spaces + 2)
+    given = np.zeros((len(AXES), len(selected)), dtype=bool)
+    given[axes, row] = True
+
+    # layer markers and comments of a number after them. a marker's number can be the next chunk's first line
+    commented = np.flatnonzero((heads & 0xFF) == _COMMENT)
+    second = (heads[commented] >> 8) & 0xFF
+    candidates = commented[second == LAYER_MARKER[1]]
+    marker = np.frombuffer(LAYER_MARKER, dtype=np.uint8)
+    candidates = candidates[(text[starts[candidates, None] + np.arange(len(marker))] == marker).all(axis=1)]
+    numbered = commented[((second >= ord('0')) & (second <= ord('9'))) | (second == ord('-'))]
+    return {'line': first_line + selected, 'command': commands[selected], 'values': values,
+            'words': np.packbits(given, axis=0, bitorder='little')[0],
+            'invalid': np.packbits(given & np.isnan(values), axis=0, bitorder='little')[0],
+            'lines': count, 'markers': first_line + candidates,
+            'heights': (first_line + numbered, _numbers_at(text, starts[numbered] + 1))}
+
+
+def _last_given(given):
+    """
+    :return: index of last given at or before each index, -1 before the first
+    """
+    index = np.where(given, np.arange(len(given)), -1)
+    return np.maximum.accumulate(index, out=index)
+
+
+def _fill_forward(values, given):
+    """
+    :return: values with each value not given replaced by the last given before it. nan before the first given
+    """
+    last = _last_given(given)
+    filled = values[last]
+    filled[last < 0] = np.nan
+    return filled
+
+
+def _extrusion(command, e, has_e):
+    """
+    :param command: of each row
+    :param e: E word of each row
+    :param has_e: mask of rows with E word
+    :return: filament extruded by each row (0 for rows that aren't moves), following M82 / M83 and G92 E. the
+            extruder is absolute until M83, from e 0
+    """
+    last_mode = _last_given((command == COMMANDS[b'M82']) | (command == COMMANDS[b'M83']))
+    relative = (last_mode >= 0) & (command[last_mode] == COMMANDS[b'M83'])
+    is_move = command <= 3
+    extruded = np.where(has_e & is_move & relative, e, 0.0)
+    absolute = np.flatnonzero(has_e & is_move & ~relative)
+    if len(absolute):
+        # e after each row: set by G92 E and absolute moves, else last e plus relative moves
+        added = np.cumsum(extruded)
+        last_set = _last_given(has_e & ((command == COMMANDS[b'G92']) | (is_move & ~relative)))
+        position = np.where(last_set >= 0, e[last_set] - added[last_set], 0.0) + added
+        extruded[absolute] = position[absolute] - np.append(0.0, position)[absolute]
+    return extruded
+
+
+def parse(file_name, chunk_size=_CHUNK):
+    """
+    :param file_name: gcode file, plain (memory mapped) or compressed (see gcode_io.open_gcode)
+    :param chunk_size: bytes parsed at a time. lines are split only if there is no newline in the last 64 KB of a chunk
+    :return: dictionary: moves - array of MOVE_DTYPE of G0 - G3 lines: line, command (0 - 3), x, y, z, f after move
+            (modal, nan until first set), e - filament extruded by move, words - mask of AXES given on line, invalid -
+            mask of those that aren't finite numbers. layers - array of LAYER_DTYPE: line of each layer marker and its
+            z (nan if no number follows it). relative - lines of G91. lines - number of lines
+    """
+    if compression_of(file_name) is not None:
+        with open_gcode(file_name) as file:
+            data = np.frombuffer(file.read().encode(), dtype=np.uint8)
+    elif os.path.getsize(file_name) == 0:
+        data = np.zeros(0, dtype=np.uint8)
+    else:
+        data = np.memmap(file_name, dtype=np.uint8, mode='r')
+
+    chunks = []
+    text = np.empty(chunk_size + _LONG_WIDTH + 8, dtype=np.uint8)
+    start, line = 0, 1
+    while start < len(data):
+        size = min(len(data), start + chunk_size) - start
+        text[:size] = data[start:start + size]
+        if start + size < len(data):  # whole lines only
+            tail = max(0, size - (1 << 16))
+            newlines = np.flatnonzero(text[tail:size] == _NEWLINE)
+            size = tail + int(newlines[-1]) + 1 if len(newlines) else size
+        text[size:size + _LONG_WIDTH + 8] = _NEWLINE
+        chunk = _parse_chunk(text, size, line)
+        chunks.append(chunk)
+        start, line = start + size, line + chunk['lines']
+
+    if not chunks:
+        chunks.append(_parse_chunk(np.full(_LONG_WIDTH + 8, _NEWLINE, dtype=np.uint8), 0, 1))
+    rows = {name: np.concatenate([chunk[name] for chunk in chunks], axis=-1)
+            for name in ('line', 'command', 'values', 'words', 'invalid')}
+    markers = np.concatenate([chunk['markers'] for chunk in chunks])
+    number_lines = np.concatenate([chunk['heights'][0] for chunk in chunks])
+    numbers = np.concatenate([chunk['heights'][1] for chunk in chunks])
+
+    command = rows['command']
+    moving = np.flatnonzero(command <= 3)
+    moves = np.zeros(len(moving), dtype=MOVE_DTYPE)
+    for name in ('line', 'command', 'words', 'invalid'):
+        moves[name] = rows[name][moving]
+    for k, axis in enumerate(AXES):
+        given = (rows['words'] & (1 << k)) != 0
+        if axis == 'E':
+            moves['e'] = _extrusion(command, rows['values'][k], given)[moving]
+        else:
+            moves[axis.lower()] = _fill_forward(rows['values'][k], given)[moving]
+
+    layers = np.zeros(len(markers), dtype=LAYER_DTYPE)
+    layers['line'] = markers
+    following = np.searchsorted(number_lines, markers + 1)
+    found = following < len(number_lines)
+    found[found] = number_lines[following[found]] == markers[found] + 1
+    layers['z'] = np.nan
+    layers['z'][found] = numbers[following[found]]
+    return {'moves': moves, 'layers': layers, 'relative': rows['line'][command == COMMANDS[b'G91']],
+            'lines': line - 1}
+
+
+def _violations(lines, check, axis=OTHER, value=np.nan, limit=np.nan):
+    violations = np.zeros(len(lines), dtype=VIOLATION_DTYPE)
+    violations['line'] = lines
+    violations['check'] = CHECKS.index(check)
+    violations['axis'] = axis
+    violations['value'] = value
+    violations['limit'] = limit
+    return violations
+
+
+def move_lengths(moves):
+    """
+    :return: xy length of each move, from the move before it. nan where its start isn't known
+    """
+    x, y = moves['x'], moves['y']
+    lengths = np.full(len(moves), np.nan)
+    lengths[1:] = np.hypot(x[1:] - x[:-1], y[1:] - y[:-1])
+    return lengths
+
+
+def _printing(moves, lengths):
+    # moves extruding (E word) while moving in xy
+    if lengths is None:
+        lengths = move_lengths(moves)
+    return ((moves['words'] & (1 << AXES.index('E'))) != 0) & (lengths > 0), lengths
+
+
+def check_numbers(moves):
+    """
+    :return: violations: a violation per word of a move that isn't a finite number
+    """
+    invalid = moves[['line', 'invalid']][moves['invalid'] != 0]
+    violations = np.concatenate([_violations(invalid['line'][(invalid['invalid'] & (1 << k)) != 0], 'number', k)
+                                 for k in range(len(AXES))])
+    return violations[np.argsort(violations['line'], kind='stable')]
+
+
+def check_bed(moves, bounds=BED_BOUNDS, z_max=Z_MAX):
+    """
+    :param bounds: (x_min, y_min, x_max, y_max) of bed, mm
+    :param z_max: mm
+    :return: violations: a violation per axis of a move that ends outside of bounds (or below 0, above z_max in z).
+            axes of unknown position (before they are first set) aren't checked
+    """
+    violations = []
+    for k, axis, low, high in ((0, 'x', bounds[0], bounds[2]), (1, 'y', bounds[1], bounds[3]), (2, 'z', 0, z_max)):
+        values = moves[axis]
+        for outside, limit in ((values < low, low), (values > high, high)):
+            index = np.flatnonzero(outside)
+            violations.append(_violations(moves['line'][index], 'bed', k, values[index], limit))
+    return np.concatenate(violations)
+
+
+def check_extrusion(moves, max_e_per_mm=MAX_E_PER_MM, lengths=None):
+    """
+    :param max_e_per_mm: mm of filament per mm of xy move
+    :param lengths: of moves, see move_lengths. None to compute
+    :return: violations: printing moves (moving in xy with an E word) of E per mm not in (0, max_e_per_mm]. moves from
+            an unknown position aren't checked, nor arcs (their length isn't known from their ends)
+    """
+    printing, lengths = _printing(moves, lengths)
+    printing &= moves['command'] <= 1
+    with np.errstate(invalid='ignore', divide='ignore'):
+        per_mm = moves['e'] / lengths
+    index = np.flatnonzero(printing & ((per_mm <= 0) | (per_mm > max_e_per_mm)))
+    return _violations(moves['line'][index], 'extrusion', AXES.index('E'), per_mm[index], max_e_per_mm)
+
+
+def check_layers(moves, layers, heights=None, tolerance=LAYER_TOLERANCE, lengths=None):
+    """
+    :param layers: from parse
+    :param heights: expected z of layer k, the k-th layer marker of file (k from 0). None - the z of its marker
+    :param tolerance: mm
+    :param lengths: of moves, see move_lengths. None to compute
+    :return: violations: printing moves with E > 0 after a layer marker, at a z that isn't its layer's (nan limit for a
+            marker without z, or beyond heights). moves before the first marker aren't checked
+    """
+    printing, _ = _printing(moves, lengths)
+    # layer of each move: number of markers before it, less one
+    first_moves = np.searchsorted(moves['line'], layers['line'])
+    layer = np.cumsum(np.bincount(first_moves, minlength=len(moves) + 1)[:len(moves)]) - 1
+    expected = layers['z'] if heights is None else np.asarray(heights, dtype=np.float64)
+    index = np.flatnonzero(printing & (moves['e'] > 0) & (layer >= 0))
+    layer = layer[index]
+    limit = np.full(len(index), np.nan)
+    known = layer < len(expected)
+    limit[known] = expected[layer[known]]
+    z = moves['z'][index]
+    wrong = ~(np.abs(z - limit) <= tolerance)
+    return _violations(moves['line'][index[wrong]], 'layer', AXES.index('Z'), z[wrong], limit[wrong])
+
+
+def validate(source, bounds=BED_BOUNDS, z_max=Z_MAX, max_e_per_mm=MAX_E_PER_MM, heights=None,
+             tolerance=LAYER_TOLERANCE):
+    """
+    :param source: gcode file name, or its parse
+    :param bounds, z_max: see check_bed
+    :param max_e_per_mm: see check_extrusion
+    :param heights, tolerance: see check_layers
+    :return: array of VIOLATION_DTYPE, by line: line, check (index in CHECKS), axis (index in AXES, OTHER for none),
+            value and limit it breaks (nan where not relevant)
+    """
+    parsed = parse(source) if isinstance(source, str) else source
+    moves = parsed['moves']
+    lengths = move_lengths(moves)
+    violations = np.concatenate((check_numbers(moves), check_bed(moves, bounds, z_max),
+                                 check_extrusion(moves, max_e_per_mm, lengths),
+                                 check_layers(moves, parsed['layers'], heights, tolerance, lengths),
+                                 _violations(parsed['relative'], 'relative')))
+    return violations[np.argsort(violations['line'], kind='stable')]
+
+
+def format_violations(violations, limit=None):
+    """
+    :param violations: from validate
+    :param limit: max number of violations to format. None for all
+    :return: list of lines, 'line <n>: <check>: <message>'
+    """
+    lines = []
+    for line, check, axis, value, bound in violations[:limit].tolist():
+        check = CHECKS[check]
+        name = AXES[axis] if axis != OTHER else ''
+        if check == 'number':
+            message = f'{name} is not a number'
+        elif check == 'bed':
+            message = f'{name}{value:g} beyond bed limit {name}{bound:g}'
+        elif check == 'extrusion':
+            message = f'{value:.4g} mm of filament per mm, expected above 0 and up to {bound:g}'
+        elif check == 'layer':
+            message = f'Z{value:g} but layer is at Z{bound:g}' if bound == bound else f'Z{value:g} in layer of no z'
+        else:
+            message = 'G91 - relative positioning is not checked'
+        lines.append(f'line {line}: {check}: {message}')
+    return lines
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('file', help='gcode file, plain or compressed')
+    parser.add_argument('--bed', type=float, nargs=4, default=BED_BOUNDS, help='x_min y_min x_max y_max, mm')
+    parser.add_argument('--z-max', type=float, default=Z_MAX, help='mm')
+    parser.add_argument('--max-e-per-mm', type=float, default=MAX_E_PER_MM, help='mm of filament per mm of move')
+    parser.add_argument('--limit', type=int, default=20, help='max number of violations to print')
+    args = parser.parse_args()
+
+    found = validate(args.file, args.bed, args.z_max, args.max_e_per_mm)
+    for text in format_violations(found, args.limit):
+        print(text)
+    print(f'{len(found)} violations')
+    sys.exit(1 if len(found) else 0)
@@ -0,0 +1,243 @@
+"""
+Compressed and binary gcode files, written and read as a stream.
+open_gcode opens plain, gzip, zstd (needs zstandard package) or meatpack gcode files by extension, as text files.
+Meatpack packs the 15 most common gcode characters ('0'-'9', '.', ' ', newline, 'G', 'X') into 4 bits, two per byte,
+as the MeatPack firmware plugin does. Other characters are escaped and sent in full. Lossless, unlike the firmware
+protocol it keeps comments and spaces.
+Convert between formats: python gcode_io.py input.gcode output.gcode.gz
+"""
+import gzip
+import io
+import shutil
+import sys
+
+import numpy as np
+
+try:
+    import zstandard
+except ImportError:  # only needed for zstd files
+    zstandard = None
+
+COMPRESSIONS = ('gzip', 'zstd', 'meatpack')
+EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst', 'meatpack': '.mpk'}
+
+MEATPACK_MAGIC = b'MPK\x01'
+MEATPACK_CHARS = b'0123456789. \nGX'
+_ESCAPE = 15  # nibble of a character sent in full, in the following byte
+_PACK = np.full(256, _ESCAPE, dtype=np.uint8)  # character -> nibble
+_PACK[np.frombuffer(MEATPACK_CHARS, dtype=np.uint8)] = np.arange(len(MEATPACK_CHARS))
+_UNPACK = np.frombuffer(MEATPACK_CHARS + b'\0', dtype=np.uint8)  # nibble -> character
+_byte = np.arange(256)
+_ESCAPED = ((_byte & 15) == _ESCAPE).astype(np.uint8) + ((_byte >> 4) == _ESCAPE)  # packed byte -> full bytes after it
+# decoder's state - number of full bytes still expected (0-2). a function of state -> state is kept as a single number,
+# f(0) + 3 f(1) + 9 f(2). _COMPOSE[g, f] - function g(f(state))
+_states = np.arange(27)[:, None] // 3 ** np.arange(3) % 3  # function -> its values at 0, 1, 2
+_COMPOSE = (np.take_along_axis(_states[:, None, :].repeat(27, 1), _states[None, :, :].repeat(27, 0), axis=2) *
+            3 ** np.arange(3)).sum(axis=2).astype(np.uint8)
+_CONSTANT = (_states == _states[:, :1]).all(axis=1)  # function -> same state whatever the state before
+_CHUNK = 1 << 20
+
+
+def compression_of(file_name):
+    """
+    :return: compression of file by its extension (see EXTENSIONS). None for plain text
+    """
+    for compression, extension in EXTENSIONS.items():
+        if file_name.endswith(extension):
+            return compression
+    return None
+
+
+def open_gcode(file_name, mode='r', compression='auto', level=None):
+    """
+    :param file_name: gcode file
+    :param mode: 'r' or 'w'
+    :param compression: 'gzip', 'zstd', 'meatpack', None for plain text, or 'auto' - by file_name's extension
+    :param level: of gzip (default 6) / zstd (default 3) compression
+    :return: text file object. written text is compressed as it is written, read text decompressed as it is read
+    """
+    assert mode in ('r', 'w'), 'mode must be r or w'
+    if compression == 'auto':
+        compression = compression_of(file_name)
+    if compression is None:
+        return open(file_name, mode)
+    if compression == 'gzip':
+        return gzip.open(file_name, mode + 't', compresslevel=6 if level is None else level)
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ImportError('zstd gcode files require the zstandard package (pip install zstandard)')
+        cctx = zstandard.ZstdCompressor(level=3 if level is None else level) if mode == 'w' else None
+        return zstandard.open(file_name, mode + 't', cctx=cctx)
+    if compression == 'meatpack':
+        return io.TextIOWrapper(MeatPackFile(file_name, mode))
+    raise ValueError(f'unknown compression {compression}, expected one of {COMPRESSIONS}')
+
+
+class MeatPackEncoder:
+    '''
+    Incremental meatpack encoder. Characters are packed in pairs, an odd last character waits for the next call.
+    '''
+
+    def __init__(self):
+        self._pending = b''
+
+    def encode(self, data):
+        """
+        :param data: bytes
+        :return: packed bytes of data (and of characters left from last call)
+        """
+        data = self._pending + data
+        cut = len(data) - len(data) % 2
+        self._pending = data[cut:]
+        chars = np.frombuffer(data, dtype=np.uint8, count=cut)
+        first, second = chars[0::2], chars[1::2]
+        low, high = _PACK[first], _PACK[second]
+        escaped_first, escaped_second = low == _ESCAPE, high == _ESCAPE
+
+        # each pair is a packed byte, followed by its escaped characters in full
+        sizes = 1 + escaped_first.astype(np.int64) + escaped_second
+        starts = np.cumsum(sizes) - sizes
+        out = np.empty(sizes.sum(), dtype=np.uint8)
+        out[starts] = low | (high << 4)
+        out[starts[escaped_first] + 1] = first[escaped_first]
+        out[(starts + 1 + escaped_first)[escaped_second]] = second[escaped_second]
+        return out.tobytes()
+
+    def flush(self):
+        """
+        :return: packed bytes of the last character, padded with a NUL character. empty if none is left. the decoder
+                drops a NUL ending the data, so data itself must not end with one (gcode text never does)
+        """
+        return self.encode(b'\0') if self._pending else b''
+
+
+class MeatPackDecoder:
+    '''
+    Incremental meatpack decoder. A packed byte whose escaped characters are not given yet waits for the next call.
+    '''
+
+    def __init__(self):
+        self._pending = b''  # undecoded bytes, starting at a packed byte
+        self._last = b''  # last decoded character, held back in case it is the padding
+
+    def decode(self, data):
+        """
+        :param data: bytes, continuing last call's
+        :return: decoded bytes
+        """
+        data = self._pending + data
+        buf = np.frombuffer(data, dtype=np.uint8)
+        n = len(buf)
+        if n == 0:
+            return b''
+
+        # which bytes are packed bytes, and which escaped characters? prefix scan of the decoder's state over the
+        # bytes. each byte is a function of state: packed byte (state 0) -> its escaped count, escaped byte -> state - 1.
+        # composed by doubling: after it, transition[i] maps state before byte 0 to state after byte i. functions of a
+        # few bytes are usually already constant, than longer compositions won't change them
+        transition = _ESCAPED[buf] + np.uint8(9)
+        step = 1
+        while step < n:
+            composed = transition.copy()
+            composed[step:] = _COMPOSE[transition[step:], transition[:-step]]
+            transition = composed
+            step *= 2
+            if _CONSTANT[transition[step:]].all():
+                break
+        packed = np.flatnonzero(np.concatenate(([0], transition[:-1] % 3)) == 0)
+
+        # last packed byte may miss its escaped characters
+        cut = n
+        if len(packed) and packed[-1] + 1 + _ESCAPED[buf[packed[-1]]] > n:
+            cut = packed[-1]
+            packed = packed[:-1]
+        self._pending = data[cut:]
+
+        low, high = buf[packed] & 15, buf[packed] >> 4
+        escaped_first = low == _ESCAPE
+        escaped_second = high == _ESCAPE
+        out = np.empty(2 * len(packed), dtype=np.uint8)
+        out[0::2] = np.where(escaped_first, buf[np.minimum(packed + 1, n - 1)], _UNPACK[low])
+        out[1::2] = np.where(escaped_second, buf[np.minimum(packed + 1 + escaped_first, n - 1)], _UNPACK[high])
+        out = self._last + out.tobytes()
+        self._last = out[-1:]
+        return out[:-1]
+
+    def flush(self):
+        """
+        :return: decoded bytes held back, without padding
+        """
+        if self._pending:
+            raise ValueError('meatpack data is truncated')
+        last, self._last = self._last, b''
+        return b'' if last == b'\0' else last
+
+
+class MeatPackFile(io.BufferedIOBase):
+    '''
+    Binary file of meatpack encoded data. Written data is encoded, read data decoded, chunk by chunk.
+    '''
+
+    def __init__(self, file_name, mode='r'):
+        """
+        :param file_name: to read from / write to
+        :param mode: 'r' or 'w'
+        """
+        self.mode = mode.replace('b', '')
+        self._file = open(file_name, self.mode + 'b')
+        if self.mode == 'w':
+            self._encoder = MeatPackEncoder()
+            self._file.write(MEATPACK_MAGIC)
+        else:
+            self._decoder = MeatPackDecoder()
+            if self._file.read(len(MEATPACK_MAGIC)) != MEATPACK_MAGIC:
+                self._file.close()
+                raise ValueError(f'{file_name} is not a meatpack file')
+            self._buffer = b''
+            self._eof = False
+
+    def readable(self):
+        return self.mode == 'r'
+
+    def writable(self):
+        return self.mode == 'w'
+
+    def write(self, data):
+        data = bytes(data)
+        self._file.write(self._encoder.encode(data))
+        return len(data)
+
+    def read(self, size=-1):
+        size = -1 if size is None else size
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._file.read(_CHUNK)
+            if chunk:
+                self._buffer += self._decoder.decode(chunk)
+            else:
+                self._buffer += self._decoder.flush()
+                self._eof = True
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    read1 = read
+
+    def close(self):
+        if not self.closed:
+            if self.mode == 'w':
+                self._file.write(self._encoder.flush())
+            self._file.close()
+        super().close()
+
+
+def convert(source, destination):
+    """
+    copy gcode file to another, chunk by chunk. formats by extensions, see open_gcode
+    """
+    with open_gcode(source, 'r') as src, open_gcode(destination, 'w') as dst:
+        shutil.copyfileobj(src, dst, _CHUNK)
+
+
+if __name__ == '__main__':
+    convert(sys.argv[1], sys.argv[2])
@@ -0,0 +1,505 @@
+"""
+Streams gcode to printers while it is generated, over the numbered, ok acknowledged line protocol of Marlin / Prusa
+firmware. Each line is sent as 'N<number> <command>*<checksum>', checksum - xor of the line's bytes before '*'. Up to
+window lines are in flight (sent, not acknowledged by 'ok' yet). A 'Resend: <number>' reply sends lines again, from
+that number.
+Printers are reached over TCP ('host:port' - serial to network bridges, VirtualPrinter), or over serial ports when
+pyserial-asyncio is installed.
+Stream a file:                          python gcode_streamer.py print.gcode --printer 192.168.1.20:8888
+Benchmark against 4 virtual printers:   python gcode_streamer.py --virtual 4 --window 8 --latency 0.002
+(without a gcode file, a demo AngledGrid is generated while streamed)
+"""
+import argparse
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+try:
+    import serial_asyncio
+except ImportError:  # only needed for serial ports
+    serial_asyncio = None
+
+from gcode_io import open_gcode
+from gcode_writer import GcodeWriter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW = 4  # lines in flight. Marlin's default command buffer (BUFSIZE) holds 4
+_RESEND = re.compile(r'(?:resend|rs)[: ]\s*N?(\d+)', re.IGNORECASE)  # Marlin 'Resend: 12', Repetier 'rs 12'
+_NUMBERED = re.compile(r'N(\d+) (.*)\*(\d+)')
+_TCP = re.compile(r'[\w.\-]+:\d+')
+_CHUNK = 1 << 16  # characters generated / read at a time
+
+
+def checksum(data):
+    """
+    :param data: bytes of line, without '*' and checksum
+    :return: xor of its bytes
+    """
+    return int(np.bitwise_xor.reduce(np.frombuffer(data, dtype=np.uint8))) if data else 0
+
+
+def number_lines(commands, first):
+    """
+    :param commands: list of gcode commands (no comments or newlines)
+    :param first: line number of commands[0]
+    :return: list of lines to send (bytes): 'N<number> <command>*<checksum>\n'. checksums of all lines computed at once
+    """
+    if not commands:
+        return []
+    lines = [f'N{number} {command}'.encode() for number, command in enumerate(commands, first)]
+    lengths = np.fromiter(map(len, lines), dtype=np.int64, count=len(lines))
+    sums = np.bitwise_xor.reduceat(np.frombuffer(b''.join(lines), dtype=np.uint8), np.cumsum(lengths) - lengths)
+    return [b'%s*%d\n' % (line, total) for line, total in zip(lines, sums.tolist())]
+
+
+def split_commands(text):
+    """
+    :param text: gcode text of whole lines
+    :return: list of its commands: comments, surrounding spaces and empty lines removed
+    """
+    commands = (line.split(';', 1)[0].strip() for line in text.split('\n'))
+    return [command for command in commands if command]
+
+
+async def iter_blocks(source, chunk_size=_CHUNK):
+    """
+    gcode text of source, block by block, as it is generated or read.
+    :param source: object with write_gcode method (AngledSquare, MultiSquare, AngledGrid), gcode file name (any
+            compression, see gcode_io) or iterable of text blocks
+    :param chunk_size: number of characters per block
+    :return: async generator of text blocks
+    """
+    if isinstance(source, str):
+        with open_gcode(source, 'r') as file:
+            for block in iter(lambda: file.read(chunk_size), ''):
+                yield block
+                await asyncio.sleep(0)
+    elif hasattr(source, 'write_gcode'):
+        async for block in _generate_blocks(source, chunk_size):
+            yield block
+    else:
+        for block in source:
+            yield block
+            await asyncio.sleep(0)
+
+
+class _QueueFile:
+    '''
+    Text file a generating thread writes to, whose blocks are put in an asyncio queue. Writes wait while the queue is
+    full, so generation is only a few blocks ahead of sending.
+    '''
+
+    def __init__(self, queue, loop, stop):
+        self.queue = queue
+        self.loop = loop
+        self.stop = stop
+
+    def write(self, text):
+        if self.stop.is_set():
+            raise _Stopped()
+        asyncio.run_coroutine_threadsafe(self.queue.put(text), self.loop).result()
+
+
+class _Stopped(Exception):
+    pass
+
+
+async def _generate_blocks(obj, chunk_size, queue_size=4):
+    """
+    run obj.write_gcode in a thread, yield its text blocks as they are written
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(queue_size)
+    stop = threading.Event()
+    done = object()
+
+    def generate():
+        try:
+            obj.write_gcode(GcodeWriter(_QueueFile(queue, loop, stop), buffer_size=chunk_size))
+            result = done
+        except _Stopped:
+            return
+        except Exception as e:
+            result = e
+        asyncio.run_coroutine_threadsafe(queue.put(result), loop).result()
+
+    thread = threading.Thread(target=generate, daemon=True)
+    thread.start()
+    try:
+        while True:
+            block = await queue.get()
+            if block is done:
+                break
+            if isinstance(block, Exception):
+                raise block
+            yield block
+    finally:
+        # sending stopped early: let a waiting write through, the next one ends the thread
+        stop.set()
+        while not queue.empty():
+            queue.get_nowait()
+
+
+class PrinterStream:
+    '''
+    Sends gcode to a printer over an open connection: numbered and checksummed lines, with up to window lines waiting
+    for their 'ok'. Lines the printer asks for again are resent from history.
+    '''
+
+    def __init__(self, reader, writer, window=DEFAULT_WINDOW, timeout=30, name='printer', history=4096):
+        """
+        :param reader, writer: asyncio streams of the connection
+        :param window: max number of lines in flight. more fill the printer's buffer sooner, 1 waits for each 'ok'
+        :param timeout: seconds to wait for a reply before giving up
+        :param name: of printer, for stats and log
+        :param history: number of last lines kept for resending
+        """
+        assert window >= 1, 'window must be at least 1'
+        self.reader = reader
+        self.writer = writer
+        self.window = window
+        self.timeout = timeout
+        self.name = name
+        self.history = history
+        self._lines = {}  # line number -> sent line
+        self._in_flight = deque()  # [line number, time sent, stale] by order sent. stale - sent before a resend
+        self._next = 0  # number of next new line
+        self._sent = 0  # number of next line to send for the first time
+        self._resend_from = None  # number of next line to resend, None if not resending
+        self._replied = asyncio.Event()
+        self._error = None
+        self._latencies = []
+        self.stats = {'name': name, 'lines': 0, 'resends': 0, 'errors': 0, 'bytes': 0}
+
+    async def send(self, source):
+        """
+        :param source: gcode to send, see iter_blocks
+        :return: stats: lines (commands sent), resends (lines sent again), errors (error replies), bytes, seconds,
+                lines_per_s, latency_ms_mean / p99 / max (from sending a line to its 'ok')
+        """
+        start = time.perf_counter()
+        replies = asyncio.create_task(self._read_replies())
+        try:
+            await self._send_commands(['M110 N0'])  # line numbers start here
+            rest = ''
+            async for block in iter_blocks(source):
+                text, _, rest = (rest + block).rpartition('\n')
+                await self._send_commands(split_commands(text))
+            await self._send_commands(split_commands(rest))
+            await self._transmit(None)  # wait for all replies
+        finally:
+            replies.cancel()
+
+        seconds = time.perf_counter() - start
+        latencies = np.array(self._latencies) * 1000 if self._latencies else np.zeros(1)
+        self.stats.update(seconds=seconds, lines_per_s=self.stats['lines'] / seconds if seconds else 0.0,
+                          latency_ms_mean=float(latencies.mean()), latency_ms_p99=float(np.percentile(latencies, 99)),
+                          latency_ms_max=float(latencies.max()))
+        return self.stats
+
+    async def _send_commands(self, commands):
+        for line in number_lines(commands, self._next):
+            self._lines[self._next] = line
+            self._lines.pop(self._next - self.history, None)
+            self._next += 1
+            await self._transmit(line)
+        self.stats['lines'] += len(commands)
+
+    async def _transmit(self, line):
+        """
+        send line once the window has room, after lines waiting to be resent. None - finish resending, and wait until
+        no line is in flight
+        """
+        while True:
+            if self._error is not None:
+                raise self._error
+            if self._resend_from is not None and self._resend_from >= self._sent:
+                self._resend_from = None
+            if len(self._in_flight) >= self.window:
+                await self._wait_reply()
+            elif self._resend_from is not None:
+                self._write(self._resend_from)
+                self.stats['resends'] += 1
+                self._resend_from += 1
+            elif line is not None:
+                self._write(self._sent)
+                self._sent += 1
+                await self.writer.drain()
+                return
+            elif self._in_flight:
+                await self._wait_reply()
+            else:
+                return
+
+    def _write(self, number):
+        line = self._lines.get(number)
+        if line is None:
+            raise RuntimeError(f'{self.name} asked to resend line {number}, no longer in history')
+        self.writer.write(line)
+        self.stats['bytes'] += len(line)
+        self._in_flight.append([number, time.perf_counter(), False])
+
+    async def _wait_reply(self):
+        self._replied.clear()
+        try:
+            await asyncio.wait_for(self._replied.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f'{self.name}: no reply in {self.timeout} s') from None
+
+    async def _read_replies(self):
+        try:
+            while True:
+                raw = await self.reader.readline()
+                if not raw:
+                    raise ConnectionError(f'{self.name} closed the connection')
+                self._handle(raw.decode(errors='replace').strip())
+                self._replied.set()
+        except Exception as e:
+            self._error = e
+            self._replied.set()
+
+    def _handle(self, reply):
+        """
+        update lines in flight by reply of printer. replies come in order of lines, each line gets one 'ok'
+        """
+        if reply.startswith('ok'):
+            if self._in_flight:  # else 'ok' of a command sent before connecting
+                number, sent, stale = self._in_flight.popleft()
+                self._latencies.append(time.perf_counter() - sent)
+            return
+        resend = _RESEND.match(reply)
+        if resend is not None:
+            # lines sent before the resend request are dropped by the printer, their own requests are ignored
+            if self._in_flight and not self._in_flight[0][2]:
+                for entry in self._in_flight:
+                    entry[2] = True
+                # a lost 'M110 N0' (line 0) leaves the printer numbering by its previous lines, resend it first
+                self._resend_from = int(resend.group(1)) if self._in_flight[0][0] != 0 else 0
+            return
+        if reply.lower().startswith('error'):
+            self.stats['errors'] += 1
+            # errors of lines that will be resent are part of the protocol
+            level = logging.DEBUG if 'checksum' in reply or 'Line Number' in reply else logging.WARNING
+            logger.log(level, '%s: %s', self.name, reply)
+
+
+async def open_printer(address, baudrate=115200):
+    """
+    :param address: 'host:port' or 'tcp://host:port' for TCP, serial port otherwise ('/dev/ttyACM0', 'COM3',
+            'serial:///dev/ttyACM0')
+    :param baudrate: of serial port
+    :return: (reader, writer) asyncio streams
+    """
+    if address.startswith('tcp://') or _TCP.fullmatch(address):
+        host, port = address.replace('tcp://', '', 1).rsplit(':', 1)
+        return await asyncio.open_connection(host, int(port))
+    if serial_asyncio is None:
+        raise ImportError('streaming to serial ports requires pyserial-asyncio (pip install pyserial-asyncio)')
+    return await serial_asyncio.open_serial_connection(url=address.replace('serial://', '', 1), baudrate=baudrate)
+
+
+async def stream(address, source, window=DEFAULT_WINDOW, timeout=30, name=None):
+    """
+    connect to printer and send it gcode.
+    :param address: of printer, see open_printer
+    :param source: gcode to send, see iter_blocks
+    :return: stats of PrinterStream.send, with 'error' - None, or why sending failed
+    """
+    name = name or address
+    try:
+        reader, writer = await open_printer(address)
+    except Exception as e:
+        return {'name': name, 'error': f'{type(e).__name__}: {e}'}
+    printer = PrinterStream(reader, writer, window, timeout, name)
+    try:
+        stats = dict(await printer.send(source), error=None)
+    except Exception as e:
+        stats = dict(printer.stats, error=f'{type(e).__name__}: {e}')
+    writer.close()
+    return stats
+
+
+async def stream_to_printers(jobs, window=DEFAULT_WINDOW, timeout=30):
+    """
+    send gcode to several printers at once. a failing printer doesn't stop the others.
+    :param jobs: list of (address, source) pairs. objects generating gcode must be distinct, each is generated in its
+            own thread
+    :return: list of stats (see stream), by order of jobs
+    """
+    return await asyncio.gather(*(stream(address, source, window, timeout) for address, source in jobs))
+
+
+class VirtualPrinter:
+    '''
+    Local stand-in for printers, to test and benchmark streaming without hardware. A TCP server speaking the numbered
+    line protocol as Marlin does: a line is acknowledged with 'ok' once it enters the command buffer; a line with a bad
+    checksum or unexpected number gets an error, 'Resend: <expected number>' and 'ok'. Buffered commands run one after
+    the other. Each connection is a separate printer.
+    '''
+
+    def __init__(self, command_time=0.0, latency=0.0, buffer_size=4, error_rate=0.0, seed=None, record=False):
+        """
+        :param command_time: seconds each command runs for
+        :param latency: seconds from receiving a line to its reply reaching the sender (link and parsing delay)
+        :param buffer_size: number of commands waiting to run. reading stops while it is full
+        :param error_rate: chance of a line to arrive corrupted, to exercise resends
+        :param seed: of corruption's random generator
+        :param record: keep commands accepted on each connection, by order, in self.commands
+        """
+        self.command_time = command_time
+        self.latency = latency
+        self.buffer_size = buffer_size
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.record = record
+        self.commands = []  # list of commands per connection, if record
+        self.lines = 0
+        self.errors = 0
+        self.server = None
+        self._connections = set()
+
+    async def start(self, host='127.0.0.1', port=0):
+        """
+        :param port: 0 for any free port
+        :return: 'host:port' address to connect to
+        """
+        self.server = await asyncio.start_server(self._serve, host, port)
+        return '%s:%d' % self.server.sockets[0].getsockname()[:2]
+
+    async def close(self, timeout=1):
+        """
+        stop accepting connections. connections still open after timeout seconds are dropped
+        """
+        self.server.close()
+        if self._connections:
+            await asyncio.wait(self._connections, timeout=timeout)
+        for connection in self._connections:
+            connection.cancel()
+        await self.server.wait_closed()
+
+    async def _serve(self, reader, writer):
+        self._connections.add(asyncio.current_task())
+        loop = asyncio.get_running_loop()
+        buffer = asyncio.Queue(self.buffer_size)
+        replies = asyncio.Queue()  # (time due, reply)
+        commands = []
+        if self.record:
+            self.commands.append(commands)
+
+        async def run():
+            while True:
+                await buffer.get()
+                if self.command_time:
+                    await asyncio.sleep(self.command_time)
+
+        async def reply():
+            while True:
+                item = await replies.get()
+                if item is None:
+                    return
+                due, text = item
+                if due > loop.time():
+                    await asyncio.sleep(due - loop.time())
+                writer.write(text.encode())
+
+        tasks = [asyncio.create_task(run()), asyncio.create_task(reply())]
+        last = 0  # number of last accepted line
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode(errors='replace').strip()
+                if not line:
+                    continue
+                received = loop.time()
+                self.lines += 1
+                command = line
+                numbered = _NUMBERED.fullmatch(line)
+                if numbered is not None:  # unnumbered lines are accepted as they are
+                    number, command = int(numbered.group(1)), numbered.group(2)
+                    error = None
+                    if (self.error_rate and self.random.random() < self.error_rate or
+                            checksum(line[:line.rindex('*')].encode()) != int(numbered.group(3))):
+                        error = 'checksum mismatch'
+                    elif number != last + 1 and not command.startswith('M110'):
+                        error = 'Line Number is not Last Line Number+1'
+                    if error is not None:
+                        self.errors += 1
+                        replies.put_nowait((received + self.latency,
+                                            f'Error:{error}, Last Line: {last}\nResend: {last + 1}\nok\n'))
+                        continue
+                    last = number
+                if command.startswith('M110'):
+                    value = re.search(r'N(\d+)', command[4:])
+                    last = int(value.group(1)) if value is not None else last
+                await buffer.put(command)
+                if self.record:
+                    commands.append(command)
+                replies.put_nowait((received + self.latency, 'ok\n'))
+        except asyncio.CancelledError:
+            pass  # dropped by close
+        finally:
+            replies.put_nowait(None)  # send replies due before closing
+            await tasks[1]
+            tasks[0].cancel()
+            writer.close()
+            self._connections.discard(asyncio.current_task())
+
+
+def _demo_grid():
+    from angeled_grid_tensor import AngledGrid
+
+    mtx1 = [[0, 90, 90], [0, 90, 90], [135, 135, 45], [135, 135, 45]]
+    mtx2 = [[45, 45, 45], [45, 45, 0], [90, 90, 0], [90, 90, 0]]
+    return AngledGrid(10, 0.37, 4, 0.15, 2000, 'stream_demo.gcode', mtx1, angles_mtx2=mtx2, num_mtx1=2, y_start=70,
+                      x_start=200)
+
+
+async def main(args):
+    addresses = args.printer
+    server = None
+    if not addresses:
+        server = VirtualPrinter(args.command_time, args.latency, args.buffer, args.error_rate, seed=0)
+        addresses = [await server.start()] * args.virtual
+    try:
+        # a generated grid per printer - generation isn't shared between threads
+        jobs = [(address, args.gcode if args.gcode else _demo_grid()) for address in addresses]
+        start = time.perf_counter()
+        results = await stream_to_printers(jobs, args.window, args.timeout)
+        wall = time.perf_counter() - start
+    finally:
+        if server is not None:
+            await server.close()
+
+    for index, stats in enumerate(results):
+        if stats['error'] is not None:
+            print(f'[{index + 1}] {stats["name"]:22} FAILED {stats["error"]}')
+            continue
+        print(f'[{index + 1}] {stats["name"]:22} {stats["lines"]:9d} lines {stats["lines_per_s"]:10.0f} lines/s  '
+              f'latency mean {stats["latency_ms_mean"]:7.2f} ms  p99 {stats["latency_ms_p99"]:7.2f} ms  '
+              f'{stats["resends"]} resent')
+    total = sum(stats.get('lines', 0) for stats in results)
+    print(f'\n{total} lines to {len(results)} printers in {wall:.2f} s, {total / wall:.0f} lines/s')
+    return 1 if any(stats['error'] is not None for stats in results) else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('gcode', nargs='?', help='gcode file to send. demo AngledGrid if not given')
+    parser.add_argument('--printer', action='append', default=[], help='address of printer, repeat for several')
+    parser.add_argument('--virtual', type=int, default=1, help='number of virtual printers, if no --printer')
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW, help='lines in flight per printer')
+    parser.add_argument('--timeout', type=float, default=30, help='seconds to wait for a reply')
+    parser.add_argument('--latency', type=float, default=0.0, help='virtual printers reply latency, seconds')
+    parser.add_argument('--command-time', type=float, default=0.0, help='virtual printers time per command, seconds')
+    parser.add_argument('--buffer', type=int, default=4, help='virtual printers command buffer size')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='chance of virtual printers to corrupt a line')
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,213 @@
+import re
+
+import numpy as np
+
+from arc_fit import LINE, fit_arcs
+from profiling import NULL_PROFILER
+from toolpath import EXTRUDE
+
+# decimals per axis. 1 micron for positions
+DEFAULT_PRECISION = {'X': 3, 'Y': 3, 'Z': 3, 'E': 5, 'F': 1}
+AXES_ORDER = ('X', 'Y', 'Z', 'E', 'F')
+
+# trailing zeros (and dangling point) of a formatted number, followed by a separator
+_TRAILING_ZEROS = re.compile(r'(\.\d*[1-9])0+(?=[ ;\n])|\.0+(?=[ ;\n])')
+
+
+class GcodeWriter:
+    '''
+    Buffered gcode writer. Formats whole arrays of moves at once, with fixed precision per axis, and writes them to the
+    file in large chunks.
+    Has file-like write method, so it can be passed anywhere a gcode file is written to.
+    '''
+
+    def __init__(self, file, precision=None, buffer_size=1 << 20, strip_zeros=True, profiler=None):
+        """
+        :param file: open text file to write to
+        :param precision: dictionary of axis letter -> number of decimals. missing axes use DEFAULT_PRECISION
+        :param buffer_size: number of characters to collect before writing to file
+        :param strip_zeros: drop trailing zeros of formatted numbers (X150.000 -> X150). smaller files
+        :param profiler: Profiler to time file writes and count bytes written with. None for no profiling
+        """
+        self.file = file
+        self.precision = dict(DEFAULT_PRECISION, **(precision or {}))
+        self.buffer_size = buffer_size
+        self.strip_zeros = strip_zeros
+        self.bytes_written = 0
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        self._chunks = []
+        self._buffered = 0
+
+    def write(self, text):
+        """
+        add raw text (headers, comments...) to buffer
+        """
+        self._chunks.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        write everything buffered to file
+        """
+        if self._chunks:
+            text = ''.join(self._chunks)
+            with self.profiler.stage('file writes'):
+                self.file.write(text)
+            self.bytes_written += len(text)
+            self.profiler.count('bytes written', len(text))
+            self._chunks = []
+            self._buffered = 0
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+    def format_moves(self, xy, e=None, command='G1', e_placeholders=False):
+        """
+        :param xy: (N, 2) array of positions
+        :param e: array of N extrusions. None for travel moves
+        :param command: G0/G1
+        :param e_placeholders: leave extrusion values as placeholders, see moves_template
+        :return: gcode text of N lines in format: 'G1 Xx Yy Ee'
+        """
+        xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        if len(xy) == 0:
+            return ''
+        axes = ['X', 'Y']
+        if e is None:
+            values = xy.copy()
+        else:
+            axes.append('E')
+            values = np.column_stack((xy, np.asarray(e, dtype=float)))
+        for col, axis in enumerate(axes):
+            # round first, so tiny negatives don't show up as -0
+            values[:, col] = np.round(values[:, col], self.precision[axis]) + 0.0
+        line = command + ''.join(f' {axis}%.{self.precision[axis]}f' for axis in axes)
+        if e_placeholders:
+            line += f' E%%.{self.precision["E"]}f'
+        text = ((line + '\n') * len(values)) % tuple(values.ravel().tolist())
+        return self._strip(text)
+
+    def emit_moves(self, xy, e=None, command='G1'):
+        """
+        write block of moves. see format_moves
+        """
+        self.write(self.format_moves(xy, e, command))
+
+    def format_arcs(self, arcs, e_placeholders=False):
+        """
+        :param arcs: structured array of arc_fit.ARC_DTYPE
+        :param e_placeholders: leave extrusion values as placeholders, see toolpath_template
+        :return: gcode text. lines as 'G1 Xx Yy Ee', arcs as 'G2 Xx Yy Ii Jj Ee' (G3 counter clockwise)
+        """
+        text = []
+        commands = arcs['command']
+        bounds = np.concatenate(([0], np.flatnonzero(commands[1:] != commands[:-1]) + 1, [len(arcs)]))
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            run = arcs[begin:end]
+            xy = np.column_stack((run['x'], run['y']))
+            if run['command'][0] == LINE:
+                e = None if e_placeholders else run['e']
+                text.append(self.format_moves(xy, e, e_placeholders=e_placeholders))
+                continue
+            values = np.column_stack((xy, run['i'], run['j']) + (() if e_placeholders else (run['e'],)))
+            axes = ('X', 'Y', 'X', 'Y', 'E')[:values.shape[1]]  # I, J with positions' precision
+            for col, axis in enumerate(axes):
+                values[:, col] = np.round(values[:, col], self.precision[axis]) + 0.0
+            line = (f'G{run["command"][0]} X%.{self.precision["X"]}f Y%.{self.precision["Y"]}f '
+                    f'I%.{self.precision["X"]}f J%.{self.precision["Y"]}f')
+            line += f' E%%.{self.precision["E"]}f' if e_placeholders else f' E%.{self.precision["E"]}f'
+            text.append(self._strip(((line + '\n') * len(values)) % tuple(values.ravel().tolist())))
+        return ''.join(text)
+
+    def format_toolpath(self, toolpath, start=None, arc_tolerance=None):
+        """
+        :param toolpath: Toolpath
+        :param start: [x_pos, y_pos] the nuzzle moves from to the toolpath's first position, for fitting arcs from it.
+                None - first move is left a line
+        :param arc_tolerance: if given, runs of printing moves along circles are fitted with arcs within this distance
+                (mm), see arc_fit.fit_arcs
+        :return: gcode text. travel moves as 'G0 Xx Yy', printing moves as 'G1 Xx Yy Ee' (or G2/G3 arcs)
+        """
+        text = []
+        previous = start
+        for run in toolpath.runs():
+            if not run.flags[0] & EXTRUDE:
+                text.append(self.format_moves(run.xy, command='G0'))
+            elif arc_tolerance is None:
+                text.append(self.format_moves(run.xy, run.e))
+            elif previous is None:
+                text.append(self.format_moves(run.xy[:1], run.e[:1]))
+                text.append(self.format_arcs(fit_arcs(run.xy[1:], run.e[1:], run.xy[0], arc_tolerance)))
+            else:
+                text.append(self.format_arcs(fit_arcs(run.xy, run.e, previous, arc_tolerance)))
+            previous = run.xy[-1]
+        return ''.join(text)
+
+    def toolpath_template(self, toolpath):
+        """
+        gcode of toolpath, with extrusion values of printing moves left as placeholders to fill by fill_template.
+        layers sharing a path have their positions formatted once.
+        :param toolpath: Toolpath
+        :return: template text
+        """
+        text = []
+        for run in toolpath.runs():
+            if run.flags[0] & EXTRUDE:
+                text.append(self.format_moves(run.xy, e_placeholders=True))
+            else:
+                text.append(self.format_moves(run.xy, command='G0'))
+        return ''.join(text)
+
+    def fill_template(self, template, e):
+        """
+        :param template: from toolpath_template
+        :param e: array of extrusions of the template's printing moves
+        :return: gcode text
+        """
+        e = np.round(np.asarray(e, dtype=float), self.precision['E']) + 0.0
+        return self._strip(template % tuple(e.tolist()))
+
+    def emit_toolpath(self, toolpath):
+        """
+        write toolpath. see format_toolpath
+        """
+        self.write(self.format_toolpath(toolpath))
+
+    def format_move(self, command='G1', comment=None, **axes):
+        """
+        :param command: G0/G1
+        :param comment: to add at end of line
+        :param axes: axis letter -> value, e.g. Z=0.3, F=6000. None values are skipped
+        :return: single gcode line
+        """
+        words = [command]
+        for axis in AXES_ORDER:
+            if axes.get(axis) is not None:
+                words.append(f'{axis}{round(axes[axis], self.precision[axis]) + 0.0:.{self.precision[axis]}f}')
+        text = ' '.join(words) + (f' ; {comment}' if comment else '') + '\n'
+        return self._strip(text)
+
+    def emit_move(self, command='G1', comment=None, **axes):
+        """
+        write single move. see format_move
+        """
+        self.write(self.format_move(command, comment, **axes))
+
+    def _strip(self, text):
+        return _TRAILING_ZEROS.sub(r'\1', text) if self.strip_zeros else text
+
+
+def as_writer(file):
+    """
+    :param file: open text file or GcodeWriter
+    :return: GcodeWriter writing to file
+    """
+    return file if isinstance(file, GcodeWriter) else GcodeWriter(file)
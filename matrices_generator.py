@@ -1,38 +1,138 @@
 import numpy as np
-from copy import deepcopy
 
 
-def positive_charge(n, azimuthal=False):
+def _index_grid(n):
+    """
+    :param n: dimensions of square mtx
+    :return: two n x n arrays of row (i) and column (j) indices
+    """
+    return np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+
+
+def wrap_angles(angles):
+    """
+    bring angles back into the 0 to 180 deg range, same as the scalar "if angle < 0 / if angle > 180" blocks.
+    :param angles: array of angles (degrees)
+    :return: array of wrapped angles (degrees)
     """
+    angles = np.asarray(angles, dtype=float)
+    angles = np.where(angles < 0, angles + 180, angles)
+    return np.where(angles > 180, angles - 180, angles)
+
 
+def radius_shells(n, center=None):
+    """
     :param n: dimensions of square mtx
-    :return: matrix n x n of angles, in redial or azimuthal direction from center
+    :param center: center of the shells. middle of mtx by default
+    :return: n x n array of floored squared distances from center, used as shell index
+    """
+    center = (n - 1) / 2 if center is None else center
+    i, j = _index_grid(n)
+    return np.floor((i - center) ** 2 + (j - center) ** 2)
+
+
+def positive_charge_array(n, azimuthal=False):
+    """
+    vectorized positive_charge.
+    :param n: dimensions of square mtx
+    :return: arrays n x n of angles, in redial or azimuthal direction from center, and of radius shells
     """
     center = (n - 1) / 2
+    i, j = _index_grid(n)
+    angles = np.arctan2(i - center, j - center) * 180 / np.pi + 90
+    if azimuthal:
+        angles += 90
+    return wrap_angles(angles), radius_shells(n, center)
+
+
+def alternating_radial_azimutal_array(n, perp=False):
+    """
+    vectorized alternating_radial_azimutal.
+    :param n: dimensions of square mtx
+    :param perp: flip which shells are azimutal and which are radial
+    :return: array n x n of angles
+    """
+    center = (n - 1) / 2
+    azimut = [2, 8, 12, 14, 26, 24, 40]
+    rad = [0, 4, 6, 18, 20, 22, 32]
+    i, j = _index_grid(n)
+    angles = np.arctan2(i - center, j - center) * 180 / np.pi + 90
+    shells = radius_shells(n, center)
+    angles = np.where(np.isin(shells, rad if perp else azimut), angles + 90, angles)  # azimutal
+    return wrap_angles(angles)
+
+
+def four_charges_array(n):
+    """
+    vectorized four_charges.
+    :param n: dimensions of square mtx
+    :return: array n x n of angles, in redial direction from center of each quarter of mtx
+    """
+    i, j = _index_grid(n)
+    x_0 = np.where(i < n / 2, (n - 1) / 4, 3 * (n - 1) / 4)
+    y_0 = np.where(j < n / 2, (n - 1) / 4, 3 * (n - 1) / 4)
+    return wrap_angles(np.arctan2(i - x_0, j - y_0) * 180 / np.pi + 90)
+
+
+def dome_array(n):
+    """
+    vectorized dome.
+    :param n: dimensions of square mtx
+    :return: array n x n of angles
+    """
+    center = (n - 1) / 2
+    i, j = _index_grid(n)
+    angles = np.arctan2(i - center, j - center) * 180 / np.pi
+    angles += ((i - center) ** 2 + (j - center) ** 2) * 10
+    return wrap_angles(angles)
+
+
+def _rows_to_mtx(row_angles, n):
+    """
+    :param row_angles: 1d array, angle of each row
+    :return: array n x n, each row filled with its angle
+    """
+    return np.repeat(np.asarray(row_angles)[:, np.newaxis], n, axis=1)
+
 
-    angles = []
-    radios = []
-    for i in range(n):
-        row = []
-        r_row = []
-        for j in range(n):
-            # print('r = ', (i - center) ** 2 + (j - center) ** 2)
-            # print('r_floor = ', np.floor((i - center) ** 2 + (j - center) ** 2))
-            r_row.append(np.floor((i - center) ** 2 + (j - center) ** 2))
-
-            angle = np.arctan2(i - center, j - center) * 180 / np.pi + 90
-            if azimuthal:
-                angle += 90
-            if angle < 0:
-                angle += 180
-            if angle > 180:
-                angle -= 180
-            row.append(angle)
-        angles.append(row)
-        radios.append(r_row)
-        # print(r_row)
-
-    return angles, radios
+def rotate_as_function_of_y_sqr_array(n, const):
+    i = np.arange(n)
+    return _rows_to_mtx(np.arctan2(const * (5 * i) ** 2, 1) * 180 / np.pi, n)  # 5*i in order to work in mm
+
+
+def rotate_as_function_of_y_array(n, const):
+    i = np.arange(n)
+    return _rows_to_mtx(np.arctan2(const * (5 * i), 1) * 180 / np.pi, n)  # 5*i in order to work in mm
+
+
+def rotate_sin_array(n, const):
+    i = np.arange(n)
+    # 5*i+ 2.5 in order to work in mm and get value of mid fixel
+    return _rows_to_mtx(const * ((i * 5 + 2.5) + np.sin((i * 5 + 2.5) * 1)) * 90, n)
+
+
+def egg_carton_array(n, offset=1):
+    """
+    vectorized egg_carton.
+    :param offset: can be 1 or -1. default 1 = no change. -1 causes shift between all squares
+    :return: array of alternating 45 and -45 degrees
+    """
+    j, i = _index_grid(n)
+    return offset * 45 * (-1) ** (i + j)
+
+
+def get_perpendicular_array(mtx):
+    return np.asarray(mtx) + 90
+
+
+def positive_charge(n, azimuthal=False):
+    """
+
+    :param n: dimensions of square mtx
+    :return: matrix n x n of angles, in redial or azimuthal direction from center
+    """
+    angles, radios = positive_charge_array(n, azimuthal)
+    return angles.tolist(), radios.tolist()
 
 
 # ang, r = positive_charge(10)
@@ -40,33 +140,7 @@ def positive_charge(n, azimuthal=False):
 
 # print(r)
 def alternating_radial_azimutal(n, perp=False):
-    center = (n - 1) / 2
-    azimut = {2, 8, 12, 14, 26, 24, 40}
-    rad = {0, 4, 6, 18, 20, 22, 32}
-    thresh = [0, 2, 6, 14, 22, 26, 32, 40]
-    angles = []
-    for i in range(n):
-        row = []
-        for j in range(n):
-            angle = np.arctan2(i - center, j - center) * 180 / np.pi + 90
-
-            if not perp:
-                if (np.floor((i - center) ** 2 + (j - center) ** 2)) in azimut:
-                    angle += 90  # azimutal
-            else:
-                if (np.floor((i - center) ** 2 + (j - center) ** 2)) in rad:
-                    angle += 90  # azimutal
-
-            if angle < 0:
-                angle += 180
-            if angle > 180:
-                angle -= 180
-            row.append(angle)
-        angles.append(row)
-    return angles
-
-
-print(alternating_radial_azimutal(10))
+    return alternating_radial_azimutal_array(n, perp).tolist()
 
 
 def four_charges(n):
@@ -74,54 +148,11 @@ def four_charges(n):
     :param n: dimensions of square mtx
     :return: matrix n x n of angles, in redial or azimuthal direction from center of each quarter of mtx
     """
-    angles = []
-    for i in range(n):
-        row = []
-        for j in range(n):
-            if j < n / 2 and i < n / 2:
-                x_0 = (n - 1) / 4
-                y_0 = (n - 1) / 4
-            elif j < n / 2 <= i:
-                x_0 = 3 * (n - 1) / 4
-                y_0 = (n - 1) / 4
-            elif j >= n / 2 > i:
-                x_0 = (n - 1) / 4
-                y_0 = 3 * (n - 1) / 4
-            else:
-                x_0 = 3 * (n - 1) / 4
-                y_0 = 3 * (n - 1) / 4
-
-            angle = np.arctan2(i - x_0, j - y_0) * 180 / np.pi + 90
-
-            if angle < 0:
-                angle += 180
-            if angle > 180:
-                angle -= 180
-            row.append(angle)
-        angles.append(row)
-
-    return angles
+    return four_charges_array(n).tolist()
 
 
 def dome(n):
-    center = (n - 1) / 2
-
-    angles = []
-    for i in range(n):
-        row = []
-        for j in range(n):
-            angle = np.arctan2(i - center, j - center) * 180 / np.pi
-
-            angle += ((i - center) ** 2 + (j - center) ** 2) * 10
-
-            if angle < 0:
-                angle += 180
-            if angle > 180:
-                angle -= 180
-            row.append(angle)
-        angles.append(row)
-
-    return angles
+    return dome_array(n).tolist()
 
 
 def face():
@@ -132,29 +163,15 @@ def face():
 
 
 def rotate_as_function_of_y_sqr(n, const):
-    mtx = []
-    for i in range(n):
-        angle = np.arctan2(const * (5 * i) ** 2, 1) * 180 / np.pi  # 5*i in order to work in mm
-        mtx.append(np.full(n, angle).tolist())
-    return mtx
+    return rotate_as_function_of_y_sqr_array(n, const).tolist()
 
 
 def rotate_as_function_of_y(n, const):
-    mtx = []
-    for i in range(n):
-        angle = np.arctan2(const * (5 * i), 1) * 180 / np.pi  # 5*i in order to work in mm
-        mtx.append(np.full(n, angle).tolist())
-
-    return mtx
+    return rotate_as_function_of_y_array(n, const).tolist()
 
 
 def rotate_sin(n, const):
-    mtx = []
-    for i in range(n):
-        angle = const * ((i * 5 + 2.5) + np.sin(
-            (i * 5 + 2.5) * 1)) * 90  # * 180 / np.pi  # 5*i+ 2.5 in order to work in mm and get value of mid fixel
-        mtx.append(np.full(n, angle).tolist())
-    return mtx
+    return rotate_sin_array(n, const).tolist()
 
 
 def malmala():
@@ -190,18 +207,17 @@ def egg_carton(n, offset=1):
     :param n:
     :return: matrix of alternating 45 and -45 degrees matrix
     """
-    return [[offset * 45 * (-1) ** (i + j) for i in range(n)] for j in range(n)]
+    return egg_carton_array(n, offset).tolist()
 
 
 def get_perpendicular(mtx):
-    new_mtx = deepcopy(mtx)
-    for i in range(len(mtx)):
-        for j in range(len(mtx[0])):
-            new_mtx[i][j] = mtx[i][j] + 90
-    return new_mtx
+    return get_perpendicular_array(mtx).tolist()
+
 
+if __name__ == '__main__':
+    print(alternating_radial_azimutal(10))
 
-mtx1 = [[0, 90, 135], [90, 135, 0], [135, 0, 45], [135, 90, 90]]
-mtx2 = get_perpendicular(mtx1)
-# print(mtx1)
-# print(mtx2)
+    mtx1 = [[0, 90, 135], [90, 135, 0], [135, 0, 45], [135, 90, 90]]
+    mtx2 = get_perpendicular(mtx1)
+    # print(mtx1)
+    # print(mtx2)
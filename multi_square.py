@@ -1,5 +1,7 @@
 import angled_square
-from flat_objects import FlatObject
+from flat_objects import BED_X, BED_Y, FlatObject
+from gcode_io import open_gcode
+from gcode_writer import as_writer
 
 
 class MultiSquare(FlatObject):
@@ -10,54 +12,99 @@ class MultiSquare(FlatObject):
 
     # self, size, layers_num = 1, thickness = 0.15, x_start = 150, y_start = 100, speed = 2000, nuzzle_size = 0.4):
 
-    def __init__(self, name, array, start_x=150, start_y=100):
+    def __init__(self, name, array, start_x=150, start_y=100, positions=None, bed=(BED_X, BED_Y)):
+        """
+        :param positions: [x_pos, y_pos] of bottom left corner of each square of array, e.g. from
+                plate_layout.plan_plates. None - squares are placed in rows from (start_x, start_y)
+        :param bed: (width, height) of bed, mm. squares must end within it
+        """
         FlatObject.__init__(self, 10, x_start=start_x, y_start=start_y)
         self.array = array
+        self.positions = positions
+        self.bed = bed
 
         self.name = name
 
-    def create_gcode(self, frame=False):
+    def create_gcode(self, frame=False, compression='auto'):
         '''
         :param frame:
+        :param compression: of gcode file: 'gzip', 'zstd', 'meatpack', None, or 'auto' - by extension of self.name
         :return:
         '''
-        with open(self.name, 'w') as file:
-            file.seek(0)
-
-            ### header ###
-            file.write(self.header)
-
-            start = [self.x_start, self.y_start]
-
-            for i, item in enumerate(self.array):
-                # print(start)
-                # sq = squre.Square(size=item[0], layers_num=item[1], thickness=item[2], speed=item[3],
-                #                   nuzzle_size=item[4], x_start=start[0],
-                #                   y_start=start[1])
-
-                # self, size, nuzzle_size=0.4, layers_num=1, thickness=0.15, x_start=150, y_start=100, speed=2000
-
-                sq = angled_square.AngledSquare(item[0], nuzzle_size=item[1], layers_num=item[2], thickness=item[3],
-                                                speed=item[4], x_start=start[0],
-                                                y_start=start[1])
-                file.write(f'\n; sqr number {i + 1}\n\n')
-                sq.fill_inside(file)
-
-                # move position of square
-                if start[0] < 200:
-                    start[0] = start[0] + sq.size + 5
-                else:
-                    start[0] = self.x_start
-                    start[1] = start[1] + sq.size + 5
-                # else:
-                #     raise NameError('exceeded plate boundaries')
-
-            # finish print
-            file.write(self.finish)
+        squares = self.get_squares()  # checked against self.bed before the output file is opened (and truncated)
+        with open_gcode(self.name, 'w', compression) as file:
+            self.write_gcode(file, squares)
         self.gcode = file
 
-    def get_gcode(self, frame=False):
-        self.create_gcode(frame)
+    def write_gcode(self, file, squares=None):
+        """
+        write the whole print: header, squares by order, end print.
+        :param file: open gcode file or GcodeWriter to write to
+        :param squares: list of AngledSquare, from get_squares. None to place them here
+        """
+        if squares is None:
+            squares = self.get_squares()
+        writer = as_writer(file)
+
+        ### header ###
+        writer.write(self.header)
+
+        for i, sq in enumerate(squares):
+            writer.write(f'\n; sqr number {i + 1}\n\n')
+            sq.fill_inside(writer)
+
+        # finish print
+        writer.write(self.finish)
+        writer.flush()
+
+    def iter_squares(self):
+        """
+        :return: iterator of AngledSquare of each item of self.array, by print order, at its position on the plate. all
+                squares are placed and checked against self.bed before the first one is yielded
+        """
+        return iter(self.get_squares())
+
+    def get_squares(self):
+        """
+        place all squares of self.array, then check each one ends within self.bed.
+        :return: list of AngledSquare, by print order, at their positions on the plate
+        """
+        squares = []
+        start = [self.x_start, self.y_start]
+
+        for k, item in enumerate(self.array):
+            if self.positions is not None:
+                start = list(self.positions[k])
+            # print(start)
+            # sq = squre.Square(size=item[0], layers_num=item[1], thickness=item[2], speed=item[3],
+            #                   nuzzle_size=item[4], x_start=start[0],
+            #                   y_start=start[1])
+
+            # self, size, nuzzle_size=0.4, layers_num=1, thickness=0.15, x_start=150, y_start=100, speed=2000
+
+            sq = angled_square.AngledSquare(item[0], nuzzle_size=item[1], layers_num=item[2], thickness=item[3],
+                                            speed=item[4], x_start=start[0],
+                                            y_start=start[1])
+            squares.append(sq)
+
+            # move position of square
+            if self.positions is not None:
+                continue
+            if start[0] < 200:
+                start[0] = start[0] + sq.size + 5
+            else:
+                start[0] = self.x_start
+                start[1] = start[1] + sq.size + 5
+            # else:
+            #     raise NameError('exceeded plate boundaries')
+
+        for k, sq in enumerate(squares):
+            if sq.x_end > self.bed[0] or sq.y_end > self.bed[1]:
+                raise ValueError(f'square {k + 1} exceeds the {self.bed[0]} x {self.bed[1]} mm bed, see plate_layout')
+        return squares
+
+    def get_gcode(self, frame=False, compression='auto'):
+        self.create_gcode(frame, compression)
         return self.gcode
 
 
@@ -87,13 +134,13 @@ def get_scaling_mtx():
 
 
 
-mtx=[[20, 0.37, 1, 0.15, 2000],[20, 0.37, 1, 0.15, 2000], [20, 0.37, 1, 0.15, 2000], [20, 0.37, 1, 0.15, 2000],
-    [20, 0.37, 2, 0.15, 2000],[20, 0.37, 2, 0.15, 2000], [20, 0.37, 2, 0.15, 2000], [20, 0.37, 2, 0.15, 2000],
-    [20, 0.37, 3, 0.15, 2000], [20, 0.37, 3, 0.15, 2000], [20, 0.37, 3, 0.15, 2000], [20, 0.37, 3, 0.15, 2000]]
+if __name__ == '__main__':
+    mtx = [[20, 0.37, 1, 0.15, 2000], [20, 0.37, 1, 0.15, 2000], [20, 0.37, 1, 0.15, 2000], [20, 0.37, 1, 0.15, 2000],
+           [20, 0.37, 2, 0.15, 2000], [20, 0.37, 2, 0.15, 2000], [20, 0.37, 2, 0.15, 2000], [20, 0.37, 2, 0.15, 2000],
+           [20, 0.37, 3, 0.15, 2000], [20, 0.37, 3, 0.15, 2000], [20, 0.37, 3, 0.15, 2000], [20, 0.37, 3, 0.15, 2000]]
 
-
-sqs = MultiSquare('calibrate.gcode', mtx, start_y=50, start_x=70)
-sqs.get_gcode()
+    sqs = MultiSquare('calibrate.gcode', mtx, start_y=50, start_x=70)
+    sqs.get_gcode()
 
 
 # sqs = MultiSquare('0.07 layers.gcode',
@@ -0,0 +1,59 @@
+import numpy as np
+
+
+def _distance_from_chord(points, a, b):
+    """
+    :param points: (K, 2) array
+    :param a: (K, 2) array of chords' start positions
+    :param b: (K, 2) array of chords' end positions
+    :return: distance of each point from its chord (from a, if chord has no length)
+    """
+    chord = b - a
+    length = np.hypot(chord[:, 0], chord[:, 1])
+    offset = points - a
+    cross = np.abs(chord[:, 0] * offset[:, 1] - chord[:, 1] * offset[:, 0])
+    return np.where(length > 0, cross / np.where(length > 0, length, 1), np.hypot(offset[:, 0], offset[:, 1]))
+
+
+def merge_collinear(positions, extrusion, start, tolerance=1e-3):
+    """
+    merge consecutive moves going in the same direction along (nearly) the same line into single moves. extrusion of
+    merged moves is summed, so total extrusion is conserved.
+    :param positions: (N, 2) array of positions, for printer to stop on
+    :param extrusion: array of N amounts of material to extrude, one per move
+    :param start: [x_pos, y_pos] the nuzzle moves from to positions[0]
+    :param tolerance: max distance (mm) of a removed position from the merged move
+    :return: (positions, extrusion, removed). removed - number of moves merged away
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+    extrusion = np.asarray(extrusion, dtype=float)
+    n = len(positions)
+    if n < 2:
+        return positions, extrusion, 0
+
+    points = np.vstack((np.asarray(start, dtype=float).reshape(1, 2), positions))  # points[m] -> points[m + 1] is move m
+
+    # an inner point can go if the moves before and after it are collinear and don't turn back
+    before = points[1:-1] - points[:-2]
+    after = points[2:] - points[1:-1]
+    keep = np.ones(n + 1, dtype=bool)
+    keep[1:-1] = ~((_distance_from_chord(points[1:-1], points[:-2], points[2:]) <= tolerance) &
+                   (np.einsum('ij,ij->i', before, after) >= 0))
+
+    # locally collinear points may still drift away from the merged move along a slow curve. keep the ones that do,
+    # until every removed point is within tolerance of the move replacing it.
+    index = np.arange(n + 1)
+    while True:
+        previous_kept = np.maximum.accumulate(np.where(keep, index, 0))
+        next_kept = np.minimum.accumulate(np.where(keep, index, n)[::-1])[::-1]
+        removed = ~keep
+        far = removed.copy()
+        far[removed] = _distance_from_chord(points[removed], points[previous_kept[removed]],
+                                            points[next_kept[removed]]) > tolerance
+        if not far.any():
+            break
+        keep |= far
+
+    kept = np.flatnonzero(keep)
+    merged_extrusion = np.add.reduceat(extrusion, kept[:-1])  # move m belongs to merged move starting at kept <= m
+    return points[kept[1:]], merged_extrusion, n - (len(kept) - 1)
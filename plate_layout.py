@@ -0,0 +1,201 @@
+"""
+Packs specimens of different sizes onto the printer's bed, on as few plates as possible - every plate is another heat
+up and bed leveling.
+Two packers of rectangles, both first fit over plates (each specimen goes to the first plate it fits on, a new plate
+is opened when it fits on none):
+    shelf - rows of specimens (first fit decreasing height). each row is as high as its first, highest, specimen
+    skyline - each specimen at the lowest, then leftmost, position on top of those already placed (bottom left)
+'best' runs both, over a few orders of specimens, and keeps the layout of fewest plates (fullest first plates on ties).
+Run: python plate_layout.py specimens.json [--method best] [--margin 10] [--spacing 5]
+(specimens.json - list of MultiSquare items [size, nuzzle_size, layers_num, thickness, speed]. writes a gcode file per
+plate)
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+
+from flat_objects import BED_X, BED_Y
+from multi_square import MultiSquare
+
+METHODS = ('shelf', 'skyline', 'best')
+MARGIN = 10  # mm, from bed edges to specimens
+SPACING = 5  # mm, between specimens
+
+
+def pack(sizes, bed=(BED_X, BED_Y), margin=MARGIN, spacing=SPACING, method='skyline'):
+    """
+    :param sizes: list of (width, height) of specimens, mm
+    :param bed: (width, height) of bed, mm
+    :param margin: from bed edges, mm
+    :param spacing: between specimens, mm
+    :param method: 'shelf', 'skyline' or 'best', see module doc
+    :return: list of plates, each a list of (index of specimen, x, y) - bottom left corner on bed, by print order (rows
+            from bottom to top, each left to right)
+    """
+    if method not in METHODS:
+        raise ValueError(f'unknown packing method {method}, expected one of {METHODS}')
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 2)
+    # specimens are packed with spacing added to their width and height, into an area as much larger
+    width, height = bed[0] - 2 * margin + spacing, bed[1] - 2 * margin + spacing
+    boxes = sizes + spacing
+    too_big = np.flatnonzero((boxes[:, 0] > width + 1e-9) | (boxes[:, 1] > height + 1e-9))
+    if len(too_big):
+        raise ValueError(f'specimens {too_big.tolist()} are larger than the bed without margins')
+
+    if method == 'best':
+        layouts = [_PACKERS[packer](boxes, order, width, height) for packer in ('shelf', 'skyline')
+                   for order in _orders(sizes)]
+        plates = min(layouts, key=lambda layout: (len(layout), [-_area(sizes, plate) for plate in layout]))
+    else:
+        plates = _PACKERS[method](boxes, _orders(sizes)[0], width, height)
+    return [sorted(((index, x + margin, y + margin) for index, x, y in plate), key=lambda item: (item[2], item[1]))
+            for plate in plates]
+
+
+def _orders(sizes):
+    """
+    :return: orders to place specimens in: by decreasing height, by decreasing area, by decreasing longer side
+    """
+    width, height = sizes[:, 0], sizes[:, 1]
+    return [np.lexsort((-width, -height)), np.lexsort((-height, -width * height)),
+            np.lexsort((-width * height, -np.maximum(width, height)))]
+
+
+def _area(sizes, plate):
+    return sum(sizes[index, 0] * sizes[index, 1] for index, x, y in plate)
+
+
+def _pack_shelves(boxes, order, width, height):
+    plates = []  # each: {'shelves': [[y, height, x of free space]], 'top': y of free space, 'items': [...]}
+    for index in order:
+        w, h = boxes[index]
+        for plate in plates:
+            shelf = next((shelf for shelf in plate['shelves'] if h <= shelf[1] and shelf[2] + w <= width), None)
+            if shelf is None and plate['top'] + h <= height:
+                shelf = [plate['top'], h, 0.0]
+                plate['shelves'].append(shelf)
+                plate['top'] += h
+            if shelf is not None:
+                break
+        else:
+            shelf = [0.0, h, 0.0]
+            plate = {'shelves': [shelf], 'top': h, 'items': []}
+            plates.append(plate)
+        plate['items'].append((int(index), shelf[2], shelf[0]))
+        shelf[2] += w
+    return [plate['items'] for plate in plates]
+
+
+def _pack_skyline(boxes, order, width, height):
+    plates = []  # each: {'skyline': [[x, y, width]] left to right, covering the bed's width, 'items': [...]}
+    for index in order:
+        w, h = boxes[index]
+        for plate in plates:
+            position = _skyline_position(plate['skyline'], w, h, width, height)
+            if position is not None:
+                break
+        else:
+            plate = {'skyline': [[0.0, 0.0, width]], 'items': []}
+            plates.append(plate)
+            position = _skyline_position(plate['skyline'], w, h, width, height)
+        _skyline_add(plate['skyline'], position, w, h)
+        plate['items'].append((int(index), *position))
+    return [plate['items'] for plate in plates]
+
+
+def _skyline_position(skyline, w, h, width, height):
+    """
+    :return: lowest, than leftmost, (x, y) a w x h box fits at on top of skyline. None if it doesn't fit
+    """
+    best = None
+    for start in range(len(skyline)):
+        x = skyline[start][0]
+        if x + w > width + 1e-9:
+            break
+        # box rests on the highest segment under it
+        y, end = 0.0, start
+        while end < len(skyline) and skyline[end][0] < x + w - 1e-9:
+            y = max(y, skyline[end][1])
+            end += 1
+        if y + h <= height + 1e-9 and (best is None or (y, x) < (best[1], best[0])):
+            best = (x, y)
+    return best
+
+
+def _skyline_add(skyline, position, w, h):
+    x, y = position
+    # segments under the box are cut to its right side
+    covered = [segment for segment in skyline if segment[0] < x + w - 1e-9 and segment[0] + segment[2] > x + 1e-9]
+    right = covered[-1]
+    remainder = right[0] + right[2] - (x + w)
+    first = skyline.index(covered[0])
+    new = [[x, y + h, w]]
+    if covered[0][0] < x - 1e-9:  # box starts inside its first segment
+        new.insert(0, [covered[0][0], covered[0][1], x - covered[0][0]])
+    if remainder > 1e-9:
+        new.append([x + w, right[1], remainder])
+    skyline[first:first + len(covered)] = new
+    # merge neighbours of same height
+    k = 0
+    while k < len(skyline) - 1:
+        if abs(skyline[k][1] - skyline[k + 1][1]) < 1e-9:
+            skyline[k][2] += skyline.pop(k + 1)[2]
+        else:
+            k += 1
+
+
+_PACKERS = {'shelf': _pack_shelves, 'skyline': _pack_skyline}
+
+
+def get_report(plates, sizes, bed=(BED_X, BED_Y), margin=MARGIN):
+    """
+    :param plates: from pack
+    :param sizes: list of (width, height) of specimens
+    :return: dictionary: plates, specimens, utilisation (area of specimens over bed area within margins, per plate),
+            mean_utilisation
+    """
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 2)
+    usable = (bed[0] - 2 * margin) * (bed[1] - 2 * margin)
+    utilisation = [float(_area(sizes, plate) / usable) for plate in plates]
+    return {'plates': len(plates), 'specimens': [len(plate) for plate in plates], 'utilisation': utilisation,
+            'mean_utilisation': float(np.mean(utilisation)) if plates else 0.0}
+
+
+def plan_plates(name, array, bed=(BED_X, BED_Y), margin=MARGIN, spacing=SPACING, method='skyline'):
+    """
+    lay squares of a calibration batch out on as few plates as possible.
+    :param name: gcode file name. plates after the first are named name_2.gcode, name_3.gcode...
+    :param array: MultiSquare items: [[size, nuzzle_size, layers_num, thickness, speed], ...]
+    :return: (list of MultiSquare, one per plate, report - see get_report)
+    """
+    sizes = [(item[0], item[0]) for item in array]
+    plates = pack(sizes, bed, margin, spacing, method)
+    base, extension = os.path.splitext(name)
+    multi_squares = []
+    for number, plate in enumerate(plates, start=1):
+        plate_name = name if number == 1 else f'{base}_{number}{extension}'
+        multi_squares.append(MultiSquare(plate_name, [array[index] for index, x, y in plate], start_x=plate[0][1],
+                                         start_y=plate[0][2], positions=[(x, y) for index, x, y in plate],
+                                         bed=bed))
+    return multi_squares, get_report(plates, sizes, bed, margin)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('specimens', help='JSON list of MultiSquare items')
+    parser.add_argument('--name', default='plate.gcode', help='gcode file of first plate')
+    parser.add_argument('--method', choices=METHODS, default='best')
+    parser.add_argument('--bed', type=float, nargs=2, default=(BED_X, BED_Y), help='bed width and height, mm')
+    parser.add_argument('--margin', type=float, default=MARGIN, help='from bed edges, mm')
+    parser.add_argument('--spacing', type=float, default=SPACING, help='between specimens, mm')
+    args = parser.parse_args()
+
+    with open(args.specimens) as file:
+        specimens = json.load(file)
+    multi_squares, report = plan_plates(args.name, specimens, args.bed, args.margin, args.spacing, args.method)
+    for multi_square, count, utilisation in zip(multi_squares, report['specimens'], report['utilisation']):
+        multi_square.create_gcode()
+        print(f'{multi_square.name:30} {count:4d} specimens  {utilisation * 100:5.1f}% of bed')
+    print(f'{report["plates"]} plates, mean utilisation {report["mean_utilisation"] * 100:.1f}%')
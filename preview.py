@@ -0,0 +1,226 @@
+"""
+Preview images of AngledSquare, MultiSquare and AngledGrid, rasterized from their toolpath arrays - no gcode is
+formatted or parsed.
+Printing moves are drawn as lines sampled about once per pixel, all segments of a chunk at once. One pass gives three
+maps: deposited material (mm of height, from E and the filament's cross section), and layer and angle of the last line
+printed over each pixel. Maps are colored and written as PNG (zlib only), or saved raw as .npy.
+Run: python preview.py grid.gcode.png angle   (previews the demo AngledGrid)
+"""
+import struct
+import sys
+import zlib
+
+import numpy as np
+
+from angeled_grid_tensor import AngledGrid
+from angled_square import AngledSquare
+from multi_square import MultiSquare
+from toolpath import EXTRUDE, Toolpath
+
+COLOR_BY = ('angle', 'layer', 'density')
+DEFAULT_RESOLUTION = 10  # pixels per mm
+FILAMENT_DIAMETER = 1.75  # mm, E is length of filament
+_CHUNK = 1 << 22  # samples drawn at a time
+# density ramp: stops (fraction of max) -> RGB. white for no material, dark red for most
+_RAMP = np.array([0, 0.25, 0.6, 1])
+_RAMP_COLORS = np.array([[255, 255, 255], [255, 220, 60], [220, 40, 20], [80, 0, 0]])
+
+
+def get_toolpath(obj):
+    """
+    :param obj: AngledSquare, MultiSquare, AngledGrid or Toolpath
+    :return: Toolpath of all moves of obj, by print order, with their layers
+    """
+    if isinstance(obj, Toolpath):
+        return obj
+    if isinstance(obj, AngledSquare):
+        return Toolpath.concatenate(_square_toolpaths(obj))
+    if isinstance(obj, MultiSquare):
+        return Toolpath.concatenate(toolpath for sq in obj.iter_squares() for toolpath in _square_toolpaths(sq))
+    if isinstance(obj, AngledGrid):
+        toolpaths = []
+        for layer, i, j, toolpath in obj.iter_toolpaths():
+            toolpath.data['layer'] = layer
+            toolpaths.append(toolpath)
+        return Toolpath.concatenate(toolpaths)
+    raise TypeError(f'cannot preview {type(obj).__name__}')
+
+
+def _square_toolpaths(sq):
+    # each layer starts with travel to the square's corner. xy path is the same in all layers
+    start = (sq.x_start, sq.y_start)
+    pos, lengths, _ = sq.generate_path(start=start)
+    return [Toolpath.from_positions(pos, lengths * sq.get_extrusion_factor(layer), layer=layer, travel_to=start)
+            for layer in range(sq.layers_num)]
+
+
+def rasterize(toolpath, resolution=DEFAULT_RESOLUTION, bounds=None, line_width=None, chunk_size=_CHUNK):
+    """
+    :param toolpath: Toolpath. each move is drawn from the position of the move before it
+    :param resolution: pixels per mm
+    :param bounds: (x_min, y_min, x_max, y_max) mm of image. None - printing moves' bounding box. lines outside are cut
+    :param line_width: mm. density is spread over it (mass kept), so spacing of lines doesn't show as stripes. None -
+            each line deposits on the pixels it passes through
+    :param chunk_size: max number of samples to hold at once
+    :return: dictionary of (H, W) maps, row 0 at top (max y): density - deposited material, mm of height. layer - of
+            last line printed over pixel, -1 for none. angle - of that line to x axis, degrees 0-180, nan for none.
+            bounds and resolution of image
+    """
+    data = toolpath.data
+    x1, y1 = data['x'], data['y']
+    x0, y0 = np.roll(x1, 1), np.roll(y1, 1)
+    if len(data):
+        x0[0], y0[0] = x1[0], y1[0]
+    printing = np.flatnonzero(data['flags'] & EXTRUDE)
+    x0, y0, x1, y1 = x0[printing], y0[printing], x1[printing], y1[printing]
+    e = data['e'][printing].astype(np.float64)
+
+    if bounds is None:
+        pad = (line_width or 0) / 2 + 1 / resolution
+        if len(printing):
+            bounds = (min(x0.min(), x1.min()) - pad, min(y0.min(), y1.min()) - pad, max(x0.max(), x1.max()) + pad,
+                      max(y0.max(), y1.max()) + pad)
+        else:
+            bounds = (0, 0, pad, pad)
+    x_min, y_min, x_max, y_max = bounds
+    width = max(1, int(np.ceil((x_max - x_min) * resolution)))
+    height = max(1, int(np.ceil((y_max - y_min) * resolution)))
+
+    dx, dy = x1 - x0, y1 - y0
+    # samples one pixel apart along the segment's major axis, in middles of equal steps. each gets an equal part of its
+    # extrusion. computed in pixels, float32: sample k of a segment is at base + k * step
+    samples = np.maximum(1, np.ceil(np.maximum(np.abs(dx), np.abs(dy)) * resolution)).astype(np.int64)
+    step_x, step_y = dx * resolution / samples, dy * resolution / samples
+    base_x = ((x0 - x_min) * resolution + step_x / 2).astype(np.float32)
+    base_y = ((y_max - y0) * resolution - step_y / 2).astype(np.float32)  # rows from top
+    step_x, step_y = step_x.astype(np.float32), -step_y.astype(np.float32)
+    weights = e / samples
+    ends = np.cumsum(samples)
+    density = np.zeros(width * height)
+    top = np.full(width * height, -1, dtype=np.int64)  # last printed segment over pixel
+
+    first = 0
+    while first < len(printing):
+        # segments of chunk: at least one, up to chunk_size samples. per sample values are repeated per segment values
+        last = max(first + 1, int(np.searchsorted(ends, ends[first] - samples[first] + chunk_size, 'right')))
+        count = samples[first:last]
+        k = (np.arange(ends[last - 1] - ends[first] + count[0]) -
+             np.repeat(ends[first:last] - count - ends[first] + count[0], count)).astype(np.float32)
+        px = np.floor(np.repeat(base_x[first:last], count) + k * np.repeat(step_x[first:last], count))
+        py = np.floor(np.repeat(base_y[first:last], count) + k * np.repeat(step_y[first:last], count))
+        segment, weight = np.repeat(np.arange(first, last), count), np.repeat(weights[first:last], count)
+        inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        if not inside.all():
+            segment, weight, px, py = segment[inside], weight[inside], px[inside], py[inside]
+        pixel = py.astype(np.int64) * width + px.astype(np.int64)
+        density += np.bincount(pixel, weights=weight, minlength=width * height)
+        np.maximum.at(top, pixel, segment)
+        first = last
+
+    # mm of filament -> mm^3 -> mm of height over pixel's area
+    density = density.reshape(height, width) * (np.pi * FILAMENT_DIAMETER ** 2 / 4) * resolution ** 2
+    if line_width is not None:
+        density = _box_blur(density, int(round(line_width * resolution)))
+    printed = top >= 0
+    layer = np.full(width * height, -1, dtype=np.int32)
+    layer[printed] = data['layer'][printing[top[printed]]]
+    angle = np.full(width * height, np.nan, dtype=np.float32)
+    angle[printed] = np.degrees(np.arctan2(dy[top[printed]], dx[top[printed]])) % 180
+    return {'density': density.astype(np.float32), 'layer': layer.reshape(height, width),
+            'angle': angle.reshape(height, width), 'bounds': tuple(float(b) for b in bounds), 'resolution': resolution}
+
+
+def _box_blur(image, size):
+    """
+    :return: image averaged over size x size pixels around each pixel, by cumulative sums. sum is kept but at edges
+    """
+    if size <= 1:
+        return image
+    before, after = size // 2, size - 1 - size // 2
+    for axis in (0, 1):
+        padded = np.pad(image, [(before + 1, after) if a == axis else (0, 0) for a in (0, 1)])
+        total = np.cumsum(padded, axis=axis)
+        image = (np.take(total, range(size, total.shape[axis]), axis=axis) -
+                 np.take(total, range(total.shape[axis] - size), axis=axis)) / size
+    return image
+
+
+def _hsv_colors(hue, value=0.9):
+    """
+    :param hue: array of hues 0-1
+    :return: array of RGB colors (uint8) of full saturation
+    """
+    k = (np.asarray(hue)[..., None] * 6 + np.array([5, 3, 1])) % 6
+    return (255 * value * (1 - np.clip(np.minimum(k, 4 - k), 0, 1))).astype(np.uint8)
+
+
+def colorize(raster, by='angle', vmax=None):
+    """
+    :param raster: from rasterize
+    :param by: 'angle' (hue around the color circle over 0-180 degrees), 'layer' (red for first layer to blue for last)
+            or 'density' (white -> yellow -> red -> dark red)
+    :param vmax: density of darkest color. None for max density
+    :return: (H, W, 3) uint8 RGB image, white where nothing is printed
+    """
+    if by not in COLOR_BY:
+        raise ValueError(f'unknown color {by}, expected one of {COLOR_BY}')
+    if by == 'density':
+        density = raster['density']
+        vmax = vmax if vmax is not None else max(float(density.max()), 1e-12)
+        fraction = np.clip(density / vmax, 0, 1)
+        return np.stack([np.interp(fraction, _RAMP, _RAMP_COLORS[:, c]) for c in range(3)], axis=-1).astype(np.uint8)
+
+    printed = raster['layer'] >= 0
+    image = np.full(printed.shape + (3,), 255, dtype=np.uint8)
+    if by == 'angle':
+        image[printed] = _hsv_colors(raster['angle'][printed] / 180)
+    else:
+        layers = raster['layer'][printed]
+        image[printed] = _hsv_colors(2 / 3 * layers / max(1, int(layers.max(initial=0))))
+    return image
+
+
+def write_png(file_name, image):
+    """
+    :param image: (H, W) gray or (H, W, 3) RGB uint8 image
+    """
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width = image.shape[:2]
+    color_type = 2 if image.ndim == 3 else 0
+    rows = np.hstack((np.zeros((height, 1), dtype=np.uint8), image.reshape(height, -1)))  # filter 0 for every row
+
+    def chunk(kind, content):
+        return struct.pack('>I', len(content)) + kind + content + struct.pack('>I', zlib.crc32(kind + content))
+
+    with open(file_name, 'wb') as file:
+        file.write(b'\x89PNG\r\n\x1a\n')
+        file.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)))
+        file.write(chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)))
+        file.write(chunk(b'IEND', b''))
+
+
+def save_preview(obj, file_name, by='angle', resolution=DEFAULT_RESOLUTION, line_width=None):
+    """
+    :param obj: AngledSquare, MultiSquare, AngledGrid or Toolpath
+    :param file_name: .png for colored image, .npy for raw map of 'by' (angle, layer or density)
+    :param line_width: mm, see rasterize. None for obj's nuzzle size
+    :return: raster, see rasterize
+    """
+    if line_width is None:
+        line_width = getattr(obj, 'nuzzle_size', None)
+    raster = rasterize(get_toolpath(obj), resolution, line_width=line_width)
+    if file_name.endswith('.npy'):
+        if by not in COLOR_BY:
+            raise ValueError(f'unknown map {by}, expected one of {COLOR_BY}')
+        np.save(file_name, raster[by])
+    else:
+        write_png(file_name, colorize(raster, by))
+    return raster
+
+
+if __name__ == '__main__':
+    mtx1 = [[0, 90, 90], [0, 90, 90], [135, 135, 45], [135, 135, 45]]
+    mtx2 = [[45, 45, 45], [45, 45, 0], [90, 90, 0], [90, 90, 0]]
+    grid = AngledGrid(10, 0.37, 4, 0.15, 2000, 'preview.gcode', mtx1, angles_mtx2=mtx2, num_mtx1=2, y_start=70,
+                      x_start=200)
+    save_preview(grid, sys.argv[1] if len(sys.argv) > 1 else 'preview.png', *sys.argv[2:3])
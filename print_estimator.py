@@ -0,0 +1,302 @@
+"""
+Print time and filament estimate of AngledSquare, MultiSquare and AngledGrid, computed from their toolpath arrays -
+no gcode is formatted or written.
+Moves follow a trapezoidal speed profile (accelerate, cruise, decelerate), with the printer's limits read from the
+object's header: max accelerations (M201), max feedrates (M203), accelerations (M204) and jerk (M205). Junction
+speeds between moves follow classic jerk: the velocity change of each axis through a junction is within its jerk.
+Planning is vectorized: the forward and backward passes of the planner are min-plus recurrences, solved with
+cumulative minimums.
+Modal settings are followed as in the written gcode: each layer beginning sets 'M204 S<speed>' and 'G1 F<speed>', and
+AngledGrid's 'move z up' before each square sets F6000, which its square is then printed at.
+"""
+import re
+
+import numpy as np
+
+from angeled_grid_tensor import AngledGrid
+from angled_square import AngledSquare
+from multi_square import MultiSquare
+from toolpath import TRAVEL, Toolpath
+
+AXES = ('X', 'Y', 'Z', 'E')
+GRID_FEEDRATE = 6000  # mm/min, set by 'move z up' of AngledGrid.format_cells
+LAYER_RETRACT = 0.8  # mm of filament, retracted and restored around layer change at F2100
+LAYER_Z = 0.6  # z of layer change
+LAYER_FEEDRATE = 10800  # mm/min, of z and travel moves of layer change
+
+
+def get_limits(header):
+    """
+    :param header: gcode header, with M201, M203, M204 and M205 commands
+    :return: dictionary of motion limits: max_accel, max_feedrate, jerk (axis -> mm/s^2 or mm/s), accel, travel_accel,
+            retract_accel (mm/s^2)
+    """
+    limits = {'max_accel': {}, 'max_feedrate': {}, 'jerk': {}, 'accel': None, 'travel_accel': None,
+              'retract_accel': None}
+    for line in header.splitlines():
+        words = line.split(';')[0].split()
+        if not words or words[0] not in ('M201', 'M203', 'M204', 'M205'):
+            continue
+        values = {word[0]: float(word[1:]) for word in words[1:] if re.fullmatch(r'[A-Z]-?\d*\.?\d+', word)}
+        if words[0] == 'M201':
+            limits['max_accel'].update((axis, values[axis]) for axis in AXES if axis in values)
+        elif words[0] == 'M203':
+            limits['max_feedrate'].update((axis, values[axis]) for axis in AXES if axis in values)
+        elif words[0] == 'M205':
+            limits['jerk'].update((axis, values[axis]) for axis in AXES if axis in values)
+        elif words[0] == 'M204':
+            set_accel(limits, values)
+    return limits
+
+
+def set_accel(limits, values):
+    """
+    apply M204 to limits
+    :param values: dictionary of M204 parameters: S (print and travel), P (print), T (travel), R (retract)
+    """
+    if 'S' in values:
+        limits['accel'] = limits['travel_accel'] = values['S']
+    for key, name in (('P', 'accel'), ('T', 'travel_accel'), ('R', 'retract_accel')):
+        if key in values:
+            limits[name] = values[key]
+
+
+def _axis_limit(value, components, axis_limits):
+    """
+    :param value: array of requested feedrates / accelerations along moves
+    :param components: (N, 4) array of moves' |X, Y, Z, E| components per mm of move
+    :param axis_limits: axis -> max feedrate / acceleration of axis
+    :return: value, lowered so no axis exceeds its limit
+    """
+    for col, axis in enumerate(AXES):
+        if axis in axis_limits:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                value = np.minimum(value, np.where(components[:, col] > 0, axis_limits[axis] / components[:, col],
+                                                   np.inf))
+    return value
+
+
+def _segmented_reach(limit, gain, group):
+    """
+    highest values w allowed by w[k] <= limit[k], w[k + 1] <= w[k] + gain[k] within each group of consecutive nodes
+    :param limit: array of N upper bounds
+    :param gain: array of N - 1 increments, from node k to k + 1 (ignored between groups)
+    :param group: non decreasing array of N group numbers
+    :return: array of N values. w[k] = min over j <= k in group of limit[j] + gain[j] + ... + gain[k - 1]
+    """
+    total = np.concatenate(([0], np.cumsum(gain)))
+    first = np.flatnonzero(np.concatenate(([True], group[1:] != group[:-1])))
+    total = total - np.repeat(total[first], np.diff(np.append(first, len(group))))  # sums restart every group
+    value = limit - total
+    # shift each group below all earlier ones, so cumulative minimum doesn't cross group borders
+    span = 2 * (np.abs(value).max() if len(value) else 0) + 1
+    return np.minimum.accumulate(value - span * group) + span * group + total
+
+
+def move_times(xy, e, start, feedrate, accel, limits, stops=None):
+    """
+    time of each move, moves planned together as the printer's planner does.
+    :param xy: (N, 2) array of positions, for printer to stop on
+    :param e: array of N extrusions (mm of filament)
+    :param start: [x_pos, y_pos] the nuzzle moves from to xy[0], at rest
+    :param feedrate: requested speed (mm/s), scalar or one per move
+    :param accel: requested acceleration (mm/s^2), scalar or one per move
+    :param limits: from get_limits
+    :param stops: boolean array of N. True - printer is at rest before the move (e.g. after a z move). None for no
+            stops but the first move
+    :return: array of N times, seconds. moves without xy length take no time
+    """
+    xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+    n = len(xy)
+    if n == 0:
+        return np.zeros(0)
+    delta = np.diff(xy, axis=0, prepend=np.asarray(start, dtype=float).reshape(1, 2))
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    moving = length > 0
+    safe_length = np.where(moving, length, 1)
+    direction = np.column_stack((delta, np.zeros(n), np.asarray(e, dtype=float) * np.ones(n))) / safe_length[:, None]
+    components = np.abs(direction)
+
+    speed = _axis_limit(np.broadcast_to(np.asarray(feedrate, dtype=float), (n,)), components, limits['max_feedrate'])
+    acceleration = _axis_limit(np.broadcast_to(np.asarray(accel, dtype=float), (n,)), components, limits['max_accel'])
+
+    # fastest start from / stop to rest: every axis' velocity within its jerk
+    safe = _axis_limit(speed, components, limits['jerk'])
+    # fastest junction between consecutive moves, classic jerk
+    junction = np.minimum(speed[:-1], speed[1:])
+    factor = np.ones(n - 1)
+    for col, axis in enumerate(AXES):
+        if axis in limits['jerk']:
+            change = np.abs(direction[1:, col] - direction[:-1, col]) * junction
+            with np.errstate(divide='ignore', invalid='ignore'):
+                factor = np.minimum(factor, np.where(change > 0, limits['jerk'][axis] / change, 1))
+    junction = np.maximum(junction * factor, np.minimum(safe[:-1], safe[1:]))
+
+    # nodes: entry of each move, and exit of the last move before each stop. speed squared at nodes is bound by
+    # junctions and by what acceleration over the moves between them reaches, forward and backward
+    stops = np.zeros(n, dtype=bool) if stops is None else np.asarray(stops, dtype=bool).copy()
+    stops[0] = True
+    group = np.cumsum(stops) - 1
+    entry = np.arange(n) + group  # node of move's entry
+    exit_node = entry + 1
+    nodes = n + group[-1] + 1
+    limit = np.empty(nodes)
+    limit[entry] = np.where(stops, safe, np.concatenate(([0], junction))) ** 2
+    last = np.append(stops[1:], True)  # last move before each stop
+    limit[exit_node[last]] = safe[last] ** 2
+    gain = np.zeros(nodes - 1)
+    gain[entry] = 2 * acceleration * length
+    node_group = np.empty(nodes, dtype=np.int64)
+    node_group[entry] = group
+    node_group[exit_node[last]] = group[last]
+    forward = _segmented_reach(limit, gain, node_group)
+    backward = _segmented_reach(limit[::-1], gain[::-1], node_group[-1] - node_group[::-1])[::-1]
+    node_speed = np.sqrt(np.maximum(np.minimum(forward, backward), 0))
+    v_entry, v_exit = node_speed[entry], node_speed[exit_node]
+
+    # trapezoid, or triangle if cruise speed is not reached
+    v_entry, v_exit = np.minimum(v_entry, speed), np.minimum(v_exit, speed)
+    cruise_length = length - (2 * speed ** 2 - v_entry ** 2 - v_exit ** 2) / (2 * acceleration)
+    peak = np.where(cruise_length >= 0, speed,
+                    np.sqrt(np.maximum((2 * acceleration * length + v_entry ** 2 + v_exit ** 2) / 2, 0)))
+    time = (2 * peak - v_entry - v_exit) / acceleration + np.maximum(cruise_length, 0) / speed
+    return np.where(moving, time, 0.0)
+
+
+def rest_to_rest_time(distance, speed, accel):
+    """
+    :return: time of a single move from rest to rest, seconds
+    """
+    if distance <= 0:
+        return 0.0
+    if speed ** 2 / accel >= distance:  # triangle
+        return 2 * np.sqrt(distance / accel)
+    return distance / speed + speed / accel
+
+
+def estimate_toolpath(toolpath, start, feedrate, accel, limits, stops=None):
+    """
+    :param toolpath: Toolpath. travel moves use limits['travel_accel'] if given, instead of accel
+    :param start: [x_pos, y_pos] the nuzzle moves from to the first position
+    :param feedrate: mm/s
+    :param accel: mm/s^2 of printing moves
+    :param limits: from get_limits
+    :param stops: see move_times
+    :return: (time, travel time, total extrusion). times in seconds
+    """
+    travel = (toolpath.flags & TRAVEL).astype(bool)
+    travel_accel = limits['travel_accel'] if limits['travel_accel'] is not None else accel
+    times = move_times(toolpath.xy, toolpath.e, start, feedrate, np.where(travel, travel_accel, accel), limits,
+                       stops)
+    return times.sum(), times[travel].sum(), float(toolpath.e[~travel].sum(dtype=np.float64))
+
+
+def layer_change_time(height, distance, accel, limits):
+    """
+    time of layer beginning: retract, z up, travel to the layer's start, z down to height, restore
+    :param height: z of layer
+    :param distance: of travel to layer's start, mm
+    :param accel: acceleration of travel, mm/s^2
+    """
+    retract_accel = min(limits['retract_accel'] or np.inf, limits['max_accel'].get('E', np.inf))
+    retract_speed = min(2100 / 60, limits['max_feedrate'].get('E', np.inf))
+    z_speed = min(LAYER_FEEDRATE / 60, limits['max_feedrate'].get('Z', np.inf))
+    z_accel = limits['max_accel'].get('Z', np.inf)
+    travel_speed = min(LAYER_FEEDRATE / 60, limits['max_feedrate'].get('X', np.inf))
+    travel_accel = min(accel, limits['max_accel'].get('X', np.inf))
+    return (2 * rest_to_rest_time(LAYER_RETRACT, retract_speed, retract_accel) +
+            2 * rest_to_rest_time(abs(LAYER_Z - height), z_speed, z_accel) +
+            rest_to_rest_time(distance, travel_speed, travel_accel))
+
+
+def _square_estimate(sq, limits, position):
+    """
+    :param sq: AngledSquare, printed by fill_inside
+    :param position: [x_pos, y_pos] nuzzle is at before the square
+    :return: dictionary of time, travel_time, e, moves. and position nuzzle ends at
+    """
+    start = (sq.x_start, sq.y_start)
+    pos, lengths, _ = sq.generate_path(start=start)
+    speed = sq.speed / 60  # G1 F<speed> and M204 S<speed> of layer beginning
+    total = travel = e = 0.0
+    for layer in range(sq.layers_num):
+        extrusion = lengths * sq.get_extrusion_factor(layer)
+        times = move_times(pos, extrusion, start, speed, sq.speed, limits)
+        change = layer_change_time(sq.thickness * (layer + 1), np.hypot(start[0] - position[0],
+                                                                        start[1] - position[1]), sq.speed, limits)
+        total += times.sum() + change
+        travel += change
+        e += extrusion.sum()
+        position = pos[-1] if len(pos) else start
+    return {'time_s': float(total), 'travel_time_s': float(travel), 'e_mm': float(e),
+            'moves': len(pos) * sq.layers_num}, position
+
+
+def estimate(obj, limits=None):
+    """
+    :param obj: AngledSquare, MultiSquare or AngledGrid
+    :param limits: from get_limits. None to read them from obj.header
+    :return: dictionary: time_s - total print time (of moves, without heating and homing), travel_time_s - time of
+            non extruding moves (travel, z and layer changes), e_mm - total extrusion (mm of filament), moves - number
+            of xy moves
+    """
+    limits = limits if limits is not None else get_limits(obj.header)
+    if isinstance(obj, AngledSquare):
+        return _square_estimate(obj, limits, (obj.x_start, obj.y_start))[0]
+    if isinstance(obj, MultiSquare):
+        return _multi_square_estimate(obj, limits)
+    if isinstance(obj, AngledGrid):
+        return _grid_estimate(obj, limits)
+    raise TypeError(f'cannot estimate {type(obj).__name__}')
+
+
+def _multi_square_estimate(multi, limits):
+    result = {'time_s': 0.0, 'travel_time_s': 0.0, 'e_mm': 0.0, 'moves': 0}
+    position = (multi.x_start, multi.y_start)
+    for sq in multi.iter_squares():
+        square, position = _square_estimate(sq, limits, position)
+        for key in result:
+            result[key] += square[key]
+    return result
+
+
+def _grid_estimate(grid, limits):
+    """
+    squares of a layer are planned together: moves of a square don't stop but at its ends, where z moves
+    """
+    sq = grid.get_extrusion_square()
+    speed = GRID_FEEDRATE / 60
+    z_speed = min(speed, limits['max_feedrate'].get('Z', np.inf))
+    z_accel = limits['max_accel'].get('Z', np.inf)
+    layers = {}
+    for layer, i, j, toolpath in grid.iter_toolpaths(sq):
+        layers.setdefault(layer, []).append(toolpath)
+
+    total = travel = e = 0.0
+    moves = 0
+    position = (grid.x_start, grid.y_start)
+    for layer, toolpaths in sorted(layers.items()):
+        thickness = grid.layer_thickness[layer] if grid.layer_thickness is not None else grid.thickness
+        height = thickness * (layer + 1)
+        change = layer_change_time(height, np.hypot(grid.x_start - position[0], grid.y_start - position[1]),
+                                   grid.speed, limits)
+        # each square: z up and down around its travel move
+        hops = len(toolpaths) * 2 * rest_to_rest_time(3 * thickness, z_speed, z_accel)
+
+        # every square's travel move and its first printing move start at rest
+        sizes = [len(toolpath) for toolpath in toolpaths]
+        stops = np.zeros(sum(sizes), dtype=bool)
+        firsts = np.cumsum([0] + sizes[:-1])
+        stops[firsts] = True
+        stops[firsts + 1] = True
+        path = Toolpath.concatenate(toolpaths)
+        # M204 S<speed> of the layer beginning sets both print and travel acceleration
+        layer_limits = dict(limits, travel_accel=grid.speed)
+        path_time, path_travel, path_e = estimate_toolpath(path, (grid.x_start, grid.y_start), speed, grid.speed,
+                                                           layer_limits, stops)
+        total += path_time + change + hops
+        travel += path_travel + change + hops
+        e += path_e
+        moves += len(path)
+        position = path.xy[-1]
+    return {'time_s': float(total), 'travel_time_s': float(travel), 'e_mm': float(e), 'moves': moves}
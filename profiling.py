@@ -0,0 +1,120 @@
+import time
+from collections import defaultdict
+
+
+class _Stage:
+    """
+    context manager adding the time spent inside it to a profiler's timer
+    """
+    __slots__ = ('timers', 'name', 'start')
+
+    def __init__(self, timers, name):
+        self.timers = timers
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.timers[self.name] += time.perf_counter() - self.start
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Profiler:
+    '''
+    Cumulative timers and counters of slicing stages.
+    Usage: with profiler.stage('path generation'): ... / profiler.count('squares')
+    '''
+
+    enabled = True
+
+    def __init__(self):
+        self.timers = defaultdict(float)  # stage name -> seconds
+        self.counters = defaultdict(int)  # counter name -> count
+
+    def stage(self, name):
+        """
+        :param name: of stage
+        :return: context manager timing its block into timer name
+        """
+        return _Stage(self.timers, name)
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+
+    def add(self, report):
+        """
+        add timers and counters of another profiler's report (e.g. from a worker process)
+        """
+        for name, seconds in report['timers'].items():
+            self.timers[name] += seconds
+        for name, amount in report['counters'].items():
+            self.counters[name] += amount
+
+    def report(self):
+        """
+        :return: dictionary of timers (seconds) and counters
+        """
+        return {'timers': dict(self.timers), 'counters': dict(self.counters)}
+
+    def pop_report(self):
+        """
+        :return: report, than reset all timers and counters
+        """
+        report = self.report()
+        self.timers.clear()
+        self.counters.clear()
+        return report
+
+
+class NullProfiler:
+    '''
+    Disabled profiler: same interface as Profiler, does nothing.
+    '''
+
+    enabled = False
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def count(self, name, amount=1):
+        pass
+
+    def add(self, report):
+        pass
+
+    def report(self):
+        return None
+
+    def pop_report(self):
+        return None
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def format_report(report):
+    """
+    :param report: from Profiler.report
+    :return: text table of stages by time spent, and counters
+    """
+    lines = [f'{"stage":24}{"seconds":>12}']
+    for name, seconds in sorted(report['timers'].items(), key=lambda item: -item[1]):
+        lines.append(f'{name:24}{seconds:12.4f}')
+    lines.append(f'{"counter":24}{"count":>12}')
+    for name, amount in sorted(report['counters'].items()):
+        lines.append(f'{name:24}{amount:12d}')
+    return '\n'.join(lines)
@@ -0,0 +1,252 @@
+"""
+Batch slicer: creates gcode of many jobs in one process.
+Run: python slicer.py jobs.json [--workers 4] [--fail-fast] [--out-dir gcode] [--report report.json] [--preview angle]
+                                [--check]
+
+Manifest is JSON, YAML or CSV (by extension). JSON/YAML hold a list of jobs, or {"defaults": {...}, "jobs": [...]}
+with defaults applying to every job. CSV has one job per row, a column per parameter; cells are read as JSON when they
+parse as JSON (numbers, lists, objects), else as text, and empty cells are skipped.
+Each job has:
+    type - 'square' (AngledSquare), 'multi_square' (MultiSquare) or 'grid' (AngledGrid)
+    output - gcode file to write, relative to --out-dir. compressed by its extension: .gz, .zst or .mpk (see gcode_io)
+    name - optional, for the report. output by default
+    any other key - parameter of the object's constructor, e.g. size, angle, array, sq_size, angles_mtx1...
+Angle and thickness matrices are either lists of rows, {"generator": "egg_carton", "args": [6]} for a function of
+matrices_generator, or {"field": "orientation.npy", "shape": [20, 30]} imported from a map (.npy, TIFF or image, other
+keys are arguments of field_import.import_angles / import_thickness). angles_mtx2 can also be "perpendicular" -
+perpendicular to angles_mtx1.
+With --preview, each job also saves a preview image next to its gcode (output's name, .png), see preview.py.
+With --check, each job's gcode is validated once written (see gcode_check.py), and a job of any violation fails.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import yaml
+except ImportError:  # only needed for YAML manifests
+    yaml = None
+
+import field_import
+import matrices_generator
+from angeled_grid_tensor import AngledGrid
+from angled_square import AngledSquare
+from disk_cache import DiskToolpathCache
+from gcode_check import format_violations, validate
+from gcode_io import EXTENSIONS, compression_of
+from multi_square import MultiSquare
+from preview import COLOR_BY, DEFAULT_RESOLUTION, save_preview
+from toolpath_cache import ToolpathCache
+
+JOB_TYPES = ('square', 'multi_square', 'grid')
+MATRIX_PARAMS = ('angles_mtx1', 'angles_mtx2', 'thickness_mtx')
+
+# state of this (worker) process, kept warm between jobs: generated square paths are shared by all its grids
+_process_state = {}
+
+
+def load_manifest(file_name):
+    """
+    :param file_name: JSON, YAML or CSV manifest. see module doc
+    :return: list of job dictionaries, defaults applied
+    """
+    extension = os.path.splitext(file_name)[1].lower()
+    with open(file_name, newline='') as file:
+        if extension == '.csv':
+            content = [{key: _parse_cell(value) for key, value in row.items() if value not in (None, '')}
+                       for row in csv.DictReader(file)]
+        elif extension in ('.yaml', '.yml'):
+            if yaml is None:
+                raise ImportError('reading YAML manifests requires PyYAML (pip install pyyaml)')
+            content = yaml.safe_load(file)
+        else:
+            content = json.load(file)
+
+    if isinstance(content, dict):
+        defaults, jobs = content.get('defaults', {}), content.get('jobs', [])
+    else:
+        defaults, jobs = {}, content
+    return [dict(defaults, **job) for job in jobs]
+
+
+def _parse_cell(value):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def get_matrix(spec, angles_mtx1=None, thickness=False):
+    """
+    :param spec: list of rows, {"generator": name, "args": [...], "kwargs": {...}}, {"field": map, ...arguments} or
+            "perpendicular"
+    :param angles_mtx1: resolved angles_mtx1 of the job, for "perpendicular"
+    :param thickness: spec is of thickness_mtx: maps are averaged, not circular averaged as angles
+    :return: matrix (list of rows)
+    """
+    if spec == 'perpendicular':
+        return matrices_generator.get_perpendicular(angles_mtx1)
+    if isinstance(spec, dict) and 'field' in spec:
+        arguments = dict(spec)
+        source = arguments.pop('field')
+        if thickness:
+            return field_import.import_thickness(source, **arguments)
+        return field_import.import_angles(source, **arguments)
+    if isinstance(spec, dict):
+        name = spec['generator']
+        generator = getattr(matrices_generator, name, None)
+        if name.startswith('_') or not callable(generator):
+            raise ValueError(f'unknown matrix generator {name}')
+        return generator(*spec.get('args', ()), **spec.get('kwargs', {}))
+    return spec
+
+
+def split_output(output):
+    """
+    :return: (output without .gcode and compression extensions, compression of output)
+    """
+    compression = compression_of(output)
+    name = output[:-len(EXTENSIONS[compression])] if compression is not None else output
+    return name[:-len('.gcode')] if name.endswith('.gcode') else name, compression
+
+
+def create_job(job, out_dir='.', disk_cache=None):
+    """
+    :param job: dictionary of job, see module doc
+    :param out_dir: directory relative output paths are in
+    :param disk_cache: directory of a DiskToolpathCache to share generated paths through. None for no disk cache
+    :return: (object to call create_gcode of, its arguments, path of gcode file it writes)
+    """
+    params = dict(job)
+    job_type = params.pop('type')
+    output = os.path.join(out_dir, params.pop('output'))
+    params.pop('name', None)
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+
+    if disk_cache is not None and job_type != 'multi_square':
+        if disk_cache not in _process_state:
+            _process_state[disk_cache] = DiskToolpathCache(disk_cache)
+        params.setdefault('disk_cache', _process_state[disk_cache])
+
+    if job_type == 'square':  # writes file_name.gcode[.gz]
+        file_name, compression = split_output(output)
+        square = AngledSquare(file_name=file_name, **params)
+        return square, {'compression': compression}, f'{file_name}.gcode{EXTENSIONS.get(compression, "")}'
+    if job_type == 'multi_square':
+        return MultiSquare(output, **params), {}, output
+    if job_type == 'grid':
+        params['angles_mtx1'] = get_matrix(params['angles_mtx1'])
+        for name in MATRIX_PARAMS[1:]:
+            if params.get(name) is not None:
+                params[name] = get_matrix(params[name], params['angles_mtx1'], name == 'thickness_mtx')
+        if 'path_cache' not in _process_state:
+            _process_state['path_cache'] = ToolpathCache(disk_cache=params.get('disk_cache'))
+        params.setdefault('path_cache', _process_state['path_cache'])
+        params.pop('disk_cache', None)  # used through path_cache
+        return AngledGrid(file_name=output, **params), {}, output
+    raise ValueError(f'unknown job type {job_type}, expected one of {JOB_TYPES}')
+
+
+def run_job(task):
+    """
+    :param task: (index, job, out_dir, disk_cache, preview, check). preview - (color by, resolution) of preview image
+            to save, or None. check - validate gcode, see gcode_check.validate
+    :return: result dictionary: index, name, type, output, ok, seconds, bytes, preview, violations (None if not
+            checked), error
+    """
+    index, job, out_dir, disk_cache, preview, check = task
+    result = {'index': index, 'name': job.get('name', job.get('output')), 'type': job.get('type'),
+              'output': None, 'ok': False, 'seconds': 0.0, 'bytes': 0, 'preview': None, 'violations': None,
+              'error': None}
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):  # objects print debug info
+            obj, kwargs, output = create_job(job, out_dir, disk_cache)
+            obj.create_gcode(**kwargs)
+            if preview is not None:
+                result['preview'] = split_output(output)[0] + '.png'
+                save_preview(obj, result['preview'], *preview)
+        result.update(output=output, bytes=os.path.getsize(output))
+        if check:
+            violations = validate(output)
+            result['violations'] = len(violations)
+            if len(violations):
+                raise ValueError(f'{len(violations)} violations in gcode, {format_violations(violations, 1)[0]}')
+        result['ok'] = True
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def run_jobs(jobs, workers=1, fail_fast=False, out_dir='.', disk_cache=None, preview=None, check=False):
+    """
+    :param jobs: list of job dictionaries
+    :param workers: number of processes to run jobs in. 1 runs them in this process
+    :param fail_fast: stop at first failed job. jobs not started yet are skipped
+    :param preview: (color by, resolution) of preview image to save of each job, see preview.save_preview. None for no
+            preview
+    :param check: validate gcode of each job, see gcode_check.validate. a job of any violation fails
+    :return: yields result of each job (see run_job), by order of jobs
+    """
+    tasks = [(index, job, out_dir, disk_cache, preview, check) for index, job in enumerate(jobs)]
+    if workers <= 1:
+        for task in tasks:
+            result = run_job(task)
+            yield result
+            if fail_fast and not result['ok']:
+                return
+        return
+
+    pool = ProcessPoolExecutor(workers)
+    try:
+        for future in [pool.submit(run_job, task) for task in tasks]:
+            result = future.result()
+            yield result
+            if fail_fast and not result['ok']:
+                return
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('manifest', help='JSON, YAML or CSV file of jobs')
+    parser.add_argument('--workers', type=int, default=1, help='number of processes to run jobs in')
+    parser.add_argument('--fail-fast', action='store_true', help='stop at first failed job')
+    parser.add_argument('--out-dir', default='.', help='directory relative output paths are in')
+    parser.add_argument('--disk-cache', help='directory to cache generated square paths in, shared between runs')
+    parser.add_argument('--report', help='JSON file to save per job results to')
+    parser.add_argument('--preview', choices=COLOR_BY, help='save preview image of each job, colored by')
+    parser.add_argument('--preview-resolution', type=float, default=DEFAULT_RESOLUTION, help='preview pixels per mm')
+    parser.add_argument('--check', action='store_true', help='validate gcode of each job, fail jobs of violations')
+    args = parser.parse_args(argv)
+
+    jobs = load_manifest(args.manifest)
+    preview = (args.preview, args.preview_resolution) if args.preview else None
+    start = time.perf_counter()
+    results = []
+    for result in run_jobs(jobs, args.workers, args.fail_fast, args.out_dir, args.disk_cache, preview, args.check):
+        results.append(result)
+        status = 'ok' if result['ok'] else f'FAILED {result["error"]}'
+        print(f'[{result["index"] + 1}/{len(jobs)}] {str(result["name"]):40} {result["seconds"] * 1000:10.1f} ms '
+              f'{result["bytes"]:11d} bytes  {status}')
+    wall = time.perf_counter() - start
+
+    failed = sum(not result['ok'] for result in results)
+    skipped = len(jobs) - len(results)
+    print(f'\n{len(results) - failed} done, {failed} failed, {skipped} skipped in {wall:.2f} s')
+    if args.report:
+        with open(args.report, 'w') as file:
+            json.dump({'wall_s': wall, 'failed': failed, 'skipped': skipped, 'results': results}, file, indent=1)
+    return 1 if failed or skipped else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+# flags of a move
+TRAVEL = 1  # non extruding move (G0)
+EXTRUDE = 2  # printing move (G1 with E)
+
+# one record per move: where the nuzzle goes, how much it extrudes on the way, and in which layer. 23 bytes per move.
+# positions stay float64: generated positions are rounded to 4-6 decimals, and float32 would move them across gcode
+# rounding ties (71.0465 -> 71.047). extrusion is float32, far below its gcode precision.
+TOOLPATH_DTYPE = np.dtype([('x', np.float64), ('y', np.float64), ('e', np.float32), ('flags', np.uint8),
+                           ('layer', np.uint16)])
+
+
+class Toolpath:
+    '''
+    Sequence of printer moves, backed by one contiguous numpy structured array (TOOLPATH_DTYPE).
+    Slicing returns a Toolpath viewing the same memory. xy is a (N, 2) view of the positions.
+    Shared representation of paths of AngledSquare, MultiSquare and AngledGrid.
+    '''
+
+    def __init__(self, data=None, size=0):
+        """
+        :param data: structured array of TOOLPATH_DTYPE to wrap (not copied)
+        :param size: if no data given, number of (zeroed) moves to allocate
+        """
+        if data is None:
+            data = np.zeros(size, dtype=TOOLPATH_DTYPE)
+        assert data.dtype == TOOLPATH_DTYPE, 'toolpath data must be of TOOLPATH_DTYPE'
+        self.data = data
+
+    @classmethod
+    def from_positions(cls, positions, extrusion=None, layer=0, travel_to=None):
+        """
+        :param positions: (N, 2) array of positions, for printer to stop on
+        :param extrusion: array of N amounts of material to extrude, one per move. None for travel moves
+        :param layer: of print, starting at 0
+        :param travel_to: [x_pos, y_pos] to travel to before positions. None for no travel move
+        :return: Toolpath of the moves
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        offset = 0 if travel_to is None else 1
+        path = cls(size=len(positions) + offset)
+        data = path.data
+        if travel_to is not None:
+            data['x'][0], data['y'][0] = travel_to
+            data['flags'][0] = TRAVEL
+        data['x'][offset:] = positions[:, 0]
+        data['y'][offset:] = positions[:, 1]
+        if extrusion is None:
+            data['flags'][offset:] = TRAVEL
+        else:
+            data['e'][offset:] = extrusion
+            data['flags'][offset:] = EXTRUDE
+        data['layer'] = layer
+        return path
+
+    @classmethod
+    def concatenate(cls, toolpaths):
+        """
+        :param toolpaths: iterable of Toolpath
+        :return: single Toolpath of all moves, by order. allocated once, each toolpath copied in as a block
+        """
+        toolpaths = list(toolpaths)
+        return cls(np.concatenate([toolpath.data for toolpath in toolpaths]) if toolpaths else None)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return Toolpath(self.data[item])
+        return self.data[item]
+
+    def __repr__(self):
+        return f'Toolpath({len(self)} moves, {self.nbytes} bytes)'
+
+    @property
+    def xy(self):
+        """
+        :return: (N, 2) view of positions. writing to it changes the toolpath
+        """
+        x = self.data['x']
+        return as_strided(x, shape=(len(x), 2), strides=(x.strides[0], x.itemsize))
+
+    @property
+    def e(self):
+        return self.data['e']
+
+    @property
+    def flags(self):
+        return self.data['flags']
+
+    @property
+    def layer(self):
+        return self.data['layer']
+
+    @property
+    def is_travel(self):
+        return (self.data['flags'] & TRAVEL).astype(bool)
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes
+
+    def positions(self):
+        """
+        :return: (N, 2) copy of positions
+        """
+        return self.xy.copy()
+
+    def translate(self, dx, dy):
+        """
+        move toolpath in place
+        :return: self
+        """
+        self.data['x'] += dx
+        self.data['y'] += dy
+        return self
+
+    def translated(self, dx, dy):
+        """
+        :return: moved copy of toolpath
+        """
+        return Toolpath(self.data.copy()).translate(dx, dy)
+
+    def runs(self):
+        """
+        split toolpath to runs of moves with same flags.
+        :return: yields Toolpath views, by order
+        """
+        flags = self.data['flags']
+        bounds = np.concatenate(([0], np.flatnonzero(flags[1:] != flags[:-1]) + 1, [len(flags)]))
+        for begin, end in zip(bounds[:-1], bounds[1:]):
+            if end > begin:
+                yield self[begin:end]
@@ -0,0 +1,107 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from angled_square import AngledSquare
+from profiling import NULL_PROFILER
+
+
+class ToolpathCache:
+    '''
+    Cache of AngledSquare toolpaths, to be shared between cells of a grid.
+    A square's path depends only on its angle, size and nuzzle size - its position only shifts it. Hence each path is
+    generated once at the origin, kept as an (N, 2) array, and translated to the cell's corner when used.
+    Bounded: least recently used paths are evicted once max_entries is reached.
+    '''
+
+    def __init__(self, max_entries=256, angle_decimals=6, disk_cache=None):
+        """
+        :param max_entries: max number of paths to keep. 0 disables caching (every lookup is a miss)
+        :param angle_decimals: angles are rounded to this many decimals (degrees) before being used as key
+        :param disk_cache: DiskToolpathCache to look paths up in on a miss, before generating them
+        """
+        self.max_entries = max_entries
+        self.angle_decimals = angle_decimals
+        self.disk_cache = disk_cache
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.profiler = NULL_PROFILER  # set by AngledGrid.create_gcode(profile=True)
+        self._paths = OrderedDict()
+
+    def __len__(self):
+        return len(self._paths)
+
+    def key(self, angle, size, nuzzle_size):
+        """
+        :param angle: angle of square (degrees)
+        :param size: of square
+        :param nuzzle_size: nuzzle size
+        :return: hashable key. angle is quantized, so float noise from matrix generators maps to the same path.
+        """
+        return round(float(angle) % 360, self.angle_decimals), float(size), float(nuzzle_size)
+
+    def get_relative(self, angle, size, nuzzle_size):
+        """
+        :return: read only (N, 2) array of the square's path, with its bottom left corner at the origin
+        """
+        return self.get_relative_with_lengths(angle, size, nuzzle_size)[0]
+
+    def get_relative_with_lengths(self, angle, size, nuzzle_size):
+        """
+        :return: (path, lengths). read only (N, 2) array of the square's path, with its bottom left corner at the
+                origin, and length of each of its N moves, first one from the corner. lengths don't change by shifting
+                the path, so they are computed once too
+        """
+        key = self.key(angle, size, nuzzle_size)
+        entry = self._paths.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._paths.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        with self.profiler.stage('square construction'):
+            sq = AngledSquare(key[1], angle=key[0], nuzzle_size=key[2], x_start=0, y_start=0,
+                              disk_cache=self.disk_cache)
+        with self.profiler.stage('path generation'):
+            path = sq.generate_arrays()
+            lengths = sq.get_move_lengths(path, start=(0, 0))
+        path.flags.writeable = False
+        lengths.flags.writeable = False
+        entry = path, lengths
+        if self.max_entries > 0:
+            self._paths[key] = entry
+            if len(self._paths) > self.max_entries:
+                self._paths.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def get(self, angle, size, nuzzle_size, x_start, y_start):
+        """
+        :param x_start: x position of bottom left corner
+        :param y_start: y position of bottom left corner
+        :return: (N, 2) array of the square's path, at its position
+        """
+        return self.get_with_lengths(angle, size, nuzzle_size, x_start, y_start)[0]
+
+    def get_with_lengths(self, angle, size, nuzzle_size, x_start, y_start):
+        """
+        :return: (path, lengths). (N, 2) array of the square's path, at its position, and length of each of its moves
+        """
+        path, lengths = self.get_relative_with_lengths(angle, size, nuzzle_size)
+        with self.profiler.stage('path translation'):
+            # round away float noise of the shift, path positions are generated with at most 6 decimals
+            return np.round(path + (x_start, y_start), 6), lengths
+
+    def stats(self):
+        """
+        :return: dictionary of hit/miss counters and current size
+        """
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'entries': len(self._paths),
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+    def clear(self):
+        self._paths.clear()
+        self.hits = self.misses = self.evictions = 0
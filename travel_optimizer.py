@@ -0,0 +1,114 @@
+import numpy as np
+
+TRAVEL_ORDERS = ('rows', 'nearest', 'two_opt')
+
+
+def travel_distance(starts, ends, origin):
+    """
+    :param starts: (N, 2) array of paths' start positions, by print order (already oriented)
+    :param ends: (N, 2) array of paths' end positions, by print order (already oriented)
+    :param origin: [x_pos, y_pos] nuzzle position before first path
+    :return: total length of non-extruding moves: origin to first start, and each end to next start
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    if len(starts) == 0:
+        return 0.0
+    previous = np.vstack((np.asarray(origin, dtype=float).reshape(1, 2), ends[:-1]))
+    return float(np.hypot(*(starts - previous).T).sum())
+
+
+def orient(starts, ends, order, reverse):
+    """
+    :param order: indices of paths, by print order
+    :param reverse: boolean array, True where path is printed from its end to its start
+    :return: (starts, ends) arrays by print order, swapped where reversed
+    """
+    order = np.asarray(order, dtype=int)
+    reverse = np.asarray(reverse, dtype=bool)[:, np.newaxis]
+    s, e = starts[order], ends[order]
+    return np.where(reverse, e, s), np.where(reverse, s, e)
+
+
+def nearest_neighbour(starts, ends, origin):
+    """
+    greedy ordering: from current position, go to the closest end (start or end) of any path not printed yet.
+    :return: (order, reverse) arrays. see orient
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    n = len(starts)
+    left = np.ones(n, dtype=bool)
+    order = np.empty(n, dtype=int)
+    reverse = np.zeros(n, dtype=bool)
+    position = np.asarray(origin, dtype=float)
+    for k in range(n):
+        to_start = np.hypot(*(starts - position).T)
+        to_end = np.hypot(*(ends - position).T)
+        to_start[~left] = np.inf
+        to_end[~left] = np.inf
+        best_start, best_end = np.argmin(to_start), np.argmin(to_end)
+        if to_end[best_end] < to_start[best_start]:
+            order[k], reverse[k], position = best_end, True, starts[best_end]
+        else:
+            order[k], reverse[k], position = best_start, False, ends[best_start]
+        left[order[k]] = False
+    return order, reverse
+
+
+def two_opt(starts, ends, order, reverse, origin, max_passes=10, tolerance=1e-9):
+    """
+    improve ordering by reversing segments of it (which also flips direction of each path in segment), as long as
+    travel gets shorter.
+    :param order: initial order, e.g. from nearest_neighbour
+    :param reverse: initial directions
+    :param max_passes: max number of passes over all segments start points
+    :return: (order, reverse) arrays. see orient
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    order = np.array(order, dtype=int)
+    reverse = np.array(reverse, dtype=bool)
+    n = len(order)
+    origin = np.asarray(origin, dtype=float)
+    s, e = orient(starts, ends, order, reverse)
+
+    for _ in range(max_passes):
+        improved = False
+        for a in range(n):
+            previous = origin if a == 0 else e[a - 1]
+            # reversing segment [a, b] replaces links previous->s[a] and e[b]->s[b + 1]
+            # by previous->e[b] and s[a]->s[b + 1]. links inside the segment keep their lengths.
+            e_b = e[a:]
+            next_s = s[a + 1:]
+            old = np.hypot(*(previous - s[a])) + np.append(np.hypot(*(e_b[:-1] - next_s).T), 0)
+            new = np.hypot(*(previous - e_b).T) + np.append(np.hypot(*(s[a] - next_s).T), 0)
+            gain = old - new
+            b = int(np.argmax(gain))
+            if gain[b] > tolerance:
+                b += a
+                order[a:b + 1] = order[a:b + 1][::-1]
+                reverse[a:b + 1] = ~reverse[a:b + 1][::-1]
+                s[a:b + 1], e[a:b + 1] = e[a:b + 1][::-1].copy(), s[a:b + 1][::-1].copy()
+                improved = True
+        if not improved:
+            break
+    return order, reverse
+
+
+def optimize_order(starts, ends, origin, method='two_opt', max_passes=10):
+    """
+    :param starts: (N, 2) array of paths' start positions
+    :param ends: (N, 2) array of paths' end positions
+    :param origin: [x_pos, y_pos] nuzzle position before first path
+    :param method: one of TRAVEL_ORDERS. 'rows' keeps given order
+    :return: (order, reverse) arrays. see orient
+    """
+    assert method in TRAVEL_ORDERS, f'travel order must be one of {TRAVEL_ORDERS}'
+    n = len(starts)
+    if method == 'rows':
+        return np.arange(n), np.zeros(n, dtype=bool)
+    order, reverse = nearest_neighbour(starts, ends, origin)
+    if method == 'two_opt':
+        order, reverse = two_opt(starts, ends, order, reverse, origin, max_passes=max_passes)
+    return order, reverse